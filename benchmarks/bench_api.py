@@ -0,0 +1,182 @@
+"""API 数据库会话基准
+
+在临时 SQLite 数据库中写入合成论文，用 uvicorn 在本进程内启动 FastAPI 应用，
+以多个并发客户端请求 ``/api/v1/papers``，分别测量两种会话依赖的吞吐量（请求/秒）
+和延迟 p50/p99：
+
+- ``per-request``：旧实现，每个请求调用 ``create_engine`` 新建引擎和连接
+- ``pooled``：进程内共享的连接池引擎（``evo_flywheel.db.engine``）
+
+用法:
+    python benchmarks/bench_api.py [--papers 2000] [--clients 8] [--duration 5]
+        [--modes per-request pooled] [--json result.json]
+"""
+
+import argparse
+import json
+import socket
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import httpx
+import uvicorn
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from evo_flywheel.api import deps
+from evo_flywheel.api.main import app
+from evo_flywheel.config import get_settings
+from evo_flywheel.db.engine import dispose_engine, get_engine
+from evo_flywheel.db.models import Base, Paper
+
+
+def percentile(values: list[float], q: float) -> float:
+    """最近秩法百分位数"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(q / 100 * len(ordered) + 0.5) - 1))
+    return ordered[rank]
+
+
+def per_request_get_db() -> Iterator[Session]:
+    """旧的会话依赖：每个请求新建引擎"""
+    engine = create_engine(get_settings().effective_database_url)
+    with Session(engine) as session:
+        yield session
+
+
+def seed_database(directory: Path, papers: int) -> None:
+    """把配置指向临时数据库并写入合成论文"""
+    get_settings().database_path = f"sqlite:///{directory / 'bench.db'}"
+    dispose_engine()
+    engine = get_engine()
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            Paper(
+                title=f"Synthetic paper {i}",
+                authors="A. Author; B. Author",
+                abstract="Adaptive evolution " * 20,
+                doi=f"10.1101/bench.{i:06d}",
+                url=f"https://doi.org/10.1101/bench.{i:06d}",
+                publication_date=f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}",
+                journal="Bench Journal",
+                source="bench",
+                taxa="Mammals" if i % 2 else "Birds",
+                importance_score=i % 100,
+            )
+            for i in range(papers)
+        )
+        session.commit()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure(base_url: str, clients: int, duration: float) -> dict[str, Any]:
+    """并发请求论文列表直到时间用完"""
+    latencies: list[list[float]] = [[] for _ in range(clients)]
+    errors = [0] * clients
+    stop_at = time.perf_counter() + duration
+
+    def worker(index: int) -> None:
+        with httpx.Client(base_url=base_url, timeout=30.0) as client:
+            while time.perf_counter() < stop_at:
+                started = time.perf_counter()
+                response = client.get("/api/v1/papers", params={"limit": 20})
+                latencies[index].append(time.perf_counter() - started)
+                errors[index] += response.status_code != 200
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    all_latencies = [v for values in latencies for v in values]
+    return {
+        "requests": len(all_latencies),
+        "errors": sum(errors),
+        "requests_per_sec": round(len(all_latencies) / elapsed, 1),
+        "latency_p50_ms": round(percentile(all_latencies, 50) * 1000, 2),
+        "latency_p99_ms": round(percentile(all_latencies, 99) * 1000, 2),
+    }
+
+
+def run_mode(mode: str, clients: int, duration: float) -> dict[str, Any]:
+    """以指定的会话依赖启动应用并测量"""
+    if mode == "per-request":
+        app.dependency_overrides[deps.get_db] = per_request_get_db
+    else:
+        app.dependency_overrides.pop(deps.get_db, None)
+
+    port = _free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", access_log=False)
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        measure(base_url, clients, min(duration, 1.0))  # 预热
+        return measure(base_url, clients, duration)
+    finally:
+        server.should_exit = True
+        thread.join()
+        app.dependency_overrides.pop(deps.get_db, None)
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        seed_database(Path(tmpdir), args.papers)
+        results = {mode: run_mode(mode, args.clients, args.duration) for mode in args.modes}
+        dispose_engine()
+
+    result: dict[str, Any] = {"config": vars(args), **results}
+    if "per-request" in results and "pooled" in results:
+        before = results["per-request"]["requests_per_sec"]
+        after = results["pooled"]["requests_per_sec"]
+        result["speedup"] = round(after / before, 2) if before else 0.0
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--papers", type=int, default=2000, help="合成论文数")
+    parser.add_argument("--clients", type=int, default=8, help="并发客户端数")
+    parser.add_argument("--duration", type=float, default=5.0, help="每种模式的测量时长（秒）")
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=["per-request", "pooled"],
+        default=["per-request", "pooled"],
+        help="要测量的会话依赖",
+    )
+    parser.add_argument("--json", type=Path, help="将结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    result = run(args)
+    for mode in args.modes:
+        print(f"{mode:<12}{result[mode]}")
+    if "speedup" in result:
+        print(f"{'speedup':<12}{result['speedup']}x")
+
+    if args.json:
+        args.json.write_text(json.dumps(result, indent=2, default=str), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""端到端采集基准
+
+启动本地替身服务器（合成 RSS/Atom feed + 分页的 bioRxiv/medRxiv API，见 feed_server.py），
+以 collect_from_all_sources 采集并通过调度任务的写库路径保存到临时 SQLite 数据库，
+报告吞吐量（论文/秒）、各源请求延迟的 p50/p99 以及进程峰值 RSS。
+
+用法:
+    python benchmarks/bench_collection.py [--feeds 20] [--items 50] [--biorxiv 500]
+        [--targets biorxiv:evolutionary_biology medrxiv:genetic_and_genomic_medicine]
+        [--latency 0.05] [--failure-rate 0.0] [--streaming] [--json result.json]
+        [--min-throughput 0]
+
+``--min-throughput`` 大于 0 时，吞吐量低于该值以非零状态退出，可用于部署前的回归检查。
+"""
+
+import argparse
+import json
+import resource
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from feed_server import ServerConfig, StandInServer
+
+from evo_flywheel.collectors import biorxiv, http
+from evo_flywheel.collectors.biorxiv import PreprintTarget
+from evo_flywheel.collectors.orchestrator import CollectionReport, collect_from_all_sources
+from evo_flywheel.config import get_settings
+from evo_flywheel.db.engine import get_engine
+from evo_flywheel.db.models import Base
+
+
+def percentile(values: list[float], q: float) -> float:
+    """最近秩法百分位数"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(q / 100 * len(ordered) + 0.5) - 1))
+    return ordered[rank]
+
+
+def peak_rss_mb() -> float:
+    """当前进程的峰值常驻内存（MB，Linux 下 ru_maxrss 单位为 KB）"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 if sys.platform != "darwin" else peak / 1024 / 1024
+
+
+def instrument_latency() -> dict[str, list[float]]:
+    """包装共享 HTTP 层，按源记录每次请求（含重试）的耗时"""
+    latencies: dict[str, list[float]] = defaultdict(list)
+
+    def _source_of(url: str) -> str:
+        path = url.split("://", 1)[-1].split("/", 1)[-1]
+        return "preprints" if path.startswith("details/") else path
+
+    async_get = http.async_http_get
+
+    async def timed_async_get(client: Any, url: str, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return await async_get(client, url, **kwargs)
+        finally:
+            latencies[_source_of(url)].append(time.perf_counter() - started)
+
+    sync_get = biorxiv.http_get
+
+    def timed_get(url: str, **kwargs: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return sync_get(url, **kwargs)
+        finally:
+            latencies[_source_of(url)].append(time.perf_counter() - started)
+
+    http.async_http_get = timed_async_get  # type: ignore[assignment]
+    biorxiv.http_get = timed_get  # type: ignore[assignment]
+    return latencies
+
+
+def prepare_database(directory: Path) -> None:
+    """把调度任务的写库路径指向临时数据库"""
+    settings = get_settings()
+    settings.database_path = f"sqlite:///{directory / 'bench.db'}"
+    settings.collection_archive_dir = ""
+    Base.metadata.create_all(get_engine())
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    from evo_flywheel.scheduler.jobs import _save_papers_to_db
+
+    config = ServerConfig(
+        feeds=args.feeds,
+        items_per_feed=args.items,
+        biorxiv_total=args.biorxiv,
+        latency=args.latency,
+        failure_rate=args.failure_rate,
+        seed=args.seed,
+    )
+
+    with tempfile.TemporaryDirectory() as tmpdir, StandInServer(config) as server:
+        prepare_database(Path(tmpdir))
+        get_settings().http_backoff_base = args.backoff
+        get_settings().biorxiv_requests_per_second = args.preprint_rate
+        biorxiv.API_BASE_URL = server.biorxiv_api_base
+        latencies = instrument_latency()
+
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=1)
+        sources = server.feed_sources()
+        targets = [PreprintTarget.parse(spec) for spec in args.targets]
+
+        report = CollectionReport()
+        started = time.perf_counter()
+        if args.streaming:
+            from evo_flywheel.collectors.pipeline import stream_from_all_sources
+
+            stats = stream_from_all_sources(
+                start_date,
+                end_date,
+                _save_papers_to_db,
+                sources,
+                preprint_targets=targets,
+            )
+            collected, saved = stats.unique, stats.saved
+        else:
+            papers = collect_from_all_sources(
+                start_date, end_date, rss_sources=sources, preprint_targets=targets, report=report
+            )
+            collect_seconds = time.perf_counter() - started
+            collected, saved = len(papers), _save_papers_to_db(papers)
+        elapsed = time.perf_counter() - started
+
+    all_latencies = [v for values in latencies.values() for v in values]
+    per_source_p50 = [percentile(v, 50) for v in latencies.values()]
+    result: dict[str, Any] = {
+        "config": vars(args),
+        "expected_papers": (
+            config.feeds * config.items_per_feed + config.biorxiv_total * len(targets)
+        ),
+        "collected": collected,
+        "saved": saved,
+        "seconds": round(elapsed, 3),
+        "papers_per_sec": round(collected / elapsed, 1) if elapsed else 0.0,
+        "requests": len(all_latencies),
+        "latency_p50_ms": round(percentile(all_latencies, 50) * 1000, 1),
+        "latency_p99_ms": round(percentile(all_latencies, 99) * 1000, 1),
+        "source_p50_ms": {
+            "median": round(percentile(per_source_p50, 50) * 1000, 1),
+            "worst": round(max(per_source_p50, default=0.0) * 1000, 1),
+        },
+        "preprint_p99_ms": round(percentile(latencies.get("preprints", []), 99) * 1000, 1),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+    if not args.streaming:
+        result["collect_seconds"] = round(collect_seconds, 3)
+        result["failed_sources"] = len(report.failed)
+        result["save_seconds"] = round(elapsed - collect_seconds, 3)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--feeds", type=int, default=20, help="RSS/Atom 源数量")
+    parser.add_argument("--items", type=int, default=50, help="每个 feed 的条目数")
+    parser.add_argument("--biorxiv", type=int, default=500, help="每个预印本目标的记录数")
+    parser.add_argument(
+        "--targets",
+        nargs="+",
+        default=["biorxiv:evolutionary_biology"],
+        help="预印本目标（server:category）",
+    )
+    parser.add_argument(
+        "--preprint-rate", type=float, default=0.0, help="预印本 API 限速（每秒请求数，0 不限）"
+    )
+    parser.add_argument("--latency", type=float, default=0.05, help="每个响应的平均延迟（秒）")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="返回 503 的概率")
+    parser.add_argument("--backoff", type=float, default=0.05, help="重试退避基数（秒）")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--streaming", action="store_true", help="使用流式管道采集")
+    parser.add_argument("--json", type=Path, help="将结果写入 JSON 文件")
+    parser.add_argument("--min-throughput", type=float, default=0.0, help="最低论文/秒")
+    args = parser.parse_args()
+
+    result = run(args)
+    for key, value in result.items():
+        if key != "config":
+            print(f"{key:<18}{value}")
+
+    if args.json:
+        args.json.write_text(json.dumps(result, indent=2, default=str), encoding="utf-8")
+
+    if args.min_throughput and result["papers_per_sec"] < args.min_throughput:
+        print(f"FAIL: {result['papers_per_sec']} papers/s < {args.min_throughput}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""SQLite 读写争用基准
+
+模拟调度器写库、API/Streamlit 同时读库的场景：一个写进程按批调用 ``bulk_upsert_papers``
+（调度任务的写库路径，每批一个事务），多个读进程反复执行论文列表查询（计数 + 按日期排序分页），
+分别在两种 SQLite 配置下测量写入吞吐量、读取吞吐量、延迟 p50/p99 和 ``database is locked`` 错误数：
+
+- ``default``：SQLite 默认配置（回滚日志、synchronous=FULL、约 2MB 页缓存、不使用 mmap）
+- ``tuned``：``Settings`` 中的性能配置（默认 WAL、synchronous=NORMAL 等）
+
+用法:
+    python benchmarks/bench_sqlite.py [--papers 5000] [--readers 4] [--batch 50]
+        [--duration 5] [--profiles default tuned] [--json result.json]
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import OperationalError
+
+from evo_flywheel.config import Settings, get_settings
+from evo_flywheel.db import crud
+from evo_flywheel.db.engine import dispose_engine, get_engine, get_session_factory
+from evo_flywheel.db.models import Base, Paper
+
+# SQLite 默认值（``default`` 配置）
+DEFAULT_PROFILE = {
+    "sqlite_journal_mode": "DELETE",
+    "sqlite_synchronous": "FULL",
+    "sqlite_cache_size_kb": 2000,
+    "sqlite_mmap_size_mb": 0,
+    "sqlite_temp_store": "DEFAULT",
+}
+
+# Settings 中的默认性能配置（``tuned`` 配置）
+TUNED_PROFILE = {name: Settings.model_fields[name].default for name in DEFAULT_PROFILE}
+
+
+def percentile(values: list[float], q: float) -> float:
+    """最近秩法百分位数"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(q / 100 * len(ordered) + 0.5) - 1))
+    return ordered[rank]
+
+
+def make_papers(start: int, count: int) -> list[dict[str, Any]]:
+    """生成采集器输出格式的合成论文"""
+    return [
+        {
+            "title": f"Synthetic paper {i}",
+            "authors": ["A. Author", "B. Author"],
+            "abstract": "Adaptive evolution " * 20,
+            "doi": f"10.1101/bench.{i:07d}",
+            "url": f"https://doi.org/10.1101/bench.{i:07d}",
+            "publication_date": f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}",
+            "journal": "Bench Journal",
+            "source": "bench",
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def apply_profile(path: Path, profile: dict[str, Any]) -> None:
+    """把共享引擎指向数据库文件并应用 SQLite 配置"""
+    settings = get_settings()
+    settings.database_path = f"sqlite:///{path}"
+    for name, value in profile.items():
+        setattr(settings, name, value)
+    dispose_engine()
+
+
+def prepare_database(path: Path, papers: int, profile: dict[str, Any]) -> None:
+    """在新的数据库中写入初始论文"""
+    apply_profile(path, profile)
+    Base.metadata.create_all(get_engine())
+    with get_session_factory()() as session:
+        crud.bulk_upsert_papers(session, make_papers(0, papers))
+        session.commit()
+    dispose_engine()
+
+
+def writer(
+    path: Path, profile: dict[str, Any], stop_at: float, start: int, batch: int
+) -> dict[str, Any]:
+    """写进程：按批写入论文直到时间用完（对应调度器）"""
+    apply_profile(path, profile)
+    session_factory = get_session_factory()
+    latencies: list[float] = []
+    errors = 0
+    while time.time() < stop_at:
+        started = time.perf_counter()
+        try:
+            with session_factory() as session:
+                crud.bulk_upsert_papers(session, make_papers(start, batch))
+                session.commit()
+            start += batch
+            latencies.append(time.perf_counter() - started)
+        except OperationalError:
+            errors += 1
+    return {"latencies": latencies, "errors": errors}
+
+
+def reader(path: Path, profile: dict[str, Any], stop_at: float) -> dict[str, Any]:
+    """读进程：反复查询论文列表直到时间用完（对应 API / Streamlit）"""
+    apply_profile(path, profile)
+    session_factory = get_session_factory()
+    query = (
+        select(Paper.id, Paper.title, Paper.publication_date)
+        .order_by(Paper.publication_date.desc())
+        .limit(20)
+    )
+    latencies: list[float] = []
+    errors = 0
+    while time.time() < stop_at:
+        started = time.perf_counter()
+        try:
+            with session_factory() as session:
+                session.scalar(select(func.count()).select_from(Paper))
+                session.execute(query).all()
+            latencies.append(time.perf_counter() - started)
+        except OperationalError:
+            errors += 1
+    return {"latencies": latencies, "errors": errors}
+
+
+def run_profile(name: str, directory: Path, args: argparse.Namespace) -> dict[str, Any]:
+    """在一种配置下同时运行写进程和读进程"""
+    profile = DEFAULT_PROFILE if name == "default" else TUNED_PROFILE
+    path = directory / f"{name}.db"
+    prepare_database(path, args.papers, profile)
+
+    with ProcessPoolExecutor(max_workers=args.readers + 1) as pool:
+        # 先启动所有进程再统一开始计时
+        list(pool.map(time.sleep, [0.0] * (args.readers + 1)))
+        stop_at = time.time() + args.duration
+        write = pool.submit(writer, path, profile, stop_at, args.papers, args.batch)
+        reads = [pool.submit(reader, path, profile, stop_at) for _ in range(args.readers)]
+        write_result = write.result()
+        read_results = [future.result() for future in reads]
+
+    write_latencies = write_result["latencies"]
+    read_latencies = [v for result in read_results for v in result["latencies"]]
+    errors = write_result["errors"] + sum(result["errors"] for result in read_results)
+    return {
+        "papers_written": len(write_latencies) * args.batch,
+        "writes_per_sec": round(len(write_latencies) * args.batch / args.duration, 1),
+        "write_p99_ms": round(percentile(write_latencies, 99) * 1000, 2),
+        "reads_per_sec": round(len(read_latencies) / args.duration, 1),
+        "read_p50_ms": round(percentile(read_latencies, 50) * 1000, 2),
+        "read_p99_ms": round(percentile(read_latencies, 99) * 1000, 2),
+        "locked_errors": errors,
+    }
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        results = {name: run_profile(name, Path(tmpdir), args) for name in args.profiles}
+    return {"config": vars(args), **results}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--papers", type=int, default=5000, help="初始论文数")
+    parser.add_argument("--readers", type=int, default=4, help="并发读进程数")
+    parser.add_argument("--batch", type=int, default=50, help="写进程每个事务插入的论文数")
+    parser.add_argument("--duration", type=float, default=5.0, help="每种配置的测量时长（秒）")
+    parser.add_argument(
+        "--profiles",
+        nargs="+",
+        choices=["default", "tuned"],
+        default=["default", "tuned"],
+        help="要测量的 SQLite 配置",
+    )
+    parser.add_argument("--json", type=Path, help="将结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    result = run(args)
+    for name in args.profiles:
+        print(f"{name:<9}{result[name]}")
+
+    if args.json:
+        args.json.write_text(json.dumps(result, indent=2, default=str), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""文本规范化微基准
+
+对比旧实现（逐个 str.replace + 每次调用重新匹配三个正则）与 textnorm 模块
+在 10k 条合成 RSS 条目上的单条耗时。
+
+用法:
+    python benchmarks/bench_textnorm.py [--entries 10000] [--repeat 5]
+"""
+
+import argparse
+import random
+import re
+import time
+import unicodedata
+from collections.abc import Callable
+
+from evo_flywheel.collectors import textnorm
+
+# ============================================================================
+# 旧实现（基准对照）
+# ============================================================================
+
+
+def legacy_normalize_title(title: str) -> str:
+    unicode_fractions = {
+        "½": "1/2",
+        "⅓": "1/3",
+        "⅔": "2/3",
+        "¼": "1/4",
+        "¾": "3/4",
+        "⅕": "1/5",
+        "⅛": "1/8",
+        "⅜": "3/8",
+        "⅝": "5/8",
+        "⅞": "7/8",
+    }
+    for unicode_char, replacement in unicode_fractions.items():
+        title = title.replace(unicode_char, replacement)
+    title = title.lower()
+    title = unicodedata.normalize("NFKD", title)
+    title = "".join(c for c in title if not unicodedata.combining(c))
+    title = re.sub(r"\s+", " ", title)
+    return title.strip()
+
+
+def legacy_extract_doi(text: str | None) -> str | None:
+    if not text:
+        return None
+    doi_patterns = [
+        r"\b10\.\d{4,9}/[^\s\]\"\'<>]+",
+        r"doi:(10\.\d{4,9}/[^\s\"\'<>]+)",
+        r"doi\.org/(10\.\d{4,9}/[^\s\"\'<>]+)",
+    ]
+    for pattern in doi_patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            doi = match.group(1) if match.lastindex and match.lastindex >= 1 else match.group(0)
+            return re.sub(r"[.,;:\s]+$", "", doi)
+    return None
+
+
+# ============================================================================
+# 合成数据
+# ============================================================================
+
+_WORDS = [
+    "evolution",
+    "adaptation",
+    "selection",
+    "genome",
+    "population",
+    "speciation",
+    "drift",
+    "mutation",
+    "phylogeny",
+    "fitness",
+    "lineage",
+    "hybridization",
+    "convergent",
+    "island",
+    "finch",
+    "drosophila",
+]
+_DECORATIONS = ["", "", "", " Café", " Müller's", " ½ sib", "  (Preprint) ", "\tRevisited"]
+
+
+def synthetic_entries(count: int, seed: int = 42) -> list[tuple[str, str]]:
+    """生成 (标题, 描述) 条目，约 30% 的标题重复出现（多源/多次运行）"""
+    rng = random.Random(seed)
+    unique = [
+        " ".join(rng.choice(_WORDS).capitalize() for _ in range(rng.randint(6, 14)))
+        + rng.choice(_DECORATIONS)
+        for _ in range(int(count * 0.7))
+    ]
+    entries = []
+    for i in range(count):
+        title = rng.choice(unique)
+        doi = f"10.{rng.randint(1000, 99999)}/2024.{i:06d}"
+        description = rng.choice(
+            [
+                f"<p>Abstract text. doi:{doi}.</p>",
+                f"Read more at https://doi.org/{doi}",
+                "No identifier in this summary.",
+            ]
+        )
+        entries.append((title, description))
+    return entries
+
+
+def _time_per_entry(
+    func: Callable[[str], object], values: list[str], repeat: int, reset: Callable[[], None]
+) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        reset()
+        started = time.perf_counter()
+        for value in values:
+            func(value)
+        best = min(best, time.perf_counter() - started)
+    return best / len(values) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    entries = synthetic_entries(args.entries)
+    titles = [title for title, _ in entries]
+    descriptions = [description for _, description in entries]
+
+    # 基准前先确认两种实现结果一致
+    assert all(legacy_normalize_title(t) == textnorm.normalize_title(t) for t in titles)
+    assert all(legacy_extract_doi(d) == textnorm.extract_doi(d) for d in descriptions)
+
+    def no_reset() -> None:
+        pass
+
+    rows = [
+        (
+            "normalize_title",
+            _time_per_entry(legacy_normalize_title, titles, args.repeat, no_reset),
+            _time_per_entry(
+                textnorm.normalize_title, titles, args.repeat, textnorm.normalize_title.cache_clear
+            ),
+        ),
+        (
+            "extract_doi",
+            _time_per_entry(legacy_extract_doi, descriptions, args.repeat, no_reset),
+            _time_per_entry(textnorm.extract_doi, descriptions, args.repeat, no_reset),
+        ),
+    ]
+
+    print(f"{args.entries} synthetic entries, best of {args.repeat} (cold LRU cache per run)")
+    print(f"{'function':<18}{'before µs/entry':>18}{'after µs/entry':>18}{'speedup':>10}")
+    for name, before, after in rows:
+        print(f"{name:<18}{before:>18.2f}{after:>18.2f}{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""采集基准用的本地替身服务器
+
+在子进程中运行一个 HTTP 服务器，提供：
+
+- ``/feeds/<n>``: 合成的 RSS 2.0 / Atom feed（偶数编号为 RSS，奇数为 Atom）
+- ``/details/<server>/<start>/<end>/<cursor>?category=<c>``: 与 bioRxiv API 格式一致的分页接口
+  （每个服务器 + 分类各有 ``biorxiv_total`` 条互不相同的记录）
+
+每个响应前按配置注入延迟，并按失败率返回 503。feed 内容在启动时预先生成，
+服务器本身几乎不占 CPU，且与被测进程不共享 GIL 和内存统计。
+"""
+
+import json
+import multiprocessing
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from xml.sax.saxutils import escape
+
+WORDS = [
+    "adaptive",
+    "radiation",
+    "selection",
+    "drift",
+    "speciation",
+    "hybrid",
+    "genome",
+    "population",
+    "phylogenetic",
+    "convergent",
+    "plasticity",
+    "fitness",
+    "mutation",
+    "recombination",
+    "lineage",
+    "divergence",
+    "introgression",
+    "niche",
+    "coevolution",
+    "transposon",
+    "regulatory",
+    "island",
+    "domestication",
+    "polygenic",
+    "sweep",
+    "balancing",
+    "deleterious",
+    "cichlid",
+    "stickleback",
+    "drosophila",
+    "arabidopsis",
+    "yeast",
+    "bacteria",
+    "virus",
+    "mammal",
+    "bird",
+    "fish",
+    "insect",
+    "plant",
+]
+
+BIORXIV_PAGE_SIZE = 100
+
+_BIORXIV_PATH = re.compile(r"^/details/(\w+)/[\d-]+/[\d-]+/(\d+)(?:\?category=(\w+))?")
+_FEED_PATH = re.compile(r"^/feeds/(\d+)")
+
+
+@dataclass(frozen=True)
+class ServerConfig:
+    """替身服务器配置"""
+
+    feeds: int = 20
+    items_per_feed: int = 50
+    biorxiv_total: int = 500
+    latency: float = 0.05
+    jitter: float = 0.5
+    failure_rate: float = 0.0
+    seed: int = 0
+
+
+def _title(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(12)).capitalize()
+
+
+def _abstract(rng: random.Random) -> str:
+    sentences = [" ".join(rng.choice(WORDS) for _ in range(15)) for _ in range(6)]
+    return "<p>" + ". ".join(sentences) + ".</p>"
+
+
+def build_feed(index: int, config: ServerConfig) -> bytes:
+    """生成第 index 个 feed（偶数 RSS 2.0，奇数 Atom）"""
+    rng = random.Random(config.seed * 100_003 + index)
+    now = datetime.now(UTC)
+    items = []
+    for i in range(config.items_per_feed):
+        doi = f"10.9999/bench.{index:04d}.{i:05d}"
+        published = now - timedelta(minutes=i * 7)
+        title = escape(_title(rng))
+        abstract = escape(_abstract(rng))
+        authors = ", ".join(f"{rng.choice(WORDS).title()} {chr(65 + j)}" for j in range(3))
+        if index % 2 == 0:
+            items.append(
+                f"<item><title>{title}</title>"
+                f"<link>https://doi.org/{doi}</link>"
+                f"<description>{abstract}</description>"
+                f"<dc:creator>{authors}</dc:creator>"
+                f"<pubDate>{format_datetime(published)}</pubDate></item>"
+            )
+        else:
+            items.append(
+                f"<entry><title>{title}</title>"
+                f'<link href="https://doi.org/{doi}"/><id>doi:{doi}</id>'
+                f'<summary type="html">{abstract}</summary>'
+                f"<author><name>{authors}</name></author>"
+                f"<published>{published.isoformat()}</published></entry>"
+            )
+
+    if index % 2 == 0:
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/">'
+            f"<channel><title>Bench Feed {index}</title>{''.join(items)}</channel></rss>"
+        ).encode()
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<feed xmlns="http://www.w3.org/2005/Atom">'
+        f"<title>Bench Feed {index}</title>{''.join(items)}</feed>"
+    ).encode()
+
+
+def build_biorxiv_records(
+    config: ServerConfig,
+    server: str = "biorxiv",
+    category: str = "evolutionary_biology",
+) -> list[dict[str, Any]]:
+    """生成一个服务器 + 分类的全部 API 记录"""
+    rng = random.Random(f"{config.seed}:{server}:{category}")
+    today = datetime.now(UTC).strftime("%Y-%m-%d")
+    return [
+        {
+            "doi": f"10.1101/bench.{server}.{category}.{i:06d}",
+            "title": _title(rng),
+            "authors": "; ".join(f"{rng.choice(WORDS).title()}, {chr(65 + j)}." for j in range(4)),
+            "abstract": re.sub(r"</?p>", "", _abstract(rng)),
+            "date": today,
+            "category": category.replace("_", " "),
+        }
+        for i in range(config.biorxiv_total)
+    ]
+
+
+def _make_handler(config: ServerConfig) -> type[BaseHTTPRequestHandler]:
+    feeds = [build_feed(i, config) for i in range(config.feeds)]
+    records: dict[tuple[str, str], list[dict[str, Any]]] = {}
+    rng = random.Random(config.seed)
+    rng_lock = threading.Lock()
+
+    def records_for(server: str, category: str) -> list[dict[str, Any]]:
+        with rng_lock:
+            if (server, category) not in records:
+                records[server, category] = build_biorxiv_records(config, server, category)
+            return records[server, category]
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+            pass
+
+        def _send(self, status: int, body: bytes, content_type: str) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:  # noqa: N802
+            with rng_lock:
+                delay = config.latency * rng.uniform(1 - config.jitter, 1 + config.jitter)
+                failed = rng.random() < config.failure_rate
+            time.sleep(max(delay, 0.0))
+
+            if failed:
+                self._send(503, b"Service Unavailable", "text/plain")
+                return
+
+            if match := _FEED_PATH.match(self.path):
+                index = int(match.group(1))
+                if index < len(feeds):
+                    self._send(200, feeds[index], "application/xml")
+                    return
+            elif match := _BIORXIV_PATH.match(self.path):
+                server, cursor, category = match.groups()
+                collection = records_for(server, category or "evolutionary_biology")
+                cursor = int(cursor)
+                page = collection[cursor : cursor + BIORXIV_PAGE_SIZE]
+                body = {
+                    "messages": [{"status": "ok", "cursor": cursor, "total": len(collection)}],
+                    "collection": page,
+                }
+                self._send(200, json.dumps(body).encode(), "application/json")
+                return
+
+            self._send(404, b"Not Found", "text/plain")
+
+    return Handler
+
+
+def _serve(config: ServerConfig, port_queue: Any) -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(config))
+    server.daemon_threads = True
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+class StandInServer:
+    """在子进程中运行的替身服务器（上下文管理器）
+
+    Example:
+        >>> with StandInServer(ServerConfig(feeds=4)) as server:
+        ...     sources = server.feed_sources()
+    """
+
+    def __init__(self, config: ServerConfig) -> None:
+        self.config = config
+        self.base_url = ""
+        self._process: multiprocessing.Process | None = None
+
+    def __enter__(self) -> "StandInServer":
+        ctx = multiprocessing.get_context("spawn")
+        port_queue = ctx.Queue()
+        self._process = ctx.Process(target=_serve, args=(self.config, port_queue), daemon=True)
+        self._process.start()
+        self.base_url = f"http://127.0.0.1:{port_queue.get(timeout=60)}"
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+
+    @property
+    def biorxiv_api_base(self) -> str:
+        """替身预印本 API 的基础 URL（后接服务器名）"""
+        return f"{self.base_url}/details"
+
+    def feed_sources(self) -> list[dict[str, Any]]:
+        """替身 feed 的源配置列表（与 load_rss_sources 的格式一致）"""
+        return [
+            {"name": f"Bench Feed {i}", "url": f"{self.base_url}/feeds/{i}", "priority": i}
+            for i in range(self.config.feeds)
+        ]
@@ -1,23 +1,24 @@
 """API 依赖注入模块"""
 
+from collections.abc import Iterator
+
 from sqlalchemy.orm import Session
 
+from evo_flywheel.db.engine import get_session_factory
+
 
-def get_db() -> Session:
-    """获取数据库会话
+def get_db() -> Iterator[Session]:
+    """获取请求级数据库会话
 
-    在生产环境中返回真实的数据库会话。
+    会话来自进程内共享的连接池引擎（与 ``get_db_session`` 相同），
+    请求结束时关闭并把连接归还连接池；未提交的修改在关闭时回滚。
     在测试环境中会被 override 为测试数据库会话。
 
-    Returns:
+    Yields:
         Session: 数据库会话
     """
-    from sqlalchemy import create_engine
-
-    from evo_flywheel.config import get_settings
-
-    settings = get_settings()
-    engine = create_engine(settings.effective_database_url)
-
-    with Session(engine) as session:
+    session = get_session_factory()()
+    try:
         yield session
+    finally:
+        session.close()
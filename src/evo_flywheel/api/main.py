@@ -16,6 +16,8 @@ from evo_flywheel.api.v1 import (
     search,
     stats,
 )
+from evo_flywheel.db.engine import dispose_engine, get_engine
+from evo_flywheel.db.indexes import ensure_indexes
 from evo_flywheel.logging import get_logger
 
 logger = get_logger(__name__)
@@ -23,11 +25,19 @@ logger = get_logger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """应用生命周期管理"""
+    """应用生命周期管理
+
+    启动时创建共享的数据库引擎（所有请求复用其连接池）并补建缺失的索引，关闭时释放连接
+    """
     # 启动
+    try:
+        ensure_indexes(get_engine())
+    except Exception as e:
+        logger.warning(f"索引检查失败，跳过: {e}")
     logger.info("FastAPI 应用启动")
     yield
     # 关闭
+    dispose_engine()
     logger.info("FastAPI 应用关闭")
 
 
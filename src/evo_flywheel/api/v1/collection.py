@@ -4,12 +4,12 @@ from datetime import datetime, timedelta
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import Column
 from sqlalchemy.orm import Session
 
 from evo_flywheel.api.deps import get_db
-from evo_flywheel.collectors.orchestrator import collect_from_all_sources
-from evo_flywheel.db import crud
-from evo_flywheel.scheduler.jobs import load_rss_sources
+from evo_flywheel.db.models import RSSSource
+from evo_flywheel.scheduler.jobs import collect_sources_now, load_rss_sources
 
 router = APIRouter()
 
@@ -18,11 +18,11 @@ router = APIRouter()
 def trigger_fetch(
     days: int = Query(7, ge=1, le=30, description="采集最近几天的论文"),
     sources: str | None = Query(None, description="指定数据源（逗号分隔）"),
-    db: Session = Depends(get_db),
 ) -> dict:
     """触发数据采集
 
-    手动触发从 RSS 和 API 采集论文
+    手动触发从 RSS 和 API 采集论文。与定时轮询走同一条采集路径（源状态、熔断、
+    近似去重），已有轮询在进行时返回 409
     """
     try:
         # 计算日期范围
@@ -37,53 +37,26 @@ def trigger_fetch(
             requested_sources = [s.strip() for s in sources.split(",")]
             rss_sources = [s for s in rss_sources if s.get("name") in requested_sources]
 
-        # 执行采集
-        papers = collect_from_all_sources(
+        # 执行采集、入库并写回源状态
+        result = collect_sources_now(
+            rss_sources,
             start_date=start_date,
             end_date=end_date,
-            rss_sources=rss_sources,
             category="evolutionary_biology",
         )
-
-        # 保存到数据库并统计新增数量
-        new_count = 0
-        for paper_data in papers:
-            # 检查是否已存在
-            existing = None
-            if paper_data.get("doi"):
-                existing = crud.get_paper_by_doi(db, paper_data["doi"])
-            elif paper_data.get("url"):
-                from evo_flywheel.db.models import Paper
-
-                existing = db.query(Paper).filter(Paper.url == paper_data["url"]).first()
-
-            if not existing:
-                crud.create_paper(
-                    db,
-                    title=paper_data.get("title", ""),
-                    doi=paper_data.get("doi"),
-                    authors=paper_data.get("authors", []),
-                    abstract=paper_data.get("abstract"),
-                    url=paper_data.get("url"),
-                    publication_date=paper_data.get("publication_date"),
-                    journal=paper_data.get("journal"),
-                    source=paper_data.get("source"),
-                )
-                new_count += 1
-
-        db.commit()
-
-        return {"total": len(papers), "new": new_count}
     except Exception as e:
-        db.rollback()
         raise HTTPException(status_code=500, detail=f"采集失败: {e!s}")
 
+    if result is None:
+        raise HTTPException(status_code=409, detail="已有采集在进行中")
+    return result
+
 
 @router.get("/status")
 def get_collection_status(db: Session = Depends(get_db)) -> dict[str, Any]:
     """获取采集状态
 
-    返回当前系统采集状态和最近采集时间
+    返回当前系统采集状态、最近采集时间以及各源的健康状况（熔断状态、连续失败次数等）
     """
     from evo_flywheel.db import crud
 
@@ -100,11 +73,16 @@ def get_collection_status(db: Session = Depends(get_db)) -> dict[str, Any]:
     else:
         current_status = "idle"
 
+    # 各源的健康状况
+    sources = crud.get_rss_sources(db)
+
     # 构建返回数据
     result: dict[str, Any] = {
         "status": current_status,
         "last_collection": None,
-        "total_sources": 8,  # 固定值，后续可以从 RSSSource 表获取
+        "total_sources": len(sources),
+        "healthy_sources": sum(1 for s in sources if (s.circuit_state or "closed") == "closed"),
+        "source_health": [_source_health(s) for s in sources],
     }
 
     if latest_log:
@@ -118,3 +96,21 @@ def get_collection_status(db: Session = Depends(get_db)) -> dict[str, Any]:
         }
 
     return result
+
+
+def _isoformat(value: datetime | Column[datetime] | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def _source_health(source: RSSSource) -> dict[str, Any]:
+    """将源记录转换为健康状况字典"""
+    return {
+        "name": source.name,
+        "type": source.source_type,
+        "circuit_state": source.circuit_state or "closed",
+        "consecutive_failures": source.consecutive_failures or 0,
+        "open_until": _isoformat(source.open_until),
+        "last_error": source.last_error,
+        "last_fetch": _isoformat(source.last_fetch),
+        "next_poll_at": _isoformat(source.next_poll_at),
+    }
@@ -0,0 +1,219 @@
+"""原始响应归档模块
+
+把各源返回的原始字节按内容寻址（sha256）gzip 压缩后保存到磁盘，
+并以 JSONL 索引记录每次抓取的源、URL 和抓取时间，供离线重放解析
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import overload
+
+from evo_flywheel.config import get_settings
+from evo_flywheel.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 归档内容类型
+KIND_RSS = "rss"
+KIND_BIORXIV = "biorxiv"
+
+INDEX_FILENAME = "index.jsonl"
+
+_archives: dict[Path, "ResponseArchive"] = {}
+_archives_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class ArchiveEntry:
+    """一次抓取的索引记录"""
+
+    source: str
+    kind: str
+    fetched_at: datetime
+    sha256: str
+    size: int
+    url: str | None = None
+
+    def to_json(self) -> str:
+        """序列化为索引行"""
+        data = asdict(self)
+        data["fetched_at"] = self.fetched_at.isoformat()
+        return json.dumps(data, ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, line: str) -> "ArchiveEntry":
+        """从索引行反序列化"""
+        data = json.loads(line)
+        data["fetched_at"] = datetime.fromisoformat(data["fetched_at"])
+        return cls(**data)
+
+
+class ResponseArchive:
+    """基于文件的原始响应归档
+
+    目录布局::
+
+        <root>/index.jsonl              # 每次抓取一行 ArchiveEntry
+        <root>/objects/ab/abcdef....gz  # 按 sha256 寻址的 gzip 内容
+
+    内容相同的响应（例如未变化的 feed）只保存一份。同一实例可被多个线程共享。
+
+    Example:
+        >>> archive = ResponseArchive("data/raw_archive")
+        >>> entry = archive.store("Nature", b"<rss/>", url="https://www.nature.com/nature.rss")
+        >>> archive.load(entry.sha256)
+        b'<rss/>'
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self.index_path = self.root / INDEX_FILENAME
+        self._lock = threading.Lock()
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest}.gz"
+
+    def store(
+        self,
+        source: str,
+        content: bytes,
+        *,
+        kind: str = KIND_RSS,
+        url: str | None = None,
+        fetched_at: datetime | None = None,
+    ) -> ArchiveEntry:
+        """归档一次抓取的原始内容
+
+        Args:
+            source: 源名称
+            content: 原始响应字节
+            kind: 内容类型（rss / biorxiv）
+            url: 请求 URL
+            fetched_at: 抓取时间，默认当前 UTC 时间
+
+        Returns:
+            ArchiveEntry: 写入索引的记录
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        entry = ArchiveEntry(
+            source=source,
+            kind=kind,
+            fetched_at=fetched_at or datetime.now(UTC),
+            sha256=digest,
+            size=len(content),
+            url=url,
+        )
+
+        path = self._object_path(digest)
+        # 在锁外压缩，已有的内容不再压缩
+        compressed = None if path.exists() else gzip.compress(content, compresslevel=6)
+        with self._lock:
+            if compressed is not None and not path.exists():
+                # 临时文件 + 原子替换，中断不会留下半写的对象
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(".tmp")
+                tmp_path.write_bytes(compressed)
+                os.replace(tmp_path, path)
+
+            with open(self.index_path, "a", encoding="utf-8") as f:
+                f.write(entry.to_json() + "\n")
+
+        return entry
+
+    def load(self, digest: str) -> bytes:
+        """读取归档内容
+
+        Args:
+            digest: 内容的 sha256
+
+        Returns:
+            bytes: 原始响应字节
+
+        Raises:
+            FileNotFoundError: 内容不存在
+        """
+        return gzip.decompress(self._object_path(digest).read_bytes())
+
+    def entries(
+        self,
+        *,
+        source: str | None = None,
+        kind: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> Iterator[ArchiveEntry]:
+        """按抓取顺序遍历索引记录
+
+        Args:
+            source: 只返回该源的记录
+            kind: 只返回该类型的记录
+            since: 只返回不早于该时间抓取的记录
+            until: 只返回不晚于该时间抓取的记录
+
+        Yields:
+            ArchiveEntry: 索引记录
+        """
+        if not self.index_path.exists():
+            return
+
+        since = _as_utc(since)
+        until = _as_utc(until)
+        with open(self.index_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = ArchiveEntry.from_json(line)
+                except (ValueError, TypeError, KeyError) as e:
+                    logger.warning(f"Skipping unreadable archive index line: {e}")
+                    continue
+
+                if source is not None and entry.source != source:
+                    continue
+                if kind is not None and entry.kind != kind:
+                    continue
+                fetched_at = _as_utc(entry.fetched_at)
+                if since is not None and fetched_at < since:
+                    continue
+                if until is not None and fetched_at > until:
+                    continue
+                yield entry
+
+
+@overload
+def _as_utc(value: datetime) -> datetime: ...
+@overload
+def _as_utc(value: None) -> None: ...
+@overload
+def _as_utc(value: datetime | None) -> datetime | None: ...
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=UTC)
+
+
+def get_response_archive() -> ResponseArchive | None:
+    """获取配置的响应归档（同一目录共享一个实例）
+
+    Returns:
+        ResponseArchive | None: 未配置 ``settings.collection_archive_dir`` 时返回 None
+    """
+    archive_dir = get_settings().collection_archive_dir
+    if not archive_dir:
+        return None
+
+    root = Path(archive_dir).resolve()
+    with _archives_lock:
+        archive = _archives.get(root)
+        if archive is None:
+            archive = _archives[root] = ResponseArchive(root)
+    return archive
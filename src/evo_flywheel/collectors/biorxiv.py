@@ -1,26 +1,92 @@
 """bioRxiv API 采集器模块
 
-通过 bioRxiv 官方 API 获取预印本论文
+通过 bioRxiv 官方 API 获取预印本论文。同一 API 也提供 medRxiv 数据，
+多个 (服务器, 分类) 目标可以共享线程池和限速并发抓取
 """
 
-from datetime import datetime
+import json
+import queue
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from typing import Any
+from urllib.parse import urlsplit
 
-import requests
-
+from evo_flywheel.collectors.archive import KIND_BIORXIV, ResponseArchive, get_response_archive
+from evo_flywheel.collectors.checkpoint import CursorCheckpointStore
+from evo_flywheel.collectors.http import RateLimiter, get_rate_limiter, http_get
+from evo_flywheel.collectors.record import PaperData, PaperRecord
+from evo_flywheel.config import get_settings
 from evo_flywheel.logging import get_logger
 
 logger = get_logger(__name__)
 
-# bioRxiv API 基础 URL
-BIORXIV_API_BASE = "https://api.biorxiv.org/details/biorxiv"
+# 预印本 API 基础 URL（后接服务器名，如 /biorxiv、/medrxiv）
+API_BASE_URL = "https://api.biorxiv.org/details"
+DEFAULT_SERVER = "biorxiv"
 DEFAULT_CATEGORY = "evolutionary_biology"
 
+# bioRxiv 在归档和论文 source 字段中的源名称
+BIORXIV_SOURCE = "bioRxiv"
+
+# 各服务器在归档和论文 source 字段中的源名称
+SERVER_SOURCES = {"biorxiv": BIORXIV_SOURCE, "medrxiv": "medRxiv"}
+PREPRINT_SOURCES = frozenset(SERVER_SOURCES.values())
+
+# bioRxiv API 每页固定返回 100 条
+PAGE_SIZE = 100
+
+# 并发回填中工作线程完成一个窗口的标记
+_WINDOW_DONE = object()
+
+
+@dataclass(frozen=True)
+class PreprintTarget:
+    """一个预印本采集目标（服务器 + 分类）"""
+
+    server: str = DEFAULT_SERVER
+    category: str = DEFAULT_CATEGORY
+
+    def __post_init__(self) -> None:
+        if self.server not in SERVER_SOURCES:
+            raise ValueError(f"Unknown preprint server: {self.server!r}")
+
+    @classmethod
+    def parse(cls, spec: str) -> "PreprintTarget":
+        """从 ``server:category`` 或 ``category`` 形式的字符串创建目标
+
+        Args:
+            spec: 目标描述，例如 ``medrxiv:genetic_and_genomic_medicine``
+
+        Returns:
+            PreprintTarget: 采集目标
+
+        Raises:
+            ValueError: 服务器未知
+        """
+        server, _, category = spec.strip().rpartition(":")
+        return cls(server or DEFAULT_SERVER, category or DEFAULT_CATEGORY)
+
+    @property
+    def source(self) -> str:
+        """论文 source 字段中的源名称"""
+        return SERVER_SOURCES[self.server]
+
+    @property
+    def label(self) -> str:
+        """日志中使用的目标名称"""
+        return f"{self.server}:{self.category}"
+
 
 def build_api_url(
     start_date: datetime,
     end_date: datetime,
     category: str = DEFAULT_CATEGORY,
+    cursor: int = 0,
+    server: str = DEFAULT_SERVER,
 ) -> str:
     """构建 bioRxiv API URL
 
@@ -28,6 +94,8 @@ def build_api_url(
         start_date: 开始日期
         end_date: 结束日期
         category: 论文分类 (默认: evolutionary_biology)
+        cursor: 分页游标（从 0 开始的记录偏移）
+        server: 预印本服务器（biorxiv / medrxiv）
 
     Returns:
         str: 完整的 API URL
@@ -35,7 +103,7 @@ def build_api_url(
     start_str = start_date.strftime("%Y-%m-%d")
     end_str = end_date.strftime("%Y-%m-%d")
 
-    url = f"{BIORXIV_API_BASE}/{start_str}/{end_str}?category={category}"
+    url = f"{API_BASE_URL}/{server}/{start_str}/{end_str}/{cursor}?category={category}"
     logger.debug(f"Built bioRxiv API URL: {url}")
 
     return url
@@ -62,14 +130,17 @@ def parse_biorxiv_date(date_str: str | None) -> str | None:
         return None
 
 
-def parse_biorxiv_paper(paper_data: dict[str, Any]) -> dict[str, Any]:
+def parse_biorxiv_paper(
+    paper_data: dict[str, Any], source: str = BIORXIV_SOURCE
+) -> PaperRecord | dict[str, Any]:
     """解析 bioRxiv 论文数据
 
     Args:
         paper_data: bioRxiv API 返回的论文数据
+        source: 论文 source 字段（medRxiv 论文为 "medRxiv"）
 
     Returns:
-        dict: 解析后的论文数据，无效返回空字典
+        PaperRecord | dict: 解析后的论文记录，无效返回空字典
     """
     # 提取标题（必需字段）
     title = paper_data.get("title", "").strip()
@@ -93,18 +164,192 @@ def parse_biorxiv_paper(paper_data: dict[str, Any]) -> dict[str, Any]:
     date_str = paper_data.get("date")
     publication_date = parse_biorxiv_date(date_str)
 
-    # 构建结果
-    result = {
-        "title": title,
-        "authors": authors,
-        "abstract": abstract,
-        "doi": doi,
-        "url": f"https://doi.org/{doi}" if doi else None,
-        "publication_date": publication_date,
-        "source": "bioRxiv",
-    }
+    return PaperRecord(
+        title=title,
+        authors=authors,
+        abstract=abstract,
+        doi=doi,
+        url=f"https://doi.org/{doi}" if doi else None,
+        publication_date=publication_date,
+        source=source,
+    )
+
+
+def _api_rate_limiter() -> RateLimiter:
+    """预印本 API 的共享限速器（所有服务器、分类和分页共用同一主机配额）"""
+    return get_rate_limiter(
+        urlsplit(API_BASE_URL).netloc, get_settings().biorxiv_requests_per_second
+    )
+
+
+def _fetch_page(
+    url: str,
+    timeout: int,
+    archive: ResponseArchive | None = None,
+    source: str = BIORXIV_SOURCE,
+) -> dict[str, Any]:
+    """请求单页 bioRxiv API 数据，提供 archive 时归档原始响应"""
+    _api_rate_limiter().acquire()
+    try:
+        response = http_get(url, params={"format": "json"}, timeout=timeout)
+        response.raise_for_status()
+    except TimeoutError:
+        logger.error(f"Timeout fetching bioRxiv API: {url}")
+        raise
+    except Exception as e:
+        logger.error(f"Failed to fetch bioRxiv papers: {e}")
+        raise
+
+    if archive is not None:
+        archive.store(source, response.content, kind=KIND_BIORXIV, url=url)
+
+    return response.json()
+
+
+def parse_page_content(content: bytes, source: str = BIORXIV_SOURCE) -> list[PaperData]:
+    """解析一页原始 API 响应为论文列表（用于重放归档）
+
+    Args:
+        content: API 响应的原始 JSON 字节
+        source: 论文 source 字段
+
+    Returns:
+        list[dict]: 解析后的论文列表
+    """
+    return _parse_collection(json.loads(content).get("collection", []), source)
+
+
+def _parse_collection(
+    collection: list[dict[str, Any]],
+    source: str = BIORXIV_SOURCE,
+) -> list[PaperData]:
+    """解析单页论文列表，跳过无效论文"""
+    papers: list[PaperData] = []
+    for paper_data in collection:
+        try:
+            paper = parse_biorxiv_paper(paper_data, source)
+            if paper:  # 跳过无效论文
+                papers.append(paper)
+        except Exception as e:
+            logger.warning(f"Failed to parse paper: {e}")
+            continue
+    return papers
+
+
+def _total_of(data: dict[str, Any]) -> int | None:
+    """从 API 响应的 messages 中读取结果总数"""
+    messages = data.get("messages") or []
+    if not messages:
+        return None
+    try:
+        return int(messages[0].get("total"))
+    except (TypeError, ValueError):
+        return None
+
+
+def window_key(
+    start_date: datetime,
+    end_date: datetime,
+    category: str,
+    server: str = DEFAULT_SERVER,
+) -> str:
+    """生成日期窗口的检查点键
+
+    Args:
+        start_date: 窗口开始日期
+        end_date: 窗口结束日期
+        category: 论文分类
+        server: 预印本服务器（bioRxiv 的键不带服务器前缀，兼容已有检查点）
+
+    Returns:
+        str: 检查点键，例如 ``evolutionary_biology:2024-12-01:2024-12-01``
+    """
+    key = f"{category}:{start_date:%Y-%m-%d}:{end_date:%Y-%m-%d}"
+    return key if server == DEFAULT_SERVER else f"{server}:{key}"
+
+
+def iter_biorxiv_pages(
+    start_date: datetime,
+    end_date: datetime,
+    category: str = DEFAULT_CATEGORY,
+    timeout: int = 60,
+    checkpoint: CursorCheckpointStore | None = None,
+    *,
+    server: str = DEFAULT_SERVER,
+) -> Iterator[list[PaperData]]:
+    """按游标逐页获取 bioRxiv 论文
+
+    bioRxiv API 每页最多返回 100 条，通过 ``messages[0].total`` 判断是否还有后续页。
+    提供 ``checkpoint`` 时从该窗口上次保存的游标继续，每页被消费后保存新游标，
+    窗口全部完成后标记为已完成（已完成的窗口不再请求）。
+    配置了 ``settings.collection_archive_dir`` 时每页原始响应都会归档。
+
+    Args:
+        start_date: 开始日期
+        end_date: 结束日期
+        category: 论文分类
+        timeout: 请求超时时间（秒）
+        checkpoint: 游标检查点存储（可选）
+        server: 预印本服务器（biorxiv / medrxiv）
+
+    Yields:
+        list[dict]: 每页解析后的论文列表
+
+    Raises:
+        Exception: 网络请求失败（已保存的游标不受影响，可从断点恢复）
+    """
+    for page, key, cursor, done in _window_pages(
+        start_date, end_date, category, timeout, checkpoint, server
+    ):
+        yield page
+        # 生成器在调用方处理完本页、请求下一页时才恢复执行，此时保存游标
+        if checkpoint is not None:
+            checkpoint.save(key, cursor, complete=done)
+
+
+def _window_pages(
+    start_date: datetime,
+    end_date: datetime,
+    category: str,
+    timeout: int,
+    checkpoint: CursorCheckpointStore | None,
+    server: str,
+) -> Iterator[tuple[list[PaperData], str, int, bool]]:
+    """逐页获取一个窗口的论文（从检查点的游标继续，但不保存检查点）
+
+    Yields:
+        tuple: (本页论文, 检查点键, 本页之后的游标, 窗口是否完成)
+    """
+    target = PreprintTarget(server, category)
+    key = window_key(start_date, end_date, category, server)
+    cursor = 0
+    archive = get_response_archive()
 
-    return result
+    if checkpoint is not None:
+        state = checkpoint.get(key)
+        if state.complete:
+            logger.debug(f"bioRxiv window {key} already complete, skipping")
+            return
+        cursor = state.cursor
+        if cursor:
+            logger.info(f"Resuming bioRxiv window {key} from cursor {cursor}")
+
+    while True:
+        url = build_api_url(start_date, end_date, category, cursor, server)
+        logger.info(f"Fetching bioRxiv papers from {url}")
+
+        data = _fetch_page(url, timeout, archive, target.source)
+        collection = data.get("collection", [])
+        total = _total_of(data)
+
+        cursor += len(collection)
+        # 没有分页信息（旧响应格式）、空页或已取完时结束
+        done = total is None or not collection or cursor >= total
+
+        yield _parse_collection(collection, target.source), key, cursor, done
+
+        if done:
+            break
 
 
 def fetch_biorxiv_papers(
@@ -112,9 +357,11 @@ def fetch_biorxiv_papers(
     end_date: datetime,
     category: str = DEFAULT_CATEGORY,
     timeout: int = 60,
-) -> list[dict[str, Any]]:
+) -> list[PaperData]:
     """从 bioRxiv API 获取论文列表
 
+    自动翻页，返回日期范围内的全部论文。
+
     Args:
         start_date: 开始日期
         end_date: 结束日期
@@ -128,34 +375,242 @@ def fetch_biorxiv_papers(
         Exception: 网络请求失败
         TimeoutError: 请求超时
     """
-    url = build_api_url(start_date, end_date, category)
+    papers: list[PaperData] = []
+    for page in iter_biorxiv_pages(start_date, end_date, category, timeout):
+        papers.extend(page)
+
+    logger.info(f"Fetched {len(papers)} papers from bioRxiv")
+    return papers
+
+
+def iter_preprint_pages(
+    start_date: datetime,
+    end_date: datetime,
+    targets: Iterable[PreprintTarget],
+    *,
+    timeout: int = 60,
+    max_workers: int | None = None,
+    deadline: float | None = None,
+) -> Iterator[list[PaperData]]:
+    """并发获取多个预印本目标的论文，按页完成顺序产出
+
+    所有目标的首页先并发请求；首页返回结果总数后，该目标剩余的分页立即加入
+    同一个线程池，与其他目标的分页交错抓取。所有请求共享预印本 API 的限速器，
+    因此增加目标主要增加请求数，而不是成倍延长采集时间。
+
+    Args:
+        start_date: 开始日期
+        end_date: 结束日期
+        targets: 采集目标列表
+        timeout: 请求超时时间（秒）
+        max_workers: 并发线程数，默认 ``settings.biorxiv_max_workers``
+        deadline: 整批抓取的截止时间（秒，可选），到期时取消剩余分页
+
+    Yields:
+        list[dict]: 每页解析后的论文列表
+
+    Raises:
+        RuntimeError: 有分页请求失败（其余分页仍会先全部产出）
+        TimeoutError: 超过 ``deadline`` 仍有分页未完成
+    """
+    targets = list(dict.fromkeys(targets))
+    if not targets:
+        return
+
+    archive = get_response_archive()
+    max_workers = max_workers or get_settings().biorxiv_max_workers
+    stop_at = time.monotonic() + deadline if deadline is not None else None
 
-    logger.info(f"Fetching bioRxiv papers from {url}")
+    def fetch(target: PreprintTarget, cursor: int) -> dict[str, Any]:
+        url = build_api_url(start_date, end_date, target.category, cursor, target.server)
+        logger.debug(f"Fetching {target.label} papers from {url}")
+        return _fetch_page(url, timeout, archive, target.source)
 
+    errors: list[Exception] = []
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="preprint")
     try:
-        response = requests.get(url, params={"format": "json"}, timeout=timeout)
-        response.raise_for_status()
-    except TimeoutError:
-        logger.error(f"Timeout fetching bioRxiv API: {url}")
-        raise
-    except Exception as e:
-        logger.error(f"Failed to fetch bioRxiv papers: {e}")
-        raise
+        pending: dict[Future[dict[str, Any]], tuple[PreprintTarget, int]] = {
+            executor.submit(fetch, target, 0): (target, 0) for target in targets
+        }
+        while pending:
+            remaining = stop_at - time.monotonic() if stop_at is not None else None
+            done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            if not done:
+                logger.error(f"Deadline of {deadline}s exceeded with {len(pending)} pages pending")
+                raise TimeoutError(f"Global deadline of {deadline}s exceeded")
+            for future in done:
+                target, cursor = pending.pop(future)
+                try:
+                    data = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to fetch {target.label} page at cursor {cursor}: {e}")
+                    errors.append(e)
+                    continue
+
+                collection = data.get("collection", [])
+                total = _total_of(data)
+                # 首页确定分页：按首页条数（API 固定每页 100 条）提交剩余游标
+                if cursor == 0 and collection and total is not None:
+                    for next_cursor in range(len(collection), total, len(collection)):
+                        next_future = executor.submit(fetch, target, next_cursor)
+                        pending[next_future] = (target, next_cursor)
+                    logger.info(f"{target.label}: {total} papers in {start_date} to {end_date}")
+
+                yield _parse_collection(collection, target.source)
+    finally:
+        # 截止或调用方提前退出时不等待进行中的请求
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if errors:
+        raise RuntimeError(f"{len(errors)} preprint API page(s) failed") from errors[0]
+
+
+def fetch_preprint_papers(
+    start_date: datetime,
+    end_date: datetime,
+    targets: Iterable[PreprintTarget],
+    *,
+    timeout: int = 60,
+    max_workers: int | None = None,
+    deadline: float | None = None,
+) -> list[PaperData]:
+    """并发获取多个预印本目标的全部论文（见 iter_preprint_pages）
+
+    Args:
+        start_date: 开始日期
+        end_date: 结束日期
+        targets: 采集目标列表
+        timeout: 请求超时时间（秒）
+        max_workers: 并发线程数，默认 ``settings.biorxiv_max_workers``
+        deadline: 整批抓取的截止时间（秒，可选）
 
-    data = response.json()
+    Returns:
+        list[dict]: 解析后的论文列表（未去重）
 
-    # 解析论文列表
-    papers = []
-    collection = data.get("collection", [])
+    Raises:
+        RuntimeError: 有分页请求失败
+        TimeoutError: 超过截止时间仍有分页未完成
+    """
+    papers: list[PaperData] = []
+    for page in iter_preprint_pages(
+        start_date, end_date, targets, timeout=timeout, max_workers=max_workers, deadline=deadline
+    ):
+        papers.extend(page)
 
-    for paper_data in collection:
+    logger.info(f"Fetched {len(papers)} preprints")
+    return papers
+
+
+def split_date_windows(
+    start_date: datetime,
+    end_date: datetime,
+    window_days: int = 1,
+) -> list[tuple[datetime, datetime]]:
+    """将日期范围切分为连续的窗口（包含首尾日期）
+
+    Args:
+        start_date: 开始日期
+        end_date: 结束日期
+        window_days: 每个窗口的天数
+
+    Returns:
+        list[tuple]: (窗口开始, 窗口结束) 列表
+    """
+    windows = []
+    current = start_date
+    step = timedelta(days=max(window_days, 1))
+    while current <= end_date:
+        window_end = min(current + step - timedelta(days=1), end_date)
+        windows.append((current, window_end))
+        current = window_end + timedelta(days=1)
+    return windows
+
+
+def backfill_biorxiv(
+    start_date: datetime,
+    end_date: datetime,
+    category: str = DEFAULT_CATEGORY,
+    *,
+    window_days: int = 1,
+    checkpoint: CursorCheckpointStore | None = None,
+    max_workers: int = 1,
+    timeout: int = 60,
+    server: str = DEFAULT_SERVER,
+) -> Iterator[list[PaperData]]:
+    """按日期窗口回填 bioRxiv 论文，可断点恢复
+
+    日期范围被切分为多个窗口，每个窗口独立翻页并记录游标检查点。
+    中断后再次调用时，已完成的窗口被跳过，未完成的窗口从保存的游标继续。
+
+    Args:
+        start_date: 开始日期
+        end_date: 结束日期
+        category: 论文分类
+        window_days: 每个窗口的天数
+        checkpoint: 游标检查点存储（可选）
+        max_workers: 并发抓取的窗口数，1 表示顺序抓取
+        timeout: 请求超时时间（秒）
+        server: 预印本服务器（biorxiv / medrxiv）
+
+    Yields:
+        list[dict]: 每页解析后的论文列表（并发模式下各窗口的页交错产出）
+
+    Raises:
+        Exception: 某个窗口的请求失败（回填停止，各窗口已处理的页的游标已保存）
+    """
+    windows = split_date_windows(start_date, end_date, window_days)
+    logger.info(f"Backfilling {server} {category}: {len(windows)} windows")
+
+    def _pages(window: tuple[datetime, datetime]) -> Iterator[list[PaperData]]:
+        return iter_biorxiv_pages(
+            window[0], window[1], category, timeout, checkpoint, server=server
+        )
+
+    if max_workers <= 1:
+        for window in windows:
+            yield from _pages(window)
+        return
+
+    # 工作线程抓取的页经有界队列交给调用方，调用方处理完一页后才保存该页的游标，
+    # 写库失败或进程中断时未处理的页不会被标记为已完成
+    page_queue: queue.Queue[Any] = queue.Queue(maxsize=max_workers * 2)
+    stop = threading.Event()
+
+    def _put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                page_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run_window(window: tuple[datetime, datetime]) -> None:
         try:
-            paper = parse_biorxiv_paper(paper_data)
-            if paper:  # 跳过无效论文
-                papers.append(paper)
+            for item in _window_pages(window[0], window[1], category, timeout, checkpoint, server):
+                if not _put(item):
+                    return
+            _put(_WINDOW_DONE)
         except Exception as e:
-            logger.warning(f"Failed to parse paper: {e}")
-            continue
+            _put(e)
 
-    logger.info(f"Fetched {len(papers)} papers from bioRxiv")
-    return papers
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="biorxiv")
+    try:
+        for window in windows:
+            executor.submit(_run_window, window)
+        remaining = len(windows)
+        while remaining:
+            item = page_queue.get()
+            if item is _WINDOW_DONE:
+                remaining -= 1
+                continue
+            if isinstance(item, Exception):
+                raise item
+            page, key, cursor, done = item
+            yield page
+            if checkpoint is not None:
+                checkpoint.save(key, cursor, complete=done)
+    finally:
+        # 失败或调用方提前退出时通知工作线程停止，不再启动排队的窗口
+        stop.set()
+        executor.shutdown(wait=True, cancel_futures=True)
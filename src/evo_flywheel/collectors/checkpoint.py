@@ -0,0 +1,108 @@
+"""采集游标检查点模块
+
+以 JSON 文件持久化分页游标，支持中断后的断点续采
+"""
+
+import json
+import os
+import threading
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from evo_flywheel.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CursorState:
+    """单个窗口的游标状态"""
+
+    cursor: int = 0
+    complete: bool = False
+
+
+class CursorCheckpointStore:
+    """基于 JSON 文件的游标检查点存储
+
+    每次保存都以临时文件 + 原子替换的方式写盘，进程中断不会留下半写的文件。
+    同一实例可被多个线程共享。
+
+    Example:
+        >>> store = CursorCheckpointStore("data/biorxiv_checkpoints.json")
+        >>> store.save("evolutionary_biology:2024-12-01:2024-12-01", 200)
+        >>> store.get("evolutionary_biology:2024-12-01:2024-12-01").cursor
+        200
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._windows: dict[str, dict[str, Any]] = self._load()
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """从磁盘读取检查点，文件不存在或损坏时返回空"""
+        if not self.path.exists():
+            return {}
+
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            return dict(data.get("windows", {}))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable checkpoint file {self.path}: {e}")
+            return {}
+
+    def _flush(self) -> None:
+        """原子写入检查点文件（调用方需持有锁）"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"windows": self._windows}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def get(self, key: str) -> CursorState:
+        """获取窗口的游标状态
+
+        Args:
+            key: 窗口键
+
+        Returns:
+            CursorState: 游标状态，未记录过的窗口返回初始状态
+        """
+        with self._lock:
+            entry = self._windows.get(key)
+        if entry is None:
+            return CursorState()
+        return CursorState(cursor=int(entry.get("cursor", 0)), complete=bool(entry.get("complete")))
+
+    def save(self, key: str, cursor: int, complete: bool = False) -> None:
+        """保存窗口的游标状态
+
+        Args:
+            key: 窗口键
+            cursor: 下一次请求应使用的游标
+            complete: 窗口是否已全部取完
+        """
+        with self._lock:
+            self._windows[key] = {
+                "cursor": cursor,
+                "complete": complete,
+                "updated_at": datetime.now(UTC).isoformat(),
+            }
+            self._flush()
+
+    def reset(self, key: str | None = None) -> None:
+        """清除检查点
+
+        Args:
+            key: 要清除的窗口键，None 表示清除全部
+        """
+        with self._lock:
+            if key is None:
+                self._windows.clear()
+            else:
+                self._windows.pop(key, None)
+            self._flush()
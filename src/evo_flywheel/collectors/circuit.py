@@ -0,0 +1,135 @@
+"""采集源熔断器模块
+
+为每个源维护熔断状态（状态保存在源配置字典中，由调用方持久化到 RSSSource 表）：
+
+- closed: 正常抓取，记录连续失败次数
+- open: 连续失败达到阈值后打开，冷却期内直接跳过，不再为坏源等待超时
+- half_open: 冷却期结束后放行一次试探请求，成功则关闭，失败则以翻倍的冷却时间重新打开
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from evo_flywheel.config import get_settings
+from evo_flywheel.logging import get_logger
+
+logger = get_logger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# last_error 的最大保存长度
+MAX_ERROR_LENGTH = 500
+
+
+@dataclass(frozen=True)
+class CircuitPolicy:
+    """熔断策略
+
+    第 n 次打开（n 从 0 开始，按超过阈值的失败次数计）的冷却时间为
+    ``min(cooldown_max, cooldown_base * 2**n)``。
+    """
+
+    failure_threshold: int = 3
+    cooldown_base: timedelta = timedelta(minutes=30)
+    cooldown_max: timedelta = timedelta(hours=24)
+
+    @classmethod
+    def from_settings(cls) -> "CircuitPolicy":
+        """从配置创建熔断策略"""
+        settings = get_settings()
+        return cls(
+            failure_threshold=settings.circuit_failure_threshold,
+            cooldown_base=timedelta(minutes=settings.circuit_cooldown_minutes),
+            cooldown_max=timedelta(hours=settings.circuit_cooldown_max_hours),
+        )
+
+    def cooldown(self, failures: int) -> timedelta:
+        """计算连续失败 failures 次后的冷却时间"""
+        exponent = max(0, failures - self.failure_threshold)
+        # 指数上限避免大失败次数时溢出
+        return min(self.cooldown_max, self.cooldown_base * (1 << min(exponent, 32)))
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=UTC)
+
+
+def circuit_state(source: Mapping[str, Any]) -> str:
+    """返回源的熔断状态（未记录过的源为 closed）"""
+    return source.get("circuit_state") or CLOSED
+
+
+def allow_request(source: dict[str, Any], now: datetime | None = None) -> bool:
+    """判断是否允许抓取该源
+
+    打开状态的源冷却期结束后转为半开，放行一次试探请求。
+
+    Args:
+        source: 源配置字典（可能原地更新 circuit_state）
+        now: 当前时间，默认当前 UTC 时间
+
+    Returns:
+        bool: 允许抓取返回 True
+    """
+    if circuit_state(source) != OPEN:
+        return True
+
+    now = now or datetime.now(UTC)
+    open_until = _as_utc(source.get("open_until"))
+    if open_until is not None and open_until > now:
+        return False
+
+    source["circuit_state"] = HALF_OPEN
+    logger.info(f"Circuit for {source.get('name', 'Unknown')} half-open, sending trial request")
+    return True
+
+
+def record_success(source: dict[str, Any]) -> None:
+    """记录一次成功抓取（含 304），关闭熔断器
+
+    Args:
+        source: 源配置字典（原地更新）
+    """
+    if circuit_state(source) != CLOSED:
+        logger.info(f"Circuit for {source.get('name', 'Unknown')} closed, source recovered")
+    source["circuit_state"] = CLOSED
+    source["consecutive_failures"] = 0
+    source["open_until"] = None
+    source["last_error"] = None
+
+
+def record_failure(
+    source: dict[str, Any],
+    error: BaseException | str,
+    now: datetime | None = None,
+    policy: CircuitPolicy | None = None,
+) -> None:
+    """记录一次失败，连续失败达到阈值或半开试探失败时打开熔断器
+
+    Args:
+        source: 源配置字典（原地更新）
+        error: 失败原因
+        now: 当前时间，默认当前 UTC 时间
+        policy: 熔断策略，默认从配置读取
+    """
+    policy = policy or CircuitPolicy.from_settings()
+    now = now or datetime.now(UTC)
+    failures = (source.get("consecutive_failures") or 0) + 1
+
+    source["consecutive_failures"] = failures
+    source["last_error"] = (str(error) or type(error).__name__)[:MAX_ERROR_LENGTH]
+
+    if circuit_state(source) == HALF_OPEN or failures >= policy.failure_threshold:
+        cooldown = policy.cooldown(failures)
+        source["circuit_state"] = OPEN
+        source["open_until"] = now + cooldown
+        logger.warning(
+            f"Circuit for {source.get('name', 'Unknown')} opened after {failures} "
+            f"consecutive failures, retrying after {cooldown}"
+        )
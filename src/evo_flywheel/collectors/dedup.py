@@ -1,57 +1,24 @@
 """数据去重模块
 
-基于 DOI 和标题的论文去重逻辑
+基于 DOI 和标题的论文去重逻辑，以及基于 MinHash/LSH 的近似重复检测
 """
 
+import hashlib
+import random
 import re
-import unicodedata
-from typing import Any
+import zlib
+from array import array
+from collections.abc import Iterable
+from typing import Protocol
 
+from evo_flywheel.collectors.record import PaperData
+from evo_flywheel.collectors.textnorm import normalize_title
 from evo_flywheel.logging import get_logger
 
 logger = get_logger(__name__)
 
 
-def normalize_title(title: str) -> str:
-    """规范化标题用于去重
-
-    Args:
-        title: 原始标题
-
-    Returns:
-        str: 规范化后的标题
-    """
-    # 替换 Unicode 分数字符 (先处理)
-    unicode_fractions = {
-        "½": "1/2",
-        "⅓": "1/3",
-        "⅔": "2/3",
-        "¼": "1/4",
-        "¾": "3/4",
-        "⅕": "1/5",
-        "⅛": "1/8",
-        "⅜": "3/8",
-        "⅝": "5/8",
-        "⅞": "7/8",
-    }
-    for unicode_char, replacement in unicode_fractions.items():
-        title = title.replace(unicode_char, replacement)
-
-    # 转换为小写
-    title = title.lower()
-    # Unicode 规范化 (NFKD 分解组合字符)
-    title = unicodedata.normalize("NFKD", title)
-    # 移除变音符号
-    title = "".join(c for c in title if not unicodedata.combining(c))
-    # 压缩空白字符
-    title = re.sub(r"\s+", " ", title)
-    # 去除首尾空白
-    title = title.strip()
-
-    return title
-
-
-def extract_paper_key(paper: dict[str, Any]) -> str | None:
+def extract_paper_key(paper: PaperData) -> str | None:
     """提取论文唯一键
 
     优先使用 DOI，其次使用规范化后的标题
@@ -82,7 +49,7 @@ def extract_paper_key(paper: dict[str, Any]) -> str | None:
     return None
 
 
-def is_duplicate_paper(paper: dict[str, Any], existing_keys: set[str]) -> bool:
+def is_duplicate_paper(paper: PaperData, existing_keys: set[str]) -> bool:
     """判断论文是否重复
 
     Args:
@@ -100,7 +67,7 @@ def is_duplicate_paper(paper: dict[str, Any], existing_keys: set[str]) -> bool:
     return key in existing_keys
 
 
-def remove_duplicate_papers(papers: list[dict[str, Any]]) -> list[dict[str, Any]]:
+def remove_duplicate_papers(papers: list[PaperData]) -> list[PaperData]:
     """移除重复论文
 
     保留第一次出现的论文，后续重复的将被移除
@@ -111,7 +78,7 @@ def remove_duplicate_papers(papers: list[dict[str, Any]]) -> list[dict[str, Any]
     Returns:
         list[dict]: 去重后的论文列表
     """
-    result: list[dict[str, Any]] = []
+    result: list[PaperData] = []
     seen_keys: set[str] = set()
 
     for paper in papers:
@@ -135,3 +102,420 @@ def remove_duplicate_papers(papers: list[dict[str, Any]]) -> list[dict[str, Any]
         logger.info(f"Removed {removed_count} duplicate papers")
 
     return result
+
+
+class KeyIndex(Protocol):
+    """跨运行的论文键索引（已入库论文的键集合）"""
+
+    def contains_many(self, keys: set[str]) -> set[str]:
+        """返回其中已入库的键"""
+        ...
+
+
+def remove_known_papers(
+    papers: list[PaperData],
+    key_index: KeyIndex,
+) -> list[PaperData]:
+    """移除键已在索引中的论文（已入库的论文）
+
+    Args:
+        papers: 论文列表
+        key_index: 论文键索引
+
+    Returns:
+        list[dict]: 未入库的论文列表
+    """
+    if not papers:
+        return papers
+
+    keys = [extract_paper_key(paper) for paper in papers]
+    known = key_index.contains_many({key for key in keys if key is not None})
+    result = [paper for paper, key in zip(papers, keys, strict=True) if key not in known]
+
+    removed_count = len(papers) - len(result)
+    if removed_count > 0:
+        logger.info(f"Removed {removed_count} already stored papers")
+
+    return result
+
+
+# ============================================================================
+# MinHash / LSH 近似去重
+# ============================================================================
+
+# 默认参数：128 个置换分成 16 个 band，每个 band 8 行，
+# Jaccard 相似度 0.8 的论文对约 95% 概率成为候选，0.5 的约 6%
+DEFAULT_NUM_PERM = 128
+DEFAULT_BANDS = 16
+DEFAULT_SHINGLE_SIZE = 4
+DEFAULT_SIMILARITY_THRESHOLD = 0.8
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_NON_ALNUM_RE = re.compile(r"[^0-9a-z]+")
+
+Signature = tuple[int, ...]
+
+
+def paper_shingles(
+    paper: PaperData,
+    shingle_size: int = DEFAULT_SHINGLE_SIZE,
+    abstract_tokens: int = 0,
+) -> set[str]:
+    """提取论文的 shingle 集合
+
+    规范化标题（去除标点）的字符 k-gram，可选加入摘要前 N 个词
+
+    Args:
+        paper: 论文数据字典
+        shingle_size: 字符 k-gram 长度
+        abstract_tokens: 加入的摘要词数，0 表示不使用摘要
+
+    Returns:
+        set[str]: shingle 集合，标题为空时返回空集合
+    """
+    title = str(paper.get("title") or "").strip()
+    text = _NON_ALNUM_RE.sub(" ", normalize_title(title)).strip() if title else ""
+
+    shingles: set[str] = set()
+    if text:
+        if len(text) <= shingle_size:
+            shingles.add(text)
+        else:
+            shingles.update(text[i : i + shingle_size] for i in range(len(text) - shingle_size + 1))
+
+    if abstract_tokens > 0 and paper.get("abstract"):
+        abstract = _NON_ALNUM_RE.sub(" ", normalize_title(str(paper["abstract"])))
+        shingles.update(f"w:{token}" for token in abstract.split()[:abstract_tokens])
+
+    return shingles
+
+
+class MinHasher:
+    """MinHash 签名计算器
+
+    同样的 num_perm 和 seed 在不同进程中产生相同的签名，可以持久化比较。
+    """
+
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, seed: int = 1) -> None:
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._perms = [
+            (rng.randint(1, _MERSENNE_PRIME - 1), rng.randint(0, _MERSENNE_PRIME - 1))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, shingles: set[str]) -> Signature:
+        """计算 shingle 集合的 MinHash 签名
+
+        Args:
+            shingles: shingle 集合
+
+        Returns:
+            Signature: 长度为 num_perm 的签名
+        """
+        if not shingles:
+            return (_MAX_HASH,) * self.num_perm
+
+        hashes = [zlib.crc32(s.encode("utf-8")) for s in shingles]
+        return tuple(
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes) for a, b in self._perms
+        )
+
+
+def estimate_similarity(left: Signature, right: Signature) -> float:
+    """由两个签名估计 Jaccard 相似度
+
+    Args:
+        left: 签名
+        right: 签名
+
+    Returns:
+        float: 估计的 Jaccard 相似度（0-1）
+    """
+    if not left or len(left) != len(right):
+        return 0.0
+    return sum(1 for a, b in zip(left, right, strict=True) if a == b) / len(left)
+
+
+def encode_signature(signature: Signature) -> bytes:
+    """将签名编码为字节（用于持久化）"""
+    return array("Q", signature).tobytes()
+
+
+def decode_signature(data: bytes) -> Signature:
+    """将字节解码为签名"""
+    values = array("Q")
+    values.frombytes(data)
+    return tuple(values)
+
+
+class LSHStore(Protocol):
+    """LSH 索引的存储后端"""
+
+    def candidates(self, bucket_keys: list[str]) -> set[str]:
+        """返回落在任一桶中的论文键"""
+        ...
+
+    def signatures(self, keys: set[str]) -> dict[str, Signature]:
+        """返回论文键对应的签名"""
+        ...
+
+    def add(self, key: str, signature: Signature, bucket_keys: list[str]) -> None:
+        """写入论文签名及其所在的桶（键已存在时忽略）"""
+        ...
+
+    def bucket_members(self, bucket_keys: list[str]) -> dict[str, set[str]]:
+        """返回每个桶中的论文键（一批论文的全部桶一次查询）"""
+        ...
+
+    def add_many(self, entries: list[tuple[str, Signature, list[str]]]) -> None:
+        """批量写入 (论文键, 签名, 桶) （键已存在时忽略）"""
+        ...
+
+
+class MemoryLSHStore:
+    """内存 LSH 存储（单次运行内去重，或无数据库时使用）"""
+
+    def __init__(self) -> None:
+        self._signatures: dict[str, Signature] = {}
+        self._buckets: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def candidates(self, bucket_keys: list[str]) -> set[str]:
+        result: set[str] = set()
+        for bucket_key in bucket_keys:
+            result.update(self._buckets.get(bucket_key, ()))
+        return result
+
+    def signatures(self, keys: set[str]) -> dict[str, Signature]:
+        return {key: self._signatures[key] for key in keys if key in self._signatures}
+
+    def add(self, key: str, signature: Signature, bucket_keys: list[str]) -> None:
+        if key in self._signatures:
+            return
+        self._signatures[key] = signature
+        for bucket_key in bucket_keys:
+            self._buckets.setdefault(bucket_key, set()).add(key)
+
+    def bucket_members(self, bucket_keys: list[str]) -> dict[str, set[str]]:
+        return {key: set(self._buckets[key]) for key in bucket_keys if key in self._buckets}
+
+    def add_many(self, entries: list[tuple[str, Signature, list[str]]]) -> None:
+        for key, signature, bucket_keys in entries:
+            self.add(key, signature, bucket_keys)
+
+
+class LSHIndex:
+    """基于 MinHash + LSH 的近似重复论文索引
+
+    签名按 band 切分并哈希到桶中，查询只比较同桶候选，
+    耗时与语料总量无关；存储后端可替换为数据库以跨批次、跨运行增量更新。
+
+    Example:
+        >>> index = LSHIndex()
+        >>> index.add({"title": "Rapid evolution of beak size in Darwin's finches"})
+        >>> print(index.find_duplicate({"title": "Rapid evolution of beak size in Darwins finches."}))
+        title:rapid evolution of beak size in darwin's finches
+    """
+
+    def __init__(
+        self,
+        store: LSHStore | None = None,
+        *,
+        num_perm: int = DEFAULT_NUM_PERM,
+        bands: int = DEFAULT_BANDS,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        shingle_size: int = DEFAULT_SHINGLE_SIZE,
+        abstract_tokens: int = 0,
+    ) -> None:
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+
+        self.store: LSHStore = store if store is not None else MemoryLSHStore()
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.abstract_tokens = abstract_tokens
+        self._hasher = MinHasher(num_perm)
+
+    def signature(self, paper: PaperData) -> Signature:
+        """计算论文的 MinHash 签名"""
+        return self._hasher.signature(
+            paper_shingles(paper, self.shingle_size, self.abstract_tokens)
+        )
+
+    def bucket_keys(self, signature: Signature) -> list[str]:
+        """计算签名所在的 LSH 桶（格式: "band:hash"）"""
+        keys = []
+        for band in range(self.bands):
+            chunk = signature[band * self.rows : (band + 1) * self.rows]
+            digest = hashlib.blake2b(array("Q", chunk).tobytes(), digest_size=8).hexdigest()
+            keys.append(f"{band}:{digest}")
+        return keys
+
+    def _indexable_signature(self, paper: PaperData) -> Signature | None:
+        """计算论文签名，没有可用 shingle（标题为空）时返回 None"""
+        shingles = paper_shingles(paper, self.shingle_size, self.abstract_tokens)
+        return self._hasher.signature(shingles) if shingles else None
+
+    def query(
+        self, paper: PaperData, signature: Signature | None = None
+    ) -> list[tuple[str, float]]:
+        """查找与论文近似重复的已索引论文
+
+        Args:
+            paper: 论文数据字典
+            signature: 预先计算的签名，None 时现场计算
+
+        Returns:
+            list[tuple[str, float]]: (论文键, 估计相似度)，按相似度降序；
+                论文自身的键不计入
+        """
+        if signature is None:
+            signature = self._indexable_signature(paper)
+            if signature is None:
+                return []
+
+        own_key = extract_paper_key(paper)
+        candidates = self.store.candidates(self.bucket_keys(signature))
+        candidates.discard(own_key)  # type: ignore[arg-type]
+        if not candidates:
+            return []
+
+        matches = [
+            (key, similarity)
+            for key, stored in self.store.signatures(candidates).items()
+            if (similarity := estimate_similarity(signature, stored)) >= self.threshold
+        ]
+        return sorted(matches, key=lambda match: match[1], reverse=True)
+
+    def find_duplicate(self, paper: PaperData, signature: Signature | None = None) -> str | None:
+        """返回最相似的近似重复论文键，没有则返回 None"""
+        matches = self.query(paper, signature)
+        return matches[0][0] if matches else None
+
+    def add(self, paper: PaperData, signature: Signature | None = None) -> None:
+        """将论文加入索引（已存在的键忽略）
+
+        Args:
+            paper: 论文数据字典
+            signature: 预先计算的签名，None 时现场计算
+        """
+        key = extract_paper_key(paper)
+        if key is None:
+            return
+
+        if signature is None:
+            signature = self._indexable_signature(paper)
+            if signature is None:
+                return
+        self.store.add(key, signature, self.bucket_keys(signature))
+
+    def add_all(self, papers: Iterable[PaperData]) -> None:
+        """将一批论文加入索引，一次写入存储（已存在的键忽略）
+
+        Args:
+            papers: 论文数据字典
+        """
+        entries = []
+        for paper in papers:
+            key = extract_paper_key(paper)
+            signature = self._indexable_signature(paper) if key is not None else None
+            if signature is not None:
+                entries.append((key, signature, self.bucket_keys(signature)))
+        if entries:
+            self.store.add_many(entries)  # type: ignore[arg-type]
+
+    def filter_new(self, papers: list[PaperData]) -> list[PaperData]:
+        """移除一批论文中与索引或本批先出现的论文近似重复的论文，保留的论文加入索引
+
+        整批的桶和候选签名各查询一次存储，保留的论文一次写入，
+        存储访问次数与批大小无关。
+
+        Args:
+            papers: 论文列表
+
+        Returns:
+            list[dict]: 保留的论文（保持原顺序）
+        """
+        prepared = []
+        for paper in papers:
+            # 签名只计算一次，查询和入库共用
+            signature = self._indexable_signature(paper)
+            buckets = self.bucket_keys(signature) if signature is not None else []
+            prepared.append((paper, signature, buckets))
+
+        # 存储中的桶成员和签名，本批保留的论文随后加入，使批内也能互相去重
+        members = self.store.bucket_members(
+            list(dict.fromkeys(bucket for _, _, buckets in prepared for bucket in buckets))
+        )
+        known = self.store.signatures(set().union(*members.values()))
+
+        result: list[PaperData] = []
+        entries: list[tuple[str, Signature, list[str]]] = []
+        for paper, signature, buckets in prepared:
+            if signature is None:
+                result.append(paper)
+                continue
+
+            own_key = extract_paper_key(paper)
+            candidates = {key for bucket in buckets for key in members.get(bucket, ())}
+            candidates.discard(own_key)  # type: ignore[arg-type]
+            matches = [
+                (similarity, key)
+                for key in candidates
+                if key in known
+                and (similarity := estimate_similarity(signature, known[key])) >= self.threshold
+            ]
+            if matches:
+                logger.debug(
+                    f"Near-duplicate paper found: {paper.get('title')!r} ~ {max(matches)[1]}"
+                )
+                continue
+
+            result.append(paper)
+            if own_key is not None and own_key not in known:
+                known[own_key] = signature
+                for bucket in buckets:
+                    members.setdefault(bucket, set()).add(own_key)
+                entries.append((own_key, signature, buckets))
+
+        if entries:
+            self.store.add_many(entries)
+        return result
+
+
+def remove_near_duplicate_papers(
+    papers: list[PaperData],
+    index: LSHIndex | None = None,
+    *,
+    chunk_size: int = 500,
+) -> list[PaperData]:
+    """移除近似重复论文
+
+    与索引中已有论文或本批中先出现的论文近似重复的论文被移除，
+    保留的论文加入索引。按 ``chunk_size`` 分块，每块对存储只做常数次批量读写。
+
+    Args:
+        papers: 论文列表
+        index: LSH 索引，None 时仅在本批内去重
+        chunk_size: 每块的论文数
+
+    Returns:
+        list[dict]: 去重后的论文列表
+    """
+    index = index if index is not None else LSHIndex()
+    result: list[PaperData] = []
+
+    for offset in range(0, len(papers), chunk_size):
+        result.extend(index.filter_new(papers[offset : offset + chunk_size]))
+
+    removed_count = len(papers) - len(result)
+    if removed_count > 0:
+        logger.info(f"Removed {removed_count} near-duplicate papers")
+
+    return result
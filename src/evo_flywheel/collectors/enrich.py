@@ -0,0 +1,309 @@
+"""论文元数据补全模块
+
+对缺少 DOI 或摘要的论文查询 Crossref 兼容接口补全元数据：
+有 DOI 的论文按 ``filter=doi:...`` 分批查询，没有 DOI 的论文按标题检索并校验标题一致。
+查询结果（包括未命中）缓存在本地 SQLite 文件中，后续运行直接命中缓存，
+补全 DOI 后的论文即可按 DOI 精确去重
+"""
+
+import json
+import re
+import sqlite3
+import threading
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import UTC, datetime, timedelta
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+from evo_flywheel.collectors.http import get_rate_limiter, http_get
+from evo_flywheel.collectors.record import PaperData
+from evo_flywheel.collectors.textnorm import html_to_text, normalize_title
+from evo_flywheel.config import get_settings
+from evo_flywheel.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 查询返回的字段
+SELECT_FIELDS = "DOI,title,abstract,author"
+
+# 按标题检索时比较的候选数
+TITLE_SEARCH_ROWS = 3
+
+REQUEST_TIMEOUT = 30.0
+
+_NON_ALNUM_RE = re.compile(r"[^0-9a-z]+")
+
+# Crossref 返回的条目（缓存中以 None 表示查询过但未命中）
+Work = dict[str, Any]
+
+_caches: dict[Path, "EnrichmentCache"] = {}
+_caches_lock = threading.Lock()
+
+
+class EnrichmentCache:
+    """基于 SQLite 文件的查询结果缓存
+
+    命中的结果永久保存；未命中的结果在 ``negative_ttl`` 后过期并重新查询
+    （Crossref 收录新论文有延迟）。同一实例可被多个线程共享。
+
+    Example:
+        >>> cache = EnrichmentCache("data/enrichment_cache.sqlite")
+        >>> cache.put_many({"doi:10.1101/x": None})
+        >>> cache.get_many(["doi:10.1101/x"])
+        {'doi:10.1101/x': None}
+    """
+
+    def __init__(self, path: str | Path, negative_ttl: timedelta = timedelta(days=7)) -> None:
+        self.path = Path(path)
+        self.negative_ttl = negative_ttl
+        if str(path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS lookups "
+                "(key TEXT PRIMARY KEY, work TEXT, fetched_at TEXT NOT NULL)"
+            )
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Work | None]:
+        """读取缓存的查询结果
+
+        Args:
+            keys: 查询键
+
+        Returns:
+            dict: 命中缓存的键 -> 结果（None 表示查询过但未命中）
+        """
+        keys = list(dict.fromkeys(keys))
+        expires = (datetime.now(UTC) - self.negative_ttl).isoformat()
+        result: dict[str, Work | None] = {}
+
+        with self._lock:
+            # 分块查询，避免超过 SQLite 的参数上限
+            for i in range(0, len(keys), 500):
+                chunk = keys[i : i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, work, fetched_at FROM lookups WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for key, work, fetched_at in rows:
+                    if work is None and fetched_at < expires:
+                        continue
+                    result[key] = json.loads(work) if work is not None else None
+        return result
+
+    def put_many(self, results: Mapping[str, Work | None]) -> None:
+        """保存查询结果
+
+        Args:
+            results: 键 -> 结果（None 表示未命中）
+        """
+        if not results:
+            return
+
+        now = datetime.now(UTC).isoformat()
+        rows = [
+            (key, json.dumps(work, ensure_ascii=False) if work is not None else None, now)
+            for key, work in results.items()
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO lookups (key, work, fetched_at) VALUES (?, ?, ?)", rows
+            )
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
+
+
+def get_enrichment_cache() -> EnrichmentCache:
+    """获取配置的查询缓存（同一文件共享一个实例）
+
+    Returns:
+        EnrichmentCache: ``settings.enrichment_cache_path`` 对应的缓存
+    """
+    settings = get_settings()
+    path = Path(settings.enrichment_cache_path).resolve()
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = _caches[path] = EnrichmentCache(
+                path, negative_ttl=timedelta(days=settings.enrichment_negative_ttl_days)
+            )
+    return cache
+
+
+def _match_text(title: str) -> str:
+    """标题的比较形式（规范化并去除标点）"""
+    return _NON_ALNUM_RE.sub(" ", normalize_title(title)).strip()
+
+
+def doi_key(doi: str) -> str:
+    """DOI 查询的缓存键"""
+    return f"doi:{doi.strip().lower()}"
+
+
+def title_key(title: str) -> str:
+    """标题查询的缓存键"""
+    return f"title:{_match_text(title)}"
+
+
+def _fetch_works(params: dict[str, Any]) -> list[Work]:
+    """请求 Crossref 兼容接口的 /works，返回结果列表"""
+    settings = get_settings()
+    api_url = settings.enrichment_api_url.rstrip("/")
+    params = {**params, "select": SELECT_FIELDS}
+    if settings.enrichment_mailto:
+        params["mailto"] = settings.enrichment_mailto
+
+    get_rate_limiter(urlsplit(api_url).netloc, settings.enrichment_requests_per_second).acquire()
+    response = http_get(f"{api_url}/works", params=params, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    items: list[Work] = response.json().get("message", {}).get("items", [])
+    return items
+
+
+def lookup_dois(dois: list[str]) -> dict[str, Work | None]:
+    """批量按 DOI 查询（一次请求）
+
+    Args:
+        dois: DOI 列表
+
+    Returns:
+        dict: 缓存键 -> 结果，接口未返回的 DOI 为 None
+    """
+    items = _fetch_works({"filter": ",".join(f"doi:{doi}" for doi in dois), "rows": len(dois)})
+    found = {doi_key(item["DOI"]): item for item in items if item.get("DOI")}
+    return {doi_key(doi): found.get(doi_key(doi)) for doi in dois}
+
+
+def search_title(title: str, min_similarity: float) -> dict[str, Work | None]:
+    """按标题检索，只接受标题足够相似的结果
+
+    Args:
+        title: 论文标题
+        min_similarity: 最低标题相似度（0-1）
+
+    Returns:
+        dict: 缓存键 -> 最相似的结果，没有足够相似的结果时为 None
+    """
+    target = _match_text(title)
+    items = _fetch_works({"query.bibliographic": title, "rows": TITLE_SEARCH_ROWS})
+
+    best: Work | None = None
+    best_score = min_similarity
+    for item in items:
+        for candidate in item.get("title") or []:
+            score = SequenceMatcher(None, target, _match_text(candidate)).ratio()
+            if score >= best_score:
+                best, best_score = item, score
+    return {title_key(title): best}
+
+
+def _jats_to_text(abstract: str) -> str:
+    """将 Crossref 的 JATS 摘要转换为纯文本（去掉开头的 "Abstract" 小标题）"""
+    text = html_to_text(abstract)
+    head, _, rest = text.partition(" ")
+    return rest if head.lower() == "abstract" and rest else text
+
+
+def apply_work(paper: PaperData, work: Work) -> bool:
+    """用查询结果补全论文的缺失字段（不覆盖已有值）
+
+    Args:
+        paper: 论文数据字典（原地更新）
+        work: Crossref 返回的条目
+
+    Returns:
+        bool: 是否补全了任何字段
+    """
+    changed = False
+    if not paper.get("doi") and work.get("DOI"):
+        paper["doi"] = work["DOI"]
+        changed = True
+    if not paper.get("abstract") and work.get("abstract"):
+        paper["abstract"] = _jats_to_text(work["abstract"]) or None
+        changed = changed or paper["abstract"] is not None
+    if not paper.get("authors") and work.get("author"):
+        authors = [
+            " ".join(part for part in (author.get("given"), author.get("family")) if part)
+            for author in work["author"]
+        ]
+        paper["authors"] = [author for author in authors if author]
+        changed = changed or bool(paper["authors"])
+    return changed
+
+
+def enrich_papers(
+    papers: list[PaperData],
+    cache: EnrichmentCache | None = None,
+    max_workers: int | None = None,
+) -> list[PaperData]:
+    """补全论文缺失的 DOI、摘要和作者
+
+    有 DOI 但缺摘要的论文按 ``settings.enrichment_batch_size`` 分批查询，
+    没有 DOI 的论文按标题检索；请求在线程池中并发（共享限速），
+    结果写入缓存，失败的请求不缓存，下次运行重试。
+
+    Args:
+        papers: 论文列表（原地补全）
+        cache: 查询缓存，默认使用配置的缓存文件
+        max_workers: 并发请求数，默认 ``settings.enrichment_concurrency``
+
+    Returns:
+        list[dict]: 同一论文列表
+    """
+    by_doi = [p for p in papers if p.get("doi") and not p.get("abstract")]
+    by_title = [p for p in papers if not p.get("doi") and p.get("title")]
+    if not by_doi and not by_title:
+        return papers
+
+    settings = get_settings()
+    cache = cache if cache is not None else get_enrichment_cache()
+    keys = {doi_key(p["doi"]): p["doi"] for p in by_doi}
+    titles = {title_key(p["title"]): p["title"] for p in by_title}
+    results = cache.get_many([*keys, *titles])
+
+    missing_dois = [doi for key, doi in keys.items() if key not in results]
+    missing_titles = [title for key, title in titles.items() if key not in results]
+    batch_size = max(1, settings.enrichment_batch_size)
+
+    fetched: dict[str, Work | None] = {}
+    if missing_dois or missing_titles:
+        workers = max_workers or settings.enrichment_concurrency
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="enrich") as executor:
+            futures = [
+                executor.submit(lookup_dois, missing_dois[i : i + batch_size])
+                for i in range(0, len(missing_dois), batch_size)
+            ]
+            futures += [
+                executor.submit(search_title, title, settings.enrichment_title_similarity)
+                for title in missing_titles
+            ]
+            for future in as_completed(futures):
+                try:
+                    fetched.update(future.result())
+                except Exception as e:
+                    logger.warning(f"Metadata lookup failed: {e}")
+        cache.put_many(fetched)
+        results.update(fetched)
+
+    enriched = 0
+    for paper in by_doi:
+        work = results.get(doi_key(paper["doi"]))
+        enriched += bool(work and apply_work(paper, work))
+    for paper in by_title:
+        work = results.get(title_key(paper["title"]))
+        enriched += bool(work and apply_work(paper, work))
+
+    logger.info(
+        f"Enriched {enriched}/{len(by_doi) + len(by_title)} papers "
+        f"({len(fetched)} looked up, {len(results) - len(fetched)} cached)"
+    )
+    return papers
@@ -0,0 +1,234 @@
+"""异步抓取引擎模块
+
+基于 asyncio + httpx 并发抓取多个 RSS 源，按完成顺序流式返回结果
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator, Coroutine
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+
+from evo_flywheel.collectors import http
+from evo_flywheel.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 默认参数
+DEFAULT_TIMEOUT = 60.0
+DEFAULT_DEADLINE = 180.0
+DEFAULT_PER_HOST_LIMIT = 2
+
+
+@dataclass
+class FeedResponse:
+    """单个源的抓取结果"""
+
+    source: dict[str, Any]
+    content: bytes | None = None
+    status_code: int | None = None
+    error: Exception | None = None
+    elapsed: float = 0.0
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """是否成功获取到内容"""
+        return self.error is None and self.content is not None
+
+    @property
+    def not_modified(self) -> bool:
+        """服务器是否返回 304（自上次抓取以来未变化）"""
+        return self.error is None and self.status_code == 304
+
+
+def create_async_client(timeout: float = DEFAULT_TIMEOUT) -> httpx.AsyncClient:
+    """创建异步 HTTP 客户端（连接池、HTTP/2、压缩协商与共享 HTTP 层一致）
+
+    Args:
+        timeout: 单个请求超时时间（秒）
+
+    Returns:
+        httpx.AsyncClient: 异步客户端
+    """
+    return http.create_async_client(timeout)
+
+
+def build_conditional_headers(
+    etag: str | None = None,
+    last_modified: str | None = None,
+) -> dict[str, str]:
+    """根据上次抓取保存的校验器构建条件请求头
+
+    Args:
+        etag: 上次响应的 ETag
+        last_modified: 上次响应的 Last-Modified
+
+    Returns:
+        dict: If-None-Match / If-Modified-Since 请求头
+    """
+    headers: dict[str, str] = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def _host_of(url: str) -> str:
+    """提取 URL 的主机名（用于按主机限流）"""
+    return urlsplit(url).netloc.lower()
+
+
+async def _fetch_one(
+    client: httpx.AsyncClient,
+    source: dict[str, Any],
+    semaphore: asyncio.Semaphore,
+) -> FeedResponse:
+    """在主机并发限制下抓取单个源"""
+    url = source["url"]
+    headers = build_conditional_headers(source.get("etag"), source.get("last_modified"))
+    started = time.perf_counter()
+
+    async with semaphore:
+        try:
+            response = await http.async_http_get(client, url, headers=headers)
+            if response.status_code == 304:
+                logger.debug(f"RSS feed not modified: {url}")
+                return FeedResponse(
+                    source=source,
+                    status_code=304,
+                    elapsed=time.perf_counter() - started,
+                    etag=response.headers.get("ETag") or source.get("etag"),
+                    last_modified=(
+                        response.headers.get("Last-Modified") or source.get("last_modified")
+                    ),
+                )
+            response.raise_for_status()
+        except Exception as e:
+            logger.error(f"Failed to fetch RSS feed {url}: {e}")
+            return FeedResponse(
+                source=source,
+                error=e,
+                elapsed=time.perf_counter() - started,
+            )
+
+    return FeedResponse(
+        source=source,
+        content=response.content,
+        status_code=response.status_code,
+        elapsed=time.perf_counter() - started,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+    )
+
+
+async def iter_feed_responses(
+    sources: list[dict[str, Any]],
+    *,
+    timeout: float = DEFAULT_TIMEOUT,
+    deadline: float = DEFAULT_DEADLINE,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+) -> AsyncIterator[FeedResponse]:
+    """并发抓取多个源，按完成顺序产出结果
+
+    每个主机最多同时 ``per_host_limit`` 个请求；超过 ``deadline`` 仍未完成的源
+    会被取消并以 TimeoutError 结果产出。源配置中带有 ``etag`` / ``last_modified``
+    时发送条件请求，未变化的源以 304 结果产出。
+
+    Args:
+        sources: 源配置列表，每个源包含 name 和 url
+        timeout: 单个请求超时时间（秒）
+        deadline: 整批抓取的全局截止时间（秒）
+        per_host_limit: 每个主机的最大并发请求数
+
+    Yields:
+        FeedResponse: 单个源的抓取结果
+    """
+    if not sources:
+        return
+
+    semaphores: dict[str, asyncio.Semaphore] = {}
+
+    async with create_async_client(timeout=timeout) as client:
+        pending: dict[asyncio.Task[FeedResponse], dict[str, Any]] = {}
+        for source in sources:
+            host = _host_of(source["url"])
+            semaphore = semaphores.setdefault(host, asyncio.Semaphore(per_host_limit))
+            task = asyncio.create_task(_fetch_one(client, source, semaphore))
+            pending[task] = source
+
+        loop = asyncio.get_running_loop()
+        stop_at = loop.time() + deadline
+
+        try:
+            while pending:
+                remaining = stop_at - loop.time()
+                if remaining <= 0:
+                    break
+
+                done, _ = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    pending.pop(task)
+                    yield task.result()
+
+            # 截止时间已到，剩余请求按超时处理
+            expired = list(pending.items())
+            for task, _ in expired:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            pending.clear()
+
+            for _, source in expired:
+                logger.error(f"Deadline of {deadline}s exceeded fetching {source['url']}")
+                yield FeedResponse(
+                    source=source,
+                    error=TimeoutError(f"Global deadline of {deadline}s exceeded"),
+                    elapsed=deadline,
+                )
+        finally:
+            # 调用方提前退出时同样取消未完成的请求
+            for task in pending:
+                task.cancel()
+
+
+def run_sync[T](coro: Coroutine[Any, Any, T]) -> T:
+    """在同步代码中运行协程
+
+    当前线程已有事件循环运行时（例如在 FastAPI 的 async 端点中），
+    在独立线程中运行协程，避免 ``asyncio.run`` 报错。
+
+    Args:
+        coro: 要运行的协程
+
+    Returns:
+        协程返回值
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    values: list[T] = []
+    errors: list[BaseException] = []
+
+    def _runner() -> None:
+        try:
+            values.append(asyncio.run(coro))
+        except BaseException as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=_runner, name="evo-fetcher")
+    thread.start()
+    thread.join()
+
+    if errors:
+        raise errors[0]
+    return values[0]
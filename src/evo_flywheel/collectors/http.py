@@ -0,0 +1,280 @@
+"""采集器共享 HTTP 层
+
+所有采集器共用的连接池客户端：按主机复用 keep-alive 连接，
+安装了 h2 时启用 HTTP/2，安装了 brotli 时协商 br 压缩，
+并对瞬时错误按指数退避（带抖动）重试；共享同一主机的抓取线程可通过限速器协调请求速率
+"""
+
+import asyncio
+import importlib.util
+import random
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from evo_flywheel.config import get_settings
+from evo_flywheel.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 可选依赖：h2 提供 HTTP/2，brotli / brotlicffi 提供 br 解码
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+BROTLI_AVAILABLE = any(importlib.util.find_spec(m) is not None for m in ("brotli", "brotlicffi"))
+
+# 使用浏览器 User-Agent 避免被 403 拒绝
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept-Encoding": "gzip, deflate, br" if BROTLI_AVAILABLE else "gzip, deflate",
+}
+
+# 值得重试的响应状态码（限流与网关/服务端瞬时错误）
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+_rate_limiters: dict[str, "RateLimiter"] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """重试策略
+
+    第 n 次重试前等待 ``uniform(0, min(backoff_max, backoff_base * 2**n))`` 秒（全抖动），
+    响应带 Retry-After 时至少等待该时长（不超过 backoff_max）。
+    """
+
+    max_retries: int = 2
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+
+    @classmethod
+    def from_settings(cls) -> "RetryPolicy":
+        """从配置创建重试策略"""
+        settings = get_settings()
+        return cls(
+            max_retries=settings.http_max_retries,
+            backoff_base=settings.http_backoff_base,
+            backoff_max=settings.http_backoff_max,
+        )
+
+    def delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        """计算第 attempt 次重试前的等待时间（秒）"""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = max(delay, min(float(retry_after), self.backoff_max))
+        return delay
+
+
+class RateLimiter:
+    """线程安全的请求限速器
+
+    相邻两次请求的开始时间至少间隔 ``1 / rate`` 秒，多个线程共享同一配额；
+    rate 不大于 0 时不限速。
+
+    Example:
+        >>> limiter = RateLimiter(4.0)
+        >>> limiter.acquire()
+        0.0
+    """
+
+    def __init__(self, rate: float) -> None:
+        self.rate = rate
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """阻塞到轮到本次请求
+
+        Returns:
+            float: 实际等待的时间（秒）
+        """
+        if self._interval <= 0:
+            return 0.0
+
+        # 在锁内预约时间槽，在锁外等待，等待中的线程不阻塞其他线程预约
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        wait = slot - now
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+def get_rate_limiter(key: str, rate: float) -> RateLimiter:
+    """获取按键共享的限速器（通常以主机名为键）
+
+    Args:
+        key: 限速器键
+        rate: 每秒请求数，与已有限速器不同时重新创建
+
+    Returns:
+        RateLimiter: 共享限速器
+    """
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(key)
+        if limiter is None or limiter.rate != rate:
+            limiter = _rate_limiters[key] = RateLimiter(rate)
+    return limiter
+
+
+def client_options(timeout: float) -> dict[str, Any]:
+    """同步与异步客户端共用的构造参数
+
+    Args:
+        timeout: 请求超时时间（秒）
+
+    Returns:
+        dict: httpx 客户端参数
+    """
+    settings = get_settings()
+    return {
+        "timeout": timeout,
+        "headers": DEFAULT_HEADERS,
+        "follow_redirects": True,
+        "http2": HTTP2_AVAILABLE,
+        "limits": httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_connections,
+        ),
+    }
+
+
+def get_http_client() -> httpx.Client:
+    """获取进程内共享的同步 HTTP 客户端（线程安全）
+
+    Returns:
+        httpx.Client: 共享客户端
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(**client_options(timeout=60.0))
+                logger.debug(f"Created shared HTTP client (http2={HTTP2_AVAILABLE})")
+    return _client
+
+
+def close_http_client() -> None:
+    """关闭共享客户端，释放连接池"""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+def create_async_client(timeout: float) -> httpx.AsyncClient:
+    """创建与共享客户端配置一致的异步客户端
+
+    Args:
+        timeout: 请求超时时间（秒）
+
+    Returns:
+        httpx.AsyncClient: 异步客户端
+    """
+    return httpx.AsyncClient(**client_options(timeout))
+
+
+def _should_retry(response: httpx.Response) -> bool:
+    return response.status_code in RETRY_STATUSES
+
+
+def http_get(
+    url: str,
+    *,
+    params: Mapping[str, Any] | None = None,
+    headers: Mapping[str, str] | None = None,
+    timeout: float = 60.0,
+    retry: RetryPolicy | None = None,
+) -> httpx.Response:
+    """通过共享连接池发送 GET 请求，瞬时错误自动重试
+
+    连接错误、超时以及 429/5xx 响应会按重试策略重试；重试耗尽后，
+    错误响应原样返回（由调用方 raise_for_status），连接错误则抛出。
+
+    Args:
+        url: 请求 URL
+        params: 查询参数（与 URL 中已有的查询串合并）
+        headers: 额外请求头
+        timeout: 请求超时时间（秒）
+        retry: 重试策略，默认从配置读取
+
+    Returns:
+        httpx.Response: 响应
+    """
+    retry = retry or RetryPolicy.from_settings()
+    client = get_http_client()
+    if params:
+        # httpx 的 params 会替换 URL 中已有的查询串，这里改为合并
+        url = str(httpx.URL(url).copy_merge_params(params))
+
+    attempt = 0
+    while True:
+        last_attempt = attempt >= retry.max_retries
+        try:
+            response = client.get(url, headers=headers, timeout=timeout)
+        except httpx.TransportError as e:
+            if last_attempt:
+                raise
+            delay = retry.delay(attempt)
+            logger.warning(f"GET {url} failed ({e!r}), retrying in {delay:.1f}s")
+        else:
+            if last_attempt or not _should_retry(response):
+                return response
+            delay = retry.delay(attempt, response)
+            logger.warning(f"GET {url} returned {response.status_code}, retrying in {delay:.1f}s")
+        time.sleep(delay)
+        attempt += 1
+
+
+async def async_http_get(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    headers: Mapping[str, str] | None = None,
+    retry: RetryPolicy | None = None,
+) -> httpx.Response:
+    """http_get 的异步版本，使用调用方提供的异步客户端
+
+    Args:
+        client: 异步客户端
+        url: 请求 URL
+        headers: 额外请求头
+        retry: 重试策略，默认从配置读取
+
+    Returns:
+        httpx.Response: 响应
+    """
+    retry = retry or RetryPolicy.from_settings()
+
+    attempt = 0
+    while True:
+        last_attempt = attempt >= retry.max_retries
+        try:
+            response = await client.get(url, headers=headers)
+        except httpx.TransportError as e:
+            if last_attempt:
+                raise
+            delay = retry.delay(attempt)
+            logger.warning(f"GET {url} failed ({e!r}), retrying in {delay:.1f}s")
+        else:
+            if last_attempt or not _should_retry(response):
+                return response
+            delay = retry.delay(attempt, response)
+            logger.warning(f"GET {url} returned {response.status_code}, retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
+        attempt += 1
@@ -3,119 +3,647 @@
 协调多个数据源，统一论文采集流程
 """
 
-from datetime import datetime
-from typing import Any
+import asyncio
+import multiprocessing
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any, overload
 
-from evo_flywheel.collectors.biorxiv import fetch_biorxiv_papers
-from evo_flywheel.collectors.dedup import remove_duplicate_papers
-from evo_flywheel.collectors.rss import fetch_rss_feed, parse_rss_entries
+from evo_flywheel.collectors.archive import (
+    KIND_BIORXIV,
+    KIND_RSS,
+    ResponseArchive,
+    get_response_archive,
+)
+from evo_flywheel.collectors.biorxiv import (
+    BIORXIV_SOURCE,
+    DEFAULT_CATEGORY,
+    PREPRINT_SOURCES,
+    PreprintTarget,
+    fetch_preprint_papers,
+    parse_page_content,
+)
+from evo_flywheel.collectors.circuit import allow_request, record_failure, record_success
+from evo_flywheel.collectors.dedup import KeyIndex, remove_duplicate_papers, remove_known_papers
+from evo_flywheel.collectors.enrich import enrich_papers
+from evo_flywheel.collectors.fetcher import (
+    DEFAULT_DEADLINE,
+    DEFAULT_PER_HOST_LIMIT,
+    DEFAULT_TIMEOUT,
+    FeedResponse,
+    iter_feed_responses,
+    run_sync,
+)
+from evo_flywheel.collectors.record import PaperData
+from evo_flywheel.collectors.rss import ParsedFeed, parse_feed_content
+from evo_flywheel.config import get_settings
 from evo_flywheel.logging import get_logger
 
 logger = get_logger(__name__)
 
+# 采集状态（写入 CollectionLog.status）
+STATUS_SUCCESS = "success"
+STATUS_PARTIAL = "partial"
+STATUS_FAILED = "failed"
+
+
+@dataclass
+class SourceReport:
+    """单个源的采集结果"""
+
+    name: str
+    papers: int = 0
+    seconds: float = 0.0
+    error: str | None = None
+    skipped: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """是否采集成功（跳过的源不算失败）"""
+        return self.error is None
+
+
+@dataclass
+class CollectionReport:
+    """一次采集的结构化报告：各源的耗时、论文数和错误"""
+
+    sources: list[SourceReport] = field(default_factory=list)
+    total_papers: int = 0
+    seconds: float = 0.0
+
+    @property
+    def failed(self) -> list[SourceReport]:
+        """失败（含超时）的源"""
+        return [source for source in self.sources if not source.ok and not source.skipped]
+
+    @property
+    def status(self) -> str:
+        """整体状态：全部成功、部分失败或全部失败"""
+        attempted = [source for source in self.sources if not source.skipped]
+        failed = self.failed
+        if not failed:
+            return STATUS_SUCCESS
+        if len(failed) == len(attempted):
+            return STATUS_FAILED
+        return STATUS_PARTIAL
+
+    @property
+    def source_names(self) -> str:
+        """本次抓取的源名称（逗号分隔，与 CollectionLog.sources 格式一致）"""
+        return ",".join(source.name for source in self.sources if not source.skipped)
+
+    @property
+    def error_message(self) -> str | None:
+        """失败源的错误汇总"""
+        return "; ".join(f"{source.name}: {source.error}" for source in self.failed) or None
+
+
+def _describe_error(error: BaseException | str) -> str:
+    """错误的简短描述（与熔断器记录的 last_error 一致）"""
+    return str(error) or type(error).__name__
+
+
+def _collect_preprints(
+    start_date: datetime,
+    end_date: datetime,
+    targets: Sequence[PreprintTarget],
+    deadline: float | None = None,
+) -> tuple[list[PaperData], SourceReport]:
+    """采集预印本并生成报告（所有目标合并为一个 bioRxiv 源）
+
+    任一分页失败或超时时返回空列表，避免部分结果推进高水位而漏掉未完成分页中的论文。
+    """
+    labels = ", ".join(target.label for target in targets)
+    logger.info(f"Collecting preprints ({labels}): {start_date} to {end_date}")
+
+    report = SourceReport(name=BIORXIV_SOURCE)
+    started = time.perf_counter()
+    try:
+        papers = fetch_preprint_papers(start_date, end_date, targets, deadline=deadline)
+        # 去重（同一论文可能出现在多个分类中）
+        papers = remove_duplicate_papers(papers)
+        logger.info(f"Collected {len(papers)} papers from {len(targets)} preprint targets")
+    except Exception as e:
+        logger.error(f"Failed to collect from bioRxiv: {e}")
+        papers = []
+        report.error = _describe_error(e)
+
+    report.papers = len(papers)
+    report.seconds = time.perf_counter() - started
+    return papers, report
+
 
 def collect_from_biorxiv(
     start_date: datetime,
     end_date: datetime,
-    category: str = "evolutionary_biology",
-) -> list[dict[str, Any]]:
-    """从 bioRxiv 采集论文
+    category: str = DEFAULT_CATEGORY,
+    targets: Sequence[PreprintTarget] | None = None,
+    deadline: float | None = None,
+) -> list[PaperData]:
+    """从 bioRxiv / medRxiv 采集论文
+
+    多个目标并发抓取，合并后统一去重一次。任一分页失败时返回空列表，
+    避免部分结果推进高水位而漏掉失败分页中的论文。
 
     Args:
         start_date: 开始日期
         end_date: 结束日期
-        category: 论文分类
+        category: 论文分类（未提供 targets 时采集该 bioRxiv 分类）
+        targets: 预印本采集目标列表（可选）
+        deadline: 截止时间（秒，可选），到期仍未完成时按失败处理
 
     Returns:
         list[dict]: 去重后的论文列表
     """
-    logger.info(f"Collecting from bioRxiv: {start_date} to {end_date}")
+    targets = targets or [PreprintTarget(category=category)]
+    return _collect_preprints(start_date, end_date, targets, deadline)[0]
 
-    try:
-        papers = fetch_biorxiv_papers(start_date, end_date, category)
-        # 去重
-        papers = remove_duplicate_papers(papers)
-        logger.info(f"Collected {len(papers)} papers from bioRxiv")
-        return papers
-    except Exception as e:
-        logger.error(f"Failed to collect from bioRxiv: {e}")
-        return []
+
+@overload
+def as_utc(value: datetime) -> datetime: ...
+@overload
+def as_utc(value: None) -> None: ...
+@overload
+def as_utc(value: datetime | None) -> datetime | None: ...
 
 
-def collect_from_rss_sources(sources: list[dict[str, Any]]) -> list[dict[str, Any]]:
+def as_utc(value: datetime | None) -> datetime | None:
+    """将时间统一为 UTC（数据库读出的无时区时间按 UTC 处理）
+
+    Args:
+        value: 时间
+
+    Returns:
+        datetime | None: 带 UTC 时区的时间
+    """
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def collect_from_rss_sources(
+    sources: list[dict[str, Any]],
+    *,
+    timeout: float = DEFAULT_TIMEOUT,
+    deadline: float = DEFAULT_DEADLINE,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    overlap: timedelta | None = None,
+    parse_workers: int | None = None,
+    on_report: Callable[[SourceReport], Any] | None = None,
+) -> list[PaperData]:
     """从多个 RSS 源采集论文
 
+    所有源并发抓取，每个源到达后立即解析，总耗时取决于最慢的源
+    （且不超过 ``deadline``），而不是所有源耗时之和。
+    熔断器打开的源在冷却期内直接跳过（见 collectors.circuit）。
+
+    源配置中的 ``etag`` / ``last_modified`` 用于条件请求，返回 304 的源不再解析；
+    带有 ``high_water_mark`` 的源只解析晚于 ``high_water_mark - overlap`` 的条目。
+    抓取成功后新的校验器、高水位、``new_items`` 和 ``last_fetch`` 会写回源配置字典，
+    由调用方持久化。
+
     Args:
         sources: RSS 源配置列表，每个源包含 name 和 url
+        timeout: 单个源请求超时时间（秒）
+        deadline: 整批抓取的全局截止时间（秒）
+        per_host_limit: 每个主机的最大并发请求数
+        overlap: 高水位回看时长，默认使用 settings.collection_overlap_hours
+        parse_workers: 解析进程数，0 表示在当前进程解析，
+            默认使用 settings.collection_parse_workers
+        on_report: 接收每个源采集结果的回调（可选）
 
     Returns:
         list[dict]: 去重后的论文列表
     """
-    all_papers: list[dict[str, Any]] = []
+    all_papers: list[PaperData] = []
+    stream_rss_sources(
+        sources,
+        all_papers.extend,
+        timeout=timeout,
+        deadline=deadline,
+        per_host_limit=per_host_limit,
+        overlap=overlap,
+        parse_workers=parse_workers,
+        on_report=on_report,
+    )
+
+    # 跨源去重
+    all_papers = remove_duplicate_papers(all_papers)
+    logger.info(f"Total {len(all_papers)} unique papers from RSS sources")
+
+    return all_papers
+
 
+def stream_rss_sources(
+    sources: list[dict[str, Any]],
+    on_papers: Callable[[list[PaperData]], Any],
+    *,
+    timeout: float = DEFAULT_TIMEOUT,
+    deadline: float = DEFAULT_DEADLINE,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    overlap: timedelta | None = None,
+    parse_workers: int | None = None,
+    on_report: Callable[[SourceReport], Any] | None = None,
+) -> None:
+    """并发抓取 RSS 源，每个源解析完成后立即交给回调
+
+    与 collect_from_rss_sources 行为一致，但不在内存中汇总，也不做跨源去重，
+    适合流式管道（回调可以是有界队列的写入函数）。
+    配置了 ``settings.collection_archive_dir`` 时，每个源的原始响应都会归档。
+
+    Args:
+        sources: RSS 源配置列表，每个源包含 name 和 url
+        on_papers: 接收单个源解析结果的回调
+        timeout: 单个源请求超时时间（秒）
+        deadline: 整批抓取的全局截止时间（秒）
+        per_host_limit: 每个主机的最大并发请求数
+        overlap: 高水位回看时长，默认使用 settings.collection_overlap_hours
+        parse_workers: 解析进程数，0 表示在当前进程解析，
+            默认使用 settings.collection_parse_workers
+        on_report: 接收每个源采集结果的回调（可选，跳过的源也会报告）
+    """
+    report = on_report or _ignore_report
+    valid_sources: list[dict[str, Any]] = []
     for source in sources:
-        url = source.get("url")
         name = source.get("name", "Unknown")
-
-        if not url:
+        if not source.get("url"):
             logger.warning(f"RSS source {name} has no URL, skipping")
+            report(SourceReport(name=name, error="no URL", skipped=True))
             continue
+        if not allow_request(source):
+            logger.info(f"RSS source {name} circuit open until {source['open_until']}, skipping")
+            report(SourceReport(name=name, error="circuit open", skipped=True))
+            continue
+        valid_sources.append(source)
 
-        logger.info(f"Collecting from RSS source: {name}")
+    if not valid_sources:
+        return
 
-        try:
-            feed = fetch_rss_feed(url)
-            papers = parse_rss_entries(feed.entries, source=name)
-            all_papers.extend(papers)
-            logger.info(f"Collected {len(papers)} papers from {name}")
-        except Exception as e:
-            logger.error(f"Failed to collect from {name}: {e}")
+    settings = get_settings()
+    if overlap is None:
+        overlap = timedelta(hours=settings.collection_overlap_hours)
+    if parse_workers is None:
+        parse_workers = settings.collection_parse_workers
+
+    # 只有一个源时进程池没有并行收益
+    workers = min(parse_workers, len(valid_sources))
+    executor = create_parse_executor(workers) if workers > 1 else None
+    try:
+        run_sync(
+            _collect_rss_async(
+                valid_sources,
+                on_papers,
+                timeout=timeout,
+                deadline=deadline,
+                per_host_limit=per_host_limit,
+                overlap=overlap,
+                parse_executor=executor,
+                archive=get_response_archive(),
+                on_report=report,
+            )
+        )
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+def _ignore_report(report: SourceReport) -> None:
+    """未提供 on_report 时丢弃源报告"""
+
+
+def create_parse_executor(workers: int) -> ProcessPoolExecutor:
+    """创建 feed 解析进程池
+
+    使用 forkserver（不可用时为 spawn）启动子进程，避免从多线程的父进程 fork。
+
+    Args:
+        workers: 工作进程数
+
+    Returns:
+        ProcessPoolExecutor: 进程池
+    """
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method))
+
+
+async def _collect_rss_async(
+    sources: list[dict[str, Any]],
+    on_papers: Callable[[list[PaperData]], Any],
+    *,
+    timeout: float,
+    deadline: float,
+    per_host_limit: int,
+    overlap: timedelta,
+    parse_executor: Executor | None = None,
+    archive: ResponseArchive | None = None,
+    on_report: Callable[[SourceReport], Any] = _ignore_report,
+) -> None:
+    """并发抓取 RSS 源，并按到达顺序解析后交给回调
+
+    提供 ``parse_executor`` 时，每个源的解析作为独立任务提交到进程池，
+    多个源的解析并行进行；否则逐个在工作线程中解析。两种方式都不会在
+    事件循环线程上运行 feedparser，抓取不会因解析而停顿。
+    提供 ``archive`` 时，解析前先归档原始响应。
+    每个源的耗时、论文数和错误交给 ``on_report``。
+    """
+    loop = asyncio.get_running_loop()
+    parse_tasks: list[asyncio.Task[None]] = []
+
+    async for result in iter_feed_responses(
+        sources,
+        timeout=timeout,
+        deadline=deadline,
+        per_host_limit=per_host_limit,
+    ):
+        source = result.source
+        name = source.get("name", "Unknown")
+
+        if result.not_modified:
+            # 304: 自上次抓取以来未变化，跳过解析；服务器可能在 304 中更换校验器，保存新值
+            source["etag"] = result.etag
+            source["last_modified"] = result.last_modified
+            source["last_fetch"] = datetime.now(UTC)
+            source["new_items"] = 0
+            record_success(source)
+            on_report(SourceReport(name=name, seconds=result.elapsed))
+            logger.info(f"RSS source {name} not modified since last fetch, skipping")
+            continue
+
+        if not result.ok:
+            logger.error(f"Failed to collect from {name}: {result.error}")
+            error = result.error or "unknown error"
+            record_failure(source, error)
+            on_report(SourceReport(name=name, seconds=result.elapsed, error=_describe_error(error)))
             # 继续处理其他源
             continue
 
-    # 跨源去重
-    all_papers = remove_duplicate_papers(all_papers)
-    logger.info(f"Total {len(all_papers)} unique papers from RSS sources")
+        if archive is not None:
+            try:
+                archive.store(name, result.content, kind=KIND_RSS, url=source.get("url"))  # type: ignore[arg-type]
+            except OSError as e:
+                logger.warning(f"Failed to archive response from {name}: {e}")
 
-    return all_papers
+        high_water_mark = as_utc(source.get("high_water_mark"))
+        since = high_water_mark - overlap if high_water_mark else None
+
+        if parse_executor is None:
+            try:
+                # feedparser 是同步 CPU 密集解析，放到线程中执行，避免阻塞事件循环上的抓取
+                parsed = await asyncio.to_thread(parse_feed_content, result.content, name, since)  # type: ignore[arg-type]
+            except Exception as e:
+                logger.error(f"Failed to parse feed from {name}: {e}")
+                record_failure(source, e)
+                on_report(SourceReport(name=name, seconds=result.elapsed, error=_describe_error(e)))
+                continue
+            _apply_parsed_feed(result, parsed, since, on_papers, on_report)
+        else:
+            parse_tasks.append(
+                asyncio.create_task(
+                    _parse_in_executor(loop, parse_executor, result, since, on_papers, on_report)
+                )
+            )
+
+    if parse_tasks:
+        await asyncio.gather(*parse_tasks)
+
+
+async def _parse_in_executor(
+    loop: asyncio.AbstractEventLoop,
+    executor: Executor,
+    result: FeedResponse,
+    since: datetime | None,
+    on_papers: Callable[[list[PaperData]], Any],
+    on_report: Callable[[SourceReport], Any] = _ignore_report,
+) -> None:
+    """在进程池中解析单个源，完成后交给回调"""
+    name = result.source.get("name", "Unknown")
+    try:
+        try:
+            parsed = await loop.run_in_executor(
+                executor, parse_feed_content, result.content, name, since
+            )
+        except BrokenExecutor as e:
+            # 工作进程异常退出时退回当前进程解析
+            logger.warning(f"Parse pool unavailable ({e}), parsing {name} in-process")
+            parsed = parse_feed_content(result.content, name, since)  # type: ignore[arg-type]
+    except Exception as e:
+        logger.error(f"Failed to parse feed from {name}: {e}")
+        record_failure(result.source, e)
+        on_report(SourceReport(name=name, seconds=result.elapsed, error=_describe_error(e)))
+        return
+    _apply_parsed_feed(result, parsed, since, on_papers, on_report)
+
+
+def _apply_parsed_feed(
+    result: FeedResponse,
+    parsed: ParsedFeed,
+    since: datetime | None,
+    on_papers: Callable[[list[PaperData]], Any],
+    on_report: Callable[[SourceReport], Any] = _ignore_report,
+) -> None:
+    """将解析结果写回源状态并交给回调"""
+    source = result.source
+    name = source.get("name", "Unknown")
+
+    if since is not None:
+        logger.info(
+            f"{name}: {parsed.new_entries}/{parsed.total_entries} entries newer than high-water mark"
+        )
+
+    # 保存校验器和高水位，供下次增量采集使用
+    high_water_mark = as_utc(source.get("high_water_mark"))
+    source["etag"] = result.etag
+    source["last_modified"] = result.last_modified
+    source["last_fetch"] = datetime.now(UTC)
+    source["new_items"] = len(parsed.papers)
+    record_success(source)
+    if parsed.newest is not None and (high_water_mark is None or parsed.newest > high_water_mark):
+        source["high_water_mark"] = parsed.newest
+
+    logger.info(f"Collected {len(parsed.papers)} papers from {name} in {result.elapsed:.2f}s")
+    on_report(SourceReport(name=name, papers=len(parsed.papers), seconds=result.elapsed))
+    on_papers(parsed.papers)
 
 
 def collect_from_all_sources(
     start_date: datetime,
     end_date: datetime,
     rss_sources: list[dict[str, Any]] | None = None,
-    category: str = "evolutionary_biology",
-) -> list[dict[str, Any]]:
+    category: str = DEFAULT_CATEGORY,
+    key_index: KeyIndex | None = None,
+    include_biorxiv: bool = True,
+    replay: bool = False,
+    preprint_targets: Sequence[PreprintTarget] | None = None,
+    deadline: float | None = None,
+    report: CollectionReport | None = None,
+) -> list[PaperData]:
     """从所有源采集论文
 
+    bioRxiv / medRxiv 在后台线程中抓取，与所有 RSS 源同时进行，共用一个截止时间
+    （默认 ``settings.collection_deadline_seconds``）。到期时已完成的源照常返回，
+    未完成的 RSS 源和预印本记为超时，一个慢源不会拖住其他源。
+
+    ``replay=True`` 时不访问网络，而是从原始响应归档中重新解析抓取时间在
+    [start_date, end_date] 内的响应（见 replay_archived_papers），
+    用于解析器修改后重新处理历史数据。
+
     Args:
         start_date: 开始日期
         end_date: 结束日期
         rss_sources: RSS 源配置列表（可选，默认从配置文件读取）
         category: bioRxiv 论文分类
+        key_index: 已入库论文的键索引（可选），提供时丢弃已入库的论文
+        include_biorxiv: 是否采集 bioRxiv（自适应轮询时 bioRxiv 未到期则跳过）
+        replay: 是否从归档重放（rss_sources 为 None 时重放归档中的所有源）
+        preprint_targets: 预印本采集目标（可选，默认只采集 category 对应的 bioRxiv 分类）
+        deadline: 本次采集的总截止时间（秒，可选）
+        report: 采集报告（可选），提供时填入各源的耗时、论文数和错误
 
     Returns:
         list[dict]: 去重后的论文列表
+
+    Raises:
+        ValueError: replay=True 但未配置归档目录
     """
+    if replay:
+        return _collect_from_archive(start_date, end_date, rss_sources, include_biorxiv, key_index)
+
     logger.info(f"Starting collection from all sources: {start_date} to {end_date}")
 
-    all_papers: list[dict[str, Any]] = []
+    settings = get_settings()
+    if deadline is None:
+        deadline = settings.collection_deadline_seconds
+    if report is None:
+        report = CollectionReport()
+    started = time.perf_counter()
 
-    # 1. 从 bioRxiv 采集
-    biorxiv_papers = collect_from_biorxiv(start_date, end_date, category)
-    all_papers.extend(biorxiv_papers)
+    # 1. bioRxiv / medRxiv 在后台线程中抓取，同时在当前线程抓取 RSS 源
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="preprints")
+    try:
+        preprints = None
+        if include_biorxiv:
+            targets = preprint_targets or [PreprintTarget(category=category)]
+            preprints = executor.submit(_collect_preprints, start_date, end_date, targets, deadline)
 
-    # 2. 从 RSS 源采集
-    if rss_sources is None:
-        # 如果没有提供源，使用默认空列表
-        rss_sources = []
+        # 2. 从 RSS 源采集
+        rss_reports: list[SourceReport] = []
+        rss_papers = collect_from_rss_sources(
+            rss_sources or [], deadline=deadline, on_report=rss_reports.append
+        )
 
-    rss_papers = collect_from_rss_sources(rss_sources)
-    all_papers.extend(rss_papers)
+        # 预印本同样受截止时间约束，到期后立即返回
+        all_papers: list[PaperData] = []
+        if preprints is not None:
+            biorxiv_papers, biorxiv_report = preprints.result()
+            all_papers.extend(biorxiv_papers)
+            report.sources.append(biorxiv_report)
+        all_papers.extend(rss_papers)
+        report.sources.extend(rss_reports)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
     # 3. 跨源去重
     all_papers = remove_duplicate_papers(all_papers)
 
-    logger.info(f"Total {len(all_papers)} unique papers collected from all sources")
+    # 4. 丢弃以前运行中已入库的论文
+    if key_index is not None:
+        all_papers = remove_known_papers(all_papers, key_index)
+
+    # 5. 补全缺失的 DOI / 摘要，补全出 DOI 的论文按 DOI 再去重一次
+    if settings.enrichment_enabled:
+        all_papers = remove_duplicate_papers(enrich_papers(all_papers))
+        if key_index is not None:
+            all_papers = remove_known_papers(all_papers, key_index)
+
+    report.total_papers = len(all_papers)
+    report.seconds = time.perf_counter() - started
+    for source in report.sources:
+        if not source.skipped:
+            logger.info(
+                f"  {source.name}: {source.papers} papers in {source.seconds:.2f}s"
+                + (f" ({source.error})" if source.error else "")
+            )
+    logger.info(
+        f"Total {len(all_papers)} unique papers collected from all sources "
+        f"in {report.seconds:.2f}s ({report.status}, {len(report.failed)} failed)"
+    )
+
+    return all_papers
+
+
+def replay_archived_papers(
+    archive: ResponseArchive,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    source_names: Iterable[str] | None = None,
+) -> Iterator[list[PaperData]]:
+    """按抓取顺序从原始响应归档重新解析论文，不访问网络
+
+    内容相同的响应（未变化的 feed 被多次抓取）只解析一次。
+
+    Args:
+        archive: 响应归档
+        start_date: 只重放不早于该时间抓取的响应
+        end_date: 只重放不晚于该时间抓取的响应
+        source_names: 只重放这些源（None 表示全部）
+
+    Yields:
+        list[dict]: 每个归档响应解析出的论文列表
+    """
+    names = set(source_names) if source_names is not None else None
+    replayed: set[str] = set()
+
+    for entry in archive.entries(since=start_date, until=end_date):
+        if names is not None and entry.source not in names:
+            continue
+        if entry.sha256 in replayed:
+            continue
+        replayed.add(entry.sha256)
+
+        try:
+            content = archive.load(entry.sha256)
+            if entry.kind == KIND_BIORXIV:
+                papers = parse_page_content(content, entry.source)
+            else:
+                papers = parse_feed_content(content, entry.source).papers
+        except Exception as e:
+            logger.error(f"Failed to replay {entry.source} response {entry.sha256[:12]}: {e}")
+            continue
+
+        yield papers
+
+
+def _collect_from_archive(
+    start_date: datetime,
+    end_date: datetime,
+    rss_sources: list[dict[str, Any]] | None,
+    include_biorxiv: bool,
+    key_index: KeyIndex | None,
+) -> list[PaperData]:
+    """collect_from_all_sources 的重放模式"""
+    archive = get_response_archive()
+    if archive is None:
+        raise ValueError("Replay requires settings.collection_archive_dir to be configured")
+
+    source_names: set[str] | None = None
+    if rss_sources is not None:
+        source_names = {source["name"] for source in rss_sources if source.get("name")}
+        if include_biorxiv:
+            source_names.update(PREPRINT_SOURCES)
+
+    logger.info(f"Replaying archived responses fetched {start_date} to {end_date}")
+    all_papers: list[PaperData] = []
+    for papers in replay_archived_papers(archive, start_date, end_date, source_names):
+        all_papers.extend(papers)
+
+    all_papers = remove_duplicate_papers(all_papers)
+    if key_index is not None:
+        all_papers = remove_known_papers(all_papers, key_index)
 
+    logger.info(f"Replayed {len(all_papers)} unique papers from archive")
     return all_papers
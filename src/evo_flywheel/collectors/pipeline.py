@@ -0,0 +1,284 @@
+"""流式采集管道模块
+
+采集器 -> 有界队列 -> 在线去重 -> （元数据补全）-> 批量写库，内存占用与批大小相关而与总量无关
+"""
+
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from evo_flywheel.collectors.biorxiv import DEFAULT_CATEGORY, PreprintTarget, iter_preprint_pages
+from evo_flywheel.collectors.dedup import KeyIndex, extract_paper_key, remove_known_papers
+from evo_flywheel.collectors.enrich import enrich_papers
+from evo_flywheel.collectors.orchestrator import stream_rss_sources
+from evo_flywheel.collectors.record import PaperData
+from evo_flywheel.config import get_settings
+from evo_flywheel.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 默认参数
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_QUEUE_SIZE = 1000
+DEFAULT_FLUSH_INTERVAL = 5.0
+
+# 生产者结束标记
+_DONE = object()
+
+# 生产者：接收 emit 回调，把论文批次推入管道
+Producer = Callable[[Callable[[list[PaperData]], None]], None]
+# 写入器：接收一批论文，返回实际保存的数量
+Writer = Callable[[list[PaperData]], int]
+# 补全器：原地补全一批论文的元数据，返回同一批论文
+Enricher = Callable[[list[PaperData]], list[PaperData]]
+
+
+@dataclass
+class PipelineStats:
+    """流式管道运行统计"""
+
+    received: int = 0
+    unique: int = 0
+    duplicates: int = 0
+    known: int = 0
+    saved: int = 0
+    batches: int = 0
+    errors: dict[str, str] = field(default_factory=dict)
+
+
+def run_pipeline(
+    producers: dict[str, Producer],
+    writer: Writer,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    key_index: KeyIndex | None = None,
+    enricher: Enricher | None = None,
+) -> PipelineStats:
+    """运行流式采集管道
+
+    每个生产者在独立线程中运行，把论文推入有界队列（队列满时阻塞，形成背压）；
+    当前线程消费队列，按论文键在线去重，累积到 ``batch_size`` 或距上次写入超过
+    ``flush_interval`` 秒时调用 ``writer`` 写库，快速源的论文因此无需等待慢速源。
+    提供 ``key_index`` 时，每批写入前先丢弃以前运行中已入库的论文；
+    提供 ``enricher`` 时，每批写入前补全元数据，并按补全后的键（如新得到的 DOI）再次去重。
+
+    Args:
+        producers: 生产者名称 -> 生产者函数
+        writer: 批量写入函数
+        batch_size: 每批写入的论文数
+        queue_size: 队列容量（论文数）
+        flush_interval: 最长写入间隔（秒）
+        key_index: 已入库论文的键索引（可选）
+        enricher: 元数据补全函数（可选）
+
+    Returns:
+        PipelineStats: 运行统计
+    """
+    stats = PipelineStats()
+    paper_queue: queue.Queue[Any] = queue.Queue(maxsize=queue_size)
+
+    def _run_producer(name: str, producer: Producer) -> None:
+        def emit(papers: list[PaperData]) -> None:
+            for paper in papers:
+                paper_queue.put(paper)
+
+        try:
+            producer(emit)
+        except Exception as e:
+            logger.error(f"Pipeline producer {name} failed: {e}")
+            stats.errors[name] = str(e)
+        finally:
+            paper_queue.put(_DONE)
+
+    threads = [
+        threading.Thread(target=_run_producer, args=(name, producer), name=f"producer-{name}")
+        for name, producer in producers.items()
+    ]
+    for thread in threads:
+        thread.start()
+
+    seen_keys: set[str] = set()
+    batch: list[PaperData] = []
+    last_flush = time.monotonic()
+    remaining = len(threads)
+
+    def _enrich(papers: list[PaperData], enrich: Enricher) -> list[PaperData]:
+        """补全元数据，丢弃补全后键重复或已入库的论文"""
+        keys_before = [extract_paper_key(paper) for paper in papers]
+        result = []
+        for paper, old_key in zip(enrich(papers), keys_before, strict=True):
+            key = extract_paper_key(paper)
+            if key != old_key:
+                if key in seen_keys:
+                    stats.duplicates += 1
+                    stats.unique -= 1
+                    continue
+                seen_keys.add(key)  # type: ignore[arg-type]
+            result.append(paper)
+
+        if key_index is not None:
+            known = len(result)
+            result = remove_known_papers(result, key_index)
+            stats.known += known - len(result)
+        return result
+
+    def _flush() -> None:
+        nonlocal batch, last_flush
+        if batch:
+            try:
+                pending = batch
+                if key_index is not None:
+                    pending = remove_known_papers(batch, key_index)
+                    stats.known += len(batch) - len(pending)
+                if enricher is not None and pending:
+                    pending = _enrich(pending, enricher)
+                if pending:
+                    stats.saved += writer(pending)
+            except Exception as e:
+                logger.error(f"Pipeline writer failed for batch of {len(batch)}: {e}")
+                stats.errors["writer"] = str(e)
+            stats.batches += 1
+        batch = []
+        last_flush = time.monotonic()
+
+    while remaining:
+        try:
+            item = paper_queue.get(timeout=flush_interval)
+        except queue.Empty:
+            _flush()
+            continue
+
+        if item is _DONE:
+            remaining -= 1
+            continue
+
+        stats.received += 1
+        key = extract_paper_key(item)
+        if key is None or key in seen_keys:
+            stats.duplicates += 1
+            continue
+
+        seen_keys.add(key)
+        stats.unique += 1
+        batch.append(item)
+
+        if len(batch) >= batch_size or time.monotonic() - last_flush >= flush_interval:
+            _flush()
+
+    _flush()
+    for thread in threads:
+        thread.join()
+
+    logger.info(
+        f"Pipeline completed: {stats.received} received, {stats.unique} unique, "
+        f"{stats.saved} saved in {stats.batches} batches"
+    )
+    return stats
+
+
+def biorxiv_producer(
+    start_date: datetime,
+    end_date: datetime,
+    category: str = DEFAULT_CATEGORY,
+    targets: Sequence[PreprintTarget] | None = None,
+) -> Producer:
+    """创建逐页产出 bioRxiv / medRxiv 论文的生产者
+
+    多个目标共享线程池和限速并发抓取，按页完成顺序产出
+
+    Args:
+        start_date: 开始日期
+        end_date: 结束日期
+        category: 论文分类（未提供 targets 时采集该 bioRxiv 分类）
+        targets: 预印本采集目标列表（可选）
+
+    Returns:
+        Producer: 生产者函数
+    """
+    targets = targets or [PreprintTarget(category=category)]
+
+    def produce(emit: Callable[[list[PaperData]], None]) -> None:
+        for page in iter_preprint_pages(start_date, end_date, targets):
+            emit(page)
+
+    return produce
+
+
+def rss_producer(sources: list[dict[str, Any]], **kwargs: Any) -> Producer:
+    """创建按源到达顺序产出 RSS 论文的生产者
+
+    队列满时 emit 会阻塞抓取引擎的事件循环，从而暂停后续解析（背压）。
+
+    Args:
+        sources: RSS 源配置列表
+        **kwargs: 传给 stream_rss_sources 的参数
+
+    Returns:
+        Producer: 生产者函数
+    """
+
+    def produce(emit: Callable[[list[PaperData]], None]) -> None:
+        stream_rss_sources(sources, emit, **kwargs)
+
+    return produce
+
+
+def stream_from_all_sources(
+    start_date: datetime,
+    end_date: datetime,
+    writer: Writer,
+    rss_sources: Iterable[dict[str, Any]] | None = None,
+    category: str = DEFAULT_CATEGORY,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    key_index: KeyIndex | None = None,
+    include_biorxiv: bool = True,
+    preprint_targets: Sequence[PreprintTarget] | None = None,
+) -> PipelineStats:
+    """以流式管道从所有源采集并写库
+
+    collect_from_all_sources 的流式版本：bioRxiv 与 RSS 同时抓取，
+    论文边到达边去重、边分批写入。
+
+    Args:
+        start_date: 开始日期
+        end_date: 结束日期
+        writer: 批量写入函数
+        rss_sources: RSS 源配置列表（可选）
+        category: bioRxiv 论文分类
+        batch_size: 每批写入的论文数
+        queue_size: 队列容量（论文数）
+        flush_interval: 最长写入间隔（秒）
+        key_index: 已入库论文的键索引（可选）
+        include_biorxiv: 是否采集 bioRxiv
+        preprint_targets: 预印本采集目标（可选，默认只采集 category 对应的 bioRxiv 分类）
+
+    Returns:
+        PipelineStats: 运行统计
+    """
+    logger.info(f"Starting streaming collection: {start_date} to {end_date}")
+
+    producers: dict[str, Producer] = {}
+    if include_biorxiv:
+        producers["bioRxiv"] = biorxiv_producer(start_date, end_date, category, preprint_targets)
+    sources = list(rss_sources or [])
+    if sources:
+        producers["rss"] = rss_producer(sources)
+
+    return run_pipeline(
+        producers,
+        writer,
+        batch_size=batch_size,
+        queue_size=queue_size,
+        flush_interval=flush_interval,
+        key_index=key_index,
+        enricher=enrich_papers if get_settings().enrichment_enabled else None,
+    )
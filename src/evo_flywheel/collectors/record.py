@@ -0,0 +1,121 @@
+"""论文记录模块
+
+采集路径（解析 -> 去重 -> 补全 -> 写库）上的论文记录。固定字段存放在 ``__slots__`` 中，
+来源和期刊名称驻留为同一个字符串对象，记录本身约 100 字节（同内容字典约 270 字节）；
+记录同时实现 MutableMapping，仍按字典方式访问论文的代码无需修改。
+"""
+
+import sys
+from collections.abc import Iterator, MutableMapping
+from dataclasses import dataclass, field
+from typing import Any
+
+# 采集路径上的论文：PaperRecord，或调用方仍以字典形式传入的论文
+PaperData = MutableMapping[str, Any]
+
+# 按字典方式访问时的固定键（与采集器输出的字典键一致）
+FIELDS = (
+    "title",
+    "authors",
+    "abstract",
+    "doi",
+    "url",
+    "publication_date",
+    "source",
+    "journal",
+)
+_FIELD_SET = frozenset(FIELDS)
+
+# 值需要驻留的字段（同一源的论文共享同一个字符串对象）
+_INTERNED = frozenset({"source", "journal"})
+
+
+def intern_name(value: str | None) -> str | None:
+    """驻留来源/期刊名称
+
+    Args:
+        value: 名称
+
+    Returns:
+        str | None: 驻留后的名称（非字符串原样返回）
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True, eq=False)
+class PaperRecord(MutableMapping[str, Any]):
+    """解析后的论文记录
+
+    字段之外的键（很少用到）保存在按需创建的附加字典中。
+    字段始终存在（缺失的值为 None），不能删除。
+
+    Example:
+        >>> paper = PaperRecord("Adaptive radiation", doi="10.1101/x", source="bioRxiv")
+        >>> paper["doi"], paper.get("journal")
+        ('10.1101/x', None)
+        >>> paper == {**paper}
+        True
+    """
+
+    title: str
+    authors: list[str] = field(default_factory=list)
+    abstract: str | None = None
+    doi: str | None = None
+    url: str | None = None
+    publication_date: str | None = None
+    source: str | None = None
+    journal: str | None = None
+    _extra: dict[str, Any] | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.source = intern_name(self.source)
+        self.journal = intern_name(self.journal)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _FIELD_SET:
+            return getattr(self, key)
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in _FIELD_SET:
+            setattr(self, key, intern_name(value) if key in _INTERNED else value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in _FIELD_SET:
+            raise TypeError(f"Cannot delete field {key!r} of PaperRecord, set it to None instead")
+        if self._extra is None:
+            raise KeyError(key)
+        del self._extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from FIELDS
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return len(FIELDS) + (len(self._extra) if self._extra else 0)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _FIELD_SET or (self._extra is not None and key in self._extra)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """与 dict.get 一致（字段直接读取属性，避免异常开销）"""
+        if key in _FIELD_SET:
+            return getattr(self, key)
+        if self._extra is not None:
+            return self._extra.get(key, default)
+        return default
+
+    def to_dict(self) -> dict[str, Any]:
+        """转换为普通字典
+
+        Returns:
+            dict: 包含全部字段和附加键的字典
+        """
+        return dict(self.items())
@@ -3,27 +3,40 @@
 解析 RSS feeds 并提取论文元数据
 """
 
-import re
+from dataclasses import dataclass
+from datetime import UTC, datetime
 from typing import Any
 
 import feedparser
-import requests
-from bs4 import BeautifulSoup
 
+from evo_flywheel.collectors.fetcher import build_conditional_headers
+from evo_flywheel.collectors.http import DEFAULT_HEADERS, http_get
+from evo_flywheel.collectors.record import PaperData, PaperRecord
+from evo_flywheel.collectors.textnorm import extract_doi, html_to_text
 from evo_flywheel.logging import get_logger
 
 logger = get_logger(__name__)
 
 
-def fetch_rss_feed(url: str, timeout: int = 60) -> feedparser.FeedParserDict:
+def fetch_rss_feed(
+    url: str,
+    timeout: int = 60,
+    etag: str | None = None,
+    last_modified: str | None = None,
+) -> feedparser.FeedParserDict:
     """获取 RSS feed
 
+    传入上次抓取保存的 ``etag`` / ``last_modified`` 时发送条件请求；
+    服务器返回 304 时不再解析，直接返回 ``status == 304`` 且无条目的结果。
+
     Args:
         url: RSS feed URL
         timeout: 请求超时时间（秒），默认 60 秒
+        etag: 上次响应的 ETag（可选）
+        last_modified: 上次响应的 Last-Modified（可选）
 
     Returns:
-        FeedParserDict: 解析后的 feed 对象
+        FeedParserDict: 解析后的 feed 对象（含 etag / modified 校验器）
 
     Raises:
         Exception: 网络请求失败
@@ -32,15 +45,20 @@ def fetch_rss_feed(url: str, timeout: int = 60) -> feedparser.FeedParserDict:
     logger.debug(f"Fetching RSS feed: {url}")
 
     # 使用浏览器 User-Agent 避免被 403 拒绝
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
-    }
+    headers = dict(DEFAULT_HEADERS)
+    headers.update(build_conditional_headers(etag, last_modified))
 
     try:
-        response = requests.get(url, timeout=timeout, headers=headers)
+        response = http_get(url, timeout=timeout, headers=headers)
+        if response.status_code == 304:
+            logger.debug(f"RSS feed not modified: {url}")
+            return feedparser.FeedParserDict(
+                status=304,
+                entries=[],
+                feed=feedparser.FeedParserDict(),
+                etag=etag,
+                modified=last_modified,
+            )
         response.raise_for_status()
     except TimeoutError:
         logger.error(f"Timeout fetching RSS feed: {url}")
@@ -49,42 +67,18 @@ def fetch_rss_feed(url: str, timeout: int = 60) -> feedparser.FeedParserDict:
         logger.error(f"Failed to fetch RSS feed {url}: {e}")
         raise
 
-    return feedparser.parse(response.content)
-
-
-def extract_doi(text: str | None) -> str | None:
-    """从文本中提取 DOI
-
-    Args:
-        text: 输入文本
-
-    Returns:
-        str | None: 提取的 DOI，未找到返回 None
-    """
-    if not text:
-        return None
-
-    # 匹配 DOI 格式: 10.xxxx/xxxxx
-    doi_patterns = [
-        r"\b10\.\d{4,9}/[^\s\]\"\'<>]+",  # 标准 DOI 格式
-        r"doi:(10\.\d{4,9}/[^\s\"\'<>]+)",  # doi: 前缀
-        r"doi\.org/(10\.\d{4,9}/[^\s\"\'<>]+)",  # doi.org 域名
-    ]
-
-    for pattern in doi_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            doi = match.group(1) if match.lastindex and match.lastindex >= 1 else match.group(0)
-            # 清理可能的后缀
-            doi = re.sub(r"[.,;:\s]+$", "", doi)
-            return doi
-
-    return None
+    feed = feedparser.parse(response.content)
+    feed["etag"] = response.headers.get("ETag")
+    feed["modified"] = response.headers.get("Last-Modified")
+    return feed
 
 
 def clean_html(text: str | None) -> str:
     """清理文本中的 HTML 标签
 
+    使用流式标签剥离器；畸形标记（未闭合的标签、注释等）按原文保留为文本，
+    与 BeautifulSoup 的 html.parser 结果一致
+
     Args:
         text: 包含 HTML 的文本
 
@@ -94,8 +88,7 @@ def clean_html(text: str | None) -> str:
     if not text:
         return ""
 
-    soup = BeautifulSoup(text, "html.parser")
-    return soup.get_text(separator=" ", strip=True)
+    return html_to_text(text)
 
 
 def parse_authors(entry: feedparser.FeedParserDict) -> list[str]:
@@ -132,7 +125,7 @@ def parse_authors(entry: feedparser.FeedParserDict) -> list[str]:
 def parse_entry(
     entry: feedparser.FeedParserDict,
     source: str,
-) -> dict[str, Any]:
+) -> PaperRecord | dict[str, Any]:
     """解析单个 RSS 条目
 
     Args:
@@ -140,7 +133,7 @@ def parse_entry(
         source: 数据源名称
 
     Returns:
-        dict: 解析后的论文数据
+        PaperRecord | dict: 解析后的论文记录，无效条目返回空字典
     """
     # 基础字段
     title = entry.get("title", "").strip()
@@ -163,10 +156,6 @@ def parse_entry(
     if not doi and url:
         doi = extract_doi(url)
 
-    # 清理 DOI（去掉可能的前缀）
-    if doi:
-        doi = re.sub(r"^doi:", "", doi, flags=re.IGNORECASE)
-
     # 解析作者
     authors = parse_authors(entry)
 
@@ -183,22 +172,71 @@ def parse_entry(
     elif "updated" in entry:
         publication_date = entry.updated
 
-    return {
-        "title": title,
-        "authors": authors,
-        "abstract": abstract,
-        "doi": doi,
-        "url": url,
-        "publication_date": publication_date,
-        "source": source,
-        "journal": source,  # 对于 RSS 数据，source 就是期刊名
-    }
+    return PaperRecord(
+        title=title,
+        authors=authors,
+        abstract=abstract,
+        doi=doi,
+        url=url,
+        publication_date=publication_date,
+        source=source,
+        journal=source,  # 对于 RSS 数据，source 就是期刊名
+    )
+
+
+def entry_datetime(entry: feedparser.FeedParserDict) -> datetime | None:
+    """获取条目的发布时间（UTC）
+
+    优先使用 feedparser 解析好的 published_parsed，其次 updated_parsed
+
+    Args:
+        entry: RSS 条目
+
+    Returns:
+        datetime | None: 带 UTC 时区的发布时间，无法解析返回 None
+    """
+    for field in ("published_parsed", "updated_parsed"):
+        parsed = entry.get(field)
+        if parsed:
+            try:
+                return datetime(*parsed[:6], tzinfo=UTC)
+            except (TypeError, ValueError):
+                continue
+    return None
+
+
+def filter_entries_since(
+    entries: list[feedparser.FeedParserDict],
+    since: datetime | None,
+) -> tuple[list[feedparser.FeedParserDict], datetime | None]:
+    """过滤出晚于指定时间的条目
+
+    没有日期的条目无法判断新旧，一律保留（由后续去重处理）
+
+    Args:
+        entries: RSS 条目列表
+        since: 截止时间（UTC），None 表示不过滤
+
+    Returns:
+        tuple: (保留的条目列表, 所有条目中最新的发布时间)
+    """
+    kept = []
+    newest: datetime | None = None
+
+    for entry in entries:
+        published = entry_datetime(entry)
+        if published is not None and (newest is None or published > newest):
+            newest = published
+        if since is None or published is None or published > since:
+            kept.append(entry)
+
+    return kept, newest
 
 
 def parse_rss_entries(
     entries: list[feedparser.FeedParserDict],
     source: str,
-) -> list[dict[str, Any]]:
+) -> list[PaperData]:
     """批量解析 RSS 条目
 
     Args:
@@ -206,9 +244,9 @@ def parse_rss_entries(
         source: 数据源名称
 
     Returns:
-        list[dict]: 解析后的论文数据列表
+        list[PaperData]: 解析后的论文记录列表
     """
-    results = []
+    results: list[PaperData] = []
 
     for entry in entries:
         try:
@@ -222,3 +260,40 @@ def parse_rss_entries(
 
     logger.info(f"Parsed {len(results)} valid entries from {len(entries)} total entries")
     return results
+
+
+@dataclass
+class ParsedFeed:
+    """单个 feed 的解析结果（可跨进程传递）"""
+
+    papers: list[PaperData]
+    total_entries: int
+    new_entries: int
+    newest: datetime | None
+
+
+def parse_feed_content(
+    content: bytes,
+    source: str,
+    since: datetime | None = None,
+) -> ParsedFeed:
+    """解析原始 feed 内容为论文数据
+
+    模块级纯函数，可在进程池中执行：输入原始字节，只返回紧凑的论文记录。
+
+    Args:
+        content: feed 原始内容
+        source: 数据源名称
+        since: 只保留晚于该时间的条目（UTC），None 表示不过滤
+
+    Returns:
+        ParsedFeed: 解析结果
+    """
+    feed = feedparser.parse(content)
+    entries, newest = filter_entries_since(feed.entries, since)
+    return ParsedFeed(
+        papers=parse_rss_entries(entries, source=source),
+        total_entries=len(feed.entries),
+        new_entries=len(entries),
+        newest=newest,
+    )
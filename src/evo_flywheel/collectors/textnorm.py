@@ -0,0 +1,168 @@
+"""文本规范化模块
+
+采集热路径上的标题规范化、DOI 提取与 HTML 转纯文本：正则预编译、
+单次 str.translate 替换，纯 ASCII 文本走快速路径，重复标题由 LRU 缓存命中
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from html.parser import HTMLParser
+
+# 标题规范化缓存容量（同一标题在多个源、多次运行中反复出现）
+TITLE_CACHE_SIZE = 65536
+
+# Unicode 分数字符 -> ASCII（须在 NFKD 之前替换，否则会分解为分数斜线 U+2044）
+_FRACTION_TABLE = str.maketrans(
+    {
+        "½": "1/2",
+        "⅓": "1/3",
+        "⅔": "2/3",
+        "¼": "1/4",
+        "¾": "3/4",
+        "⅕": "1/5",
+        "⅛": "1/8",
+        "⅜": "3/8",
+        "⅝": "5/8",
+        "⅞": "7/8",
+    }
+)
+
+# DOI 格式: 10.xxxx/xxxxx
+# 标准格式可匹配文本中任意位置的 DOI（包括 doi: 前缀和 doi.org 链接中的），
+# 带前缀的格式仅在标准格式未命中时使用（允许 DOI 以 "]" 开头等边界情况）
+_DOI_RE = re.compile(r"\b10\.\d{4,9}/[^\s\]\"\'<>]+", re.IGNORECASE)
+_PREFIXED_DOI_RE = re.compile(r"(?:doi:|doi\.org/)(10\.\d{4,9}/[^\s\"\'<>]+)", re.IGNORECASE)
+
+# DOI 末尾常见的标点（匹配结果不含空白，只需去掉标点）
+_DOI_TRAILING_CHARS = ".,;:"
+
+
+@lru_cache(maxsize=TITLE_CACHE_SIZE)
+def normalize_title(title: str) -> str:
+    """规范化标题用于去重
+
+    替换 Unicode 分数字符、转小写、NFKD 分解并移除变音符号、压缩空白
+
+    Args:
+        title: 原始标题
+
+    Returns:
+        str: 规范化后的标题
+    """
+    # 纯 ASCII：无分数字符和变音符号，NFKD 不改变文本
+    if title.isascii():
+        return " ".join(title.lower().split())
+
+    title = unicodedata.normalize("NFKD", title.translate(_FRACTION_TABLE).lower())
+    title = "".join(c for c in title if not unicodedata.combining(c))
+    return " ".join(title.split())
+
+
+def extract_doi(text: str | None) -> str | None:
+    """从文本中提取 DOI
+
+    Args:
+        text: 输入文本
+
+    Returns:
+        str | None: 提取的 DOI，未找到返回 None
+    """
+    if not text:
+        return None
+
+    match = _DOI_RE.search(text)
+    if match:
+        doi = match.group(0)
+    else:
+        match = _PREFIXED_DOI_RE.search(text)
+        if not match:
+            return None
+        doi = match.group(1)
+
+    # 清理可能的后缀
+    return doi.rstrip(_DOI_TRAILING_CHARS)
+
+
+# 内容不计入文本的标签（与 BeautifulSoup.get_text 一致）
+_NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+
+class _TextExtractor(HTMLParser):
+    """流式提取 HTML 中的文本节点
+
+    相邻的数据片段合并为一个文本节点，遇到标签、注释、声明时结束当前节点，
+    与 BeautifulSoup 的文本节点划分一致。
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.parts: list[str] = []
+        self._buffer: list[str] = []
+        self._skip_depth = 0
+
+    def _flush(self) -> None:
+        if self._buffer:
+            text = "".join(self._buffer).strip()
+            if text:
+                self.parts.append(text)
+            self._buffer = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:  # noqa: ARG002
+        self._flush()
+        if tag in _NON_TEXT_TAGS:
+            self._skip_depth += 1
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:  # noqa: ARG002
+        self._flush()
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush()
+        if tag in _NON_TEXT_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data: str) -> None:
+        if not self._skip_depth:
+            self._buffer.append(data)
+
+    def handle_comment(self, data: str) -> None:  # noqa: ARG002
+        self._flush()
+
+    def handle_decl(self, decl: str) -> None:  # noqa: ARG002
+        self._flush()
+
+    def handle_pi(self, data: str) -> None:  # noqa: ARG002
+        self._flush()
+
+    def close(self) -> None:
+        super().close()
+        self._flush()
+
+    def unknown_decl(self, data: str) -> None:
+        # <![CDATA[...]]> 的内容作为独立文本节点保留
+        self._flush()
+        if data.startswith("CDATA["):
+            self._buffer.append(data[len("CDATA[") :])
+            self._flush()
+
+
+def html_to_text(text: str) -> str:
+    """将 HTML 片段转换为纯文本
+
+    与 ``BeautifulSoup(text, "html.parser").get_text(separator=" ", strip=True)``
+    的空白语义相同：每个文本节点去除首尾空白，丢弃空节点，以单个空格连接。
+    不含标签和实体的文本直接返回。
+
+    Args:
+        text: HTML 片段
+
+    Returns:
+        str: 纯文本
+    """
+    if "<" not in text and "&" not in text:
+        return text.strip()
+
+    extractor = _TextExtractor()
+    extractor.feed(text)
+    extractor.close()
+    return " ".join(extractor.parts)
@@ -4,6 +4,7 @@
 """
 
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -24,6 +25,52 @@ class Settings(BaseSettings):
         default="./data/evo_flywheel.db",
         description="SQLite 数据库路径（兼容配置）",
     )
+    database_pool_size: int = Field(
+        default=5,
+        description="数据库连接池常驻连接数（进程内所有会话共享）",
+    )
+    database_max_overflow: int = Field(
+        default=10,
+        description="连接池满时允许额外创建的连接数",
+    )
+    database_pool_timeout: float = Field(
+        default=30.0,
+        description="等待连接池空闲连接的最长时间（秒）",
+    )
+    database_pool_recycle: int = Field(
+        default=1800,
+        description="连接的最长复用时间（秒），超过后重新建立，-1 表示不回收",
+    )
+
+    # SQLite 性能配置（每个新连接执行对应的 PRAGMA）
+    sqlite_journal_mode: Literal["WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY"] = Field(
+        default="WAL",
+        description="日志模式，WAL 下读写互不阻塞（调度器写库时 API/Streamlit 仍可读）",
+    )
+    sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = Field(
+        default="NORMAL",
+        description="同步级别，WAL 模式下 NORMAL 不会损坏数据库（断电可能丢失最近的事务）",
+    )
+    sqlite_cache_size_kb: int = Field(
+        default=64 * 1024,
+        description="每个连接的页缓存大小（KB）",
+    )
+    sqlite_mmap_size_mb: int = Field(
+        default=256,
+        description="内存映射读取的最大字节数（MB），0 表示不使用 mmap",
+    )
+    sqlite_temp_store: Literal["DEFAULT", "FILE", "MEMORY"] = Field(
+        default="MEMORY",
+        description="临时表和排序索引的存放位置",
+    )
+    sqlite_busy_timeout_ms: int = Field(
+        default=5000,
+        description="数据库被锁定时等待的最长时间（毫秒），超时后报 database is locked",
+    )
+    migration_batch_size: int = Field(
+        default=1000,
+        description="数据迁移每批更新的行数（每批单独提交，避免长时间持有写锁）",
+    )
 
     # Chroma 配置
     chroma_persist_dir: str = Field(
@@ -69,6 +116,176 @@ class Settings(BaseSettings):
         description="RSS 源配置文件路径",
     )
 
+    # 增量采集配置
+    collection_overlap_hours: int = Field(
+        default=24,
+        description="增量采集时在高水位之前额外回看的小时数（覆盖迟到/修改的条目）",
+    )
+    collection_default_days: int = Field(
+        default=7,
+        description="源没有高水位记录时的默认采集天数",
+    )
+
+    collection_streaming: bool = Field(
+        default=False,
+        description="是否使用流式管道采集（边抓取边去重、分批入库）",
+    )
+    collection_batch_size: int = Field(
+        default=100,
+        description="流式采集每批写库的论文数",
+    )
+    collection_queue_size: int = Field(
+        default=1000,
+        description="流式采集队列容量（论文数），队列满时暂停抓取",
+    )
+    collection_parse_workers: int = Field(
+        default=0,
+        description="RSS 解析进程数（0 表示在主进程解析，大批量源可设为 CPU 核数）",
+    )
+    collection_deadline_seconds: float = Field(
+        default=180.0,
+        description="一次采集的总截止时间（秒），bioRxiv 与所有 RSS 源共用，到期未完成的源记为超时",
+    )
+
+    # 自适应轮询配置
+    polling_enabled: bool = Field(
+        default=True,
+        description="是否按各源的更新频率分别安排轮询（关闭时每次采集轮询所有源）",
+    )
+    polling_tick_minutes: int = Field(
+        default=30,
+        description="检查到期源的调度间隔（分钟）",
+    )
+    polling_min_interval_hours: float = Field(
+        default=1.0,
+        description="单个源的最短轮询间隔（小时）",
+    )
+    polling_max_interval_hours: float = Field(
+        default=72.0,
+        description="单个源的最长轮询间隔（小时），安静或失败的源退避到此为止",
+    )
+    polling_default_interval_hours: float = Field(
+        default=4.0,
+        description="尚未学到更新频率的源的轮询间隔（小时）",
+    )
+    polling_target_items: float = Field(
+        default=5.0,
+        description="预计积累多少篇新论文后再次轮询（决定活跃源的间隔）",
+    )
+    polling_smoothing: float = Field(
+        default=0.3,
+        description="更新频率指数平滑系数（越大越偏向最近一次观察）",
+    )
+    polling_backoff_factor: float = Field(
+        default=2.0,
+        description="源没有新论文或抓取失败时轮询间隔的放大倍数",
+    )
+
+    # 源熔断配置
+    circuit_failure_threshold: int = Field(
+        default=3,
+        description="连续失败多少次后打开源的熔断器（冷却期内跳过该源）",
+    )
+    circuit_cooldown_minutes: int = Field(
+        default=30,
+        description="熔断器首次打开的冷却时间（分钟），之后每次失败翻倍",
+    )
+    circuit_cooldown_max_hours: int = Field(
+        default=24,
+        description="熔断器的最长冷却时间（小时）",
+    )
+
+    collection_archive_dir: str = Field(
+        default="",
+        description="原始响应归档目录（gzip + 内容寻址，供离线重放解析），为空表示不归档",
+    )
+
+    # 采集 HTTP 配置
+    http_max_connections: int = Field(
+        default=20,
+        description="采集 HTTP 连接池的最大连接数（同一主机的连接会被复用）",
+    )
+    http_max_retries: int = Field(
+        default=2,
+        description="连接错误、超时和 429/5xx 响应的最大重试次数",
+    )
+    http_backoff_base: float = Field(
+        default=0.5,
+        description="重试退避基数（秒），第 n 次重试最多等待 base * 2^n 秒（带随机抖动）",
+    )
+    http_backoff_max: float = Field(
+        default=30.0,
+        description="单次重试的最长等待时间（秒）",
+    )
+
+    # 元数据补全配置（Crossref 兼容接口）
+    enrichment_enabled: bool = Field(
+        default=False,
+        description="采集后是否为缺少 DOI 或摘要的论文查询 Crossref 兼容接口补全元数据",
+    )
+    enrichment_api_url: str = Field(
+        default="https://api.crossref.org",
+        description="Crossref 兼容接口的 Base URL（不含 /works 路径）",
+    )
+    enrichment_mailto: str = Field(
+        default="",
+        description="随请求发送的联系邮箱（Crossref polite pool）",
+    )
+    enrichment_cache_path: str = Field(
+        default="data/enrichment_cache.sqlite",
+        description="查询结果缓存文件路径（SQLite）",
+    )
+    enrichment_batch_size: int = Field(
+        default=20,
+        description="每次请求批量查询的 DOI 数",
+    )
+    enrichment_concurrency: int = Field(
+        default=3,
+        description="并发查询数",
+    )
+    enrichment_requests_per_second: float = Field(
+        default=5.0,
+        description="补全接口的限速（每秒请求数），0 表示不限速",
+    )
+    enrichment_title_similarity: float = Field(
+        default=0.9,
+        description="按标题检索时接受结果的最低标题相似度",
+    )
+    enrichment_negative_ttl_days: int = Field(
+        default=7,
+        description="未命中结果的缓存天数（过期后重新查询）",
+    )
+
+    # 近似去重配置
+    dedup_near_duplicates: bool = Field(
+        default=True,
+        description="入库前是否用 MinHash/LSH 跳过与已有论文近似重复的论文",
+    )
+    dedup_similarity_threshold: float = Field(
+        default=0.8,
+        description="判定为近似重复的最低估计 Jaccard 相似度",
+    )
+    dedup_abstract_tokens: int = Field(
+        default=0,
+        description="计算签名时加入的摘要前 N 个词（0 表示只用标题）",
+    )
+
+    # 预印本 API（bioRxiv / medRxiv）配置
+    biorxiv_max_workers: int = Field(
+        default=4,
+        description="并发请求预印本 API 的线程数（所有服务器、分类和分页共享）",
+    )
+    biorxiv_requests_per_second: float = Field(
+        default=4.0,
+        description="预印本 API 的共享限速（每秒请求数），0 表示不限速",
+    )
+
+    # bioRxiv 回填配置
+    biorxiv_checkpoint_path: str = Field(
+        default="data/biorxiv_checkpoints.json",
+        description="bioRxiv 分页游标检查点文件路径（用于断点续采）",
+    )
+
     # 报告配置
     reports_dir: str = Field(
         default="reports",
@@ -1,6 +1,6 @@
 """数据库模块"""
 
-from evo_flywheel.db import crud
+from evo_flywheel.db import crud, indexes
 from evo_flywheel.db.models import Base, DailyReport, Feedback, Paper, RSSSource
 
-__all__ = ["Base", "Paper", "DailyReport", "Feedback", "RSSSource", "crud"]
+__all__ = ["Base", "Paper", "DailyReport", "Feedback", "RSSSource", "crud", "indexes"]
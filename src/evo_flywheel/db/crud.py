@@ -3,16 +3,34 @@
 提供论文、报告、反馈的增删改查操作
 """
 
-from datetime import date, timedelta
+from collections.abc import Iterable
+from datetime import UTC, date, datetime, timedelta
 from typing import Any
 
+from sqlalchemy import Table, and_, exists, insert, or_, select
 from sqlalchemy.orm import Session
 
-from evo_flywheel.db.models import CollectionLog, DailyReport, Feedback, Paper, PaperCluster
+from evo_flywheel.collectors.dedup import extract_paper_key
+from evo_flywheel.collectors.record import PaperData
+from evo_flywheel.db.models import (
+    CollectionLog,
+    DailyReport,
+    Feedback,
+    Paper,
+    PaperAuthor,
+    PaperCluster,
+    PaperKey,
+    PaperTag,
+    RSSSource,
+    split_names,
+)
 from evo_flywheel.logging import get_logger
 
 logger = get_logger(__name__)
 
+# IN 查询分块大小（SQLite 单条语句的参数数量有限）
+_KEY_CHUNK_SIZE = 500
+
 # ============================================================================
 # Paper CRUD
 # ============================================================================
@@ -93,6 +111,292 @@ def create_paper(
     return paper
 
 
+def _paper_row(paper_data: PaperData, created_at: datetime) -> dict[str, Any]:
+    """将采集到的论文（记录或字典）转换为 papers 表的插入行"""
+    authors = paper_data.get("authors") or []
+    return {
+        "title": paper_data.get("title", ""),
+        "doi": paper_data.get("doi") or None,
+        "authors": ";".join(authors) if authors else None,
+        "abstract": paper_data.get("abstract"),
+        "url": paper_data.get("url"),
+        "publication_date": paper_data.get("publication_date"),
+        "journal": paper_data.get("journal"),
+        "source": paper_data.get("source"),
+        "embedded": False,
+        "created_at": created_at,
+    }
+
+
+def _insert_ignoring_conflicts(db: Session, table: Table):
+    """构建遇到唯一约束冲突时跳过的 INSERT 语句"""
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+        return sqlite_insert(table).on_conflict_do_nothing()
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+        return pg_insert(table).on_conflict_do_nothing()
+    return insert(table)
+
+
+def _add_author_rows(db: Session, papers: Iterable[tuple[int, str | None]]) -> None:
+    """为批量插入的论文写入 paper_authors 行（Core INSERT 不触发模型上的同步事件）"""
+    rows = [
+        {"paper_id": paper_id, "position": position, "name": name}
+        for paper_id, authors in papers
+        for position, name in enumerate(split_names(authors))
+    ]
+    if rows:
+        db.execute(insert(PaperAuthor.__table__), rows)
+
+
+def _inserted_papers(db: Session, rows: list[dict[str, Any]]) -> list[tuple[int, str | None]]:
+    """按本批插入行的判重键（DOI，无 DOI 时为 URL，两者都没有时为标题）查回新插入的论文
+
+    不支持 executemany RETURNING 时使用。只返回还没有作者行的论文，
+    并发写入抢先插入的同一论文（已由其写入方写过作者行）不会被重复处理。
+    """
+    dois = [row["doi"] for row in rows if row["doi"]]
+    urls = [row["url"] for row in rows if not row["doi"] and row["url"]]
+    titles = [row["title"] for row in rows if not row["doi"] and not row["url"]]
+
+    conditions = []
+    if dois:
+        conditions.append(Paper.doi.in_(dois))
+    if urls:
+        conditions.append(and_(Paper.doi.is_(None), Paper.url.in_(urls)))
+    if titles:
+        conditions.append(and_(Paper.doi.is_(None), Paper.url.is_(None), Paper.title.in_(titles)))
+
+    has_authors = exists().where(PaperAuthor.paper_id == Paper.id)
+    query = select(Paper.id, Paper.authors).where(or_(*conditions), ~has_authors)
+    return [(paper_id, authors) for paper_id, authors in db.execute(query)]
+
+
+def bulk_upsert_papers(
+    db: Session,
+    papers: list[PaperData],
+    *,
+    chunk_size: int = 500,
+) -> dict[str, int]:
+    """批量保存采集到的论文，已存在的论文跳过
+
+    与逐篇 get_paper_by_doi + create_paper 的判重规则一致（有 DOI 按 DOI，
+    否则按 URL），但每个分块只做一次 DOI 和一次 URL 的集合查询，
+    再用一条 executemany INSERT ... ON CONFLICT DO NOTHING 写入，
+    全部分块在同一个事务中提交。论文键同时写入 paper_keys 表，
+    供下次采集在解析后立即过滤已入库的论文；作者写入 paper_authors 表
+    （支持 executemany RETURNING 的数据库直接取回新论文的 ID，否则按本批的 DOI / URL 查回）。
+
+    Args:
+        db: 数据库会话
+        papers: 论文数据列表（采集器输出格式）
+        chunk_size: 每个分块的论文数
+
+    Returns:
+        dict: {"inserted": 新插入数量, "skipped": 跳过数量}
+    """
+    inserted = 0
+    skipped = 0
+    created_at = datetime.now(UTC)
+    statement = _insert_ignoring_conflicts(db, Paper.__table__)
+    returning = db.get_bind().dialect.insert_executemany_returning
+    if returning:
+        statement = statement.returning(Paper.id, Paper.authors)
+
+    for offset in range(0, len(papers), chunk_size):
+        chunk = papers[offset : offset + chunk_size]
+
+        dois = {p["doi"] for p in chunk if p.get("doi")}
+        urls = {p["url"] for p in chunk if not p.get("doi") and p.get("url")}
+
+        existing_dois: set[str] = set()
+        if dois:
+            existing_dois = set(db.scalars(select(Paper.doi).where(Paper.doi.in_(dois))))
+        existing_urls: set[str] = set()
+        if urls:
+            existing_urls = set(db.scalars(select(Paper.url).where(Paper.url.in_(urls))))
+
+        add_paper_keys(db, (extract_paper_key(p) for p in chunk))
+
+        rows = []
+        for paper_data in chunk:
+            doi = paper_data.get("doi")
+            url = paper_data.get("url")
+            if doi:
+                if doi in existing_dois:
+                    skipped += 1
+                    continue
+                existing_dois.add(doi)
+            elif url:
+                if url in existing_urls:
+                    skipped += 1
+                    continue
+                existing_urls.add(url)
+            rows.append(_paper_row(paper_data, created_at))
+
+        if not rows:
+            continue
+
+        result = db.execute(statement, rows)
+        # 并发写入导致的 DOI 冲突会被 DO NOTHING 忽略
+        if returning:
+            new_papers = result.all()
+            chunk_inserted = len(new_papers)
+        else:
+            chunk_inserted = (
+                result.rowcount
+                if result.rowcount is not None and result.rowcount >= 0
+                else len(rows)
+            )
+            new_papers = _inserted_papers(db, rows) if chunk_inserted else []
+        _add_author_rows(db, new_papers)
+        inserted += chunk_inserted
+        skipped += len(rows) - chunk_inserted
+
+    db.commit()
+
+    logger.info(f"Bulk upsert: {inserted} inserted, {skipped} skipped")
+    return {"inserted": inserted, "skipped": skipped}
+
+
+# 由采集器解析得到、重放归档时可以更正的列（分析结果、标签等不受影响）
+PARSED_PAPER_FIELDS = ("title", "authors", "abstract", "url", "publication_date", "journal")
+
+
+def refresh_parsed_papers(
+    db: Session,
+    papers: list[PaperData],
+    *,
+    chunk_size: int = 500,
+) -> int:
+    """用重新解析的论文更正已入库论文的解析字段
+
+    解析器修复后重放原始响应归档时使用。按与 bulk_upsert_papers 相同的判重规则
+    （有 DOI 按 DOI，否则按 URL）找到已入库的论文，只更新 PARSED_PAPER_FIELDS
+    中取值变化的列；库中没有的论文跳过（由 bulk_upsert_papers 插入）。
+
+    Args:
+        db: 数据库会话
+        papers: 重新解析的论文列表（采集器输出格式）
+        chunk_size: 每个分块的论文数
+
+    Returns:
+        int: 有字段被更新的论文数
+    """
+    updated = 0
+    created_at = datetime.now(UTC)
+
+    for offset in range(0, len(papers), chunk_size):
+        chunk = papers[offset : offset + chunk_size]
+
+        dois = {p["doi"] for p in chunk if p.get("doi")}
+        urls = {p["url"] for p in chunk if not p.get("doi") and p.get("url")}
+        conditions = []
+        if dois:
+            conditions.append(Paper.doi.in_(dois))
+        if urls:
+            conditions.append(and_(Paper.doi.is_(None), Paper.url.in_(urls)))
+        if not conditions:
+            continue
+
+        by_doi: dict[str, Paper] = {}
+        by_url: dict[str, Paper] = {}
+        for paper in db.scalars(select(Paper).where(or_(*conditions))):
+            if paper.doi:
+                by_doi[paper.doi] = paper
+            elif paper.url:
+                by_url[paper.url] = paper
+
+        for paper_data in chunk:
+            doi = paper_data.get("doi")
+            existing = by_doi.get(doi) if doi else by_url.get(paper_data.get("url") or "")
+            if existing is None:
+                continue
+
+            row = _paper_row(paper_data, created_at)
+            changed = False
+            for field in PARSED_PAPER_FIELDS:
+                if getattr(existing, field) != row[field]:
+                    # authors 的赋值由属性事件同步 paper_authors 行
+                    setattr(existing, field, row[field])
+                    changed = True
+            if changed:
+                updated += 1
+
+    db.commit()
+
+    logger.info(f"Refreshed parsed fields of {updated} papers")
+    return updated
+
+
+def get_known_paper_keys(db: Session, keys: Iterable[str]) -> set[str]:
+    """返回已入库的论文键
+
+    Args:
+        db: 数据库会话
+        keys: 待检查的论文键（extract_paper_key 格式）
+
+    Returns:
+        set[str]: 其中已存在于 paper_keys 表的键
+    """
+    unique_keys = list(set(keys))
+    known: set[str] = set()
+    for offset in range(0, len(unique_keys), _KEY_CHUNK_SIZE):
+        chunk = unique_keys[offset : offset + _KEY_CHUNK_SIZE]
+        known.update(db.scalars(select(PaperKey.key).where(PaperKey.key.in_(chunk))))
+    return known
+
+
+def add_paper_keys(db: Session, keys: Iterable[str | None]) -> None:
+    """写入论文键（已存在的忽略，不提交事务）
+
+    Args:
+        db: 数据库会话
+        keys: 论文键，None 会被忽略
+    """
+    rows = [{"key": key} for key in set(keys) if key]
+    if rows:
+        db.execute(_insert_ignoring_conflicts(db, PaperKey.__table__), rows)
+
+
+def backfill_paper_keys(db: Session, batch_size: int = 1000) -> int:
+    """为已有论文补写论文键（可重复执行）
+
+    Args:
+        db: 数据库会话
+        batch_size: 每批读取的论文数
+
+    Returns:
+        int: 处理的论文数
+    """
+    count = 0
+    last_id = 0
+
+    while True:
+        rows = db.execute(
+            select(Paper.id, Paper.doi, Paper.title)
+            .where(Paper.id > last_id)
+            .order_by(Paper.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+
+        add_paper_keys(
+            db, (extract_paper_key({"doi": doi, "title": title}) for _, doi, title in rows)
+        )
+        last_id = rows[-1][0]
+        count += len(rows)
+        db.commit()
+
+    logger.info(f"Backfilled paper keys for {count} papers")
+    return count
+
+
 def get_paper_by_id(db: Session, paper_id: int) -> Paper | None:
     """根据 ID 获取论文
 
@@ -161,6 +465,49 @@ def get_papers(
     return query.offset(skip).limit(limit).all()
 
 
+def get_papers_by_author(db: Session, author: str, *, limit: int = 100) -> list[Paper]:
+    """获取某位作者的论文（按 paper_authors 索引连接，作者名精确匹配）
+
+    Args:
+        db: 数据库会话
+        author: 作者名
+        limit: 返回数量限制
+
+    Returns:
+        list[Paper]: 论文列表，按发表日期倒序
+    """
+    return (
+        db.query(Paper)
+        .join(PaperAuthor, PaperAuthor.paper_id == Paper.id)
+        .filter(PaperAuthor.name == author.strip())
+        .distinct()
+        .order_by(Paper.publication_date.desc())
+        .limit(limit)
+        .all()
+    )
+
+
+def get_papers_by_tag(db: Session, tag: str, *, limit: int = 100) -> list[Paper]:
+    """获取带某个标签的论文（按 paper_tags 索引连接）
+
+    Args:
+        db: 数据库会话
+        tag: 标签
+        limit: 返回数量限制
+
+    Returns:
+        list[Paper]: 论文列表，按评分倒序
+    """
+    return (
+        db.query(Paper)
+        .join(PaperTag, PaperTag.paper_id == Paper.id)
+        .filter(PaperTag.tag == tag.strip())
+        .order_by(Paper.importance_score.desc(), Paper.publication_date.desc())
+        .limit(limit)
+        .all()
+    )
+
+
 def update_paper(
     db: Session,
     paper_id: int,
@@ -465,6 +812,123 @@ def get_collection_logs(
     )
 
 
+# ============================================================================
+# RSSSource CRUD
+# ============================================================================
+
+# 在源配置字典与 RSSSource 表之间同步的状态字段
+SOURCE_STATE_FIELDS = (
+    "last_fetch",
+    "etag",
+    "last_modified",
+    "high_water_mark",
+    "update_rate",
+    "poll_interval",
+    "next_poll_at",
+    "circuit_state",
+    "consecutive_failures",
+    "open_until",
+    "last_error",
+)
+
+
+def get_or_create_rss_source(
+    db: Session,
+    *,
+    name: str,
+    url: str | None = None,
+    source_type: str = "rss",
+    priority: int | None = None,
+) -> RSSSource:
+    """按名称获取 RSS 源记录，不存在则创建
+
+    Args:
+        db: 数据库会话
+        name: 源名称
+        url: 源 URL
+        source_type: 源类型 ('rss' 或 'api')
+        priority: 优先级
+
+    Returns:
+        RSSSource: 源记录（新建记录只 flush，不提交）
+    """
+    record = db.query(RSSSource).filter(RSSSource.name == name).first()
+    if record is None:
+        record = RSSSource(name=name, url=url, source_type=source_type, priority=priority)
+        db.add(record)
+        db.flush()
+    elif url and record.url != url:
+        record.url = url
+
+    return record
+
+
+def get_rss_sources(db: Session) -> list[RSSSource]:
+    """获取所有源记录（按优先级排序）
+
+    Args:
+        db: 数据库会话
+
+    Returns:
+        list[RSSSource]: 源记录列表
+    """
+    return db.query(RSSSource).order_by(RSSSource.priority, RSSSource.name).all()
+
+
+def load_rss_source_state(db: Session, sources: list[dict[str, Any]]) -> None:
+    """将持久化的源状态加载到源配置字典中
+
+    对每个源配置，按名称查找（或创建）RSSSource 记录，
+    并把 SOURCE_STATE_FIELDS 中的字段写入字典。
+
+    Args:
+        db: 数据库会话
+        sources: 源配置列表（原地更新）
+    """
+    for source in sources:
+        name = source.get("name")
+        if not name:
+            continue
+
+        record = get_or_create_rss_source(
+            db,
+            name=name,
+            url=source.get("url"),
+            source_type=source.get("type", "rss"),
+            priority=source.get("priority"),
+        )
+        for field in SOURCE_STATE_FIELDS:
+            source[field] = getattr(record, field)
+
+    db.commit()
+
+
+def save_rss_source_state(db: Session, sources: list[dict[str, Any]]) -> None:
+    """将源配置字典中的状态字段写回 RSSSource 表
+
+    Args:
+        db: 数据库会话
+        sources: 源配置列表
+    """
+    for source in sources:
+        name = source.get("name")
+        if not name:
+            continue
+
+        record = get_or_create_rss_source(
+            db,
+            name=name,
+            url=source.get("url"),
+            source_type=source.get("type", "rss"),
+            priority=source.get("priority"),
+        )
+        for field in SOURCE_STATE_FIELDS:
+            if field in source:
+                setattr(record, field, source[field])
+
+    db.commit()
+
+
 # ============================================================================
 # PaperCluster CRUD
 # ============================================================================
@@ -0,0 +1,146 @@
+"""数据库引擎模块
+
+进程内共享一个带连接池的数据库引擎：API 的请求级会话、后台任务的
+``get_db_session`` 和其他模块都从这里取会话，不再各自创建引擎。
+SQLite 的每个新连接按配置执行性能相关的 PRAGMA（WAL、同步级别、缓存、mmap 等）
+"""
+
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
+
+from evo_flywheel.config import get_settings
+from evo_flywheel.logging import get_logger
+
+logger = get_logger(__name__)
+
+_engine: Engine | None = None
+_session_factory: sessionmaker[Session] | None = None
+_lock = threading.Lock()
+
+
+def engine_options(url: str) -> dict[str, Any]:
+    """按数据库 URL 生成连接池参数
+
+    SQLite 内存库只有一个连接可见，使用 StaticPool 共享同一连接；
+    SQLite 文件库和其他数据库使用 QueuePool（连接跨线程复用）。
+
+    Args:
+        url: 数据库连接 URL
+
+    Returns:
+        dict: ``create_engine`` 的关键字参数
+    """
+    settings = get_settings()
+    parsed = make_url(url)
+
+    if parsed.get_backend_name() == "sqlite":
+        connect_args = {"check_same_thread": False}
+        if parsed.database in (None, "", ":memory:"):
+            return {"poolclass": StaticPool, "connect_args": connect_args}
+    else:
+        connect_args = {}
+
+    return {
+        "poolclass": QueuePool,
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_timeout": settings.database_pool_timeout,
+        "pool_recycle": settings.database_pool_recycle,
+        "pool_pre_ping": True,
+        "connect_args": connect_args,
+    }
+
+
+def sqlite_pragmas() -> dict[str, str | int]:
+    """按配置生成 SQLite 连接的 PRAGMA
+
+    Returns:
+        dict: PRAGMA 名称 -> 值
+    """
+    settings = get_settings()
+    return {
+        "journal_mode": settings.sqlite_journal_mode,
+        "synchronous": settings.sqlite_synchronous,
+        "cache_size": -settings.sqlite_cache_size_kb,  # 负值表示以 KB 为单位
+        "mmap_size": settings.sqlite_mmap_size_mb * 1024 * 1024,
+        "temp_store": settings.sqlite_temp_store,
+        "busy_timeout": settings.sqlite_busy_timeout_ms,
+    }
+
+
+def _pragma_listener(pragmas: dict[str, str | int]) -> Callable[[Any, Any], None]:
+    """生成在新连接上执行 PRAGMA 的 connect 事件处理函数"""
+
+    def set_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    return set_pragmas
+
+
+def create_db_engine(url: str | None = None) -> Engine:
+    """创建带连接池的数据库引擎
+
+    SQLite 引擎的每个新连接执行 ``sqlite_pragmas()``（创建引擎时读取配置）。
+
+    Args:
+        url: 数据库连接 URL，默认 ``settings.effective_database_url``
+
+    Returns:
+        Engine: 新的数据库引擎
+    """
+    url = url or get_settings().effective_database_url
+    engine = create_engine(url, **engine_options(url))
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _pragma_listener(sqlite_pragmas()))
+    return engine
+
+
+def get_engine() -> Engine:
+    """获取进程内共享的数据库引擎（首次调用时创建）
+
+    Returns:
+        Engine: 数据库引擎
+    """
+    global _engine
+    if _engine is None:
+        with _lock:
+            if _engine is None:
+                _engine = create_db_engine()
+                logger.info(f"Created database engine: {_engine.url!r}")
+    return _engine
+
+
+def get_session_factory() -> sessionmaker[Session]:
+    """获取绑定共享引擎的会话工厂
+
+    Returns:
+        sessionmaker: 会话工厂
+    """
+    global _session_factory
+    if _session_factory is None:
+        engine = get_engine()
+        with _lock:
+            if _session_factory is None:
+                _session_factory = sessionmaker(bind=engine)
+    return _session_factory
+
+
+def dispose_engine() -> None:
+    """关闭共享引擎的所有连接（下次调用 ``get_engine`` 时按当前配置重新创建）"""
+    global _engine, _session_factory
+    with _lock:
+        engine, _engine, _session_factory = _engine, None, None
+    if engine is not None:
+        engine.dispose()
+        logger.info("Disposed database engine")
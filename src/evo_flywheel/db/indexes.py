@@ -0,0 +1,77 @@
+"""数据库索引管理模块
+
+按实际查询形态定义 papers 表的复合索引和部分索引。索引在导入本模块时挂到表上
+（``evo_flywheel.db`` 包导入时即导入），因此 ``Base.metadata.create_all`` 创建新表时会一并创建；
+已有数据库由 ``ensure_indexes`` 在启动时补建缺失的索引（可重复执行）。
+"""
+
+from sqlalchemy import Engine, Index, inspect
+
+from evo_flywheel.db.models import Paper
+from evo_flywheel.logging import get_logger
+
+logger = get_logger(__name__)
+
+PAPER_INDEXES: tuple[Index, ...] = (
+    # 论文列表按日期排序、按来源筛选、按评分筛选（stats 的已分析计数）
+    Index("idx_papers_date", Paper.publication_date),
+    Index("idx_papers_score", Paper.importance_score),
+    Index("idx_papers_source", Paper.source),
+    # 按采集时间范围查询（get_papers_by_date_range、日报、stats 今日新增），
+    # 带上评分使 only_analyzed 过滤在索引内完成
+    Index("idx_papers_created_score", Paper.created_at, Paper.importance_score),
+    # 按分类群筛选并按评分筛选/排序（论文列表、get_papers）
+    Index("idx_papers_taxa_score", Paper.taxa, Paper.importance_score),
+    # 待分析队列（importance_score IS NULL），按发表日期取最新的论文
+    # （scheduler.analysis._get_unanalyzed_papers、批量分析接口）。
+    # 首列 importance_score 使 SQLite 优先选用本索引而非 idx_papers_score + 临时排序
+    Index(
+        "idx_papers_unanalyzed_date",
+        Paper.importance_score,
+        Paper.publication_date,
+        sqlite_where=Paper.importance_score.is_(None),
+        postgresql_where=Paper.importance_score.is_(None),
+    ),
+    # 待向量化队列（embedded = 0）与向量化计数
+    Index("idx_papers_embedded_date", Paper.embedded, Paper.publication_date),
+    # 按 URL 查找论文（无 DOI 论文的判重、分析结果回写）
+    Index("idx_papers_url", Paper.url),
+)
+
+# 已被替换的索引，ensure_indexes 发现时删除
+OBSOLETE_INDEXES: tuple[str, ...] = ("idx_papers_unanalyzed",)
+
+
+def ensure_indexes(engine: Engine) -> list[str]:
+    """创建缺失的索引并删除已废弃的索引（已存在的跳过，表不存在时跳过其索引）
+
+    Args:
+        engine: 数据库引擎
+
+    Returns:
+        list[str]: 本次新建的索引名称
+    """
+    inspector = inspect(engine)
+    tables = set(inspector.get_table_names())
+    existing = {
+        index["name"]
+        for table in {index.table.name for index in PAPER_INDEXES} & tables
+        for index in inspector.get_indexes(table)
+    }
+
+    created = []
+    for index in PAPER_INDEXES:
+        if index.table.name in tables and index.name not in existing:
+            index.create(engine)
+            created.append(index.name)
+
+    obsolete = [name for name in OBSOLETE_INDEXES if name in existing]
+    if obsolete:
+        with engine.begin() as conn:
+            for name in obsolete:
+                conn.exec_driver_sql(f"DROP INDEX IF EXISTS {name}")
+        logger.info(f"Dropped obsolete indexes: {', '.join(obsolete)}")
+
+    if created:
+        logger.info(f"Created indexes: {', '.join(created)}")
+    return created
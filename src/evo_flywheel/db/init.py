@@ -1,6 +1,6 @@
 """数据库初始化脚本
 
-创建数据库表和索引
+创建数据库表和索引，并执行未执行的迁移
 """
 
 import sys
@@ -9,10 +9,11 @@ from pathlib import Path
 # 添加项目根目录到路径
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
-from sqlalchemy import Index, create_engine
-
 from evo_flywheel.config import get_settings
-from evo_flywheel.db.models import Base, Paper
+from evo_flywheel.db.engine import create_db_engine
+from evo_flywheel.db.indexes import ensure_indexes
+from evo_flywheel.db.migrations import apply_migrations
+from evo_flywheel.db.models import Base
 
 
 def init_database(drop_all: bool = False) -> None:
@@ -31,12 +32,8 @@ def init_database(drop_all: bool = False) -> None:
         # 确保数据目录存在
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
-    # 创建引擎
-    engine = create_engine(
-        db_url,
-        connect_args={"check_same_thread": False} if db_url.startswith("sqlite") else {},
-        echo=False,
-    )
+    # 创建引擎（SQLite 按配置设置 WAL 等 PRAGMA，日志模式写入数据库文件）
+    engine = create_db_engine(db_url)
 
     # 删除所有表（可选）
     if drop_all:
@@ -51,21 +48,26 @@ def init_database(drop_all: bool = False) -> None:
     print("📇 创建索引...")
     create_indexes(engine)
 
+    # 执行未执行的迁移（为已有数据库补列、补表、回填数据）
+    print("🔧 执行迁移...")
+    applied = apply_migrations(engine)
+    for item in applied:
+        print(f"  - {item.version}: {item.name}")
+    if not applied:
+        print("  - 无待执行的迁移")
+
+    engine.dispose()
     print(f"✅ 数据库初始化完成: {db_url}")
 
 
 def create_indexes(engine) -> None:
-    """创建额外的索引
+    """创建额外的索引（缺失的才创建，见 ``evo_flywheel.db.indexes``）
 
     Args:
         engine: SQLAlchemy 引擎
     """
-    # papers 表索引
-    Index("idx_papers_date", Paper.publication_date).create(engine, checkfirst=True)
-    Index("idx_papers_score", Paper.importance_score).create(engine, checkfirst=True)
-    Index("idx_papers_source", Paper.source).create(engine, checkfirst=True)
-
-    print("  - papers: publication_date, importance_score, source")
+    created = ensure_indexes(engine)
+    print(f"  - 新建索引: {', '.join(created) or '无（均已存在）'}")
 
 
 def main() -> None:
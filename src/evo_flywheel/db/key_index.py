@@ -0,0 +1,56 @@
+"""跨运行的论文键索引
+
+以 paper_keys 表记录已入库论文的键，采集器在解析后即可丢弃已入库的论文
+"""
+
+from collections.abc import Callable, Iterable
+from contextlib import AbstractContextManager
+
+from sqlalchemy.orm import Session
+
+from evo_flywheel.db import crud
+
+SessionScope = Callable[[], AbstractContextManager[Session]]
+
+
+class PaperKeyIndex:
+    """基于 paper_keys 表的论文键索引
+
+    每次查询使用独立的短会话，不会在采集期间长时间持有数据库读事务。
+
+    Args:
+        session_scope: 返回会话上下文管理器的函数（如 get_db_session）
+
+    Example:
+        >>> from evo_flywheel.db.context import get_db_session
+        >>> index = PaperKeyIndex(get_db_session)
+        >>> index.contains_many({"doi:10.1101/2024.01.01.000001"})
+        set()
+    """
+
+    def __init__(self, session_scope: SessionScope) -> None:
+        self._session_scope = session_scope
+
+    def contains_many(self, keys: set[str]) -> set[str]:
+        """返回其中已入库的键
+
+        Args:
+            keys: 待检查的论文键
+
+        Returns:
+            set[str]: 已入库的键
+        """
+        if not keys:
+            return set()
+        with self._session_scope() as session:
+            return crud.get_known_paper_keys(session, keys)
+
+    def add_many(self, keys: Iterable[str]) -> None:
+        """写入论文键
+
+        Args:
+            keys: 论文键
+        """
+        with self._session_scope() as session:
+            crud.add_paper_keys(session, keys)
+            session.commit()
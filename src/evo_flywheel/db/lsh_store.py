@@ -0,0 +1,154 @@
+"""近似去重索引的数据库存储
+
+将 MinHash 签名和 LSH 桶持久化到主数据库，索引随每次入库增量更新
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from evo_flywheel.collectors.dedup import (
+    LSHIndex,
+    Signature,
+    decode_signature,
+    encode_signature,
+)
+from evo_flywheel.db.models import Paper, PaperLSHBucket, PaperSignature
+from evo_flywheel.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 表列（Core 列带有类型，查询结果的行可被类型检查器推断）
+_signatures = PaperSignature.__table__.c
+_buckets = PaperLSHBucket.__table__.c
+_papers = Paper.__table__.c
+
+# SQLite 单条语句的参数数量有限，IN 查询按此分块
+_IN_CHUNK_SIZE = 500
+
+
+def _chunks(values: list[str], size: int = _IN_CHUNK_SIZE) -> Iterable[list[str]]:
+    for offset in range(0, len(values), size):
+        yield values[offset : offset + size]
+
+
+class SQLLSHStore:
+    """基于 paper_signatures / paper_lsh_buckets 表的 LSH 存储
+
+    读写均按批进行（IN 查询和 executemany），不提交事务，由调用方与论文入库放在同一事务中提交。
+
+    Args:
+        db: 数据库会话
+    """
+
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def candidates(self, bucket_keys: list[str]) -> set[str]:
+        result: set[str] = set()
+        for chunk in _chunks(bucket_keys):
+            result.update(
+                self.db.scalars(select(_buckets.paper_key).where(_buckets.bucket.in_(chunk)))
+            )
+        return result
+
+    def signatures(self, keys: set[str]) -> dict[str, Signature]:
+        result: dict[str, Signature] = {}
+        for chunk in _chunks(list(keys)):
+            rows = self.db.execute(
+                select(_signatures.paper_key, _signatures.signature).where(
+                    _signatures.paper_key.in_(chunk)
+                )
+            )
+            result.update((key, decode_signature(data)) for key, data in rows)
+        return result
+
+    def bucket_members(self, bucket_keys: list[str]) -> dict[str, set[str]]:
+        result: dict[str, set[str]] = {}
+        for chunk in _chunks(bucket_keys):
+            rows = self.db.execute(
+                select(_buckets.bucket, _buckets.paper_key).where(_buckets.bucket.in_(chunk))
+            )
+            for bucket, key in rows:
+                result.setdefault(bucket, set()).add(key)
+        return result
+
+    def add(self, key: str, signature: Signature, bucket_keys: list[str]) -> None:
+        self.add_many([(key, signature, bucket_keys)])
+
+    def add_many(self, entries: list[tuple[str, Signature, list[str]]]) -> None:
+        # 去掉批内重复和已入库的键，签名和桶各一次 executemany
+        pending = {key: (signature, buckets) for key, signature, buckets in entries}
+        for chunk in _chunks(list(pending)):
+            for key in self.db.scalars(
+                select(_signatures.paper_key).where(_signatures.paper_key.in_(chunk))
+            ):
+                del pending[key]
+        if not pending:
+            return
+
+        self.db.execute(
+            insert(PaperSignature.__table__),
+            [
+                {"paper_key": key, "signature": encode_signature(signature)}
+                for key, (signature, _) in pending.items()
+            ],
+        )
+        self.db.execute(
+            insert(PaperLSHBucket.__table__),
+            [
+                {"bucket": bucket, "paper_key": key}
+                for key, (_, buckets) in pending.items()
+                for bucket in dict.fromkeys(buckets)
+            ],
+        )
+
+
+def create_lsh_index(db: Session, **kwargs: Any) -> LSHIndex:
+    """创建以数据库为存储的近似去重索引
+
+    Args:
+        db: 数据库会话
+        **kwargs: 传给 LSHIndex 的参数
+
+    Returns:
+        LSHIndex: 近似去重索引
+    """
+    return LSHIndex(SQLLSHStore(db), **kwargs)
+
+
+def index_existing_papers(db: Session, index: LSHIndex, batch_size: int = 1000) -> int:
+    """为库中已有的论文建立近似去重索引（可重复执行）
+
+    Args:
+        db: 数据库会话
+        index: 近似去重索引
+        batch_size: 每批读取的论文数
+
+    Returns:
+        int: 处理的论文数
+    """
+    count = 0
+    last_id = 0
+
+    while True:
+        rows = db.execute(
+            select(_papers.id, _papers.doi, _papers.title, _papers.abstract)
+            .where(_papers.id > last_id)
+            .order_by(_papers.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+
+        index.add_all(
+            {"doi": doi, "title": title, "abstract": abstract} for _, doi, title, abstract in rows
+        )
+        last_id = rows[-1][0]
+        count += len(rows)
+        db.commit()
+
+    logger.info(f"Indexed {count} existing papers for near-duplicate detection")
+    return count
@@ -0,0 +1,406 @@
+"""数据库版本化迁移模块
+
+已执行的迁移版本记录在 schema_migrations 表中，``apply_migrations`` 按版本顺序执行未执行的迁移，
+``evo-init`` 在建表后自动调用。迁移函数使用本模块的辅助函数，均可重复执行：
+
+- ``add_column``：``ALTER TABLE ... ADD COLUMN``（SQLite 只改表结构定义，不重写数据）
+- ``create_table`` / ``create_index``：已存在的跳过；每个索引单独一个短事务，
+  WAL 模式下建索引期间读取不受影响
+- ``backfill``：按主键分批更新，每批单独提交，不长时间持有写锁
+- ``backfill_rows``：按主键分批把分隔字符串列展开写入关联表，每批单独提交
+
+新增迁移时在末尾追加 ``@migration(版本号, 名称)`` 函数，已发布的迁移不要修改。
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import Column, Engine, Index, Table, delete, insert, inspect, select, text
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateColumn
+
+from evo_flywheel.config import get_settings
+from evo_flywheel.db import crud
+from evo_flywheel.db.models import (
+    ClusterMember,
+    DailyReport,
+    Paper,
+    PaperAuthor,
+    PaperCluster,
+    PaperKey,
+    PaperLSHBucket,
+    PaperMechanism,
+    PaperSignature,
+    PaperTag,
+    ReportTopPaper,
+    RSSSource,
+    SchemaMigration,
+    split_ids,
+    split_names,
+)
+from evo_flywheel.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class Migration:
+    """一个迁移版本"""
+
+    version: int
+    name: str
+    upgrade: Callable[[Engine], None]
+
+
+MIGRATIONS: list[Migration] = []
+
+
+def migration(version: int, name: str) -> Callable[[Callable[[Engine], None]], Callable]:
+    """注册迁移函数的装饰器
+
+    Args:
+        version: 版本号（递增，不可重复）
+        name: 迁移名称
+
+    Returns:
+        装饰器
+    """
+
+    def register(upgrade: Callable[[Engine], None]) -> Callable[[Engine], None]:
+        if any(m.version == version for m in MIGRATIONS):
+            raise ValueError(f"Duplicate migration version {version}")
+        MIGRATIONS.append(Migration(version, name, upgrade))
+        return upgrade
+
+    return register
+
+
+# ============================================================================
+# 迁移辅助函数
+# ============================================================================
+
+
+def add_column(engine: Engine, table: str, column: Column) -> bool:
+    """为已有表添加列（表不存在或列已存在时跳过）
+
+    Args:
+        engine: 数据库引擎
+        table: 表名
+        column: 列定义（通常取自模型，如 ``RSSSource.__table__.c.etag``）
+
+    Returns:
+        bool: 是否添加了列
+    """
+    inspector = inspect(engine)
+    if not inspector.has_table(table):
+        return False
+    if column.name in {c["name"] for c in inspector.get_columns(table)}:
+        return False
+
+    ddl = CreateColumn(column).compile(dialect=engine.dialect)
+    quoted = engine.dialect.identifier_preparer.quote(table)
+    with engine.begin() as conn:
+        conn.execute(text(f"ALTER TABLE {quoted} ADD COLUMN {ddl}"))
+    logger.info(f"Added column {table}.{column.name}")
+    return True
+
+
+def create_table(engine: Engine, table: Table) -> bool:
+    """创建表及其索引（已存在时跳过）
+
+    Args:
+        engine: 数据库引擎
+        table: 表定义（如 ``PaperKey.__table__``）
+
+    Returns:
+        bool: 是否创建了表
+    """
+    if inspect(engine).has_table(table.name):
+        return False
+    table.create(engine)
+    logger.info(f"Created table {table.name}")
+    return True
+
+
+def create_index(engine: Engine, index: Index) -> bool:
+    """在单独的短事务中创建索引（表不存在或索引已存在时跳过）
+
+    Args:
+        engine: 数据库引擎
+        index: 索引定义
+
+    Returns:
+        bool: 是否创建了索引
+
+    Raises:
+        ValueError: 索引没有关联到表
+    """
+    if index.table is None:
+        raise ValueError(f"Index {index.name} is not bound to a table")
+    inspector = inspect(engine)
+    table = index.table.name
+    if not inspector.has_table(table):
+        return False
+    if index.name in {i["name"] for i in inspector.get_indexes(table)}:
+        return False
+    index.create(engine)
+    logger.info(f"Created index {index.name}")
+    return True
+
+
+def backfill_rows(
+    engine: Engine,
+    columns: list[Column],
+    owner: Column,
+    expand: Callable[[Any], list[dict[str, Any]]],
+    *,
+    batch_size: int | None = None,
+) -> int:
+    """按主键分批读取源表的行，展开为关联表的行写入，每批单独提交
+
+    每批先删除关联表中属于本批源行的记录再插入，重复执行结果相同。
+
+    Args:
+        engine: 数据库引擎
+        columns: 要读取的源表列，第一列为整数主键（只读取这些列，旧表缺少的新列不影响）
+        owner: 关联表中引用源表主键的列
+        expand: 把一行源数据展开为关联表插入行的函数
+        batch_size: 每批行数，默认 ``settings.migration_batch_size``
+
+    Returns:
+        int: 写入的行数
+    """
+    key = columns[0]
+    target = owner.table
+    if not inspect(engine).has_table(key.table.name):
+        return 0
+
+    batch_size = batch_size or get_settings().migration_batch_size
+    written = 0
+    last = -1
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(
+                select(*columns).where(key > last).order_by(key).limit(batch_size)
+            ).all()
+            if not rows:
+                break
+            conn.execute(delete(target).where(owner.between(rows[0][0], rows[-1][0])))
+            values = [value for row in rows for value in expand(row)]
+            if values:
+                conn.execute(insert(target), values)
+        written += len(values)
+        last = rows[-1][0]
+
+    if written:
+        logger.info(f"Backfilled {written} rows in {target.name}")
+    return written
+
+
+def backfill(
+    engine: Engine,
+    table: str,
+    assignments: str,
+    condition: str,
+    *,
+    key: str = "id",
+    batch_size: int | None = None,
+) -> int:
+    """按主键分批更新满足条件的行，每批单独提交
+
+    Args:
+        engine: 数据库引擎
+        table: 表名
+        assignments: SET 子句，如 ``"circuit_state = 'closed'"``
+        condition: 需要更新的行的条件，如 ``"circuit_state IS NULL"``
+        key: 整数主键列名
+        batch_size: 每批行数，默认 ``settings.migration_batch_size``
+
+    Returns:
+        int: 更新的行数
+    """
+    if not inspect(engine).has_table(table):
+        return 0
+
+    batch_size = batch_size or get_settings().migration_batch_size
+    select_batch = text(
+        f"SELECT {key} FROM {table} WHERE {key} > :last AND ({condition}) "
+        f"ORDER BY {key} LIMIT :limit"
+    )
+    update_batch = text(
+        f"UPDATE {table} SET {assignments} WHERE {key} BETWEEN :first AND :last AND ({condition})"
+    )
+
+    updated = 0
+    last = -1
+    while True:
+        with engine.begin() as conn:
+            ids = conn.execute(select_batch, {"last": last, "limit": batch_size}).scalars().all()
+            if not ids:
+                break
+            result = conn.execute(update_batch, {"first": ids[0], "last": ids[-1]})
+        updated += result.rowcount
+        last = ids[-1]
+
+    if updated:
+        logger.info(f"Backfilled {updated} rows in {table}")
+    return updated
+
+
+# ============================================================================
+# 迁移
+# ============================================================================
+
+
+@migration(1, "rss_source_state_columns")
+def _rss_source_state_columns(engine: Engine) -> None:
+    """RSS 源的条件请求、高水位、自适应轮询和熔断状态列"""
+    columns = RSSSource.__table__.c
+    for name in (
+        "etag",
+        "last_modified",
+        "high_water_mark",
+        "update_rate",
+        "poll_interval",
+        "next_poll_at",
+        "circuit_state",
+        "consecutive_failures",
+        "open_until",
+        "last_error",
+    ):
+        add_column(engine, "rss_sources", columns[name])
+
+    backfill(engine, "rss_sources", "circuit_state = 'closed'", "circuit_state IS NULL")
+    backfill(engine, "rss_sources", "consecutive_failures = 0", "consecutive_failures IS NULL")
+
+
+@migration(2, "dedup_index_tables")
+def _dedup_index_tables(engine: Engine) -> None:
+    """论文键表和近似去重（MinHash/LSH）表"""
+    for model in (PaperKey, PaperSignature, PaperLSHBucket):
+        create_table(engine, model.__table__)
+
+
+@migration(3, "backfill_paper_keys")
+def _backfill_paper_keys(engine: Engine) -> None:
+    """为已有论文补写论文键（采集时据此跳过已入库的论文）"""
+    with Session(engine) as session:
+        crud.backfill_paper_keys(session, batch_size=get_settings().migration_batch_size)
+
+
+@migration(4, "normalized_list_tables")
+def _normalized_list_tables(engine: Engine) -> None:
+    """作者、标签、进化机制、报告顶级论文和聚类成员的关联表，从分隔字符串列回填"""
+    for model in (PaperAuthor, PaperTag, PaperMechanism, ReportTopPaper, ClusterMember):
+        create_table(engine, model.__table__)
+
+    backfill_rows(
+        engine,
+        [Paper.id, Paper.authors],
+        PaperAuthor.paper_id,
+        lambda row: [
+            {"paper_id": row.id, "position": i, "name": name}
+            for i, name in enumerate(split_names(row.authors))
+        ],
+    )
+    backfill_rows(
+        engine,
+        [Paper.id, Paper.tags],
+        PaperTag.paper_id,
+        lambda row: [
+            {"paper_id": row.id, "tag": tag} for tag in dict.fromkeys(split_names(row.tags))
+        ],
+    )
+    backfill_rows(
+        engine,
+        [Paper.id, Paper.evolutionary_mechanism],
+        PaperMechanism.paper_id,
+        lambda row: [
+            {"paper_id": row.id, "mechanism": mechanism}
+            for mechanism in dict.fromkeys(split_names(row.evolutionary_mechanism))
+        ],
+    )
+    backfill_rows(
+        engine,
+        [DailyReport.id, DailyReport.top_paper_ids],
+        ReportTopPaper.report_id,
+        lambda row: [
+            {"report_id": row.id, "rank": i, "paper_id": paper_id}
+            for i, paper_id in enumerate(split_ids(row.top_paper_ids))
+        ],
+    )
+    backfill_rows(
+        engine,
+        [PaperCluster.id, PaperCluster.paper_ids],
+        ClusterMember.cluster_id,
+        lambda row: [
+            {"cluster_id": row.id, "position": i, "paper_id": paper_id}
+            for i, paper_id in enumerate(split_ids(row.paper_ids))
+        ],
+    )
+
+
+# ============================================================================
+# 执行
+# ============================================================================
+
+
+def applied_versions(engine: Engine) -> set[int]:
+    """读取已执行的迁移版本
+
+    Args:
+        engine: 数据库引擎
+
+    Returns:
+        set[int]: 已执行的版本号
+    """
+    if not inspect(engine).has_table(SchemaMigration.__tablename__):
+        return set()
+    with engine.connect() as conn:
+        return set(conn.execute(select(SchemaMigration.version)).scalars())
+
+
+def pending_migrations(engine: Engine) -> list[Migration]:
+    """按版本顺序返回未执行的迁移
+
+    Args:
+        engine: 数据库引擎
+
+    Returns:
+        list[Migration]: 未执行的迁移
+    """
+    applied = applied_versions(engine)
+    return sorted((m for m in MIGRATIONS if m.version not in applied), key=lambda m: m.version)
+
+
+def apply_migrations(engine: Engine) -> list[Migration]:
+    """按版本顺序执行未执行的迁移
+
+    每个迁移成功后立即记录版本；迁移失败时抛出异常，已执行的迁移保留记录，
+    修复后重新运行会从失败的版本继续。
+
+    Args:
+        engine: 数据库引擎
+
+    Returns:
+        list[Migration]: 本次执行的迁移
+    """
+    create_table(engine, SchemaMigration.__table__)
+
+    applied = []
+    for item in pending_migrations(engine):
+        logger.info(f"Applying migration {item.version}: {item.name}")
+        item.upgrade(engine)
+        with engine.begin() as conn:
+            conn.execute(
+                SchemaMigration.__table__.insert().values(
+                    version=item.version, name=item.name, applied_at=datetime.now(UTC)
+                )
+            )
+        applied.append(item)
+
+    if applied:
+        logger.info(f"Applied {len(applied)} migrations")
+    return applied
@@ -1,4 +1,9 @@
-"""SQLAlchemy 数据库模型定义"""
+"""SQLAlchemy 数据库模型定义
+
+论文的作者、标签和进化机制，报告的顶级论文和聚类的成员，除了原有的分隔字符串列，
+还规范化存放在关联表中（按作者/标签查询走索引）。给字符串列赋值时（包括通过
+``authors_list`` 等属性）由属性事件同步关联行，列表属性从关联行读取。
+"""
 
 import json
 from datetime import UTC, datetime
@@ -8,15 +13,35 @@ from sqlalchemy import (
     CheckConstraint,
     Column,
     DateTime,
+    Float,
     ForeignKey,
+    Index,
     Integer,
+    LargeBinary,
     Text,
+    event,
 )
 from sqlalchemy.orm import declarative_base, relationship
 
 Base = declarative_base()  # type: ignore
 
 
+def split_names(value: str | list[str] | None) -> list[str]:
+    """拆分分号分隔的名称（作者、标签、进化机制），去掉空项"""
+    if not value:
+        return []
+    items = value.split(";") if isinstance(value, str) else value
+    return [str(item).strip() for item in items if str(item).strip()]
+
+
+def split_ids(value: str | list[int] | None) -> list[int]:
+    """拆分逗号分隔的论文 ID，忽略非数字项"""
+    if not value:
+        return []
+    items = value.split(",") if isinstance(value, str) else value
+    return [int(item) for item in (str(i).strip() for i in items) if item.isdigit()]
+
+
 class Paper(Base):
     """论文表"""
 
@@ -50,15 +75,25 @@ class Paper(Base):
 
     created_at = Column(DateTime, default=lambda: datetime.now(UTC))
 
+    # 规范化关联行（由 authors / tags / evolutionary_mechanism 赋值时同步）
+    author_rows = relationship(
+        "PaperAuthor",
+        order_by="PaperAuthor.position",
+        cascade="all, delete-orphan",
+        lazy="selectin",  # 论文列表序列化时每批只多一次查询
+    )
+    tag_rows = relationship("PaperTag", order_by="PaperTag.id", cascade="all, delete-orphan")
+    mechanism_rows = relationship(
+        "PaperMechanism", order_by="PaperMechanism.id", cascade="all, delete-orphan"
+    )
+
     def __repr__(self) -> str:
         return f"<Paper(id={self.id}, title='{self.title[:30]}...')>"
 
     @property
     def authors_list(self) -> list[str]:
-        """获取作者列表"""
-        if self.authors:
-            return [a.strip() for a in self.authors.split(";")]
-        return []
+        """获取作者列表（来自 paper_authors 表，尚未回填的旧数据读取 authors 列）"""
+        return [row.name for row in self.author_rows] or split_names(self.authors)
 
     @authors_list.setter
     def authors_list(self, value: list[str]) -> None:
@@ -82,16 +117,21 @@ class Paper(Base):
 
     @property
     def tags_list(self) -> list[str]:
-        """获取标签列表"""
-        if self.tags:
-            return [t.strip() for t in self.tags.split(";")]
-        return []
+        """获取标签列表（来自 paper_tags 表，尚未回填的旧数据读取 tags 列）"""
+        return [row.tag for row in self.tag_rows] or split_names(self.tags)
 
     @tags_list.setter
     def tags_list(self, value: list[str]) -> None:
         """设置标签列表"""
         self.tags = ";".join(value)
 
+    @property
+    def mechanisms_list(self) -> list[str]:
+        """获取进化机制列表（来自 paper_mechanisms 表）"""
+        return [row.mechanism for row in self.mechanism_rows] or split_names(
+            self.evolutionary_mechanism
+        )
+
 
 class DailyReport(Base):
     """每日报告表"""
@@ -108,16 +148,20 @@ class DailyReport(Base):
 
     # 关系
     clusters = relationship("PaperCluster", back_populates="report", cascade="all, delete-orphan")
+    top_paper_rows = relationship(
+        "ReportTopPaper",
+        order_by="ReportTopPaper.rank",
+        cascade="all, delete-orphan",
+        lazy="selectin",
+    )
 
     def __repr__(self) -> str:
         return f"<DailyReport(date={self.report_date}, total={self.total_papers})>"
 
     @property
     def top_papers_list(self) -> list[int]:
-        """获取顶级论文ID列表"""
-        if self.top_paper_ids:
-            return [int(i.strip()) for i in self.top_paper_ids.split(",") if i.strip()]
-        return []
+        """获取顶级论文ID列表（来自 report_top_papers 表）"""
+        return [row.paper_id for row in self.top_paper_rows] or split_ids(self.top_paper_ids)
 
     @top_papers_list.setter
     def top_papers_list(self, value: list[int]) -> None:
@@ -158,6 +202,12 @@ class PaperCluster(Base):
 
     # 关系
     report = relationship("DailyReport", back_populates="clusters")
+    member_rows = relationship(
+        "ClusterMember",
+        order_by="ClusterMember.position",
+        cascade="all, delete-orphan",
+        lazy="selectin",
+    )
 
     def __repr__(self) -> str:
         return (
@@ -166,10 +216,8 @@ class PaperCluster(Base):
 
     @property
     def paper_ids_list(self) -> list[int]:
-        """获取论文ID列表"""
-        if self.paper_ids:
-            return [int(i.strip()) for i in self.paper_ids.split(",") if i.strip()]
-        return []
+        """获取论文ID列表（来自 cluster_members 表）"""
+        return [row.paper_id for row in self.member_rows] or split_ids(self.paper_ids)
 
     @paper_ids_list.setter
     def paper_ids_list(self, value: list[int]) -> None:
@@ -192,6 +240,101 @@ class PaperCluster(Base):
         self.key_findings = json.dumps(value, ensure_ascii=False)
 
 
+class PaperAuthor(Base):
+    """论文作者表（papers.authors 的规范化副本）"""
+
+    __tablename__ = "paper_authors"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    paper_id = Column(Integer, ForeignKey("papers.id", ondelete="CASCADE"), nullable=False)
+    position = Column(Integer, nullable=False)  # 作者顺序（从 0 开始）
+    name = Column(Text, nullable=False)
+
+    __table_args__ = (
+        Index("idx_paper_authors_name", "name"),
+        Index("idx_paper_authors_paper", "paper_id", "position"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<PaperAuthor(paper_id={self.paper_id}, name='{self.name}')>"
+
+
+class PaperTag(Base):
+    """论文标签表（papers.tags 的规范化副本）"""
+
+    __tablename__ = "paper_tags"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    paper_id = Column(Integer, ForeignKey("papers.id", ondelete="CASCADE"), nullable=False)
+    tag = Column(Text, nullable=False)
+
+    __table_args__ = (
+        Index("idx_paper_tags_tag", "tag"),
+        Index("idx_paper_tags_paper", "paper_id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<PaperTag(paper_id={self.paper_id}, tag='{self.tag}')>"
+
+
+class PaperMechanism(Base):
+    """论文进化机制表（papers.evolutionary_mechanism 的规范化副本）"""
+
+    __tablename__ = "paper_mechanisms"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    paper_id = Column(Integer, ForeignKey("papers.id", ondelete="CASCADE"), nullable=False)
+    mechanism = Column(Text, nullable=False)
+
+    __table_args__ = (
+        Index("idx_paper_mechanisms_mechanism", "mechanism"),
+        Index("idx_paper_mechanisms_paper", "paper_id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<PaperMechanism(paper_id={self.paper_id}, mechanism='{self.mechanism}')>"
+
+
+class ReportTopPaper(Base):
+    """报告顶级论文表（daily_reports.top_paper_ids 的规范化副本）"""
+
+    __tablename__ = "report_top_papers"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    report_id = Column(Integer, ForeignKey("daily_reports.id", ondelete="CASCADE"), nullable=False)
+    rank = Column(Integer, nullable=False)  # 排名（从 0 开始）
+    paper_id = Column(Integer, nullable=False)  # 与原 ID 列表一致，不约束论文必须存在
+
+    __table_args__ = (
+        Index("idx_report_top_papers_report", "report_id", "rank"),
+        Index("idx_report_top_papers_paper", "paper_id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ReportTopPaper(report_id={self.report_id}, paper_id={self.paper_id})>"
+
+
+class ClusterMember(Base):
+    """聚类成员表（paper_clusters.paper_ids 的规范化副本）"""
+
+    __tablename__ = "cluster_members"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    cluster_id = Column(
+        Integer, ForeignKey("paper_clusters.id", ondelete="CASCADE"), nullable=False
+    )
+    position = Column(Integer, nullable=False)
+    paper_id = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index("idx_cluster_members_cluster", "cluster_id", "position"),
+        Index("idx_cluster_members_paper", "paper_id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ClusterMember(cluster_id={self.cluster_id}, paper_id={self.paper_id})>"
+
+
 class Feedback(Base):
     """反馈表"""
 
@@ -225,19 +368,77 @@ class RSSSource(Base):
     priority = Column(Integer)
     enabled = Column(Boolean, default=True)
     last_fetch = Column(DateTime)
+
+    # 条件请求校验器（HTTP ETag / Last-Modified）
+    etag = Column(Text)
+    last_modified = Column(Text)
+
+    # 增量采集高水位（已见过的最新条目时间）
+    high_water_mark = Column(DateTime)
+
+    # 自适应轮询（更新频率：新论文数/小时；间隔：小时）
+    update_rate = Column(Float)
+    poll_interval = Column(Float)
+    next_poll_at = Column(DateTime)
+
+    # 熔断器（closed / open / half_open）
+    circuit_state = Column(Text, default="closed")
+    consecutive_failures = Column(Integer, default=0)
+    open_until = Column(DateTime)
+    last_error = Column(Text)
+
     created_at = Column(DateTime, default=lambda: datetime.now(UTC))
 
     def __repr__(self) -> str:
         return f"<RSSSource(id={self.id}, name='{self.name}', enabled={self.enabled})>"
 
 
+class PaperKey(Base):
+    """论文键表（跨运行的精确去重索引）"""
+
+    __tablename__ = "paper_keys"
+
+    key = Column(Text, primary_key=True)  # extract_paper_key 的结果，如 "doi:10.1101/..."
+    created_at = Column(DateTime, default=lambda: datetime.now(UTC))
+
+    def __repr__(self) -> str:
+        return f"<PaperKey(key='{self.key}')>"
+
+
+class PaperSignature(Base):
+    """论文 MinHash 签名表（近似去重索引）"""
+
+    __tablename__ = "paper_signatures"
+
+    paper_key = Column(Text, primary_key=True)  # extract_paper_key 的结果
+    signature = Column(LargeBinary, nullable=False)  # uint64 数组
+    created_at = Column(DateTime, default=lambda: datetime.now(UTC))
+
+    def __repr__(self) -> str:
+        return f"<PaperSignature(paper_key='{self.paper_key}')>"
+
+
+class PaperLSHBucket(Base):
+    """LSH 桶表：每篇论文每个 band 一行"""
+
+    __tablename__ = "paper_lsh_buckets"
+
+    bucket = Column(Text, primary_key=True)  # "band:hash"
+    paper_key = Column(
+        Text, ForeignKey("paper_signatures.paper_key", ondelete="CASCADE"), primary_key=True
+    )
+
+    def __repr__(self) -> str:
+        return f"<PaperLSHBucket(bucket='{self.bucket}', paper_key='{self.paper_key}')>"
+
+
 class CollectionLog(Base):
     """数据采集日志表"""
 
     __tablename__ = "collection_logs"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    status = Column(Text, nullable=False)  # 'running', 'success', 'failed'
+    status = Column(Text, nullable=False)  # 'running', 'success', 'partial', 'failed'
     total_papers = Column(Integer, default=0)
     new_papers = Column(Integer, default=0)
     sources = Column(Text)  # 逗号分隔的数据源列表
@@ -246,3 +447,54 @@ class CollectionLog(Base):
 
     def __repr__(self) -> str:
         return f"<CollectionLog(id={self.id}, status='{self.status}', total={self.total_papers})>"
+
+
+class SchemaMigration(Base):
+    """已执行的数据库迁移版本表（见 evo_flywheel.db.migrations）"""
+
+    __tablename__ = "schema_migrations"
+
+    version = Column(Integer, primary_key=True, autoincrement=False)
+    name = Column(Text, nullable=False)
+    applied_at = Column(DateTime, default=lambda: datetime.now(UTC))
+
+    def __repr__(self) -> str:
+        return f"<SchemaMigration(version={self.version}, name='{self.name}')>"
+
+
+# ============================================================================
+# 分隔字符串列 -> 关联行同步
+# ============================================================================
+
+
+@event.listens_for(Paper.authors, "set")
+def _sync_author_rows(target: Paper, value: str | None, oldvalue, initiator) -> None:
+    target.author_rows = [
+        PaperAuthor(position=i, name=name) for i, name in enumerate(split_names(value))
+    ]
+
+
+@event.listens_for(Paper.tags, "set")
+def _sync_tag_rows(target: Paper, value: str | None, oldvalue, initiator) -> None:
+    target.tag_rows = [PaperTag(tag=tag) for tag in dict.fromkeys(split_names(value))]
+
+
+@event.listens_for(Paper.evolutionary_mechanism, "set")
+def _sync_mechanism_rows(target: Paper, value: str | None, oldvalue, initiator) -> None:
+    target.mechanism_rows = [
+        PaperMechanism(mechanism=mechanism) for mechanism in dict.fromkeys(split_names(value))
+    ]
+
+
+@event.listens_for(DailyReport.top_paper_ids, "set")
+def _sync_top_paper_rows(target: DailyReport, value: str | None, oldvalue, initiator) -> None:
+    target.top_paper_rows = [
+        ReportTopPaper(rank=i, paper_id=paper_id) for i, paper_id in enumerate(split_ids(value))
+    ]
+
+
+@event.listens_for(PaperCluster.paper_ids, "set")
+def _sync_member_rows(target: PaperCluster, value: str | None, oldvalue, initiator) -> None:
+    target.member_rows = [
+        ClusterMember(position=i, paper_id=paper_id) for i, paper_id in enumerate(split_ids(value))
+    ]
@@ -4,17 +4,31 @@
 """
 
 from evo_flywheel.scheduler.jobs import (
+    build_near_duplicate_index,
     collect_daily_papers,
+    collect_sources_now,
+    load_preprint_targets,
     load_rss_sources,
     main,
+    poll_due_sources,
+    replay_archive,
+    run_biorxiv_backfill,
     run_daily_flywheel,
     schedule_flywheel,
+    stream_daily_papers,
 )
 
 __all__ = [
     "load_rss_sources",
+    "load_preprint_targets",
     "collect_daily_papers",
+    "collect_sources_now",
+    "stream_daily_papers",
     "run_daily_flywheel",
+    "poll_due_sources",
+    "run_biorxiv_backfill",
+    "replay_archive",
+    "build_near_duplicate_index",
     "schedule_flywheel",
     "main",
 ]
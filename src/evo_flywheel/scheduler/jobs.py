@@ -4,20 +4,45 @@
 """
 
 import sys
-from datetime import date, datetime, timedelta
+import threading
+from collections import Counter
+from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
 import yaml
 from apscheduler.schedulers.background import BackgroundScheduler
-
-from evo_flywheel.collectors.orchestrator import collect_from_all_sources
+from sqlalchemy.orm import Session
+
+from evo_flywheel.collectors.biorxiv import (
+    API_BASE_URL,
+    DEFAULT_SERVER,
+    PREPRINT_SOURCES,
+    PreprintTarget,
+)
+from evo_flywheel.collectors.orchestrator import (
+    CollectionReport,
+    as_utc,
+    collect_from_all_sources,
+)
+from evo_flywheel.collectors.record import PaperData
+from evo_flywheel.config import get_settings
 from evo_flywheel.db.context import get_db_session
+from evo_flywheel.db.key_index import PaperKeyIndex
 from evo_flywheel.error_handlers import handle_errors
 from evo_flywheel.logging import get_logger
+from evo_flywheel.scheduler.polling import PollingPolicy, is_due, record_poll, select_due_sources
 
 logger = get_logger(__name__)
 
+# 预印本在 RSSSource 表中的源名称（与 parse_biorxiv_paper 的 source 字段一致），
+# 所有 bioRxiv / medRxiv 目标共用这一条状态（高水位和轮询间隔）
+BIORXIV_SOURCE_NAME = "bioRxiv"
+
+# 飞轮任务与源轮询任务共用的轮询锁：源状态按 读取-修改-写回 更新，同时轮询会重复抓取
+# 并互相覆盖校验器、高水位和熔断状态
+_polling_lock = threading.Lock()
+
 
 def run_daily_flywheel() -> dict[str, Any]:
     """运行完整的飞轮流程
@@ -38,15 +63,14 @@ def run_daily_flywheel() -> dict[str, Any]:
         "report_generated": False,
     }
 
-    # 1. 采集论文
+    # 1. 采集论文（只轮询到期的源）
     try:
         from evo_flywheel.scheduler.analysis import analyze_unanalyzed_papers
 
-        papers = collect_daily_papers()
-        stats["collected"] = len(papers)
+        stats["collected"] = poll_due_sources()
 
-        # 2. 分析论文（如果有新论文）
-        if papers:
+        # 2. 分析论文（包括轮询任务在两次飞轮之间采集到的论文）
+        if stats["collected"] or get_settings().polling_enabled:
             analysis_result = analyze_unanalyzed_papers(max_papers=100)
             stats["analyzed"] = analysis_result["analyzed"]
 
@@ -70,6 +94,26 @@ def run_daily_flywheel() -> dict[str, Any]:
     return stats
 
 
+def poll_due_sources() -> int:
+    """采集到期的源（自适应轮询任务）
+
+    每个源按自己的轮询间隔被抓取，未到期的源本次跳过。飞轮任务和源轮询任务都调用本函数，
+    已有轮询在进行时本次直接跳过（进行中的轮询会采集到期的源）。
+
+    Returns:
+        int: 新采集的论文数量
+    """
+    if not _polling_lock.acquire(blocking=False):
+        logger.info("Source polling already in progress, skipping")
+        return 0
+    try:
+        if get_settings().collection_streaming:
+            return stream_daily_papers()
+        return len(collect_daily_papers())
+    finally:
+        _polling_lock.release()
+
+
 @handle_errors("加载 RSS 源配置", logger, default_return=[])
 def load_rss_sources(config_path: str = "config/sources.yaml") -> list[dict[str, Any]]:
     """加载 RSS 源配置
@@ -106,58 +150,478 @@ def load_rss_sources(config_path: str = "config/sources.yaml") -> list[dict[str,
     return sources
 
 
+@handle_errors("加载预印本目标配置", logger, default_return=[])
+def load_preprint_targets(config_path: str = "config/sources.yaml") -> list[PreprintTarget]:
+    """加载预印本 API 采集目标（type 为 api 的启用源）
+
+    每个源的 ``server``（默认 biorxiv）和 ``params.category`` 组成一个采集目标。
+
+    Args:
+        config_path: 配置文件路径
+
+    Returns:
+        list[PreprintTarget]: 采集目标列表（重复的目标只保留一个）
+    """
+    config_file = Path(config_path)
+
+    if not config_file.exists():
+        logger.warning(f"Sources config file not found: {config_path}")
+        return []
+
+    with open(config_file, encoding="utf-8") as f:
+        config = yaml.safe_load(f)
+
+    targets: list[PreprintTarget] = []
+
+    for source_name, source_config in config.get("sources", {}).items():
+        if source_config.get("type") != "api" or not source_config.get("enabled", True):
+            continue
+        params = source_config.get("params") or {}
+        try:
+            target = PreprintTarget(
+                server=source_config.get("server", DEFAULT_SERVER),
+                category=params.get("category", "evolutionary_biology"),
+            )
+        except ValueError as e:
+            logger.warning(f"Skipping preprint source {source_name}: {e}")
+            continue
+        if target not in targets:
+            targets.append(target)
+
+    logger.info(f"Loaded {len(targets)} preprint targets from {config_path}")
+    return targets
+
+
 @handle_errors("每日论文采集", logger, default_return=[])
 def collect_daily_papers(
     rss_sources: list[dict[str, Any]] | None = None,
     start_date: datetime | None = None,
     end_date: datetime | None = None,
     category: str = "evolutionary_biology",
-) -> list[dict[str, Any]]:
+) -> list[PaperData]:
     """执行每日论文采集
 
+    采集是增量的：每个源记录已见过的最新条目时间（高水位），
+    RSS 源只解析晚于高水位的条目，bioRxiv 的起始日期从高水位开始，
+    均额外回看 ``settings.collection_overlap_hours`` 以覆盖迟到或修改的条目。
+    启用自适应轮询时只采集到期的源，并根据本次的新论文数安排各源的下次轮询。
+    截止时间内完成的源照常入库，各源的结果记录到 CollectionLog。
+
     Args:
         rss_sources: RSS 源配置列表（可选，默认从配置文件加载）
-        start_date: 采集开始日期（可选，默认为7天前）
+        start_date: 采集开始日期（可选，默认从 bioRxiv 高水位开始，无高水位时为7天前）
         end_date: 采集结束日期（可选，默认为今天）
-        category: bioRxiv 论文分类
+        category: bioRxiv 论文分类（配置文件中没有启用的预印本目标时使用）
 
     Returns:
         list[dict]: 采集到的论文列表
     """
     logger.info("Starting daily paper collection")
+    papers, _ = _collect_and_save(rss_sources, start_date, end_date, category)
+    return papers
 
-    # 加载 RSS 源
-    if rss_sources is None:
-        rss_sources = load_rss_sources()
 
-    # 设置默认日期范围（最近7天）
-    if end_date is None:
-        end_date = datetime.now()
-    if start_date is None:
-        start_date = end_date - timedelta(days=7)
+def collect_sources_now(
+    rss_sources: list[dict[str, Any]],
+    start_date: datetime,
+    end_date: datetime,
+    category: str = "evolutionary_biology",
+) -> dict[str, int] | None:
+    """立即采集指定的源（API 手动触发）
 
-    logger.info(f"Collection period: {start_date} to {end_date}")
+    与定时轮询走同一条路径并持有同一把轮询锁：加载并写回源状态（条件请求校验器、
+    高水位、熔断状态），熔断打开的源照常跳过，论文经近似去重后入库。
+    手动触发不按轮询间隔筛选源。采集或写库失败时异常向上传播。
+
+    Args:
+        rss_sources: RSS 源配置列表
+        start_date: 采集开始日期
+        end_date: 采集结束日期
+        category: bioRxiv 论文分类（配置文件中没有启用的预印本目标时使用）
+
+    Returns:
+        dict | None: {total, new}；已有轮询在进行时返回 None
+    """
+    if not _polling_lock.acquire(blocking=False):
+        logger.info("Source polling already in progress, manual collection rejected")
+        return None
+    try:
+        papers, saved = _collect_and_save(
+            rss_sources, start_date, end_date, category, due_only=False
+        )
+    finally:
+        _polling_lock.release()
+    return {"total": len(papers), "new": saved}
+
+
+def _collect_and_save(
+    rss_sources: list[dict[str, Any]] | None,
+    start_date: datetime | None,
+    end_date: datetime | None,
+    category: str,
+    *,
+    due_only: bool = True,
+) -> tuple[list[PaperData], int]:
+    """采集、入库并写回源状态（collect_daily_papers 与手动采集共用）
+
+    Args:
+        rss_sources: RSS 源配置列表（None 时从配置文件加载）
+        start_date: 采集开始日期（None 时从 bioRxiv 高水位计算）
+        end_date: 采集结束日期（None 时为当前时间）
+        category: bioRxiv 论文分类
+        due_only: 是否只采集到期的源（自适应轮询）
 
-    # 从所有源采集 (参数名与 orchestrator.py 一致)
+    Returns:
+        tuple: (采集到的论文列表, 新保存的论文数)
+    """
+    rss_sources, biorxiv_state, include_biorxiv, start_date, end_date = _prepare_collection(
+        rss_sources, start_date, end_date, due_only=due_only
+    )
+
+    # 从所有源采集 (参数名与 orchestrator.py 一致)，已入库的论文在解析后即被丢弃
+    report = CollectionReport()
     papers = collect_from_all_sources(
         start_date=start_date,
         end_date=end_date,
         rss_sources=rss_sources,
         category=category,
+        key_index=PaperKeyIndex(get_db_session),
+        include_biorxiv=include_biorxiv,
+        preprint_targets=load_preprint_targets(),
+        report=report,
     )
 
     logger.info(f"Daily collection completed: {len(papers)} papers collected")
 
-    # 保存到数据库
-    if papers:
-        _save_papers_to_db(papers)
+    # 先保存论文：写库失败时异常向上传播，不写回源状态，下次采集重新抓取这些论文
+    saved = _save_papers_to_db(papers) if papers else 0
+    _record_collection_log(report, saved)
+
+    # 论文入库后再写回本次采集更新的源状态（高水位、条件请求校验器、抓取时间）
+    _advance_biorxiv_high_water_mark(biorxiv_state, papers)
+    polled = _finish_polling(
+        rss_sources,
+        biorxiv_state if include_biorxiv else None,
+        Counter(paper.get("source") for paper in papers),
+        biorxiv_ok=all(
+            source.ok for source in report.sources if source.name == BIORXIV_SOURCE_NAME
+        ),
+    )
+    _save_source_state(polled)
 
-    return papers
+    return papers, saved
+
+
+@handle_errors("流式论文采集", logger, default_return=0)
+def stream_daily_papers(
+    rss_sources: list[dict[str, Any]] | None = None,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    category: str = "evolutionary_biology",
+) -> int:
+    """以流式管道执行每日论文采集
+
+    与 collect_daily_papers 相同的增量规则，但论文边抓取边去重、分批入库，
+    不在内存中汇总全部论文；快速源的论文在慢速源仍在下载时即可查询。
+
+    Args:
+        rss_sources: RSS 源配置列表（可选，默认从配置文件加载）
+        start_date: 采集开始日期（可选，默认从 bioRxiv 高水位开始）
+        end_date: 采集结束日期（可选，默认为今天）
+        category: bioRxiv 论文分类（配置文件中没有启用的预印本目标时使用）
+
+    Returns:
+        int: 新保存的论文数量
+    """
+    from evo_flywheel.collectors.pipeline import stream_from_all_sources
+
+    logger.info("Starting streaming daily paper collection")
+
+    rss_sources, biorxiv_state, include_biorxiv, start_date, end_date = _prepare_collection(
+        rss_sources, start_date, end_date
+    )
+    new_items: Counter[str | None] = Counter()
+    previous_high_water_mark = biorxiv_state.get("high_water_mark")
+
+    def writer(batch: list[PaperData]) -> int:
+        saved = _save_papers_to_db(batch)
+        # 只用成功入库的批次推进高水位
+        _advance_biorxiv_high_water_mark(biorxiv_state, batch)
+        new_items.update(paper.get("source") for paper in batch)
+        return saved
+
+    settings = get_settings()
+    stats = stream_from_all_sources(
+        start_date,
+        end_date,
+        writer,
+        rss_sources=rss_sources,
+        category=category,
+        batch_size=settings.collection_batch_size,
+        queue_size=settings.collection_queue_size,
+        key_index=PaperKeyIndex(get_db_session),
+        include_biorxiv=include_biorxiv,
+        preprint_targets=load_preprint_targets(),
+    )
+
+    # 只跳过失败部分的源状态，下次采集按原来的高水位和校验器重新抓取（已入库的论文会被跳过）：
+    # - 写入失败：失败的批次可能包含任一源的论文，所有源的状态都不写回
+    # - 预印本生产者失败：各页乱序到达，高水位以下可能有缺口，恢复 bioRxiv 原来的高水位，
+    #   按抓取失败安排下次轮询；RSS 源的状态照常写回
+    # - RSS 生产者失败：RSS 源的状态不写回
+    if "writer" in stats.errors:
+        logger.warning(
+            f"Streaming writer failed ({stats.errors['writer']}), source state not saved"
+        )
+    else:
+        biorxiv_ok = BIORXIV_SOURCE_NAME not in stats.errors
+        if not biorxiv_ok:
+            logger.warning("Preprint collection failed, keeping bioRxiv high-water mark")
+            biorxiv_state["high_water_mark"] = previous_high_water_mark
+        if "rss" in stats.errors:
+            logger.warning("RSS collection failed, RSS source state not saved")
+        polled = _finish_polling(
+            [] if "rss" in stats.errors else rss_sources,
+            biorxiv_state if include_biorxiv else None,
+            new_items,
+            biorxiv_ok=biorxiv_ok,
+        )
+        _save_source_state(polled)
+
+    logger.info(f"Streaming collection completed: {stats.saved} new papers saved")
+    return stats.saved
+
+
+def _prepare_collection(
+    rss_sources: list[dict[str, Any]] | None,
+    start_date: datetime | None,
+    end_date: datetime | None,
+    *,
+    due_only: bool = True,
+) -> tuple[list[dict[str, Any]], dict[str, Any], bool, datetime, datetime]:
+    """准备一次采集：加载源配置与持久化状态，筛选到期的源，确定日期范围
+
+    Args:
+        rss_sources: RSS 源配置列表（None 时从配置文件加载）
+        start_date: 采集开始日期（None 时从 bioRxiv 高水位计算）
+        end_date: 采集结束日期（None 时为当前时间）
+        due_only: 是否只保留到期的源（手动采集时为 False）
+
+    Returns:
+        tuple: (到期的 RSS 源列表, bioRxiv 状态字典, 是否采集 bioRxiv, 开始日期, 结束日期)
+    """
+    # 加载 RSS 源
+    if rss_sources is None:
+        rss_sources = load_rss_sources()
+
+    # 加载各源的持久化状态（条件请求校验器、高水位等）
+    biorxiv_state: dict[str, Any] = {
+        "name": BIORXIV_SOURCE_NAME,
+        "url": API_BASE_URL,
+        "type": "api",
+    }
+    _load_source_state([biorxiv_state, *rss_sources])
+
+    # 自适应轮询：未到期的源本次跳过
+    include_biorxiv = True
+    if due_only and get_settings().polling_enabled:
+        now = datetime.now(UTC)
+        due_sources = select_due_sources(rss_sources, now)
+        if len(due_sources) < len(rss_sources):
+            logger.info(f"{len(due_sources)}/{len(rss_sources)} RSS sources due for polling")
+        rss_sources = due_sources
+        include_biorxiv = is_due(biorxiv_state, now)
+        if not include_biorxiv:
+            logger.info("bioRxiv not due for polling, skipping")
+
+    # 记录轮询前的抓取时间，用于判断本次是否抓取成功及计算更新频率
+    for source in [biorxiv_state, *rss_sources]:
+        source["previous_fetch"] = source.get("last_fetch")
+
+    # 设置默认日期范围（从高水位开始，无高水位时为最近7天）
+    if end_date is None:
+        end_date = datetime.now()
+    if start_date is None:
+        start_date = _incremental_start_date(biorxiv_state, end_date)
+
+    logger.info(f"Collection period: {start_date} to {end_date}")
+    return rss_sources, biorxiv_state, include_biorxiv, start_date, end_date
+
+
+def _finish_polling(
+    rss_sources: list[dict[str, Any]],
+    biorxiv_state: dict[str, Any] | None,
+    new_items: Counter[str | None],
+    biorxiv_ok: bool = True,
+) -> list[dict[str, Any]]:
+    """记录本次轮询结果并安排各源的下次轮询
+
+    Args:
+        rss_sources: 本次轮询的 RSS 源
+        biorxiv_state: bioRxiv 状态字典，本次未采集 bioRxiv 时为 None
+        new_items: 各源（按论文的 source 字段）新采集的论文数
+        biorxiv_ok: 预印本采集是否成功（失败时不更新 last_fetch，按抓取失败安排下次轮询）
+
+    Returns:
+        list[dict]: 本次轮询过、需要写回状态的源
+    """
+    polled = list(rss_sources)
+    new_items = Counter(new_items)
+    if biorxiv_state is not None:
+        if biorxiv_ok:
+            biorxiv_state["last_fetch"] = datetime.now(UTC)
+        polled.insert(0, biorxiv_state)
+        # 所有预印本服务器共用 bioRxiv 的轮询状态
+        new_items[BIORXIV_SOURCE_NAME] = sum(new_items[name] for name in PREPRINT_SOURCES)
+
+    if get_settings().polling_enabled:
+        policy = PollingPolicy.from_settings()
+        now = datetime.now(UTC)
+        for source in polled:
+            record_poll(
+                source,
+                previous_fetch=source.get("previous_fetch"),
+                new_items=new_items.get(source.get("name"), 0),
+                now=now,
+                policy=policy,
+            )
+            logger.debug(
+                f"{source.get('name')}: {source.get('new_items', 0)} new, "
+                f"next poll in {source['poll_interval']:.1f}h"
+            )
+
+    return polled
+
+
+def _incremental_start_date(state: dict[str, Any], end_date: datetime) -> datetime:
+    """根据高水位计算增量采集的起始日期
+
+    Args:
+        state: 源状态字典（可能包含 high_water_mark）
+        end_date: 采集结束日期
+
+    Returns:
+        datetime: 起始日期（高水位减去回看时长；无高水位时为默认天数之前）
+    """
+    settings = get_settings()
+    high_water_mark = as_utc(state.get("high_water_mark"))
+
+    if high_water_mark is None:
+        return end_date - timedelta(days=settings.collection_default_days)
+
+    start = high_water_mark - timedelta(hours=settings.collection_overlap_hours)
+    return start.replace(tzinfo=None)
+
+
+def _advance_biorxiv_high_water_mark(
+    state: dict[str, Any],
+    papers: list[PaperData],
+) -> None:
+    """用本次采集到的 bioRxiv / medRxiv 论文推进高水位
+
+    Args:
+        state: bioRxiv 源状态字典（原地更新，所有预印本目标共用）
+        papers: 本次采集到的论文
+    """
+    newest = as_utc(state.get("high_water_mark"))
+
+    for paper in papers:
+        if paper.get("source") not in PREPRINT_SOURCES or not paper.get("publication_date"):
+            continue
+        try:
+            published = datetime.strptime(paper["publication_date"], "%Y-%m-%d").replace(tzinfo=UTC)
+        except (TypeError, ValueError):
+            continue
+        if newest is None or published > newest:
+            newest = published
+
+    if newest is not None:
+        state["high_water_mark"] = newest
+
+
+@handle_errors("记录采集日志", logger)
+def _record_collection_log(report: CollectionReport, new_papers: int) -> None:
+    """将采集报告写入 CollectionLog
+
+    Args:
+        report: 采集报告
+        new_papers: 新入库的论文数
+    """
+    from evo_flywheel.db import crud
+
+    with get_db_session() as session:
+        crud.create_collection_log(
+            session,
+            status=report.status,
+            total_papers=report.total_papers,
+            new_papers=new_papers,
+            sources=report.source_names,
+            error_message=report.error_message,
+        )
+
+
+@handle_errors("加载源状态", logger)
+def _load_source_state(sources: list[dict[str, Any]]) -> None:
+    """从 RSSSource 表加载各源的状态到源配置字典
+
+    Args:
+        sources: 源配置列表（原地更新）
+    """
+    from evo_flywheel.db import crud
+
+    if not sources:
+        return
+
+    with get_db_session() as session:
+        crud.load_rss_source_state(session, sources)
+
+
+@handle_errors("保存源状态", logger)
+def _save_source_state(sources: list[dict[str, Any]]) -> None:
+    """将源配置字典中的状态写回 RSSSource 表
+
+    Args:
+        sources: 源配置列表
+    """
+    from evo_flywheel.db import crud
+
+    if not sources:
+        return
+
+    with get_db_session() as session:
+        crud.save_rss_source_state(session, sources)
+
+
+def _remove_near_duplicates(session: Session, papers: list[PaperData]) -> list[PaperData]:
+    """跳过与库中已有论文近似重复的论文，并将保留的论文加入持久化索引
+
+    Args:
+        session: 数据库会话
+        papers: 论文列表
+
+    Returns:
+        list[dict]: 去重后的论文列表
+    """
+    from evo_flywheel.collectors.dedup import remove_near_duplicate_papers
+    from evo_flywheel.db.lsh_store import create_lsh_index
 
+    settings = get_settings()
+    if not settings.dedup_near_duplicates:
+        return papers
+
+    index = create_lsh_index(
+        session,
+        threshold=settings.dedup_similarity_threshold,
+        abstract_tokens=settings.dedup_abstract_tokens,
+    )
+    return remove_near_duplicate_papers(papers, index)
 
-def _save_papers_to_db(papers: list[dict[str, Any]]) -> int:
+
+def _save_papers_to_db(papers: list[PaperData]) -> int:
     """保存论文到数据库
 
+    写库失败时回滚并抛出异常，调用方据此不推进源状态或检查点。
+
     Args:
         papers: 论文列表
 
@@ -165,54 +629,129 @@ def _save_papers_to_db(papers: list[dict[str, Any]]) -> int:
         int: 实际保存的论文数量
     """
     from evo_flywheel.db import crud
-    from evo_flywheel.db.models import Paper
 
-    saved_count = 0
-    skipped_count = 0
+    if not papers:
+        return 0
 
     with get_db_session() as session:
-        for paper_data in papers:
-            try:
-                # 检查是否已存在（通过 DOI 或 URL）
-                existing = None
-                if paper_data.get("doi"):
-                    existing = crud.get_paper_by_doi(session, paper_data["doi"])
-                elif paper_data.get("url"):
-                    # 从 URL 提取 ID 作为唯一标识
-                    existing = session.query(Paper).filter(Paper.url == paper_data["url"]).first()
-
-                if existing:
-                    skipped_count += 1
-                    continue
-
-                # 创建新论文记录
-                crud.create_paper(
-                    session,
-                    title=paper_data.get("title", ""),
-                    doi=paper_data.get("doi"),
-                    authors=paper_data.get("authors", []),
-                    abstract=paper_data.get("abstract"),
-                    url=paper_data.get("url"),
-                    publication_date=paper_data.get("publication_date"),
-                    journal=paper_data.get("journal"),
-                    source=paper_data.get("source"),
-                )
-                saved_count += 1
-
-            except Exception as e:
-                logger.error(f"Failed to save paper: {paper_data.get('title', 'Unknown')}: {e}")
-                continue
-
-        logger.info(
-            f"Saved {saved_count} new papers to database (skipped {skipped_count} duplicates)"
-        )
+        try:
+            papers = _remove_near_duplicates(session, papers)
+            result = crud.bulk_upsert_papers(session, papers)
+        except Exception as e:
+            logger.error(f"Failed to save {len(papers)} papers: {e}")
+            raise
+
+    logger.info(
+        f"Saved {result['inserted']} new papers to database "
+        f"(skipped {result['skipped']} duplicates)"
+    )
+    return result["inserted"]
+
+
+def run_biorxiv_backfill(
+    days: int = 30,
+    category: str = "evolutionary_biology",
+    max_workers: int = 1,
+) -> int:
+    """回填最近若干天的 bioRxiv 论文（可断点恢复）
 
-    return saved_count
+    按天切分窗口逐页抓取，每页到达后立即去重入库，入库成功后才保存该页的游标检查点
+    （``settings.biorxiv_checkpoint_path``）。写库失败时回填停止并抛出异常；
+    再次运行会跳过已完成的窗口，并从未完成窗口的游标处继续。
+
+    Args:
+        days: 回填天数
+        category: bioRxiv 论文分类
+        max_workers: 并发抓取的窗口数
+
+    Returns:
+        int: 新保存的论文数量
+    """
+    from evo_flywheel.collectors.biorxiv import backfill_biorxiv
+    from evo_flywheel.collectors.checkpoint import CursorCheckpointStore
+    from evo_flywheel.collectors.dedup import remove_duplicate_papers
+
+    settings = get_settings()
+    checkpoint = CursorCheckpointStore(settings.biorxiv_checkpoint_path)
+
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=days)
+    logger.info(f"Starting bioRxiv backfill: {start_date:%Y-%m-%d} to {end_date:%Y-%m-%d}")
+
+    saved = 0
+    for page in backfill_biorxiv(
+        start_date,
+        end_date,
+        category,
+        checkpoint=checkpoint,
+        max_workers=max_workers,
+    ):
+        page = remove_duplicate_papers(page)
+        if page:
+            saved += _save_papers_to_db(page)
+
+    logger.info(f"bioRxiv backfill completed: {saved} new papers")
+    return saved
+
+
+def replay_archive(days: int = 30, *, update: bool = False) -> int:
+    """从原始响应归档重新解析最近若干天抓取的响应并入库（不访问网络）
+
+    解析器修改后用于重新处理历史数据。默认只补入库中缺失的论文，已入库的论文跳过；
+    ``update=True`` 时同时用新的解析结果更正已入库论文的解析字段
+    （标题、作者、摘要、URL、发表日期、期刊，见 crud.refresh_parsed_papers）。
+
+    Args:
+        days: 重放最近多少天抓取的响应
+        update: 是否更正已入库论文的解析字段
+
+    Returns:
+        int: 新保存的论文数量
+    """
+    from evo_flywheel.db import crud
+
+    end_date = datetime.now(UTC)
+    start_date = end_date - timedelta(days=days)
+
+    papers = collect_from_all_sources(start_date, end_date, rss_sources=None, replay=True)
+    refreshed = 0
+    if update and papers:
+        with get_db_session() as session:
+            refreshed = crud.refresh_parsed_papers(session, papers)
+    saved = _save_papers_to_db(papers)
+    logger.info(
+        f"Archive replay completed: {len(papers)} papers parsed, {saved} new, {refreshed} updated"
+    )
+    return saved
+
+
+def build_near_duplicate_index() -> int:
+    """为库中已有的论文建立去重索引：论文键索引和近似去重索引（可重复执行）
+
+    Returns:
+        int: 处理的论文数量
+    """
+    from evo_flywheel.db import crud
+    from evo_flywheel.db.lsh_store import create_lsh_index, index_existing_papers
+
+    settings = get_settings()
+    with get_db_session() as session:
+        crud.backfill_paper_keys(session)
+        index = create_lsh_index(
+            session,
+            threshold=settings.dedup_similarity_threshold,
+            abstract_tokens=settings.dedup_abstract_tokens,
+        )
+        return index_existing_papers(session, index)
 
 
 def schedule_flywheel(interval_hours: int = 4) -> BackgroundScheduler:
     """配置飞轮定时任务
 
+    启用自适应轮询时另加一个源轮询任务，每 ``settings.polling_tick_minutes``
+    分钟采集一次到期的源，活跃的源因此不必等到下一次飞轮。两个任务都不并发执行自身，
+    彼此之间由 ``poll_due_sources`` 的轮询锁互斥。
+
     Args:
         interval_hours: 执行间隔（小时，默认 4 小时）
 
@@ -231,8 +770,25 @@ def schedule_flywheel(interval_hours: int = 4) -> BackgroundScheduler:
         id="flywheel",
         name="Evolutionary Biology Flywheel",
         replace_existing=True,
+        max_instances=1,
+        coalesce=True,
     )
 
+    # 按各源自己的间隔轮询
+    settings = get_settings()
+    if settings.polling_enabled:
+        scheduler.add_job(
+            poll_due_sources,
+            trigger="interval",
+            minutes=settings.polling_tick_minutes,
+            id="source_polling",
+            name="Adaptive Source Polling",
+            replace_existing=True,
+            max_instances=1,
+            coalesce=True,
+        )
+        logger.info(f"Source polling checks due sources every {settings.polling_tick_minutes} min")
+
     logger.info(f"Flywheel scheduler configured (runs every {interval_hours} hours)")
     return scheduler
 
@@ -244,8 +800,38 @@ def main() -> None:
         evo-fetch               # 执行一次飞轮（采集+分析+报告）
         evo-fetch --schedule    # 启动调度器（4小时间隔）
         evo-fetch --interval 2  # 自定义间隔（2小时）
+        evo-fetch --backfill 30 # 回填最近30天的 bioRxiv 论文（可断点恢复）
+        evo-fetch --backfill 30 --workers 4  # 并发抓取4个日期窗口
+        evo-fetch --index-duplicates  # 为已有论文建立去重索引（论文键 + 近似去重）
+        evo-fetch --replay 90   # 从原始响应归档重新解析最近90天的抓取（不访问网络），只补缺失的论文
+        evo-fetch --replay 90 --update  # 同上，并用新的解析结果更正已入库的论文
     """
+    if len(sys.argv) > 1 and sys.argv[1] == "--index-duplicates":
+        count = build_near_duplicate_index()
+        logger.info(f"Near-duplicate index built for {count} papers")
+        return
+
+    if len(sys.argv) > 2 and sys.argv[1] == "--replay":
+        try:
+            replay_archive(days=int(sys.argv[2]), update="--update" in sys.argv[3:])
+        except Exception as e:
+            logger.error(f"Archive replay failed: {e}")
+        return
+
     # 检查命令行参数
+    if len(sys.argv) > 2 and sys.argv[1] == "--backfill":
+        days = int(sys.argv[2])
+        max_workers = 1
+        if len(sys.argv) > 4 and sys.argv[3] == "--workers":
+            max_workers = int(sys.argv[4])
+
+        logger.info(f"Running bioRxiv backfill for {days} days")
+        try:
+            run_biorxiv_backfill(days=days, max_workers=max_workers)
+        except Exception as e:
+            logger.error(f"bioRxiv backfill interrupted (resume by re-running): {e}")
+        return
+
     if len(sys.argv) > 1 and sys.argv[1] == "--schedule":
         # 调度器模式
         interval_hours = 4  # 默认4小时
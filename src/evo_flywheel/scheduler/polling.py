@@ -0,0 +1,128 @@
+"""源级自适应轮询模块
+
+根据每个源观察到的更新频率（新论文数 / 两次抓取的间隔）为其计算独立的轮询间隔：
+更新频繁的源更快被再次抓取，安静或抓取失败的源按倍数退避
+"""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from evo_flywheel.collectors.orchestrator import as_utc
+from evo_flywheel.config import get_settings
+
+# 计算更新频率时两次抓取的最短间隔（小时），避免间隔过短时频率失真
+MIN_ELAPSED_HOURS = 1 / 60
+
+
+@dataclass(frozen=True)
+class PollingPolicy:
+    """轮询策略
+
+    轮询间隔取 ``target_items / update_rate``，即预计积累约 ``target_items``
+    篇新论文后再抓取；本次没有新论文或抓取失败时，间隔乘以 ``backoff_factor``。
+    所有间隔都限制在 [min_interval_hours, max_interval_hours] 内。
+    """
+
+    min_interval_hours: float = 1.0
+    max_interval_hours: float = 72.0
+    default_interval_hours: float = 4.0
+    target_items: float = 5.0
+    smoothing: float = 0.3
+    backoff_factor: float = 2.0
+
+    @classmethod
+    def from_settings(cls) -> "PollingPolicy":
+        """从配置创建轮询策略"""
+        settings = get_settings()
+        return cls(
+            min_interval_hours=settings.polling_min_interval_hours,
+            max_interval_hours=settings.polling_max_interval_hours,
+            default_interval_hours=settings.polling_default_interval_hours,
+            target_items=settings.polling_target_items,
+            smoothing=settings.polling_smoothing,
+            backoff_factor=settings.polling_backoff_factor,
+        )
+
+    def clamp(self, hours: float) -> float:
+        """将间隔限制在允许范围内"""
+        return min(self.max_interval_hours, max(self.min_interval_hours, hours))
+
+
+def is_due(source: Mapping[str, Any], now: datetime) -> bool:
+    """判断源是否到了轮询时间
+
+    Args:
+        source: 源配置字典（可能包含 next_poll_at）
+        now: 当前时间
+
+    Returns:
+        bool: 从未安排过或已到期时返回 True
+    """
+    next_poll_at = as_utc(source.get("next_poll_at"))
+    return next_poll_at is None or next_poll_at <= as_utc(now)
+
+
+def select_due_sources(sources: Iterable[dict[str, Any]], now: datetime) -> list[dict[str, Any]]:
+    """筛选出到期需要轮询的源
+
+    Args:
+        sources: 源配置列表
+        now: 当前时间
+
+    Returns:
+        list[dict]: 到期的源
+    """
+    return [source for source in sources if is_due(source, now)]
+
+
+def record_poll(
+    source: dict[str, Any],
+    *,
+    previous_fetch: datetime | None,
+    new_items: int,
+    now: datetime,
+    policy: PollingPolicy | None = None,
+) -> None:
+    """根据本次轮询结果更新源的更新频率和下次轮询时间
+
+    ``last_fetch`` 比 ``previous_fetch`` 新表示本次抓取成功（含 304），
+    此时用 ``new_items`` 更新指数平滑的 ``update_rate``（新论文数/小时）；
+    否则视为抓取失败，间隔退避。结果写入 ``poll_interval``（小时）和 ``next_poll_at``。
+
+    Args:
+        source: 源配置字典（原地更新）
+        previous_fetch: 本次轮询前的 last_fetch
+        new_items: 本次采集到的新论文数
+        now: 当前时间
+        policy: 轮询策略，默认从配置读取
+    """
+    policy = policy or PollingPolicy.from_settings()
+    previous_fetch = as_utc(previous_fetch)
+    last_fetch = as_utc(source.get("last_fetch"))
+    interval = source.get("poll_interval") or policy.default_interval_hours
+
+    # last_fetch 没有前进说明本次抓取失败
+    if last_fetch is None or (previous_fetch is not None and last_fetch <= previous_fetch):
+        interval *= policy.backoff_factor
+    else:
+        source["new_items"] = new_items
+        rate = source.get("update_rate")
+        if previous_fetch is not None:
+            hours = max((last_fetch - previous_fetch).total_seconds() / 3600, MIN_ELAPSED_HOURS)
+            observed = new_items / hours
+            rate = observed if rate is None else rate + policy.smoothing * (observed - rate)
+            source["update_rate"] = rate
+
+        if new_items == 0:
+            interval *= policy.backoff_factor
+        elif rate:
+            interval = policy.target_items / rate
+        else:
+            # 首次抓取：没有可比较的上次抓取时间
+            interval = policy.default_interval_hours
+
+    interval = policy.clamp(interval)
+    source["poll_interval"] = interval
+    source["next_poll_at"] = as_utc(now) + timedelta(hours=interval)
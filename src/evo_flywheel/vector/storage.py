@@ -5,10 +5,8 @@
 
 from typing import Any
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-
 from evo_flywheel.db import crud
+from evo_flywheel.db.engine import get_session_factory
 from evo_flywheel.logging import get_logger
 from evo_flywheel.vector import client as chroma_client
 from evo_flywheel.vector.embeddings import generate_embedding, generate_embeddings_batch
@@ -239,19 +237,7 @@ def get_papers_without_embeddings() -> list[dict[str, Any]]:
     Returns:
         list[dict]: 论文列表
     """
-    from evo_flywheel.config import get_settings
-
-    settings = get_settings()
-
-    # 创建数据库连接
-    engine = create_engine(
-        settings.effective_database_url,
-        connect_args={"check_same_thread": False}
-        if settings.effective_database_url.startswith("sqlite")
-        else {},
-    )
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    db = SessionLocal()
+    db = get_session_factory()()
 
     try:
         papers = crud.get_papers(db, limit=10000)
@@ -284,7 +270,6 @@ def get_papers_without_embeddings() -> list[dict[str, Any]]:
 
     finally:
         db.close()
-        engine.dispose()
 
 
 def rebuild_paper_embeddings(
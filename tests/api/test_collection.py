@@ -1,13 +1,41 @@
 """采集端点测试"""
 
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
 from unittest.mock import patch
 
+import httpx
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+from evo_flywheel.collectors.orchestrator import SourceReport
+from evo_flywheel.db.models import Paper, PaperSignature, RSSSource
+
+
+@pytest.fixture(autouse=True)
+def job_db(test_engine, monkeypatch):
+    """让调度器的采集路径（手动采集复用）使用测试数据库"""
+    factory = sessionmaker(bind=test_engine)
+
+    @contextmanager
+    def session_scope():
+        session = factory()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    monkeypatch.setattr("evo_flywheel.scheduler.jobs.get_db_session", session_scope)
+
 
 @patch("evo_flywheel.api.v1.collection.load_rss_sources")
-@patch("evo_flywheel.api.v1.collection.collect_from_all_sources")
-@patch("evo_flywheel.api.v1.collection.crud.get_paper_by_doi")
-@patch("evo_flywheel.api.v1.collection.crud.create_paper")
-def test_trigger_fetch(mock_create, mock_get_paper, mock_collect, mock_load_sources, client):
+@patch("evo_flywheel.scheduler.jobs.collect_from_all_sources")
+def test_trigger_fetch(mock_collect, mock_load_sources, client):
     """测试触发数据采集"""
     # Mock RSS sources
     mock_load_sources.return_value = []
@@ -27,15 +55,17 @@ def test_trigger_fetch(mock_create, mock_get_paper, mock_collect, mock_load_sour
         for i in range(5)
     ]
 
-    # Mock: 所有论文都是新的 (get_paper_by_doi 返回 None)
-    mock_get_paper.return_value = None
-
     response = client.post("/api/v1/collection/fetch?days=7")
     assert response.status_code == 200
     data = response.json()
     assert data["total"] == 5
     assert data["new"] == 5
 
+    # 再次采集同一批论文时全部按已存在跳过
+    response = client.post("/api/v1/collection/fetch?days=7")
+    assert response.status_code == 200
+    assert response.json()["new"] == 0
+
 
 def test_get_collection_status(client):
     """测试获取采集状态（返回真实的 CollectionLog 数据）"""
@@ -58,6 +88,41 @@ def test_get_collection_status(client):
         assert "created_at" in data["last_collection"]
 
 
+def test_get_collection_status_reports_source_health(client, test_db):
+    """测试采集状态包含各源的数量与熔断状态"""
+    from datetime import datetime
+
+    from evo_flywheel.db.models import RSSSource
+
+    test_db.add_all(
+        [
+            RSSSource(name="Nature", source_type="rss", priority=1),
+            RSSSource(
+                name="Evolution",
+                source_type="rss",
+                priority=2,
+                circuit_state="open",
+                consecutive_failures=4,
+                open_until=datetime(2025, 1, 1, 12),
+                last_error="Client error '404 Not Found'",
+            ),
+        ]
+    )
+    test_db.commit()
+
+    response = client.get("/api/v1/collection/status")
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["total_sources"] == 2
+    assert data["healthy_sources"] == 1
+    health = {s["name"]: s for s in data["source_health"]}
+    assert health["Nature"]["circuit_state"] == "closed"
+    assert health["Evolution"]["circuit_state"] == "open"
+    assert health["Evolution"]["consecutive_failures"] == 4
+    assert health["Evolution"]["open_until"] == "2025-01-01T12:00:00"
+
+
 def test_collection_log_model_exists():
     """测试 CollectionLog 模型存在"""
     from evo_flywheel.db.models import CollectionLog
@@ -83,7 +148,7 @@ def test_crud_create_collection_log_exists():
 
 
 @patch("evo_flywheel.api.v1.collection.load_rss_sources")
-@patch("evo_flywheel.api.v1.collection.collect_from_all_sources")
+@patch("evo_flywheel.scheduler.jobs.collect_from_all_sources")
 def test_trigger_fetch_with_sources_filter(mock_collect, mock_load_sources, client):
     """测试 sources 参数过滤数据源"""
     # Mock RSS 源
@@ -131,12 +196,8 @@ def test_trigger_fetch_with_sources_filter(mock_collect, mock_load_sources, clie
 
 
 @patch("evo_flywheel.api.v1.collection.load_rss_sources")
-@patch("evo_flywheel.api.v1.collection.collect_from_all_sources")
-@patch("evo_flywheel.api.v1.collection.crud.get_paper_by_doi")
-@patch("evo_flywheel.api.v1.collection.crud.create_paper")
-def test_trigger_fetch_single_source(
-    mock_create, mock_get_paper, mock_collect, mock_load_sources, client
-):
+@patch("evo_flywheel.scheduler.jobs.collect_from_all_sources")
+def test_trigger_fetch_single_source(mock_collect, mock_load_sources, client):
     """测试单个数据源过滤"""
     mock_load_sources.return_value = [
         {"name": "biorxiv_api", "url": "...", "source_type": "api"},
@@ -146,7 +207,6 @@ def test_trigger_fetch_single_source(
     mock_collect.return_value = [
         {"title": "Paper", "doi": "10.1101/2025.00001", "source": "biorxiv_api"}
     ]
-    mock_get_paper.return_value = None
 
     response = client.post("/api/v1/collection/fetch?days=7&sources=biorxiv_api")
     assert response.status_code == 200
@@ -159,3 +219,80 @@ def test_trigger_fetch_single_source(
 
     # 应该只有 biorxiv_api
     assert "biorxiv_api" in source_names
+
+
+@patch("evo_flywheel.api.v1.collection.load_rss_sources")
+@patch("evo_flywheel.scheduler.jobs.collect_from_all_sources")
+def test_trigger_fetch_indexes_near_duplicates(mock_collect, mock_load_sources, client, test_db):
+    """测试手动采集的论文经近似去重入库，并写入持久化 LSH 索引"""
+    mock_load_sources.return_value = []
+    abstract = "Adaptive radiation of cichlid fishes in African lakes " * 3
+    mock_collect.return_value = [
+        {"title": "Cichlid radiation in Lake Malawi", "doi": "10.1/a", "abstract": abstract},
+        {"title": "Cichlid radiation in Lake Malawi.", "doi": "10.1/b", "abstract": abstract},
+    ]
+
+    response = client.post("/api/v1/collection/fetch?days=7")
+
+    assert response.status_code == 200
+    assert response.json() == {"total": 2, "new": 1}
+    assert test_db.scalars(select(Paper.doi)).all() == ["10.1/a"]
+    assert len(test_db.scalars(select(PaperSignature.paper_key)).all()) == 1
+
+
+@patch("evo_flywheel.api.v1.collection.load_rss_sources")
+def test_trigger_fetch_skips_open_circuit_source(mock_load_sources, client, test_db, monkeypatch):
+    """测试手动采集加载并写回源状态：熔断打开的源被跳过，其余源保存校验器"""
+    # Arrange
+    test_db.add(
+        RSSSource(
+            name="Dead",
+            source_type="rss",
+            circuit_state="open",
+            consecutive_failures=5,
+            open_until=datetime.now(UTC) + timedelta(hours=1),
+        )
+    )
+    test_db.commit()
+    mock_load_sources.return_value = [
+        {"name": "Dead", "url": "https://dead.example.com/feed.rss"},
+        {"name": "Live", "url": "https://live.example.com/feed.rss"},
+    ]
+    requested = []
+
+    def handler(request):
+        requested.append(request.url.host)
+        return httpx.Response(
+            200, content=b"<rss><channel></channel></rss>", headers={"ETag": '"v2"'}
+        )
+
+    monkeypatch.setattr(
+        "evo_flywheel.collectors.fetcher.create_async_client",
+        lambda timeout=None: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    monkeypatch.setattr(
+        "evo_flywheel.collectors.orchestrator._collect_preprints",
+        lambda *args, **kwargs: ([], SourceReport(name="bioRxiv")),
+    )
+
+    # Act
+    response = client.post("/api/v1/collection/fetch?days=7")
+
+    # Assert
+    assert response.status_code == 200
+    assert requested == ["live.example.com"]
+    test_db.expire_all()
+    states = {s.name: s for s in test_db.scalars(select(RSSSource))}
+    assert states["Dead"].circuit_state == "open"
+    assert states["Dead"].consecutive_failures == 5
+    assert states["Live"].etag == '"v2"'
+
+
+def test_trigger_fetch_rejected_while_polling(client):
+    """测试已有轮询在进行时手动采集返回 409"""
+    from evo_flywheel.scheduler import jobs
+
+    with jobs._polling_lock:
+        response = client.post("/api/v1/collection/fetch?days=7")
+
+    assert response.status_code == 409
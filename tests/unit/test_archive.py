@@ -0,0 +1,148 @@
+"""原始响应归档与重放单元测试"""
+
+import json
+from datetime import UTC, datetime, timedelta
+from unittest import mock
+
+import httpx
+import pytest
+
+from evo_flywheel.collectors.archive import (
+    KIND_BIORXIV,
+    ResponseArchive,
+    get_response_archive,
+)
+from evo_flywheel.collectors.biorxiv import fetch_biorxiv_papers
+from evo_flywheel.collectors.orchestrator import (
+    collect_from_all_sources,
+    collect_from_rss_sources,
+    replay_archived_papers,
+)
+from evo_flywheel.config import get_settings
+
+RSS = b"<rss><channel><item><title>Archived Paper</title><link>https://example.com/1</link></item></channel></rss>"
+
+
+@pytest.fixture
+def archive_dir(tmp_path, monkeypatch):
+    """启用归档并指向临时目录"""
+    monkeypatch.setattr(get_settings(), "collection_archive_dir", str(tmp_path))
+    return tmp_path
+
+
+class TestResponseArchive:
+    """归档存取测试"""
+
+    def test_store_and_load_roundtrip(self, tmp_path):
+        """测试内容压缩存储后可原样读出"""
+        archive = ResponseArchive(tmp_path)
+
+        entry = archive.store("Nature", RSS, url="https://www.nature.com/nature.rss")
+
+        assert archive.load(entry.sha256) == RSS
+        assert entry.size == len(RSS)
+        assert entry.source == "Nature"
+
+    def test_identical_content_is_stored_once(self, tmp_path):
+        """测试相同内容只保存一份对象，但每次抓取都有索引记录"""
+        archive = ResponseArchive(tmp_path)
+
+        first = archive.store("Nature", RSS)
+        second = archive.store("Nature", RSS)
+
+        assert first.sha256 == second.sha256
+        assert len(list((tmp_path / "objects").rglob("*.gz"))) == 1
+        assert len(list(archive.entries())) == 2
+
+    def test_entries_filter_by_source_and_time(self, tmp_path):
+        """测试按源和抓取时间筛选索引记录"""
+        archive = ResponseArchive(tmp_path)
+        base = datetime(2024, 12, 1, tzinfo=UTC)
+        archive.store("Nature", b"a", fetched_at=base)
+        archive.store("PLOS Biology", b"b", fetched_at=base + timedelta(days=1))
+        archive.store("Nature", b"c", fetched_at=base + timedelta(days=2))
+
+        nature = [e.fetched_at for e in archive.entries(source="Nature")]
+        recent = [e.source for e in archive.entries(since=datetime(2024, 12, 2))]
+
+        assert nature == [base, base + timedelta(days=2)]
+        assert recent == ["PLOS Biology", "Nature"]
+
+    def test_unconfigured_archive_is_disabled(self, monkeypatch):
+        """测试未配置归档目录时不归档"""
+        monkeypatch.setattr(get_settings(), "collection_archive_dir", "")
+
+        assert get_response_archive() is None
+
+
+class TestArchiveReplay:
+    """采集归档与离线重放测试"""
+
+    def test_rss_responses_are_archived_and_replayed_offline(self, archive_dir, monkeypatch):
+        """测试 RSS 响应在采集时归档，重放时不访问网络"""
+
+        # Arrange: 在线采集一次
+        def online(request):
+            return httpx.Response(200, content=RSS)
+
+        monkeypatch.setattr(
+            "evo_flywheel.collectors.fetcher.create_async_client",
+            lambda timeout=None: httpx.AsyncClient(transport=httpx.MockTransport(online)),
+        )
+        collect_from_rss_sources([{"name": "Nature", "url": "https://www.nature.com/nature.rss"}])
+
+        # 之后任何网络访问都视为失败
+        def offline(request):
+            raise AssertionError("replay must not hit the network")
+
+        monkeypatch.setattr(
+            "evo_flywheel.collectors.fetcher.create_async_client",
+            lambda timeout=None: httpx.AsyncClient(transport=httpx.MockTransport(offline)),
+        )
+
+        # Act
+        now = datetime.now(UTC)
+        papers = collect_from_all_sources(now - timedelta(days=1), now, replay=True)
+
+        # Assert
+        assert [p["title"] for p in papers] == ["Archived Paper"]
+        assert papers[0]["source"] == "Nature"
+
+    def test_biorxiv_pages_are_archived_and_replayed(self, archive_dir):
+        """测试 bioRxiv 每页原始响应被归档并可重放"""
+        # Arrange
+        page = {
+            "messages": [{"total": 1}],
+            "collection": [{"title": "Preprint", "doi": "10.1101/2024.12.01.000001"}],
+        }
+        mock_response = mock.Mock(content=json.dumps(page).encode())
+        mock_response.json.return_value = page
+        with mock.patch("evo_flywheel.collectors.biorxiv.http_get", return_value=mock_response):
+            fetch_biorxiv_papers(datetime(2024, 12, 1), datetime(2024, 12, 1))
+
+        # Act
+        archive = get_response_archive()
+        replayed = list(replay_archived_papers(archive))
+
+        # Assert
+        assert [e.kind for e in archive.entries()] == [KIND_BIORXIV]
+        assert replayed == [[mock.ANY]]
+        assert replayed[0][0]["doi"] == "10.1101/2024.12.01.000001"
+
+    def test_replay_filters_requested_sources(self, archive_dir):
+        """测试重放时只解析指定的源，相同内容只解析一次"""
+        archive = get_response_archive()
+        archive.store("Nature", RSS)
+        archive.store("Nature", RSS)
+        archive.store("Other", RSS.replace(b"Archived", b"Other"))
+
+        papers = list(replay_archived_papers(archive, source_names=["Nature"]))
+
+        assert len(papers) == 1
+
+    def test_replay_requires_archive(self, monkeypatch):
+        """测试未配置归档时重放报错"""
+        monkeypatch.setattr(get_settings(), "collection_archive_dir", "")
+
+        with pytest.raises(ValueError):
+            collect_from_all_sources(datetime(2024, 1, 1), datetime(2024, 1, 2), replay=True)
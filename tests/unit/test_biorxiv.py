@@ -1,16 +1,32 @@
 """bioRxiv API 采集器单元测试"""
 
+import threading
+import time
 from datetime import datetime
 from unittest import mock
 
 import pytest
 
 from evo_flywheel.collectors.biorxiv import (
+    PreprintTarget,
+    backfill_biorxiv,
     build_api_url,
     fetch_biorxiv_papers,
+    fetch_preprint_papers,
+    iter_biorxiv_pages,
     parse_biorxiv_date,
     parse_biorxiv_paper,
+    split_date_windows,
+    window_key,
 )
+from evo_flywheel.collectors.checkpoint import CursorCheckpointStore
+from evo_flywheel.config import get_settings
+
+
+@pytest.fixture(autouse=True)
+def _no_rate_limit(monkeypatch):
+    """单元测试中关闭预印本 API 限速"""
+    monkeypatch.setattr(get_settings(), "biorxiv_requests_per_second", 0.0)
 
 
 class TestBuildAPIUrl:
@@ -192,7 +208,7 @@ class TestFetchBiorxivPapers:
         def mock_get(url, params, timeout):
             return mock_response
 
-        monkeypatch.setattr("requests.get", mock_get)
+        monkeypatch.setattr("evo_flywheel.collectors.biorxiv.http_get", mock_get)
 
         start_date = datetime(2024, 12, 1)
         end_date = datetime(2024, 12, 31)
@@ -215,7 +231,7 @@ class TestFetchBiorxivPapers:
         def mock_get(url, params, timeout):
             return mock_response
 
-        monkeypatch.setattr("requests.get", mock_get)
+        monkeypatch.setattr("evo_flywheel.collectors.biorxiv.http_get", mock_get)
 
         start_date = datetime(2024, 12, 1)
         end_date = datetime(2024, 12, 31)
@@ -233,7 +249,7 @@ class TestFetchBiorxivPapers:
         def mock_get(url, params, timeout):
             raise Exception("Network error")
 
-        monkeypatch.setattr("requests.get", mock_get)
+        monkeypatch.setattr("evo_flywheel.collectors.biorxiv.http_get", mock_get)
 
         start_date = datetime(2024, 12, 1)
         end_date = datetime(2024, 12, 31)
@@ -241,3 +257,265 @@ class TestFetchBiorxivPapers:
         # Act & Assert
         with pytest.raises(Exception, match="Network error"):
             fetch_biorxiv_papers(start_date, end_date)
+
+
+def _paged_api(total, page_size=100, fail_at_cursor=None):
+    """模拟带游标分页的 bioRxiv API，返回 (mock_get, 请求的游标列表)"""
+    requested = []
+
+    def mock_get(url, params, timeout):
+        cursor = int(url.split("?")[0].rsplit("/", 1)[1])
+        requested.append(cursor)
+        if fail_at_cursor is not None and cursor == fail_at_cursor:
+            raise Exception("Network error")
+
+        count = max(0, min(page_size, total - cursor))
+        response = mock.Mock()
+        response.json.return_value = {
+            "messages": [{"status": "ok", "cursor": cursor, "count": count, "total": str(total)}],
+            "collection": [
+                {"title": f"Paper {cursor + i}", "doi": f"10.1101/{cursor + i:06d}"}
+                for i in range(count)
+            ],
+        }
+        return response
+
+    return mock_get, requested
+
+
+class TestPagination:
+    """游标分页测试"""
+
+    def test_build_api_url_with_cursor(self):
+        """测试 URL 包含分页游标"""
+        url = build_api_url(datetime(2024, 12, 1), datetime(2024, 12, 31), cursor=200)
+
+        assert "/2024-12-01/2024-12-31/200?" in url
+
+    def test_fetch_biorxiv_papers_follows_cursor(self, monkeypatch):
+        """测试自动翻页，不再截断在 100 条"""
+        # Arrange
+        mock_get, requested = _paged_api(total=250)
+        monkeypatch.setattr("evo_flywheel.collectors.biorxiv.http_get", mock_get)
+
+        # Act
+        results = fetch_biorxiv_papers(datetime(2024, 12, 1), datetime(2024, 12, 31))
+
+        # Assert
+        assert len(results) == 250
+        assert requested == [0, 100, 200]
+
+    def test_iter_biorxiv_pages_yields_pages(self, monkeypatch):
+        """测试按页流式产出"""
+        # Arrange
+        mock_get, _ = _paged_api(total=150)
+        monkeypatch.setattr("evo_flywheel.collectors.biorxiv.http_get", mock_get)
+
+        # Act
+        pages = list(iter_biorxiv_pages(datetime(2024, 12, 1), datetime(2024, 12, 1)))
+
+        # Assert
+        assert [len(p) for p in pages] == [100, 50]
+
+
+class TestCheckpointResume:
+    """检查点断点续采测试"""
+
+    def test_resume_from_saved_cursor(self, monkeypatch, tmp_path):
+        """测试中断后从保存的游标继续"""
+        # Arrange
+        store = CursorCheckpointStore(tmp_path / "checkpoints.json")
+        start, end = datetime(2024, 12, 1), datetime(2024, 12, 1)
+        failing_get, _ = _paged_api(total=300, fail_at_cursor=200)
+        monkeypatch.setattr("evo_flywheel.collectors.biorxiv.http_get", failing_get)
+
+        # Act - 第一次运行在第三页失败
+        collected = []
+        with pytest.raises(Exception, match="Network error"):
+            for page in iter_biorxiv_pages(start, end, checkpoint=store):
+                collected.extend(page)
+
+        # 重新打开检查点文件，模拟新进程
+        store = CursorCheckpointStore(tmp_path / "checkpoints.json")
+        mock_get, requested = _paged_api(total=300)
+        monkeypatch.setattr("evo_flywheel.collectors.biorxiv.http_get", mock_get)
+        for page in iter_biorxiv_pages(start, end, checkpoint=store):
+            collected.extend(page)
+
+        # Assert
+        assert requested == [200]
+        assert len(collected) == 300
+        assert store.get(window_key(start, end, "evolutionary_biology")).complete
+
+    def test_completed_window_is_skipped(self, monkeypatch, tmp_path):
+        """测试已完成的窗口不再请求"""
+        # Arrange
+        store = CursorCheckpointStore(tmp_path / "checkpoints.json")
+        start, end = datetime(2024, 12, 1), datetime(2024, 12, 1)
+        store.save(window_key(start, end, "evolutionary_biology"), 42, complete=True)
+
+        mock_get, requested = _paged_api(total=42)
+        monkeypatch.setattr("evo_flywheel.collectors.biorxiv.http_get", mock_get)
+
+        # Act
+        pages = list(iter_biorxiv_pages(start, end, checkpoint=store))
+
+        # Assert
+        assert pages == []
+        assert requested == []
+
+
+class TestBackfill:
+    """日期窗口回填测试"""
+
+    def test_split_date_windows(self):
+        """测试日期范围按天切分（包含首尾）"""
+        windows = split_date_windows(datetime(2024, 12, 1), datetime(2024, 12, 5), window_days=2)
+
+        assert windows == [
+            (datetime(2024, 12, 1), datetime(2024, 12, 2)),
+            (datetime(2024, 12, 3), datetime(2024, 12, 4)),
+            (datetime(2024, 12, 5), datetime(2024, 12, 5)),
+        ]
+
+    def test_backfill_concurrent_windows(self, monkeypatch, tmp_path):
+        """测试并发抓取多个窗口并记录各自的检查点"""
+        # Arrange
+        store = CursorCheckpointStore(tmp_path / "checkpoints.json")
+        mock_get, requested = _paged_api(total=120)
+        monkeypatch.setattr("evo_flywheel.collectors.biorxiv.http_get", mock_get)
+        start, end = datetime(2024, 12, 1), datetime(2024, 12, 3)
+
+        # Act
+        pages = list(backfill_biorxiv(start, end, checkpoint=store, max_workers=3))
+
+        # Assert
+        assert sum(len(p) for p in pages) == 360
+        assert len(requested) == 6
+        for window_start, window_end in split_date_windows(start, end):
+            key = window_key(window_start, window_end, "evolutionary_biology")
+            assert store.get(key).complete
+
+    def test_concurrent_backfill_saves_cursor_after_page_is_consumed(self, monkeypatch, tmp_path):
+        """测试并发回填中调用方处理失败时，未处理的页不保存游标、窗口不标记完成"""
+        # Arrange
+        store = CursorCheckpointStore(tmp_path / "checkpoints.json")
+        mock_get, _ = _paged_api(total=120)
+        monkeypatch.setattr("evo_flywheel.collectors.biorxiv.http_get", mock_get)
+        start, end = datetime(2024, 12, 1), datetime(2024, 12, 3)
+        consumed = []
+
+        # Act - 第二页写库失败
+        with pytest.raises(RuntimeError, match="write failed"):
+            for page in backfill_biorxiv(start, end, checkpoint=store, max_workers=3):
+                if consumed:
+                    raise RuntimeError("write failed")
+                consumed.append(page)
+
+        # Assert - 只有第一页的游标被保存
+        states = [
+            store.get(window_key(window_start, window_end, "evolutionary_biology"))
+            for window_start, window_end in split_date_windows(start, end)
+        ]
+        assert not any(state.complete for state in states)
+        assert sum(state.cursor for state in states) == len(consumed[0])
+
+
+class TestPreprintTargets:
+    """多服务器、多分类采集测试"""
+
+    def test_parse_target_spec(self):
+        """测试解析 server:category 与仅分类的目标描述"""
+        assert PreprintTarget.parse("medrxiv:epidemiology") == PreprintTarget(
+            "medrxiv", "epidemiology"
+        )
+        assert PreprintTarget.parse("genetics") == PreprintTarget("biorxiv", "genetics")
+
+        with pytest.raises(ValueError, match="Unknown preprint server"):
+            PreprintTarget.parse("arxiv:genetics")
+
+    def test_medrxiv_url_and_window_key(self):
+        """测试 medRxiv 的 URL 与检查点键（bioRxiv 的键保持原格式）"""
+        start, end = datetime(2024, 12, 1), datetime(2024, 12, 2)
+
+        url = build_api_url(start, end, "epidemiology", server="medrxiv")
+
+        assert "/details/medrxiv/2024-12-01/2024-12-02/0?category=epidemiology" in url
+        assert window_key(start, end, "genetics") == "genetics:2024-12-01:2024-12-02"
+        assert window_key(start, end, "genetics", "medrxiv").startswith("medrxiv:genetics:")
+
+    def test_fetch_targets_concurrently_with_shared_pagination(self, monkeypatch):
+        """测试多个目标的分页在同一线程池中抓取，medRxiv 论文标记来源"""
+        # Arrange
+        totals = {("biorxiv", "genetics"): 250, ("medrxiv", "epidemiology"): 120}
+        requested = []
+
+        def mock_get(url, params, timeout):
+            path, query = url.split("?")
+            server, _, _, cursor = path.rsplit("/", 4)[1:]
+            category = query.split("=", 1)[1]
+            cursor = int(cursor)
+            requested.append((server, category, cursor))
+            total = totals[(server, category)]
+            response = mock.Mock()
+            response.json.return_value = {
+                "messages": [{"status": "ok", "total": total}],
+                "collection": [
+                    {"title": f"{category} {i}", "doi": f"10.1101/{server}.{category}.{i}"}
+                    for i in range(cursor, min(cursor + 100, total))
+                ],
+            }
+            return response
+
+        monkeypatch.setattr("evo_flywheel.collectors.biorxiv.http_get", mock_get)
+        targets = [PreprintTarget(*key) for key in totals]
+
+        # Act
+        papers = fetch_preprint_papers(
+            datetime(2024, 12, 1), datetime(2024, 12, 1), targets, max_workers=3
+        )
+
+        # Assert
+        assert len(papers) == 370
+        assert sorted(requested) == [
+            ("biorxiv", "genetics", 0),
+            ("biorxiv", "genetics", 100),
+            ("biorxiv", "genetics", 200),
+            ("medrxiv", "epidemiology", 0),
+            ("medrxiv", "epidemiology", 100),
+        ]
+        sources = {p["source"] for p in papers if p["title"].startswith("epidemiology")}
+        assert sources == {"medRxiv"}
+
+    def test_failed_page_raises_after_other_pages(self, monkeypatch):
+        """测试有分页失败时抛出异常，避免部分结果被当作完整结果"""
+        # Arrange
+        mock_get, requested = _paged_api(total=300, fail_at_cursor=100)
+        monkeypatch.setattr("evo_flywheel.collectors.biorxiv.http_get", mock_get)
+
+        # Act & Assert
+        with pytest.raises(RuntimeError, match="1 preprint API page"):
+            fetch_preprint_papers(datetime(2024, 12, 1), datetime(2024, 12, 1), [PreprintTarget()])
+        assert sorted(requested) == [0, 100, 200]
+
+    def test_deadline_cancels_pending_pages(self, monkeypatch):
+        """测试超过截止时间时不等待进行中的请求，直接抛出 TimeoutError"""
+        # Arrange
+        release = threading.Event()
+
+        def slow_get(url, params, timeout):
+            release.wait(5)
+            raise AssertionError("request should not complete")
+
+        monkeypatch.setattr("evo_flywheel.collectors.biorxiv.http_get", slow_get)
+
+        # Act & Assert
+        started = time.perf_counter()
+        try:
+            with pytest.raises(TimeoutError, match="deadline"):
+                fetch_preprint_papers(
+                    datetime(2024, 12, 1), datetime(2024, 12, 1), [PreprintTarget()], deadline=0.1
+                )
+            assert time.perf_counter() - started < 2
+        finally:
+            release.set()
@@ -0,0 +1,84 @@
+"""采集源熔断器单元测试"""
+
+from datetime import UTC, datetime, timedelta
+
+from evo_flywheel.collectors.circuit import (
+    CircuitPolicy,
+    allow_request,
+    circuit_state,
+    record_failure,
+    record_success,
+)
+
+NOW = datetime(2024, 12, 31, 12, tzinfo=UTC)
+POLICY = CircuitPolicy(
+    failure_threshold=3,
+    cooldown_base=timedelta(minutes=30),
+    cooldown_max=timedelta(hours=4),
+)
+
+
+class TestCircuitPolicy:
+    """冷却时间测试"""
+
+    def test_cooldown_doubles_and_is_capped(self):
+        """测试冷却时间按超过阈值的失败次数翻倍，且不超过上限"""
+        assert POLICY.cooldown(3) == timedelta(minutes=30)
+        assert POLICY.cooldown(4) == timedelta(hours=1)
+        assert POLICY.cooldown(5) == timedelta(hours=2)
+        assert POLICY.cooldown(50) == timedelta(hours=4)
+
+
+class TestCircuitTransitions:
+    """状态转换测试"""
+
+    def test_opens_after_threshold(self):
+        """测试连续失败达到阈值后打开"""
+        source = {"name": "Feed"}
+
+        for _ in range(2):
+            record_failure(source, "HTTP 404", now=NOW, policy=POLICY)
+            assert circuit_state(source) == "closed"
+            assert allow_request(source, NOW)
+
+        record_failure(source, "HTTP 404", now=NOW, policy=POLICY)
+
+        assert source["circuit_state"] == "open"
+        assert source["consecutive_failures"] == 3
+        assert source["open_until"] == NOW + timedelta(minutes=30)
+        assert source["last_error"] == "HTTP 404"
+        assert not allow_request(source, NOW + timedelta(minutes=29))
+
+    def test_half_open_after_cooldown(self):
+        """测试冷却期结束后转为半开并放行试探请求（兼容无时区时间）"""
+        source = {"name": "Feed", "circuit_state": "open", "open_until": datetime(2024, 12, 31, 11)}
+
+        assert allow_request(source, NOW)
+        assert source["circuit_state"] == "half_open"
+
+    def test_failed_trial_reopens_with_longer_cooldown(self):
+        """测试半开试探失败后以更长的冷却时间重新打开"""
+        source = {"name": "Feed", "circuit_state": "half_open", "consecutive_failures": 3}
+
+        record_failure(source, TimeoutError(), now=NOW, policy=POLICY)
+
+        assert source["circuit_state"] == "open"
+        assert source["open_until"] == NOW + timedelta(hours=1)
+        assert source["last_error"] == "TimeoutError"
+
+    def test_success_closes_circuit(self):
+        """测试成功后关闭熔断器并清零失败计数"""
+        source = {
+            "name": "Feed",
+            "circuit_state": "half_open",
+            "consecutive_failures": 4,
+            "open_until": NOW,
+            "last_error": "HTTP 503",
+        }
+
+        record_success(source)
+
+        assert source["circuit_state"] == "closed"
+        assert source["consecutive_failures"] == 0
+        assert source["open_until"] is None
+        assert source["last_error"] is None
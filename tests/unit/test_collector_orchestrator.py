@@ -1,13 +1,20 @@
 """采集编排器单元测试"""
 
-from datetime import datetime
-from unittest import mock
+import asyncio
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+
+import httpx
 
 from evo_flywheel.collectors.orchestrator import (
+    CollectionReport,
+    SourceReport,
     collect_from_all_sources,
     collect_from_biorxiv,
     collect_from_rss_sources,
 )
+from evo_flywheel.config import get_settings
 
 
 class TestCollectFromBiorxiv:
@@ -21,10 +28,12 @@ class TestCollectFromBiorxiv:
             {"title": "Paper 2", "doi": "10.1101/2024.12.28.222222"},
         ]
 
-        def mock_fetch(start, end, category):
+        def mock_fetch(start, end, targets, **kwargs):
             return mock_papers
 
-        monkeypatch.setattr("evo_flywheel.collectors.orchestrator.fetch_biorxiv_papers", mock_fetch)
+        monkeypatch.setattr(
+            "evo_flywheel.collectors.orchestrator.fetch_preprint_papers", mock_fetch
+        )
 
         start_date = datetime(2024, 12, 1)
         end_date = datetime(2024, 12, 31)
@@ -45,10 +54,12 @@ class TestCollectFromBiorxiv:
             {"title": "Paper 1", "doi": "10.1101/2024.12.28.111111"},  # 重复
         ]
 
-        def mock_fetch(start, end, category):
+        def mock_fetch(start, end, targets, **kwargs):
             return mock_papers
 
-        monkeypatch.setattr("evo_flywheel.collectors.orchestrator.fetch_biorxiv_papers", mock_fetch)
+        monkeypatch.setattr(
+            "evo_flywheel.collectors.orchestrator.fetch_preprint_papers", mock_fetch
+        )
 
         start_date = datetime(2024, 12, 1)
         end_date = datetime(2024, 12, 31)
@@ -60,6 +71,24 @@ class TestCollectFromBiorxiv:
         assert len(results) == 2  # 去重后只有2篇
 
 
+def _rss_bytes(*titles: str, dates: list[str] | None = None) -> bytes:
+    """构造包含指定标题（可选发布日期）的最小 RSS 文档"""
+    items = ""
+    for i, t in enumerate(titles):
+        pub_date = f"<pubDate>{dates[i]}</pubDate>" if dates else ""
+        items += f"<item><title>{t}</title><link>https://example.com/{i}</link>{pub_date}</item>"
+    return f"<rss><channel>{items}</channel></rss>".encode()
+
+
+def _mock_client_factory(monkeypatch, handler):
+    """将抓取引擎的 HTTP 客户端替换为 MockTransport"""
+
+    def factory(timeout=None):
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    monkeypatch.setattr("evo_flywheel.collectors.fetcher.create_async_client", factory)
+
+
 class TestCollectFromRSSSources:
     """RSS 源采集测试"""
 
@@ -71,21 +100,17 @@ class TestCollectFromRSSSources:
             {"name": "Source B", "url": "https://example.com/b.rss"},
         ]
 
-        # Mock RSS fetch results - 使用字典模拟 feedparser.Entry
-        def mock_fetch_rss(url):
-            mock_feed = mock.Mock()
-            mock_feed.entries = [
-                {"title": f"Paper from {url}", "link": f"https://example.com/{url}"}
-            ]
-            return mock_feed
+        def handler(request):
+            return httpx.Response(200, content=_rss_bytes(f"Paper from {request.url}"))
 
-        monkeypatch.setattr("evo_flywheel.collectors.orchestrator.fetch_rss_feed", mock_fetch_rss)
+        _mock_client_factory(monkeypatch, handler)
 
         # Act
         results = collect_from_rss_sources(sources)
 
         # Assert
         assert len(results) == 2
+        assert {p["source"] for p in results} == {"Source A", "Source B"}
 
     def test_collect_from_rss_sources_empty_list(self):
         """测试空源列表"""
@@ -108,24 +133,282 @@ class TestCollectFromRSSSources:
 
         call_count = {"count": 0}
 
-        def mock_fetch_rss(url):
+        def handler(request):
             call_count["count"] += 1
-            if "bad" in url:
-                raise Exception("Network error")
-            mock_feed = mock.Mock()
-            mock_feed.entries = [{"title": "Good Paper", "link": "https://example.com/good"}]
-            return mock_feed
+            if "bad" in str(request.url):
+                raise httpx.ConnectError("Network error", request=request)
+            return httpx.Response(200, content=_rss_bytes("Good Paper"))
 
-        monkeypatch.setattr("evo_flywheel.collectors.orchestrator.fetch_rss_feed", mock_fetch_rss)
+        _mock_client_factory(monkeypatch, handler)
 
         # Act
         results = collect_from_rss_sources(sources)
 
         # Assert
-        # 应该跳过失败的源，继续处理其他源
+        # 失败的源按重试策略重试后跳过，继续处理其他源
+        assert call_count["count"] == 2 + get_settings().http_max_retries
         assert len(results) == 1
         assert results[0]["title"] == "Good Paper"
 
+    def test_collect_from_rss_sources_skips_source_without_url(self, monkeypatch):
+        """测试跳过没有 URL 的源"""
+        # Arrange
+        sources = [
+            {"name": "No URL"},
+            {"name": "Source A", "url": "https://example.com/a.rss"},
+        ]
+
+        _mock_client_factory(
+            monkeypatch, lambda request: httpx.Response(200, content=_rss_bytes("Paper A"))
+        )
+
+        # Act
+        results = collect_from_rss_sources(sources)
+
+        # Assert
+        assert [p["title"] for p in results] == ["Paper A"]
+
+    def test_collect_from_rss_sources_http_error(self, monkeypatch):
+        """测试 HTTP 错误状态码视为失败"""
+        # Arrange
+        sources = [{"name": "Missing", "url": "https://example.com/missing.rss"}]
+
+        _mock_client_factory(monkeypatch, lambda request: httpx.Response(404))
+
+        # Act
+        results = collect_from_rss_sources(sources)
+
+        # Assert
+        assert results == []
+
+    def test_collect_from_rss_sources_updates_validators(self, monkeypatch):
+        """测试抓取成功后把校验器写回源配置"""
+        # Arrange
+        sources = [{"name": "Source A", "url": "https://example.com/a.rss"}]
+
+        _mock_client_factory(
+            monkeypatch,
+            lambda request: httpx.Response(
+                200, content=_rss_bytes("Paper A"), headers={"ETag": '"v1"'}
+            ),
+        )
+
+        # Act
+        collect_from_rss_sources(sources)
+
+        # Assert
+        assert sources[0]["etag"] == '"v1"'
+        assert sources[0]["last_fetch"] is not None
+
+    def test_collect_from_rss_sources_skips_not_modified(self, monkeypatch):
+        """测试 304 的源不解析、不产出论文，并保存 304 响应中更换的校验器"""
+        # Arrange
+        sources = [
+            {"name": "Cached", "url": "https://example.com/cached.rss", "etag": '"v1"'},
+            {"name": "Rotated", "url": "https://example.com/rotated.rss", "etag": '"r1"'},
+            {"name": "Fresh", "url": "https://example.com/fresh.rss"},
+        ]
+        rotated = {"ETag": '"r2"', "Last-Modified": "Wed, 03 Jan 2024 12:00:00 GMT"}
+
+        def handler(request):
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            if request.headers.get("if-none-match") == '"r1"':
+                return httpx.Response(304, headers=rotated)
+            return httpx.Response(200, content=_rss_bytes("Fresh Paper"))
+
+        _mock_client_factory(monkeypatch, handler)
+
+        # Act
+        results = collect_from_rss_sources(sources)
+
+        # Assert
+        assert [p["title"] for p in results] == ["Fresh Paper"]
+        assert sources[0]["etag"] == '"v1"'
+        assert sources[0]["last_modified"] is None
+        assert sources[0]["last_fetch"] is not None
+        assert sources[1]["etag"] == '"r2"'
+        assert sources[1]["last_modified"] == "Wed, 03 Jan 2024 12:00:00 GMT"
+
+    def test_collect_from_rss_sources_high_water_mark(self, monkeypatch):
+        """测试只解析高水位之后的条目并推进高水位"""
+        # Arrange
+        sources = [
+            {
+                "name": "Source A",
+                "url": "https://example.com/a.rss",
+                "high_water_mark": datetime(2024, 1, 2),
+            }
+        ]
+        content = _rss_bytes(
+            "Old Paper",
+            "New Paper",
+            dates=["Mon, 01 Jan 2024 00:00:00 GMT", "Wed, 03 Jan 2024 12:00:00 GMT"],
+        )
+        _mock_client_factory(monkeypatch, lambda request: httpx.Response(200, content=content))
+
+        # Act
+        results = collect_from_rss_sources(sources, overlap=timedelta(0))
+
+        # Assert
+        assert [p["title"] for p in results] == ["New Paper"]
+        assert sources[0]["high_water_mark"] == datetime(2024, 1, 3, 12, tzinfo=UTC)
+        assert sources[0]["new_items"] == 1
+
+    def test_collect_from_rss_sources_overlap(self, monkeypatch):
+        """测试回看时长覆盖高水位之前的迟到条目"""
+        # Arrange
+        sources = [
+            {
+                "name": "Source A",
+                "url": "https://example.com/a.rss",
+                "high_water_mark": datetime(2024, 1, 2, tzinfo=UTC),
+            }
+        ]
+        content = _rss_bytes("Late Paper", dates=["Mon, 01 Jan 2024 12:00:00 GMT"])
+        _mock_client_factory(monkeypatch, lambda request: httpx.Response(200, content=content))
+
+        # Act
+        results = collect_from_rss_sources(sources, overlap=timedelta(hours=24))
+
+        # Assert
+        assert [p["title"] for p in results] == ["Late Paper"]
+        # 高水位不会倒退
+        assert sources[0]["high_water_mark"] == datetime(2024, 1, 2, tzinfo=UTC)
+
+    def test_collect_from_rss_sources_parses_off_event_loop(self, monkeypatch):
+        """测试不使用进程池时 feed 解析在工作线程而不是事件循环线程中执行"""
+        # Arrange
+        from evo_flywheel.collectors import orchestrator
+
+        sources = [{"name": "Source A", "url": "https://example.com/a.rss"}]
+        parse_threads = []
+        parse = orchestrator.parse_feed_content
+
+        def recording_parse(*args):
+            parse_threads.append(threading.current_thread())
+            return parse(*args)
+
+        monkeypatch.setattr(orchestrator, "parse_feed_content", recording_parse)
+        _mock_client_factory(
+            monkeypatch, lambda request: httpx.Response(200, content=_rss_bytes("P"))
+        )
+        loop_threads = []
+        fetch = orchestrator.iter_feed_responses
+
+        async def recording_fetch(*args, **kwargs):
+            loop_threads.append(threading.current_thread())
+            async for result in fetch(*args, **kwargs):
+                yield result
+
+        monkeypatch.setattr(orchestrator, "iter_feed_responses", recording_fetch)
+
+        # Act
+        results = collect_from_rss_sources(sources, parse_workers=1)
+
+        # Assert
+        assert [p["title"] for p in results] == ["P"]
+        assert len(parse_threads) == 1
+        assert parse_threads[0] is not loop_threads[0]
+
+    def test_collect_from_rss_sources_process_pool(self, monkeypatch):
+        """测试在解析进程池中解析多个源，结果与状态更新与主进程解析一致"""
+        # Arrange
+        sources = [
+            {
+                "name": f"Source {i}",
+                "url": f"https://host{i}.example.com/feed.rss",
+                "high_water_mark": datetime(2024, 1, 2, tzinfo=UTC),
+            }
+            for i in range(3)
+        ]
+
+        def handler(request):
+            return httpx.Response(
+                200,
+                content=_rss_bytes(
+                    f"Old {request.url.host}",
+                    f"New {request.url.host}",
+                    dates=["Mon, 01 Jan 2024 00:00:00 GMT", "Wed, 03 Jan 2024 12:00:00 GMT"],
+                ),
+                headers={"ETag": f'"{request.url.host}"'},
+            )
+
+        _mock_client_factory(monkeypatch, handler)
+
+        # Act
+        results = collect_from_rss_sources(sources, overlap=timedelta(0), parse_workers=2)
+
+        # Assert
+        assert sorted(p["title"] for p in results) == [f"New host{i}.example.com" for i in range(3)]
+        for i, source in enumerate(sources):
+            assert source["etag"] == f'"host{i}.example.com"'
+            assert source["new_items"] == 1
+            assert source["high_water_mark"] == datetime(2024, 1, 3, 12, tzinfo=UTC)
+
+
+class TestCircuitBreaker:
+    """RSS 源熔断测试"""
+
+    def test_open_circuit_skips_source(self, monkeypatch):
+        """测试冷却期内的源不发起请求"""
+        # Arrange
+        requested = []
+
+        def handler(request):
+            requested.append(request.url.host)
+            return httpx.Response(200, content=_rss_bytes("Paper"))
+
+        _mock_client_factory(monkeypatch, handler)
+        sources = [
+            {
+                "name": "Broken",
+                "url": "https://broken.example.com/feed.rss",
+                "circuit_state": "open",
+                "open_until": datetime.now(UTC) + timedelta(hours=1),
+            },
+            {"name": "Healthy", "url": "https://healthy.example.com/feed.rss"},
+        ]
+
+        # Act
+        results = collect_from_rss_sources(sources)
+
+        # Assert
+        assert requested == ["healthy.example.com"]
+        assert len(results) == 1
+        assert sources[0]["circuit_state"] == "open"
+
+    def test_failures_and_recovery_are_recorded(self, monkeypatch):
+        """测试失败计入连续失败次数，半开试探成功后关闭熔断器"""
+        # Arrange
+        _mock_client_factory(
+            monkeypatch,
+            lambda request: httpx.Response(
+                404 if request.url.host == "down.example.com" else 200,
+                content=_rss_bytes("Paper"),
+            ),
+        )
+        sources = [
+            {"name": "Down", "url": "https://down.example.com/feed.rss"},
+            {
+                "name": "Recovered",
+                "url": "https://up.example.com/feed.rss",
+                "circuit_state": "open",
+                "consecutive_failures": 5,
+                "open_until": datetime.now(UTC) - timedelta(minutes=1),
+            },
+        ]
+
+        # Act
+        collect_from_rss_sources(sources)
+
+        # Assert
+        assert sources[0]["consecutive_failures"] == 1
+        assert "404" in sources[0]["last_error"]
+        assert sources[1]["circuit_state"] == "closed"
+        assert sources[1]["consecutive_failures"] == 0
+        assert sources[1]["open_until"] is None
+
 
 class TestCollectFromAllSources:
     """全源采集测试"""
@@ -135,15 +418,15 @@ class TestCollectFromAllSources:
 
         # Arrange
         # Mock bioRxiv
-        def mock_biorxiv(start, end, category):
+        def mock_biorxiv(start, end, targets, **kwargs):
             return [{"title": "BioRxiv Paper", "doi": "10.1101/2024.12.28.999999"}]
 
         monkeypatch.setattr(
-            "evo_flywheel.collectors.orchestrator.fetch_biorxiv_papers", mock_biorxiv
+            "evo_flywheel.collectors.orchestrator.fetch_preprint_papers", mock_biorxiv
         )
 
         # Mock RSS sources
-        def mock_collect_rss(sources):
+        def mock_collect_rss(sources, **kwargs):
             return [{"title": "RSS Paper", "doi": "10.1234/rss.001"}]
 
         monkeypatch.setattr(
@@ -164,18 +447,18 @@ class TestCollectFromAllSources:
 
         # Arrange
         # Mock bioRxiv
-        def mock_biorxiv(start, end, category):
+        def mock_biorxiv(start, end, targets, **kwargs):
             return [
                 {"title": "Shared Paper", "doi": "10.1101/2024.12.28.123456"},
                 {"title": "BioRxiv Only", "doi": "10.1101/2024.12.28.111111"},
             ]
 
         monkeypatch.setattr(
-            "evo_flywheel.collectors.orchestrator.fetch_biorxiv_papers", mock_biorxiv
+            "evo_flywheel.collectors.orchestrator.fetch_preprint_papers", mock_biorxiv
         )
 
         # Mock RSS sources (包含相同 DOI 的论文)
-        def mock_collect_rss(sources):
+        def mock_collect_rss(sources, **kwargs):
             return [
                 {"title": "Shared Paper", "doi": "10.1101/2024.12.28.123456"},
                 {"title": "RSS Only", "doi": "10.1234/rss.001"},
@@ -198,3 +481,125 @@ class TestCollectFromAllSources:
         assert "10.1101/2024.12.28.111111" in dois
         assert "10.1234/rss.001" in dois
         assert "10.1101/2024.12.28.123456" in dois
+
+    def test_collect_from_all_sources_drops_stored_papers(self, monkeypatch):
+        """测试提供键索引时丢弃已入库的论文"""
+
+        # Arrange
+        class StoredKeys:
+            def contains_many(self, keys):
+                return keys & {"doi:10.1101/2024.12.28.111111"}
+
+        monkeypatch.setattr(
+            "evo_flywheel.collectors.orchestrator.fetch_preprint_papers",
+            lambda start, end, targets, **kwargs: [
+                {"title": "Stored", "doi": "10.1101/2024.12.28.111111"},
+                {"title": "New", "doi": "10.1101/2024.12.28.222222"},
+            ],
+        )
+        monkeypatch.setattr(
+            "evo_flywheel.collectors.orchestrator.collect_from_rss_sources",
+            lambda sources, **kwargs: [],
+        )
+
+        # Act
+        results = collect_from_all_sources(
+            datetime(2024, 12, 1), datetime(2024, 12, 31), key_index=StoredKeys()
+        )
+
+        # Assert
+        assert [p["title"] for p in results] == ["New"]
+
+    def test_biorxiv_and_rss_run_concurrently(self, monkeypatch):
+        """测试 bioRxiv 与 RSS 源同时抓取（顺序执行时屏障会超时）"""
+        # Arrange
+        barrier = threading.Barrier(2, timeout=5)
+
+        def mock_biorxiv(start, end, targets, **kwargs):
+            barrier.wait()
+            return [{"title": "BioRxiv Paper", "doi": "10.1101/2024.12.28.999999"}]
+
+        def mock_collect_rss(sources, **kwargs):
+            barrier.wait()
+            return [{"title": "RSS Paper", "doi": "10.1234/rss.001"}]
+
+        monkeypatch.setattr(
+            "evo_flywheel.collectors.orchestrator.fetch_preprint_papers", mock_biorxiv
+        )
+        monkeypatch.setattr(
+            "evo_flywheel.collectors.orchestrator.collect_from_rss_sources", mock_collect_rss
+        )
+
+        # Act
+        results = collect_from_all_sources(datetime(2024, 12, 1), datetime(2024, 12, 31))
+
+        # Assert
+        assert [p["title"] for p in results] == ["BioRxiv Paper", "RSS Paper"]
+
+    def test_report_keeps_partial_results_on_deadline(self, monkeypatch):
+        """测试截止时间到期时返回已完成源的论文，并在报告中记录各源结果"""
+        # Arrange
+        monkeypatch.setattr(
+            "evo_flywheel.collectors.biorxiv.http_get",
+            lambda url, params, timeout: time.sleep(1),
+        )
+
+        async def handler(request):
+            if request.url.host == "slow.example.com":
+                await asyncio.sleep(1)
+            if request.url.host == "down.example.com":
+                return httpx.Response(503)
+            return httpx.Response(200, content=_rss_bytes("Fast Paper", "Another Paper"))
+
+        _mock_client_factory(monkeypatch, handler)
+        monkeypatch.setattr(get_settings(), "http_max_retries", 0)
+        sources = [
+            {"name": "Fast", "url": "https://fast.example.com/feed.rss"},
+            {"name": "Slow", "url": "https://slow.example.com/feed.rss"},
+            {"name": "Down", "url": "https://down.example.com/feed.rss"},
+        ]
+        report = CollectionReport()
+
+        # Act
+        started = time.perf_counter()
+        results = collect_from_all_sources(
+            datetime(2024, 12, 1),
+            datetime(2024, 12, 31),
+            rss_sources=sources,
+            deadline=0.3,
+            report=report,
+        )
+
+        # Assert
+        assert time.perf_counter() - started < 0.9
+        assert [p["title"] for p in results] == ["Fast Paper", "Another Paper"]
+        by_name = {source.name: source for source in report.sources}
+        assert set(by_name) == {"bioRxiv", "Fast", "Slow", "Down"}
+        assert by_name["Fast"].ok and by_name["Fast"].papers == 2
+        assert "deadline" in by_name["Slow"].error
+        assert "deadline" in by_name["bioRxiv"].error
+        assert "503" in by_name["Down"].error
+        assert report.total_papers == 2
+        assert report.status == "partial"
+        assert report.source_names.split(",")[0] == "bioRxiv"
+        assert report.error_message.count(";") == 2
+
+
+class TestCollectionReport:
+    """采集报告测试"""
+
+    def test_status_ignores_skipped_sources(self):
+        """测试熔断跳过的源不计入失败"""
+        report = CollectionReport(
+            sources=[
+                SourceReport("A", papers=3),
+                SourceReport("B", error="circuit open", skipped=True),
+            ]
+        )
+
+        assert report.status == "success"
+        assert report.source_names == "A"
+        assert report.error_message is None
+
+        report.sources[0].error = "boom"
+        assert report.status == "failed"
@@ -5,14 +5,21 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from evo_flywheel.db.crud import (
+    add_paper_keys,
+    backfill_paper_keys,
+    bulk_upsert_papers,
     create_daily_report,
     create_feedback,
     create_paper,
     delete_paper,
     get_daily_report_by_date,
+    get_known_paper_keys,
     get_paper_by_doi,
     get_paper_by_id,
     get_papers,
+    load_rss_source_state,
+    refresh_parsed_papers,
+    save_rss_source_state,
     update_paper,
 )
 from evo_flywheel.db.models import Base
@@ -154,6 +161,128 @@ class TestPaperCRUD:
         assert deleted is None
 
 
+class TestBulkUpsertPapers:
+    """批量保存论文测试"""
+
+    @staticmethod
+    def _papers(count, prefix="p"):
+        return [
+            {
+                "title": f"Paper {i}",
+                "doi": f"10.1101/{prefix}.{i}",
+                "authors": ["Author A", "Author B"],
+                "url": f"https://example.com/{prefix}/{i}",
+                "source": "test",
+            }
+            for i in range(count)
+        ]
+
+    def test_inserts_new_papers_across_chunks(self, db_session):
+        """测试跨分块插入新论文并保持字段格式"""
+        # Act
+        result = bulk_upsert_papers(db_session, self._papers(7), chunk_size=3)
+
+        # Assert
+        assert result == {"inserted": 7, "skipped": 0}
+        assert len(get_papers(db_session, limit=100)) == 7
+        paper = get_paper_by_doi(db_session, "10.1101/p.0")
+        assert paper.authors == "Author A;Author B"
+        assert paper.embedded is False
+
+    def test_skips_existing_and_in_batch_duplicates(self, db_session):
+        """测试已存在的论文（按 DOI / URL）和批内重复都被跳过"""
+        # Arrange
+        create_paper(db_session, title="Existing", doi="10.1101/p.0")
+        create_paper(db_session, title="No DOI", url="https://example.com/no-doi")
+        papers = self._papers(3)
+        papers.append(dict(papers[1]))
+        papers.append({"title": "No DOI again", "url": "https://example.com/no-doi"})
+
+        # Act
+        result = bulk_upsert_papers(db_session, papers)
+
+        # Assert
+        assert result == {"inserted": 2, "skipped": 3}
+        assert len(get_papers(db_session, limit=100)) == 4
+
+    def test_empty_input(self, db_session):
+        """测试空列表不写入任何数据"""
+        assert bulk_upsert_papers(db_session, []) == {"inserted": 0, "skipped": 0}
+
+
+class TestRefreshParsedPapers:
+    """重放时更正已入库论文测试"""
+
+    def test_updates_parsed_fields_only(self, db_session):
+        """测试按 DOI / URL 更正解析字段，保留分析结果，库中没有的论文跳过"""
+        # Arrange
+        paper = create_paper(
+            db_session,
+            title="Broken &amp; title",
+            doi="10.1101/a",
+            authors=["Wrong"],
+            importance_score=80,
+        )
+        create_paper(db_session, title="Same", url="https://example.com/same")
+        papers = [
+            {"title": "Fixed & title", "doi": "10.1101/a", "authors": ["Ann", "Bob"]},
+            {"title": "Same", "url": "https://example.com/same"},
+            {"title": "Not stored", "doi": "10.1101/new"},
+        ]
+
+        # Act
+        updated = refresh_parsed_papers(db_session, papers)
+
+        # Assert
+        assert updated == 1
+        db_session.refresh(paper)
+        assert paper.title == "Fixed & title"
+        assert paper.authors_list == ["Ann", "Bob"]
+        assert paper.importance_score == 80
+        assert get_paper_by_doi(db_session, "10.1101/new") is None
+        assert refresh_parsed_papers(db_session, papers) == 0
+
+
+class TestPaperKeys:
+    """论文键索引测试"""
+
+    def test_add_and_query_keys(self, db_session):
+        """测试写入键（重复写入忽略）并查询已知键"""
+        # Act
+        add_paper_keys(db_session, ["doi:10.1/a", "title:b", None])
+        add_paper_keys(db_session, ["doi:10.1/a"])
+
+        # Assert
+        assert get_known_paper_keys(db_session, ["doi:10.1/a", "doi:10.1/c"]) == {"doi:10.1/a"}
+
+    def test_bulk_upsert_registers_keys(self, db_session):
+        """测试批量保存论文时同时写入论文键"""
+        # Act
+        bulk_upsert_papers(db_session, [{"title": "Paper", "doi": "10.1/a"}, {"title": "No DOI"}])
+
+        # Assert
+        assert get_known_paper_keys(db_session, ["doi:10.1/a", "title:no doi"]) == {
+            "doi:10.1/a",
+            "title:no doi",
+        }
+
+    def test_backfill_paper_keys(self, db_session):
+        """测试为已有论文补写论文键"""
+        # Arrange
+        create_paper(db_session, title="Existing", doi="10.1/a")
+        create_paper(db_session, title="Title Only")
+
+        # Act
+        count = backfill_paper_keys(db_session, batch_size=1)
+
+        # Assert
+        assert count == 2
+        assert get_known_paper_keys(db_session, ["doi:10.1/a", "title:title only"]) == {
+            "doi:10.1/a",
+            "title:title only",
+        }
+
+
 class TestDailyReportCRUD:
     """每日报告 CRUD 操作测试"""
 
@@ -220,3 +349,43 @@ class TestFeedbackCRUD:
         assert feedback.id is not None
         assert feedback.rating == 5
         assert feedback.paper_id == paper.id
+
+
+class TestRSSSourceState:
+    """RSS 源状态持久化测试"""
+
+    def test_load_creates_source_records(self, db_session):
+        """测试加载状态时为新源创建记录"""
+        # Arrange
+        from evo_flywheel.db.models import RSSSource
+
+        sources = [{"name": "Nature", "url": "https://www.nature.com/nature.rss"}]
+
+        # Act
+        load_rss_source_state(db_session, sources)
+
+        # Assert
+        assert db_session.query(RSSSource).count() == 1
+        assert sources[0]["etag"] is None
+        assert sources[0]["last_modified"] is None
+
+    def test_save_and_load_roundtrip(self, db_session):
+        """测试保存的校验器在下次加载时恢复"""
+        # Arrange
+        sources = [
+            {
+                "name": "Nature",
+                "url": "https://www.nature.com/nature.rss",
+                "etag": '"v1"',
+                "last_modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+            }
+        ]
+
+        # Act
+        save_rss_source_state(db_session, sources)
+        reloaded = [{"name": "Nature", "url": "https://www.nature.com/nature.rss"}]
+        load_rss_source_state(db_session, reloaded)
+
+        # Assert
+        assert reloaded[0]["etag"] == '"v1"'
+        assert reloaded[0]["last_modified"] == "Mon, 01 Jan 2024 00:00:00 GMT"
@@ -0,0 +1,142 @@
+"""共享数据库引擎单元测试"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool, StaticPool
+
+from evo_flywheel.api.main import app
+from evo_flywheel.config import get_settings
+from evo_flywheel.db import engine as db_engine
+from evo_flywheel.db.context import get_db_session
+from evo_flywheel.db.engine import (
+    create_db_engine,
+    dispose_engine,
+    engine_options,
+    get_engine,
+    get_session_factory,
+)
+from evo_flywheel.db.models import Base, Paper
+
+
+@pytest.fixture
+def temp_database(tmp_path, monkeypatch):
+    """把共享引擎指向临时 SQLite 文件"""
+    monkeypatch.setattr(get_settings(), "database_path", f"sqlite:///{tmp_path / 'test.db'}")
+    dispose_engine()
+    Base.metadata.create_all(get_engine())
+    yield
+    dispose_engine()
+
+
+class TestEngineOptions:
+    """连接池参数测试"""
+
+    def test_sqlite_memory_uses_static_pool(self):
+        """测试 SQLite 内存库共享同一个连接，且允许跨线程使用"""
+        options = engine_options("sqlite://")
+
+        assert options["poolclass"] is StaticPool
+        assert options["connect_args"] == {"check_same_thread": False}
+
+    def test_sqlite_file_uses_queue_pool_with_pre_ping(self, monkeypatch):
+        """测试 SQLite 文件库使用按配置调整的 QueuePool"""
+        # Arrange
+        monkeypatch.setattr(get_settings(), "database_pool_size", 3)
+        monkeypatch.setattr(get_settings(), "database_max_overflow", 2)
+
+        # Act
+        engine = create_db_engine("sqlite:///data/test.db")
+
+        # Assert
+        assert isinstance(engine.pool, QueuePool)
+        assert engine.pool.size() == 3
+        assert engine.pool._max_overflow == 2
+        assert engine.pool._pre_ping is True
+        assert (
+            engine_options("sqlite:///data/test.db")["connect_args"]["check_same_thread"] is False
+        )
+
+
+class TestSqlitePragmas:
+    """SQLite 性能配置测试"""
+
+    def test_pragmas_applied_to_every_connection(self, tmp_path, monkeypatch):
+        """测试新连接按配置设置 WAL、同步级别、缓存等 PRAGMA"""
+        # Arrange
+        monkeypatch.setattr(get_settings(), "sqlite_cache_size_kb", 8192)
+        monkeypatch.setattr(get_settings(), "sqlite_busy_timeout_ms", 1234)
+        engine = create_db_engine(f"sqlite:///{tmp_path / 'pragma.db'}")
+
+        # Act
+        with engine.connect() as conn:
+            values = {
+                name: conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+                for name in ("journal_mode", "synchronous", "cache_size", "temp_store")
+            }
+            busy_timeout = conn.exec_driver_sql("PRAGMA busy_timeout").scalar()
+
+        # Assert
+        assert values == {
+            "journal_mode": "wal",
+            "synchronous": 1,  # NORMAL
+            "cache_size": -8192,
+            "temp_store": 2,  # MEMORY
+        }
+        assert busy_timeout == 1234
+        engine.dispose()
+
+    def test_writer_commits_while_reader_in_transaction(self, tmp_path, monkeypatch):
+        """测试 WAL 模式下读事务未结束时写入可以提交，读取方仍看到一致的快照"""
+        # Arrange
+        monkeypatch.setattr(get_settings(), "sqlite_busy_timeout_ms", 100)
+        engine = create_db_engine(f"sqlite:///{tmp_path / 'wal.db'}")
+        Base.metadata.create_all(engine)
+
+        # Act
+        with engine.connect() as reader, engine.connect() as writer:
+            reader.exec_driver_sql("BEGIN")
+            before = reader.execute(text("SELECT COUNT(*) FROM papers")).scalar()
+            writer.execute(text("INSERT INTO papers (title) VALUES ('New')"))
+            writer.commit()  # 回滚日志模式下这里会因读锁报 database is locked
+            snapshot = reader.execute(text("SELECT COUNT(*) FROM papers")).scalar()
+            reader.rollback()
+
+        # Assert
+        assert (before, snapshot) == (0, 0)
+        engine.dispose()
+
+
+class TestSharedEngine:
+    """进程内共享引擎测试"""
+
+    def test_engine_is_reused_until_disposed(self, temp_database):
+        """测试多次获取返回同一引擎，释放后重新创建"""
+        # Act
+        first = get_engine()
+        factory = get_session_factory()
+        dispose_engine()
+
+        # Assert
+        assert get_engine() is not first
+        assert get_session_factory() is not factory
+
+    def test_sessions_share_connection_pool(self, temp_database):
+        """测试 get_db_session 与 API 会话共用同一连接池"""
+        # Arrange
+        with get_db_session() as session:
+            session.add(Paper(title="Pooled", doi="10.1/pooled", url="https://doi.org/10.1/pooled"))
+        engine = get_engine()
+
+        # Act
+        with TestClient(app) as client:
+            response = client.get("/api/v1/papers")
+            reused = db_engine._engine is engine
+            checked_in = engine.pool.checkedin()
+
+        # Assert
+        assert response.status_code == 200
+        assert [p["title"] for p in response.json()["papers"]] == ["Pooled"]
+        assert reused
+        assert checked_in >= 1
+        assert db_engine._engine is None  # 应用关闭时释放
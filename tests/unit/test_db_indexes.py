@@ -0,0 +1,153 @@
+"""数据库索引单元测试
+
+热点查询的 EXPLAIN QUERY PLAN 回归测试：查询退化为 papers 全表扫描时失败
+"""
+
+import re
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, event, inspect
+
+from evo_flywheel.api.v1.analysis import get_analysis_status
+from evo_flywheel.api.v1.papers import list_papers
+from evo_flywheel.api.v1.stats import get_overview_stats
+from evo_flywheel.config import get_settings
+from evo_flywheel.db import crud
+from evo_flywheel.db.engine import dispose_engine, get_engine, get_session_factory
+from evo_flywheel.db.indexes import PAPER_INDEXES, ensure_indexes
+from evo_flywheel.db.models import Base, Paper
+from evo_flywheel.reporters.generator import generate_daily_report
+from evo_flywheel.scheduler.analysis import _get_unanalyzed_papers, _get_unembedded_papers
+
+# 全表扫描（SCAN papers / 旧版本的 SCAN TABLE papers），不含 USING ... INDEX 的扫描
+FULL_SCAN_RE = re.compile(r"^SCAN (TABLE )?papers$")
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """带全部表和索引的临时数据库（共享引擎）"""
+    monkeypatch.setattr(get_settings(), "database_path", f"sqlite:///{tmp_path / 'idx.db'}")
+    dispose_engine()
+    engine = get_engine()
+    Base.metadata.create_all(engine)
+    yield engine
+    dispose_engine()
+
+
+@pytest.fixture
+def captured(engine):
+    """记录执行过的查询 papers 表的 SELECT 语句"""
+    statements: list[tuple[str, tuple]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "papers" in statement:
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    yield statements
+    event.remove(engine, "before_cursor_execute", capture)
+
+
+def full_scans(engine, statements: list[tuple[str, tuple]]) -> list[str]:
+    """返回执行计划中包含 papers 全表扫描的语句"""
+    offending = []
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+            if any(FULL_SCAN_RE.match(row[-1]) for row in plan):
+                offending.append(f"{statement} -> {[row[-1] for row in plan]}")
+    return offending
+
+
+class TestEnsureIndexes:
+    """索引创建测试"""
+
+    def test_creates_missing_indexes_idempotently(self, tmp_path):
+        """测试在没有索引的旧表上补建全部索引，再次执行不重复创建"""
+        # Arrange
+        engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+        Paper.__table__.create(engine)
+        for index in PAPER_INDEXES:
+            index.drop(engine)
+
+        # Act
+        first = ensure_indexes(engine)
+        second = ensure_indexes(engine)
+
+        # Assert
+        assert sorted(first) == sorted(index.name for index in PAPER_INDEXES)
+        assert second == []
+        names = {index["name"] for index in inspect(engine).get_indexes("papers")}
+        assert names >= set(first)
+        engine.dispose()
+
+    def test_drops_obsolete_indexes(self, tmp_path):
+        """测试删除已被替换的索引"""
+        # Arrange
+        engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+        Paper.__table__.create(engine)
+        with engine.begin() as conn:
+            conn.exec_driver_sql("CREATE INDEX idx_papers_unanalyzed ON papers (created_at)")
+
+        # Act
+        ensure_indexes(engine)
+
+        # Assert
+        names = {index["name"] for index in inspect(engine).get_indexes("papers")}
+        assert "idx_papers_unanalyzed" not in names
+        assert "idx_papers_unanalyzed_date" in names
+        engine.dispose()
+
+    def test_skips_missing_tables(self, tmp_path):
+        """测试数据库尚未初始化时不报错"""
+        engine = create_engine(f"sqlite:///{tmp_path / 'empty.db'}")
+
+        assert ensure_indexes(engine) == []
+        engine.dispose()
+
+
+class TestHotQueryPlans:
+    """热点查询执行计划测试"""
+
+    def test_hot_queries_use_indexes(self, engine, captured):
+        """测试按采集时间、分类群+评分、待分析/待向量化队列、URL、作者、标签的查询都不扫描全表"""
+        # Arrange
+        session = get_session_factory()()
+
+        # Act
+        crud.get_papers_by_date_range(session, date.today(), only_analyzed=True)
+        generate_daily_report(date.today(), session)
+        crud.get_papers(session, taxa="Mammals", min_score=60)
+        list_papers(skip=0, limit=20, taxa="Mammals", min_score=60, db=session)
+        get_overview_stats(db=session)
+        get_analysis_status(db=session)
+        _get_unanalyzed_papers(10)
+        session.query(Paper).filter(Paper.url == "https://example.org/paper").first()
+        _get_unembedded_papers(10)
+        crud.get_papers_by_author(session, "Ann")
+        crud.get_papers_by_tag(session, "drift")
+        session.close()
+
+        # Assert
+        assert len(captured) >= 12
+        assert full_scans(engine, captured) == []
+
+    def test_unanalyzed_queue_uses_partial_index(self, engine, captured):
+        """测试待分析队列查询使用部分索引完成筛选和排序（不使用临时排序）"""
+        _get_unanalyzed_papers(10)
+
+        ((statement, parameters),) = captured
+        with engine.connect() as conn:
+            plan = [
+                row[-1]
+                for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            ]
+        assert plan == ["SEARCH papers USING INDEX idx_papers_unanalyzed_date (importance_score=?)"]
+
+    def test_detects_full_table_scan(self, engine, captured):
+        """测试回归检查能发现全表扫描（abstract 没有索引）"""
+        with get_session_factory()() as session:
+            session.query(Paper).filter(Paper.abstract == "x").all()
+
+        assert len(full_scans(engine, captured)) == 1
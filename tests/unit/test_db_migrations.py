@@ -0,0 +1,181 @@
+"""数据库迁移单元测试"""
+
+import pytest
+from sqlalchemy import (
+    Column,
+    Index,
+    Integer,
+    MetaData,
+    Table,
+    Text,
+    create_engine,
+    event,
+    inspect,
+    text,
+)
+from sqlalchemy.orm import Session
+
+from evo_flywheel.config import get_settings
+from evo_flywheel.db import crud, migrations
+from evo_flywheel.db.init import init_database
+from evo_flywheel.db.migrations import (
+    MIGRATIONS,
+    Migration,
+    add_column,
+    apply_migrations,
+    backfill,
+    create_index,
+    pending_migrations,
+)
+from evo_flywheel.db.models import Base, RSSSource
+
+# 加入状态列和去重表之前的表结构
+LEGACY_SCHEMA = [
+    """CREATE TABLE papers (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL, authors TEXT,
+        abstract TEXT, doi TEXT UNIQUE, url TEXT, publication_date TEXT, journal TEXT,
+        source TEXT, taxa TEXT, evolutionary_scale TEXT, research_method TEXT,
+        evolutionary_mechanism TEXT, importance_score INTEGER, key_findings TEXT,
+        innovation_summary TEXT, tags TEXT, embedding_id TEXT, embedded BOOLEAN,
+        created_at DATETIME)""",
+    """CREATE TABLE rss_sources (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT, url TEXT, source_type TEXT,
+        priority INTEGER, enabled BOOLEAN, last_fetch DATETIME, created_at DATETIME)""",
+    "INSERT INTO papers (title, doi) VALUES ('A', '10.1101/a'), ('B', NULL)",
+    "INSERT INTO rss_sources (name, url) VALUES ('Nature', 'https://n'), ('Science', 'https://s')",
+]
+
+
+@pytest.fixture
+def legacy_engine(tmp_path):
+    """旧版本表结构的数据库"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as conn:
+        for statement in LEGACY_SCHEMA:
+            conn.execute(text(statement))
+    yield engine
+    engine.dispose()
+
+
+class TestApplyMigrations:
+    """迁移执行测试"""
+
+    def test_upgrades_legacy_database(self, legacy_engine):
+        """测试旧数据库补齐列、表和论文键，且只执行一次"""
+        # Act
+        applied = apply_migrations(legacy_engine)
+        again = apply_migrations(legacy_engine)
+
+        # Assert
+        assert [m.version for m in applied] == sorted(m.version for m in MIGRATIONS)
+        assert again == []
+        inspector = inspect(legacy_engine)
+        columns = {c["name"] for c in inspector.get_columns("rss_sources")}
+        assert columns == set(RSSSource.__table__.c.keys())
+        assert {"paper_keys", "paper_signatures", "paper_lsh_buckets", "paper_authors"} <= set(
+            inspector.get_table_names()
+        )
+        with legacy_engine.connect() as conn:
+            states = conn.execute(
+                text("SELECT circuit_state, consecutive_failures FROM rss_sources")
+            ).all()
+            keys = conn.execute(text("SELECT key FROM paper_keys ORDER BY key")).scalars().all()
+        assert states == [("closed", 0), ("closed", 0)]
+        assert keys == ["doi:10.1101/a", "title:b"]
+
+    def test_init_database_upgrades_in_place(self, legacy_engine, tmp_path, monkeypatch):
+        """测试对已有数据库运行 evo-init（不带 --drop）时补齐条件请求列且保留数据"""
+        # Arrange
+        monkeypatch.setattr(get_settings(), "database_url", f"sqlite:///{tmp_path / 'legacy.db'}")
+        sources = [{"name": "Nature", "url": "https://n", "etag": '"v1"'}]
+        loaded = [{"name": "Nature", "url": "https://n"}]
+
+        # Act
+        init_database()
+        with Session(legacy_engine) as db:
+            crud.save_rss_source_state(db, sources)
+            crud.load_rss_source_state(db, loaded)
+
+        # Assert
+        assert loaded[0]["etag"] == '"v1"'
+        assert loaded[0]["last_modified"] is None
+        with legacy_engine.connect() as conn:
+            names = conn.execute(text("SELECT name FROM rss_sources ORDER BY id")).scalars()
+            assert names.all() == ["Nature", "Science"]
+
+    def test_fresh_database_records_all_versions(self, tmp_path):
+        """测试新建的数据库执行迁移时不做改动，只记录版本"""
+        # Arrange
+        engine = create_engine(f"sqlite:///{tmp_path / 'fresh.db'}")
+        Base.metadata.create_all(engine)
+
+        # Act
+        applied = apply_migrations(engine)
+
+        # Assert
+        assert len(applied) == len(MIGRATIONS)
+        assert pending_migrations(engine) == []
+        engine.dispose()
+
+    def test_failed_migration_is_retried(self, legacy_engine, monkeypatch):
+        """测试失败的迁移不记录版本，之前成功的迁移不重复执行"""
+        # Arrange
+        calls = []
+
+        def failing(engine):
+            calls.append(2)
+            if calls.count(2) == 1:
+                raise RuntimeError("boom")
+
+        monkeypatch.setattr(
+            migrations,
+            "MIGRATIONS",
+            [Migration(1, "ok", lambda engine: calls.append(1)), Migration(2, "flaky", failing)],
+        )
+
+        # Act
+        with pytest.raises(RuntimeError):
+            apply_migrations(legacy_engine)
+        retried = apply_migrations(legacy_engine)
+
+        # Assert
+        assert calls == [1, 2, 2]
+        assert [m.version for m in retried] == [2]
+
+
+class TestMigrationHelpers:
+    """迁移辅助函数测试"""
+
+    def test_backfill_commits_in_batches(self, legacy_engine):
+        """测试分批回填，每批单独提交"""
+        # Arrange
+        add_column(legacy_engine, "rss_sources", RSSSource.__table__.c.circuit_state)
+        with legacy_engine.begin() as conn:
+            conn.execute(text("INSERT INTO rss_sources (name) VALUES ('a'), ('b'), ('c')"))
+        commits = []
+        event.listen(legacy_engine, "commit", lambda conn: commits.append(1))
+
+        # Act
+        updated = backfill(
+            legacy_engine,
+            "rss_sources",
+            "circuit_state = 'closed'",
+            "circuit_state IS NULL",
+            batch_size=2,
+        )
+
+        # Assert
+        assert updated == 5
+        assert len(commits) >= 3
+
+    def test_add_column_and_index_are_idempotent(self, legacy_engine):
+        """测试重复添加列和索引时跳过"""
+        # 索引挂在独立的表定义上，不影响模型的表
+        table = Table("rss_sources", MetaData(), Column("id", Integer), Column("name", Text))
+        index = Index("idx_test_rss_name", table.c.name)
+        column = RSSSource.__table__.c.etag
+
+        assert add_column(legacy_engine, "rss_sources", column) is True
+        assert add_column(legacy_engine, "rss_sources", column) is False
+        assert create_index(legacy_engine, index) is True
+        assert create_index(legacy_engine, index) is False
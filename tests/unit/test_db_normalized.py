@@ -0,0 +1,197 @@
+"""规范化关联表单元测试
+
+作者、标签、进化机制、报告顶级论文和聚类成员的关联行与分隔字符串列保持同步
+"""
+
+from sqlalchemy import create_engine, func, select, text
+
+from evo_flywheel.db.crud import (
+    bulk_upsert_papers,
+    create_daily_report,
+    create_paper,
+    create_paper_cluster,
+    delete_paper,
+    get_papers_by_author,
+    get_papers_by_tag,
+    update_paper,
+)
+from evo_flywheel.db.migrations import apply_migrations
+from evo_flywheel.db.models import (
+    Base,
+    ClusterMember,
+    PaperAuthor,
+    PaperMechanism,
+    PaperTag,
+    ReportTopPaper,
+)
+
+
+class TestPropertySync:
+    """属性与关联行同步测试"""
+
+    def test_create_and_update_paper_sync_rows(self, db_session):
+        """测试创建和更新论文时写入、替换作者/标签/机制行"""
+        # Arrange
+        paper = create_paper(
+            db_session,
+            title="Sync",
+            authors=["Ann", "Bob"],
+            tags=["adaptation"],
+            evolutionary_mechanism="Natural Selection;Drift",
+        )
+
+        # Act
+        update_paper(db_session, paper.id, authors=["Cid"], tags=["drift", "drift", " "])
+
+        # Assert
+        authors = db_session.execute(select(PaperAuthor.name, PaperAuthor.position)).all()
+        tags = db_session.scalars(select(PaperTag.tag)).all()
+        mechanisms = db_session.scalars(select(PaperMechanism.mechanism)).all()
+        assert authors == [("Cid", 0)]
+        assert tags == ["drift"]
+        assert sorted(mechanisms) == ["Drift", "Natural Selection"]
+        assert paper.authors_list == ["Cid"]
+        assert paper.mechanisms_list == ["Natural Selection", "Drift"]
+        assert paper.authors == "Cid"
+
+    def test_delete_paper_removes_rows(self, db_session):
+        """测试删除论文时一并删除关联行"""
+        paper = create_paper(db_session, title="Gone", authors=["Ann"], tags=["x"])
+
+        delete_paper(db_session, paper.id)
+
+        assert db_session.scalar(select(func.count()).select_from(PaperAuthor)) == 0
+        assert db_session.scalar(select(func.count()).select_from(PaperTag)) == 0
+
+    def test_report_and_cluster_rows_keep_order(self, db_session):
+        """测试报告顶级论文和聚类成员按原顺序写入"""
+        report = create_daily_report(
+            db_session, report_date="2024-12-28", total_papers=3, top_paper_ids=[3, 1, 2]
+        )
+        cluster = create_paper_cluster(
+            db_session, report_id=report.id, cluster_name="c", paper_ids=[7, 5]
+        )
+
+        ranks = db_session.execute(select(ReportTopPaper.paper_id).order_by(ReportTopPaper.rank))
+        members = db_session.execute(
+            select(ClusterMember.paper_id).order_by(ClusterMember.position)
+        )
+        assert ranks.scalars().all() == [3, 1, 2]
+        assert members.scalars().all() == [7, 5]
+        assert report.top_papers_list == [3, 1, 2]
+        assert cluster.paper_ids_list == [7, 5]
+
+
+class TestBulkUpsert:
+    """批量写入测试"""
+
+    def test_bulk_upsert_writes_author_rows_for_new_papers(self, db_session):
+        """测试批量写入只为新插入的论文写作者行"""
+        # Arrange
+        bulk_upsert_papers(db_session, [{"title": "A", "doi": "10.1/a", "authors": ["Ann"]}])
+        papers = [
+            {"title": "A", "doi": "10.1/a", "authors": ["Ann"]},
+            {"title": "B", "doi": "10.1/b", "authors": ["Ann", "Bob"]},
+        ]
+
+        # Act
+        result = bulk_upsert_papers(db_session, papers)
+
+        # Assert
+        assert result == {"inserted": 1, "skipped": 1}
+        rows = db_session.execute(
+            select(PaperAuthor.name).order_by(PaperAuthor.paper_id, PaperAuthor.position)
+        )
+        assert rows.scalars().all() == ["Ann", "Ann", "Bob"]
+
+    def test_bulk_upsert_without_returning_finds_rows_by_key(self, db_session, monkeypatch):
+        """测试不支持 RETURNING 时按 DOI / URL / 标题查回新论文，不重复处理已有论文"""
+        # Arrange
+        create_paper(db_session, title="Old", doi="10.1/old", authors=["Old Author"])
+        monkeypatch.setattr(db_session.get_bind().dialect, "insert_executemany_returning", False)
+        papers = [
+            {"title": "Old", "doi": "10.1/old", "authors": ["Old Author"]},
+            {"title": "By DOI", "doi": "10.1/new", "authors": ["Ann"]},
+            {"title": "By URL", "url": "https://example.org/p", "authors": ["Bob"]},
+            {"title": "By title", "authors": ["Cid"]},
+        ]
+
+        # Act
+        result = bulk_upsert_papers(db_session, papers)
+
+        # Assert
+        assert result == {"inserted": 3, "skipped": 1}
+        rows = db_session.execute(select(PaperAuthor.name).order_by(PaperAuthor.paper_id))
+        assert rows.scalars().all() == ["Old Author", "Ann", "Bob", "Cid"]
+
+
+class TestLookups:
+    """按作者/标签查询测试"""
+
+    def test_lookup_by_author_and_tag(self, db_session):
+        """测试按作者名和标签精确匹配，不匹配名称的子串"""
+        create_paper(db_session, title="One", authors=["Ann Lee", "Bob"], tags=["drift"])
+        create_paper(db_session, title="Two", authors=["Ann"], tags=["drift", "selection"])
+
+        assert [p.title for p in get_papers_by_author(db_session, "Ann")] == ["Two"]
+        assert {p.title for p in get_papers_by_tag(db_session, "drift")} == {"One", "Two"}
+        assert get_papers_by_tag(db_session, "sel") == []
+
+    def test_lookups_use_indexes(self, db_session):
+        """测试作者/标签查询走关联表索引"""
+        conn = db_session.connection()
+        plans = [
+            conn.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN SELECT paper_id FROM {table} WHERE {col} = 'x'"
+            ).all()[-1][-1]
+            for table, col in (("paper_authors", "name"), ("paper_tags", "tag"))
+        ]
+
+        assert all("USING" in plan and "INDEX" in plan for plan in plans)
+
+
+class TestBackfillMigration:
+    """回填迁移测试"""
+
+    def test_backfills_legacy_strings(self, tmp_path):
+        """测试旧数据库从分隔字符串列回填关联表，重复执行结果相同"""
+        # Arrange
+        engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "INSERT INTO papers (title, authors, tags, evolutionary_mechanism) "
+                    "VALUES ('A', 'Ann; Bob', 'drift;;drift', 'Drift')"
+                )
+            )
+            conn.execute(
+                text(
+                    "INSERT INTO daily_reports (report_date, total_papers, top_paper_ids) "
+                    "VALUES ('2024-12-28', 2, '2, 1,')"
+                )
+            )
+            conn.execute(
+                text(
+                    "INSERT INTO paper_clusters (report_id, cluster_name, paper_ids) VALUES (1, 'c', '1,2')"
+                )
+            )
+
+        # Act
+        apply_migrations(engine)
+        with engine.begin() as conn:
+            conn.execute(text("DELETE FROM schema_migrations WHERE version = 4"))
+        apply_migrations(engine)
+
+        # Assert
+        with engine.connect() as conn:
+            authors = conn.execute(
+                select(PaperAuthor.name).order_by(PaperAuthor.position)
+            ).scalars()
+            assert authors.all() == ["Ann", "Bob"]
+            assert conn.execute(select(PaperTag.tag)).scalars().all() == ["drift"]
+            assert conn.execute(select(PaperMechanism.mechanism)).scalars().all() == ["Drift"]
+            top = conn.execute(select(ReportTopPaper.paper_id).order_by(ReportTopPaper.rank))
+            assert top.scalars().all() == [2, 1]
+            assert conn.execute(select(ClusterMember.paper_id)).scalars().all() == [1, 2]
+        engine.dispose()
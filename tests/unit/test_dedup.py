@@ -1,10 +1,37 @@
 """数据去重单元测试"""
 
+import hashlib
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
 from evo_flywheel.collectors.dedup import (
+    LSHIndex,
+    MinHasher,
+    decode_signature,
+    encode_signature,
     extract_paper_key,
     is_duplicate_paper,
+    paper_shingles,
     remove_duplicate_papers,
+    remove_near_duplicate_papers,
 )
+from evo_flywheel.db.crud import create_paper
+from evo_flywheel.db.lsh_store import create_lsh_index, index_existing_papers
+from evo_flywheel.db.models import Base, PaperSignature
+
+PREPRINT = {
+    "title": "Rapid evolution of beak size in Darwin's finches",
+    "doi": "10.1101/2024.01.01.000001",
+    "source": "bioRxiv",
+}
+JOURNAL_VERSION = {
+    "title": "Rapid Evolution of Beak Size in Darwins Finches.",
+    "doi": "10.1038/s41586-024-00001",
+    "source": "Nature",
+}
+UNRELATED = {"title": "Gene regulatory network rewiring in yeast", "source": "PLOS Biology"}
 
 
 class TestExtractPaperKey:
@@ -215,3 +242,143 @@ class TestRemoveDuplicatePapers:
         titles = [p.get("title") for p in result]
         assert "Valid Paper" in titles
         assert "Another Valid Paper" in titles
+
+
+class TestMinHash:
+    """MinHash 签名测试"""
+
+    def test_shingles_ignore_case_and_punctuation(self):
+        """测试 shingle 忽略大小写和标点"""
+        assert paper_shingles({"title": "Beak-Size, Evolution!"}) == paper_shingles(
+            {"title": "beak size evolution"}
+        )
+
+    def test_shingles_include_abstract_tokens(self):
+        """测试可选加入摘要前 N 个词"""
+        paper = {"title": "Beak size", "abstract": "Finches on Daphne Major island"}
+
+        shingles = paper_shingles(paper, abstract_tokens=2)
+
+        assert "w:finches" in shingles
+        assert "w:on" in shingles
+        assert "w:daphne" not in shingles
+
+    def test_signature_is_deterministic(self):
+        """测试相同参数在不同实例间产生相同签名（可持久化比较）"""
+        shingles = paper_shingles(PREPRINT)
+
+        assert MinHasher().signature(shingles) == MinHasher().signature(shingles)
+
+    def test_signature_roundtrip(self):
+        """测试签名编码解码"""
+        signature = MinHasher(num_perm=8).signature({"abc", "bcd"})
+
+        assert decode_signature(encode_signature(signature)) == signature
+
+
+class TestLSHIndex:
+    """近似重复索引测试"""
+
+    def test_finds_near_duplicate_title(self):
+        """测试标题略有差异的同一论文被识别"""
+        # Arrange
+        index = LSHIndex()
+        index.add(PREPRINT)
+
+        # Act
+        matches = index.query(JOURNAL_VERSION)
+
+        # Assert
+        assert [key for key, _ in matches] == [extract_paper_key(PREPRINT)]
+        assert matches[0][1] >= index.threshold
+
+    def test_unrelated_paper_is_not_matched(self):
+        """测试不相关的论文不会被匹配"""
+        index = LSHIndex()
+        index.add(PREPRINT)
+
+        assert index.find_duplicate(UNRELATED) is None
+
+    def test_own_key_is_ignored(self):
+        """测试论文不会与自身的索引记录匹配"""
+        index = LSHIndex()
+        index.add(PREPRINT)
+
+        assert index.find_duplicate(dict(PREPRINT)) is None
+
+    def test_invalid_band_configuration(self):
+        """测试置换数不能被 band 数整除时报错"""
+        with pytest.raises(ValueError):
+            LSHIndex(num_perm=100, bands=16)
+
+    def test_remove_near_duplicate_papers_within_batch(self):
+        """测试批内近似重复被移除，保留先出现的论文"""
+        result = remove_near_duplicate_papers([PREPRINT, UNRELATED, JOURNAL_VERSION])
+
+        assert result == [PREPRINT, UNRELATED]
+
+
+class TestSQLLSHStore:
+    """数据库存储的近似重复索引测试"""
+
+    @pytest.fixture
+    def db_session(self, temp_db_path):
+        engine = create_engine(f"sqlite:///{temp_db_path}")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+
+    def test_index_persists_across_sessions(self, db_session):
+        """测试索引持久化后，新的索引实例能找到之前入库的论文"""
+        # Arrange
+        remove_near_duplicate_papers([PREPRINT], create_lsh_index(db_session))
+        db_session.commit()
+
+        # Act
+        result = remove_near_duplicate_papers(
+            [JOURNAL_VERSION, UNRELATED], create_lsh_index(db_session)
+        )
+
+        # Assert
+        assert result == [UNRELATED]
+        assert db_session.query(PaperSignature).count() == 2
+
+    def test_index_existing_papers(self, db_session):
+        """测试为已有论文建立索引，重复执行不会重复写入"""
+        # Arrange
+        create_paper(db_session, title=PREPRINT["title"], doi=PREPRINT["doi"])
+        create_paper(db_session, title=UNRELATED["title"])
+        index = create_lsh_index(db_session)
+
+        # Act
+        index_existing_papers(db_session, index, batch_size=1)
+        index_existing_papers(db_session, index)
+
+        # Assert
+        assert db_session.query(PaperSignature).count() == 2
+        assert index.find_duplicate(JOURNAL_VERSION) == extract_paper_key(PREPRINT)
+
+    def test_batch_reads_and_writes_in_bulk(self, db_session):
+        """测试一批论文的候选查询和写入按批执行，而非每篇论文各自查询和写入"""
+        # Arrange
+        papers = [{"title": hashlib.sha256(str(i).encode()).hexdigest()} for i in range(200)]
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.split()[0] + (" many" if executemany else ""))
+
+        event.listen(db_session.get_bind(), "before_cursor_execute", capture)
+
+        # Act
+        result = remove_near_duplicate_papers(
+            papers + [JOURNAL_VERSION, PREPRINT], create_lsh_index(db_session)
+        )
+        event.remove(db_session.get_bind(), "before_cursor_execute", capture)
+
+        # Assert - 桶按 IN 分块查询，签名和桶各一次 executemany
+        assert result == papers + [JOURNAL_VERSION]
+        assert statements.count("INSERT many") == 2
+        assert "INSERT" not in statements
+        assert len(statements) < len(papers) / 10
+        assert db_session.query(PaperSignature).count() == 201
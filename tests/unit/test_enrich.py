@@ -0,0 +1,222 @@
+"""元数据补全单元测试（使用本地替身 Crossref 服务器）"""
+
+import json
+import threading
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from evo_flywheel.collectors.enrich import EnrichmentCache, apply_work, enrich_papers
+from evo_flywheel.collectors.orchestrator import collect_from_all_sources
+from evo_flywheel.config import get_settings
+
+WORKS = [
+    {
+        "DOI": "10.1101/2024.12.01.000001",
+        "title": ["Rapid evolution of beak size in Darwin's finches"],
+        "abstract": "<jats:title>Abstract</jats:title><jats:p>Beak size evolved rapidly.</jats:p>",
+        "author": [{"given": "Peter", "family": "Grant"}, {"family": "Grant"}],
+    },
+    {
+        "DOI": "10.1101/2024.12.01.000002",
+        "title": ["Genomic islands of speciation in sticklebacks"],
+        "abstract": "<jats:p>Islands of divergence.</jats:p>",
+    },
+]
+
+
+class _CrossrefStandIn:
+    """最小的 Crossref /works 替身：支持 filter=doi:... 批量查询与 query.bibliographic 检索"""
+
+    def __init__(self, works, fail=False):
+        self.works = works
+        self.fail = fail
+        self.requests: list[dict[str, list[str]]] = []
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):  # noqa: A002
+                pass
+
+            def do_GET(self):  # noqa: N802
+                url = urlsplit(self.path)
+                params = parse_qs(url.query)
+                stand_in.requests.append(params)
+                if stand_in.fail or url.path != "/works":
+                    self.send_response(503 if stand_in.fail else 404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                body = json.dumps({"message": {"items": stand_in.match(params)}}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def match(self, params):
+        if "filter" in params:
+            dois = {f.removeprefix("doi:").lower() for f in params["filter"][0].split(",")}
+            return [work for work in self.works if work["DOI"].lower() in dois]
+        words = set(params["query.bibliographic"][0].lower().split())
+        return [work for work in self.works if words & set(work["title"][0].lower().split())]
+
+
+@pytest.fixture
+def crossref(monkeypatch):
+    """启动替身服务器并将补全接口指向它"""
+    stand_in = _CrossrefStandIn(WORKS)
+    stand_in.thread.start()
+    settings = get_settings()
+    monkeypatch.setattr(settings, "enrichment_api_url", stand_in.url)
+    monkeypatch.setattr(settings, "enrichment_requests_per_second", 0.0)
+    monkeypatch.setattr(settings, "http_max_retries", 0)
+    yield stand_in
+    stand_in.server.shutdown()
+    stand_in.server.server_close()
+
+
+@pytest.fixture
+def cache():
+    cache = EnrichmentCache(":memory:")
+    yield cache
+    cache.close()
+
+
+class TestEnrichPapers:
+    """补全流程测试"""
+
+    def test_batches_doi_lookups(self, crossref, cache, monkeypatch):
+        """测试缺摘要的论文按 DOI 分批查询，摘要去掉 JATS 标记"""
+        # Arrange
+        monkeypatch.setattr(get_settings(), "enrichment_batch_size", 20)
+        papers = [
+            {"title": "A", "doi": "10.1101/2024.12.01.000001"},
+            {"title": "B", "doi": "10.1101/2024.12.01.000002"},
+            {"title": "C", "doi": "10.1101/unknown", "abstract": None},
+        ]
+
+        # Act
+        enrich_papers(papers, cache=cache)
+
+        # Assert
+        assert len(crossref.requests) == 1
+        assert papers[0]["abstract"] == "Beak size evolved rapidly."
+        assert papers[0]["authors"] == ["Peter Grant", "Grant"]
+        assert papers[1]["abstract"] == "Islands of divergence."
+        assert papers[2]["abstract"] is None
+
+    def test_title_search_fills_doi_only_for_matching_title(self, crossref, cache):
+        """测试按标题检索补全 DOI，标题不一致的结果不采用"""
+        # Arrange
+        papers = [
+            {"title": "Rapid Evolution of Beak Size in Darwin’s Finches.", "abstract": "x"},
+            {"title": "Beak size in hummingbirds", "abstract": "y"},
+        ]
+
+        # Act
+        enrich_papers(papers, cache=cache)
+
+        # Assert
+        assert papers[0]["doi"] == "10.1101/2024.12.01.000001"
+        assert papers[0]["abstract"] == "x"
+        assert "doi" not in papers[1]
+
+    def test_cached_lookups_are_not_repeated(self, crossref, cache):
+        """测试命中和未命中的结果都被缓存，下次运行不再请求"""
+
+        # Arrange
+        def make_papers():
+            return [
+                {"title": "Genomic islands of speciation in sticklebacks"},
+                {"title": "Unrelated title"},
+                {"title": "A", "doi": "10.1101/unknown"},
+            ]
+
+        enrich_papers(make_papers(), cache=cache)
+        first_run = len(crossref.requests)
+
+        # Act
+        papers = make_papers()
+        enrich_papers(papers, cache=cache)
+
+        # Assert
+        assert first_run == 3
+        assert len(crossref.requests) == first_run
+        assert papers[0]["doi"] == "10.1101/2024.12.01.000002"
+
+    def test_failed_lookups_are_retried_next_run(self, crossref, cache):
+        """测试请求失败时论文保持不变且不写入缓存"""
+        # Arrange
+        crossref.fail = True
+        papers = [{"title": "A", "doi": "10.1101/2024.12.01.000001"}]
+
+        # Act
+        enrich_papers(papers, cache=cache)
+
+        # Assert
+        assert "abstract" not in papers[0]
+        assert cache.get_many(["doi:10.1101/2024.12.01.000001"]) == {}
+
+
+class TestEnrichmentCache:
+    """查询缓存测试"""
+
+    def test_negative_results_expire(self, tmp_path):
+        """测试未命中结果过期后重新查询，命中结果不过期"""
+        # Arrange
+        cache = EnrichmentCache(tmp_path / "cache.sqlite", negative_ttl=timedelta(0))
+        cache.put_many({"doi:a": None, "doi:b": {"DOI": "b"}})
+
+        # Act
+        reopened = EnrichmentCache(tmp_path / "cache.sqlite", negative_ttl=timedelta(0))
+        cached = reopened.get_many(["doi:a", "doi:b"])
+
+        # Assert
+        assert cached == {"doi:b": {"DOI": "b"}}
+
+    def test_apply_work_does_not_overwrite(self):
+        """测试补全不覆盖已有字段"""
+        paper = {"title": "T", "doi": "10.1/own", "abstract": "Own", "authors": ["Me"]}
+
+        assert apply_work(paper, WORKS[0]) is False
+        assert paper == {"title": "T", "doi": "10.1/own", "abstract": "Own", "authors": ["Me"]}
+
+
+class TestCollectWithEnrichment:
+    """采集流程中的补全测试"""
+
+    def test_enriched_doi_dedups_across_sources(self, crossref, cache, monkeypatch):
+        """测试 RSS 条目补全 DOI 后与 bioRxiv 的同一论文按 DOI 去重"""
+        # Arrange
+        monkeypatch.setattr(get_settings(), "enrichment_enabled", True)
+        monkeypatch.setattr("evo_flywheel.collectors.enrich.get_enrichment_cache", lambda: cache)
+        monkeypatch.setattr(
+            "evo_flywheel.collectors.orchestrator.fetch_preprint_papers",
+            lambda start, end, targets, **kwargs: [
+                {
+                    "title": "Rapid evolution of beak size in Darwin's finches",
+                    "doi": "10.1101/2024.12.01.000001",
+                    "abstract": "Preprint abstract",
+                }
+            ],
+        )
+        monkeypatch.setattr(
+            "evo_flywheel.collectors.orchestrator.collect_from_rss_sources",
+            lambda sources, **kwargs: [
+                {"title": "Rapid evolution of beak-size in Darwins finches"}
+            ],
+        )
+
+        # Act
+        results = collect_from_all_sources(datetime(2024, 12, 1), datetime(2024, 12, 2))
+
+        # Assert
+        assert [p["doi"] for p in results] == ["10.1101/2024.12.01.000001"]
@@ -0,0 +1,208 @@
+"""异步抓取引擎单元测试"""
+
+import asyncio
+import time
+
+import httpx
+
+from evo_flywheel.collectors.fetcher import FeedResponse, iter_feed_responses, run_sync
+
+
+def _use_handler(monkeypatch, handler):
+    """将抓取引擎的 HTTP 客户端替换为 MockTransport"""
+
+    def factory(timeout=None):
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    monkeypatch.setattr("evo_flywheel.collectors.fetcher.create_async_client", factory)
+
+
+async def _collect(sources, **kwargs) -> list[FeedResponse]:
+    return [result async for result in iter_feed_responses(sources, **kwargs)]
+
+
+class TestIterFeedResponses:
+    """并发抓取测试"""
+
+    def test_results_arrive_in_completion_order(self, monkeypatch):
+        """测试结果按完成顺序产出，而非输入顺序"""
+        # Arrange
+        delays = {"slow.example.com": 0.2, "fast.example.com": 0.01}
+
+        async def handler(request):
+            await asyncio.sleep(delays[request.url.host])
+            return httpx.Response(200, content=b"<rss/>")
+
+        _use_handler(monkeypatch, handler)
+        sources = [
+            {"name": "Slow", "url": "https://slow.example.com/feed"},
+            {"name": "Fast", "url": "https://fast.example.com/feed"},
+        ]
+
+        # Act
+        results = asyncio.run(_collect(sources))
+
+        # Assert
+        assert [r.source["name"] for r in results] == ["Fast", "Slow"]
+        assert all(r.ok for r in results)
+
+    def test_sources_are_fetched_concurrently(self, monkeypatch):
+        """测试不同主机的源并发抓取，总耗时接近最慢的源"""
+
+        # Arrange
+        async def handler(request):
+            await asyncio.sleep(0.2)
+            return httpx.Response(200, content=b"<rss/>")
+
+        _use_handler(monkeypatch, handler)
+        sources = [{"name": f"S{i}", "url": f"https://host{i}.example.com/feed"} for i in range(5)]
+
+        # Act
+        started = time.perf_counter()
+        results = asyncio.run(_collect(sources))
+        elapsed = time.perf_counter() - started
+
+        # Assert
+        assert len(results) == 5
+        assert elapsed < 0.8
+
+    def test_per_host_limit(self, monkeypatch):
+        """测试同一主机的并发请求数受限"""
+        # Arrange
+        state = {"active": 0, "peak": 0}
+
+        async def handler(request):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.05)
+            state["active"] -= 1
+            return httpx.Response(200, content=b"<rss/>")
+
+        _use_handler(monkeypatch, handler)
+        sources = [{"name": f"S{i}", "url": f"https://same.example.com/{i}"} for i in range(6)]
+
+        # Act
+        results = asyncio.run(_collect(sources, per_host_limit=2))
+
+        # Assert
+        assert len(results) == 6
+        assert state["peak"] == 2
+
+    def test_global_deadline(self, monkeypatch):
+        """测试超过全局截止时间的源以超时结果返回"""
+
+        # Arrange
+        async def handler(request):
+            if request.url.host == "hang.example.com":
+                await asyncio.sleep(5)
+            return httpx.Response(200, content=b"<rss/>")
+
+        _use_handler(monkeypatch, handler)
+        sources = [
+            {"name": "Hang", "url": "https://hang.example.com/feed"},
+            {"name": "Ok", "url": "https://ok.example.com/feed"},
+        ]
+
+        # Act
+        started = time.perf_counter()
+        results = asyncio.run(_collect(sources, deadline=0.2))
+        elapsed = time.perf_counter() - started
+
+        # Assert
+        assert elapsed < 2
+        by_name = {r.source["name"]: r for r in results}
+        assert by_name["Ok"].ok
+        assert isinstance(by_name["Hang"].error, TimeoutError)
+
+    def test_http_error_is_reported(self, monkeypatch):
+        """测试 HTTP 错误作为结果返回而不是抛出"""
+        # Arrange
+        _use_handler(monkeypatch, lambda request: httpx.Response(503))
+
+        # Act
+        results = asyncio.run(_collect([{"name": "Down", "url": "https://down.example.com/"}]))
+
+        # Assert
+        assert len(results) == 1
+        assert not results[0].ok
+        assert isinstance(results[0].error, httpx.HTTPStatusError)
+
+
+class TestConditionalRequests:
+    """条件请求（ETag / Last-Modified）测试"""
+
+    def test_sends_validators_and_handles_304(self, monkeypatch):
+        """测试携带校验器发送条件请求，304 不返回内容"""
+        # Arrange
+        seen_headers = {}
+
+        def handler(request):
+            seen_headers.update(request.headers)
+            return httpx.Response(304)
+
+        _use_handler(monkeypatch, handler)
+        sources = [
+            {
+                "name": "Cached",
+                "url": "https://cached.example.com/feed",
+                "etag": '"abc"',
+                "last_modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+            }
+        ]
+
+        # Act
+        results = asyncio.run(_collect(sources))
+
+        # Assert
+        assert seen_headers["if-none-match"] == '"abc"'
+        assert seen_headers["if-modified-since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+        assert results[0].not_modified
+        assert not results[0].ok
+        assert results[0].etag == '"abc"'
+
+    def test_captures_validators_from_response(self, monkeypatch):
+        """测试从 200 响应中记录新的校验器"""
+        # Arrange
+        seen_headers = {}
+
+        def handler(request):
+            seen_headers.update(request.headers)
+            return httpx.Response(
+                200,
+                content=b"<rss/>",
+                headers={"ETag": '"v2"', "Last-Modified": "Tue, 02 Jan 2024 00:00:00 GMT"},
+            )
+
+        _use_handler(monkeypatch, handler)
+
+        # Act
+        results = asyncio.run(_collect([{"name": "New", "url": "https://new.example.com/feed"}]))
+
+        # Assert
+        assert "if-none-match" not in seen_headers
+        assert results[0].ok
+        assert results[0].etag == '"v2"'
+        assert results[0].last_modified == "Tue, 02 Jan 2024 00:00:00 GMT"
+
+
+class TestRunSync:
+    """同步运行协程测试"""
+
+    def test_run_sync_without_running_loop(self):
+        """测试在普通同步代码中运行"""
+
+        async def compute():
+            return 42
+
+        assert run_sync(compute()) == 42
+
+    def test_run_sync_inside_running_loop(self):
+        """测试在已有事件循环的线程中运行（例如 async 端点）"""
+
+        async def compute():
+            return "ok"
+
+        async def outer():
+            return run_sync(compute())
+
+        assert asyncio.run(outer()) == "ok"
@@ -0,0 +1,208 @@
+"""采集器共享 HTTP 层单元测试"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from evo_flywheel.collectors import http
+from evo_flywheel.collectors.http import (
+    RateLimiter,
+    RetryPolicy,
+    async_http_get,
+    get_rate_limiter,
+    http_get,
+)
+
+NO_WAIT = RetryPolicy(max_retries=2, backoff_base=0)
+
+
+def _use_handler(monkeypatch, handler):
+    """将共享客户端替换为 MockTransport，返回请求计数"""
+    calls = {"count": 0}
+
+    def counting(request):
+        calls["count"] += 1
+        return handler(request)
+
+    monkeypatch.setattr(http, "_client", httpx.Client(transport=httpx.MockTransport(counting)))
+    return calls
+
+
+class TestHttpGet:
+    """同步请求与重试测试"""
+
+    def test_retries_transient_status_then_succeeds(self, monkeypatch):
+        """测试 503 后重试成功"""
+        # Arrange
+        statuses = iter([503, 502, 200])
+        calls = _use_handler(monkeypatch, lambda request: httpx.Response(next(statuses)))
+
+        # Act
+        response = http_get("https://example.com/feed", retry=NO_WAIT)
+
+        # Assert
+        assert response.status_code == 200
+        assert calls["count"] == 3
+
+    def test_returns_last_response_when_retries_exhausted(self, monkeypatch):
+        """测试重试耗尽后返回最后的错误响应"""
+        calls = _use_handler(monkeypatch, lambda request: httpx.Response(503))
+
+        response = http_get("https://example.com/feed", retry=NO_WAIT)
+
+        assert response.status_code == 503
+        assert calls["count"] == 3
+
+    def test_does_not_retry_client_errors(self, monkeypatch):
+        """测试 4xx（429 除外）不重试"""
+        calls = _use_handler(monkeypatch, lambda request: httpx.Response(404))
+
+        response = http_get("https://example.com/feed", retry=NO_WAIT)
+
+        assert response.status_code == 404
+        assert calls["count"] == 1
+
+    def test_retries_transport_errors_then_raises(self, monkeypatch):
+        """测试连接错误重试耗尽后抛出"""
+
+        def handler(request):
+            raise httpx.ConnectError("connection refused", request=request)
+
+        calls = _use_handler(monkeypatch, handler)
+
+        with pytest.raises(httpx.ConnectError):
+            http_get("https://example.com/feed", retry=NO_WAIT)
+        assert calls["count"] == 3
+
+    def test_passes_params_and_headers(self, monkeypatch):
+        """测试查询参数和请求头"""
+        seen = {}
+
+        def handler(request):
+            seen["url"] = str(request.url)
+            seen["headers"] = request.headers
+            return httpx.Response(200)
+
+        _use_handler(monkeypatch, handler)
+
+        http_get(
+            "https://api.example.com/details",
+            params={"format": "json"},
+            headers={"If-None-Match": '"v1"'},
+            retry=NO_WAIT,
+        )
+
+        assert seen["url"] == "https://api.example.com/details?format=json"
+        assert seen["headers"]["if-none-match"] == '"v1"'
+
+    def test_params_merge_with_existing_query(self, monkeypatch):
+        """测试查询参数与 URL 中已有的查询串合并（不丢失 category 等过滤条件）"""
+        seen = {}
+
+        def handler(request):
+            seen["url"] = str(request.url)
+            return httpx.Response(200)
+
+        _use_handler(monkeypatch, handler)
+
+        http_get(
+            "https://api.example.com/details/0?category=genetics",
+            params={"format": "json"},
+            retry=NO_WAIT,
+        )
+
+        assert seen["url"] == "https://api.example.com/details/0?category=genetics&format=json"
+
+
+class TestRetryPolicy:
+    """退避策略测试"""
+
+    def test_delay_is_jittered_and_capped(self):
+        """测试等待时间带抖动且不超过上限"""
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=3.0)
+
+        delays = [policy.delay(5) for _ in range(50)]
+
+        assert all(0 <= d <= 3.0 for d in delays)
+        assert len(set(delays)) > 1
+
+    def test_delay_honours_retry_after(self):
+        """测试遵守 Retry-After（不超过上限）"""
+        policy = RetryPolicy(backoff_base=0, backoff_max=10.0)
+
+        assert policy.delay(0, httpx.Response(429, headers={"Retry-After": "4"})) == 4.0
+        assert policy.delay(0, httpx.Response(429, headers={"Retry-After": "60"})) == 10.0
+
+
+class TestSharedClient:
+    """共享连接池测试"""
+
+    def test_client_is_shared_until_closed(self, monkeypatch):
+        """测试同一进程复用同一个客户端（连接池）"""
+        monkeypatch.setattr(http, "_client", None)
+
+        first = http.get_http_client()
+        assert http.get_http_client() is first
+
+        http.close_http_client()
+        second = http.get_http_client()
+        assert second is not first
+        http.close_http_client()
+
+    def test_client_negotiates_compression(self, monkeypatch):
+        """测试客户端协商压缩编码"""
+        monkeypatch.setattr(http, "_client", None)
+
+        client = http.get_http_client()
+
+        assert "gzip" in client.headers["Accept-Encoding"]
+        http.close_http_client()
+
+
+class TestAsyncHttpGet:
+    """异步请求与重试测试"""
+
+    def test_async_retries_transient_status(self):
+        """测试异步请求同样按策略重试"""
+        statuses = iter([429, 200])
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(next(statuses)))
+        )
+
+        async def run():
+            async with client:
+                return await async_http_get(client, "https://example.com/feed", retry=NO_WAIT)
+
+        assert asyncio.run(run()).status_code == 200
+
+
+class TestRateLimiter:
+    """共享限速器测试"""
+
+    def test_spaces_requests_across_threads(self, monkeypatch):
+        """测试多个线程预约的时间槽按间隔排开"""
+        # Arrange
+        clock = {"now": 100.0}
+        sleeps = []
+        monkeypatch.setattr(http.time, "monotonic", lambda: clock["now"])
+        monkeypatch.setattr(http.time, "sleep", sleeps.append)
+        limiter = RateLimiter(4.0)
+
+        # Act
+        waits = [limiter.acquire() for _ in range(3)]
+
+        # Assert
+        assert waits == [0.0, 0.25, 0.5]
+        assert sleeps == [0.25, 0.5]
+
+    def test_zero_rate_disables_limiting(self):
+        """测试 rate 为 0 时不限速"""
+        assert RateLimiter(0).acquire() == 0.0
+
+    def test_shared_by_key(self):
+        """测试同一键共享限速器，速率变化时重新创建"""
+        limiter = get_rate_limiter("api.example.org", 2.0)
+
+        assert get_rate_limiter("api.example.org", 2.0) is limiter
+        assert get_rate_limiter("api.example.org", 5.0).rate == 5.0
@@ -0,0 +1,172 @@
+"""流式采集管道单元测试"""
+
+import threading
+import time
+from datetime import datetime
+
+import httpx
+
+from evo_flywheel.collectors.pipeline import run_pipeline, stream_from_all_sources
+
+
+def _papers(prefix, count):
+    return [{"title": f"{prefix} {i}", "doi": f"10.1234/{prefix}.{i}"} for i in range(count)]
+
+
+class _RecordingWriter:
+    """记录每批写入内容的写入器"""
+
+    def __init__(self):
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def __call__(self, batch):
+        with self.lock:
+            self.batches.append(list(batch))
+        return len(batch)
+
+    @property
+    def titles(self):
+        return [p["title"] for batch in self.batches for p in batch]
+
+
+class TestRunPipeline:
+    """流式管道测试"""
+
+    def test_batches_and_dedup(self):
+        """测试按批写入并在线去重（跨生产者）"""
+        # Arrange
+        writer = _RecordingWriter()
+        producers = {
+            "a": lambda emit: emit(_papers("A", 5) + _papers("Shared", 2)),
+            "b": lambda emit: emit(_papers("B", 3) + _papers("Shared", 2)),
+        }
+
+        # Act
+        stats = run_pipeline(producers, writer, batch_size=4)
+
+        # Assert
+        assert stats.received == 12
+        assert stats.unique == 10
+        assert stats.duplicates == 2
+        assert stats.saved == 10
+        assert all(len(batch) <= 4 for batch in writer.batches)
+        assert sorted(writer.titles) == sorted(
+            [p["title"] for p in _papers("A", 5) + _papers("B", 3) + _papers("Shared", 2)]
+        )
+
+    def test_bounded_queue_applies_backpressure(self):
+        """测试队列很小时生产者阻塞但最终全部写入"""
+        # Arrange
+        writer = _RecordingWriter()
+
+        def producer(emit):
+            for i in range(50):
+                emit(_papers(f"P{i}", 1))
+
+        # Act
+        stats = run_pipeline({"p": producer}, writer, batch_size=5, queue_size=2)
+
+        # Assert
+        assert stats.saved == 50
+        assert stats.batches == 10
+
+    def test_failing_producer_does_not_stop_others(self):
+        """测试单个生产者失败时其他生产者继续"""
+        # Arrange
+        writer = _RecordingWriter()
+
+        def bad(emit):
+            emit(_papers("Bad", 1))
+            raise RuntimeError("boom")
+
+        # Act
+        stats = run_pipeline({"bad": bad, "good": lambda emit: emit(_papers("Good", 3))}, writer)
+
+        # Assert
+        assert stats.errors == {"bad": "boom"}
+        assert stats.saved == 4
+
+    def test_fast_source_flushed_before_slow_source_finishes(self):
+        """测试快速源的论文在慢速源完成前就已写入"""
+        # Arrange
+        writer = _RecordingWriter()
+        written_before_slow_done = {}
+
+        def slow(emit):
+            time.sleep(0.5)
+            written_before_slow_done["titles"] = list(writer.titles)
+            emit(_papers("Slow", 1))
+
+        # Act
+        run_pipeline(
+            {"fast": lambda emit: emit(_papers("Fast", 2)), "slow": slow},
+            writer,
+            batch_size=100,
+            flush_interval=0.1,
+        )
+
+        # Assert
+        assert written_before_slow_done["titles"] == ["Fast 0", "Fast 1"]
+        assert "Slow 0" in writer.titles
+
+    def test_key_index_drops_stored_papers(self):
+        """测试写入前丢弃键索引中已入库的论文"""
+
+        # Arrange
+        class StoredKeys:
+            def contains_many(self, keys):
+                return {key for key in keys if key.startswith("doi:10.1234/Old.")}
+
+        writer = _RecordingWriter()
+        producers = {"a": lambda emit: emit(_papers("Old", 3) + _papers("New", 2))}
+
+        # Act
+        stats = run_pipeline(producers, writer, key_index=StoredKeys())
+
+        # Assert
+        assert stats.known == 3
+        assert stats.saved == 2
+        assert sorted(writer.titles) == ["New 0", "New 1"]
+
+
+class TestStreamFromAllSources:
+    """全源流式采集测试"""
+
+    def test_stream_from_all_sources(self, monkeypatch):
+        """测试 bioRxiv 与 RSS 同时流入管道并跨源去重"""
+
+        # Arrange
+        def mock_pages(start, end, targets):
+            yield [{"title": "Shared Paper", "doi": "10.1101/shared", "source": "bioRxiv"}]
+            yield [{"title": "BioRxiv Only", "doi": "10.1101/only", "source": "bioRxiv"}]
+
+        monkeypatch.setattr("evo_flywheel.collectors.pipeline.iter_preprint_pages", mock_pages)
+
+        content = (
+            b"<rss><channel>"
+            b"<item><title>Shared Paper</title><link>https://doi.org/10.1101/shared</link></item>"
+            b"<item><title>RSS Only</title><link>https://example.com/rss-only</link></item>"
+            b"</channel></rss>"
+        )
+
+        def factory(timeout=None):
+            return httpx.AsyncClient(
+                transport=httpx.MockTransport(lambda request: httpx.Response(200, content=content))
+            )
+
+        monkeypatch.setattr("evo_flywheel.collectors.fetcher.create_async_client", factory)
+        writer = _RecordingWriter()
+
+        # Act
+        stats = stream_from_all_sources(
+            datetime(2024, 12, 1),
+            datetime(2024, 12, 2),
+            writer,
+            rss_sources=[{"name": "Journal", "url": "https://example.com/feed"}],
+        )
+
+        # Assert
+        assert stats.errors == {}
+        assert stats.unique == 3
+        assert sorted(writer.titles) == ["BioRxiv Only", "RSS Only", "Shared Paper"]
@@ -0,0 +1,98 @@
+"""自适应轮询单元测试"""
+
+from datetime import UTC, datetime, timedelta
+
+from evo_flywheel.scheduler.polling import PollingPolicy, is_due, record_poll, select_due_sources
+
+NOW = datetime(2024, 12, 31, 12, tzinfo=UTC)
+POLICY = PollingPolicy(
+    min_interval_hours=1.0,
+    max_interval_hours=48.0,
+    default_interval_hours=4.0,
+    target_items=5.0,
+    smoothing=0.5,
+    backoff_factor=2.0,
+)
+
+
+def _polled(hours_ago: float, **state) -> dict:
+    """构造一个刚刚抓取成功、上次抓取在 hours_ago 小时前的源"""
+    return {"name": "Feed", "last_fetch": NOW, **state}, NOW - timedelta(hours=hours_ago)
+
+
+class TestIsDue:
+    """到期判断测试"""
+
+    def test_never_scheduled_source_is_due(self):
+        """测试从未安排过的源立即到期"""
+        assert is_due({"name": "New"}, NOW)
+
+    def test_naive_next_poll_at_is_treated_as_utc(self):
+        """测试数据库读出的无时区时间按 UTC 比较"""
+        assert is_due({"next_poll_at": datetime(2024, 12, 31, 11)}, NOW)
+        assert not is_due({"next_poll_at": datetime(2024, 12, 31, 13)}, NOW)
+
+    def test_select_due_sources(self):
+        """测试只保留到期的源"""
+        sources = [
+            {"name": "Due", "next_poll_at": NOW - timedelta(minutes=1)},
+            {"name": "Later", "next_poll_at": NOW + timedelta(hours=1)},
+        ]
+
+        assert [s["name"] for s in select_due_sources(sources, NOW)] == ["Due"]
+
+
+class TestRecordPoll:
+    """轮询结果记录测试"""
+
+    def test_first_fetch_uses_default_interval(self):
+        """测试首次抓取没有可比较的历史，使用默认间隔"""
+        source = {"name": "Feed", "last_fetch": NOW}
+
+        record_poll(source, previous_fetch=None, new_items=30, now=NOW, policy=POLICY)
+
+        assert source["poll_interval"] == 4.0
+        assert source["next_poll_at"] == NOW + timedelta(hours=4)
+        assert "update_rate" not in source
+
+    def test_busy_feed_is_polled_sooner(self):
+        """测试更新频繁的源间隔缩短（预计积累 target_items 篇后再抓取）"""
+        source, previous = _polled(4)
+
+        # 4 小时 20 篇 -> 5 篇/小时 -> 1 小时后再抓
+        record_poll(source, previous_fetch=previous, new_items=20, now=NOW, policy=POLICY)
+
+        assert source["update_rate"] == 5.0
+        assert source["poll_interval"] == 1.0
+
+    def test_update_rate_is_smoothed(self):
+        """测试更新频率按指数平滑更新"""
+        source, previous = _polled(10, update_rate=1.0, poll_interval=5.0)
+
+        record_poll(source, previous_fetch=previous, new_items=2, now=NOW, policy=POLICY)
+
+        # 0.5 * 1.0 + 0.5 * 0.2
+        assert source["update_rate"] == 0.6
+        assert source["poll_interval"] == 5.0 / 0.6
+
+    def test_quiet_feed_backs_off_up_to_max(self):
+        """测试没有新论文的源间隔倍增，且不超过上限"""
+        source, previous = _polled(4, update_rate=0.5, poll_interval=4.0)
+
+        record_poll(source, previous_fetch=previous, new_items=0, now=NOW, policy=POLICY)
+        assert source["poll_interval"] == 8.0
+
+        source["poll_interval"] = 40.0
+        record_poll(source, previous_fetch=previous, new_items=0, now=NOW, policy=POLICY)
+        assert source["poll_interval"] == 48.0
+
+    def test_failed_fetch_backs_off(self):
+        """测试 last_fetch 未更新（抓取失败）时退避，且不修改更新频率"""
+        previous = NOW - timedelta(hours=2)
+        source = {"name": "Down", "last_fetch": previous, "update_rate": 3.0, "poll_interval": 2.0}
+
+        record_poll(source, previous_fetch=previous, new_items=0, now=NOW, policy=POLICY)
+
+        assert source["update_rate"] == 3.0
+        assert source["poll_interval"] == 4.0
+        assert source["next_poll_at"] == NOW + timedelta(hours=4)
@@ -0,0 +1,101 @@
+"""论文记录单元测试"""
+
+import pickle
+
+import pytest
+
+from evo_flywheel.collectors.biorxiv import parse_biorxiv_paper
+from evo_flywheel.collectors.dedup import extract_paper_key, remove_duplicate_papers
+from evo_flywheel.collectors.record import PaperRecord
+from evo_flywheel.collectors.rss import parse_feed_content
+
+
+class TestPaperRecord:
+    """PaperRecord 测试"""
+
+    def test_dict_compatible_access(self):
+        """测试按字典方式读写字段与附加键"""
+        # Arrange
+        paper = PaperRecord("Title", doi="10.1101/x", source="bioRxiv")
+
+        # Act
+        paper["abstract"] = "Abstract"
+        paper["_cached"] = True
+
+        # Assert
+        assert paper.abstract == "Abstract"
+        assert paper["doi"] == "10.1101/x"
+        assert paper.get("journal") is None
+        assert paper.get("missing", "default") == "default"
+        assert "_cached" in paper and "missing" not in paper
+        assert paper == {
+            "title": "Title",
+            "authors": [],
+            "abstract": "Abstract",
+            "doi": "10.1101/x",
+            "url": None,
+            "publication_date": None,
+            "source": "bioRxiv",
+            "journal": None,
+            "_cached": True,
+        }
+        with pytest.raises(KeyError):
+            paper["missing"]
+
+    def test_fields_cannot_be_deleted(self):
+        """测试字段不能删除，附加键可以删除"""
+        paper = PaperRecord("Title")
+        paper["_skipped"] = True
+
+        del paper["_skipped"]
+
+        assert "_skipped" not in paper
+        with pytest.raises(TypeError):
+            del paper["doi"]
+
+    def test_names_are_interned_and_no_instance_dict(self):
+        """测试来源名称驻留，记录没有实例字典"""
+        source = "".join(["Nat", "ure"])
+
+        first = PaperRecord("A", source=source, journal=source)
+        second = PaperRecord("B")
+        second["source"] = "".join(["Nat", "ure"])
+
+        assert first.source is second.source
+        assert not hasattr(first, "__dict__")
+
+    def test_pickle_round_trip(self):
+        """测试记录可跨进程传递（解析进程池）"""
+        paper = PaperRecord("Title", authors=["A"], doi="10.1/x")
+        paper["_extra_key"] = 1
+
+        restored = pickle.loads(pickle.dumps(paper))
+
+        assert restored == paper
+        assert isinstance(restored, PaperRecord)
+
+
+class TestCollectorsEmitRecords:
+    """采集器输出论文记录测试"""
+
+    def test_parsers_return_records_that_dedup(self):
+        """测试 RSS 与 bioRxiv 解析结果为 PaperRecord，并可直接去重"""
+        # Arrange
+        feed = (
+            b"<rss><channel><item><title>Shared Paper</title>"
+            b"<link>https://doi.org/10.1101/2024.01.01.000001</link></item></channel></rss>"
+        )
+
+        # Act
+        rss_papers = parse_feed_content(feed, "Nature").papers
+        preprint = parse_biorxiv_paper(
+            {"title": "Shared Paper", "doi": "10.1101/2024.01.01.000001"}
+        )
+        unique = remove_duplicate_papers([preprint, *rss_papers])
+
+        # Assert
+        assert isinstance(rss_papers[0], PaperRecord)
+        assert isinstance(preprint, PaperRecord)
+        assert rss_papers[0]["journal"] == "Nature"
+        assert extract_paper_key(rss_papers[0]) == extract_paper_key(preprint)
+        assert unique == [preprint]
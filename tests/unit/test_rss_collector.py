@@ -1,14 +1,20 @@
 """RSS 采集器单元测试"""
 
+from datetime import UTC, datetime
+from pathlib import Path
 from unittest import mock
 
 import feedparser
+import httpx
 import pytest
-import requests
 
 from evo_flywheel.collectors.rss import (
+    clean_html,
+    entry_datetime,
     fetch_rss_feed,
+    filter_entries_since,
     parse_entry,
+    parse_feed_content,
     parse_rss_entries,
 )
 
@@ -28,7 +34,7 @@ class TestFetchRSSFeed:
         def mock_get(url, timeout, headers=None):
             return mock_response
 
-        monkeypatch.setattr("requests.get", mock_get)
+        monkeypatch.setattr("evo_flywheel.collectors.rss.http_get", mock_get)
 
         # Act
         result = fetch_rss_feed("https://example.com/feed")
@@ -44,7 +50,7 @@ class TestFetchRSSFeed:
         def mock_get(url, timeout, headers=None):
             raise Exception("Network error")
 
-        monkeypatch.setattr("requests.get", mock_get)
+        monkeypatch.setattr("evo_flywheel.collectors.rss.http_get", mock_get)
 
         # Act & Assert
         with pytest.raises(Exception, match="Network error"):
@@ -57,12 +63,34 @@ class TestFetchRSSFeed:
         def mock_get(url, timeout, headers=None):
             raise TimeoutError("Request timeout")
 
-        monkeypatch.setattr("requests.get", mock_get)
+        monkeypatch.setattr("evo_flywheel.collectors.rss.http_get", mock_get)
 
         # Act & Assert
         with pytest.raises(TimeoutError):
             fetch_rss_feed("https://example.com/feed")
 
+    def test_fetch_rss_feed_not_modified(self, monkeypatch):
+        """测试条件请求返回 304 时不解析"""
+        # Arrange
+        captured = {}
+        mock_response = mock.Mock()
+        mock_response.status_code = 304
+
+        def mock_get(url, timeout, headers=None):
+            captured["headers"] = headers
+            return mock_response
+
+        monkeypatch.setattr("evo_flywheel.collectors.rss.http_get", mock_get)
+
+        # Act
+        result = fetch_rss_feed("https://example.com/feed", etag='"abc"')
+
+        # Assert
+        assert captured["headers"]["If-None-Match"] == '"abc"'
+        assert result.status == 304
+        assert result.entries == []
+        assert result.etag == '"abc"'
+
 
 class TestParseEntry:
     """单个 RSS 条目解析测试"""
@@ -182,6 +210,12 @@ class TestParseEntry:
         assert "<strong>" not in result["abstract"]
         assert "important" in result["abstract"]
 
+    def test_clean_html_keeps_malformed_markup_as_text(self):
+        """测试未闭合的标签和注释按原文保留，实体照常解码"""
+        assert clean_html("Text <b") == "Text <b"
+        assert clean_html("<p>x</p><!--unclosed") == "x <!--unclosed"
+        assert clean_html("<p>p < 0.05 &amp; q</p>") == "p < 0.05 & q"
+
 
 class TestParseRSSEntries:
     """批量 RSS 条目解析测试"""
@@ -262,6 +296,49 @@ class TestParseRSSEntries:
         assert all("title" in r for r in results)
 
 
+class TestIncrementalFiltering:
+    """高水位增量过滤测试"""
+
+    def _entry(self, title, published=None):
+        data = {"title": title}
+        if published:
+            data["published_parsed"] = published.timetuple()
+        return feedparser.FeedParserDict(data)
+
+    def test_entry_datetime_prefers_published(self):
+        """测试使用 published_parsed 作为条目时间"""
+        # Arrange
+        entry = self._entry("Paper", datetime(2024, 1, 2, 3, 4, 5))
+
+        # Act & Assert
+        assert entry_datetime(entry) == datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC)
+        assert entry_datetime(self._entry("Undated")) is None
+
+    def test_filter_entries_since(self):
+        """测试只保留晚于截止时间的条目（无日期条目保留）"""
+        # Arrange
+        entries = [
+            self._entry("Old", datetime(2024, 1, 1)),
+            self._entry("New", datetime(2024, 1, 3)),
+            self._entry("Undated"),
+        ]
+
+        # Act
+        kept, newest = filter_entries_since(entries, datetime(2024, 1, 2, tzinfo=UTC))
+
+        # Assert
+        assert [e["title"] for e in kept] == ["New", "Undated"]
+        assert newest == datetime(2024, 1, 3, tzinfo=UTC)
+
+    def test_filter_entries_since_none_keeps_all(self):
+        """测试无截止时间时不过滤"""
+        entries = [self._entry("Old", datetime(2024, 1, 1))]
+
+        kept, _ = filter_entries_since(entries, None)
+
+        assert len(kept) == 1
+
+
 class TestFetchRSSFeedWithHeaders:
     """RSS feed 获取测试 - 带请求头和超时"""
 
@@ -278,7 +355,7 @@ class TestFetchRSSFeedWithHeaders:
             captured_request["headers"] = headers
             return mock_response
 
-        monkeypatch.setattr("requests.get", mock_get)
+        monkeypatch.setattr("evo_flywheel.collectors.rss.http_get", mock_get)
 
         # Act
         fetch_rss_feed("https://example.com/feed")
@@ -301,7 +378,7 @@ class TestFetchRSSFeedWithHeaders:
             captured_timeout["value"] = timeout
             return mock_response
 
-        monkeypatch.setattr("requests.get", mock_get)
+        monkeypatch.setattr("evo_flywheel.collectors.rss.http_get", mock_get)
 
         # Act
         fetch_rss_feed("https://example.com/feed", timeout=60)
@@ -314,15 +391,17 @@ class TestFetchRSSFeedWithHeaders:
         # Arrange
         mock_response = mock.Mock()
         mock_response.status_code = 403
-        mock_response.raise_for_status.side_effect = requests.HTTPError("403 Forbidden")
+        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "403 Forbidden", request=mock.Mock(), response=mock_response
+        )
 
         def mock_get(url, timeout, headers=None):
             return mock_response
 
-        monkeypatch.setattr("requests.get", mock_get)
+        monkeypatch.setattr("evo_flywheel.collectors.rss.http_get", mock_get)
 
         # Act & Assert
-        with pytest.raises(requests.HTTPError, match="403"):
+        with pytest.raises(httpx.HTTPStatusError, match="403"):
             fetch_rss_feed("https://example.com/feed")
 
     def test_fetch_rss_feed_default_timeout_is_60_seconds(self, monkeypatch):
@@ -338,10 +417,46 @@ class TestFetchRSSFeedWithHeaders:
             captured_timeout["value"] = timeout
             return mock_response
 
-        monkeypatch.setattr("requests.get", mock_get)
+        monkeypatch.setattr("evo_flywheel.collectors.rss.http_get", mock_get)
 
         # Act
         fetch_rss_feed("https://example.com/feed")
 
         # Assert
         assert captured_timeout["value"] == 60
+
+
+class TestParseFeedContent:
+    """原始 feed 内容解析测试"""
+
+    def test_parse_feed_content_fixture(self):
+        """测试将出版商 feed 样本解析为论文数据"""
+        # Arrange
+        content = (Path(__file__).parent.parent / "fixtures" / "feeds" / "nature.rss").read_bytes()
+
+        # Act
+        parsed = parse_feed_content(content, "Nature")
+
+        # Assert
+        assert parsed.total_entries == parsed.new_entries == len(parsed.papers) == 30
+        assert parsed.papers[0]["source"] == "Nature"
+        assert parsed.papers[0]["doi"].startswith("10.1038/")
+        assert "<p>" not in parsed.papers[0]["abstract"]
+
+    def test_parse_feed_content_since(self):
+        """测试只保留晚于指定时间的条目"""
+        # Arrange
+        content = (
+            b"<rss><channel>"
+            b"<item><title>Old</title><pubDate>Mon, 01 Jan 2024 00:00:00 GMT</pubDate></item>"
+            b"<item><title>New</title><pubDate>Wed, 03 Jan 2024 00:00:00 GMT</pubDate></item>"
+            b"</channel></rss>"
+        )
+
+        # Act
+        parsed = parse_feed_content(content, "Test", since=datetime(2024, 1, 2, tzinfo=UTC))
+
+        # Assert
+        assert [p["title"] for p in parsed.papers] == ["New"]
+        assert parsed.total_entries == 2
+        assert parsed.newest == datetime(2024, 1, 3, tzinfo=UTC)
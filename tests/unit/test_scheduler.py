@@ -1,14 +1,21 @@
 """采集调度器单元测试"""
 
 import contextlib
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 from unittest import mock
 
+from evo_flywheel.collectors.orchestrator import SourceReport
+from evo_flywheel.collectors.pipeline import PipelineStats
+from evo_flywheel.config import get_settings
+from evo_flywheel.scheduler import jobs
 from evo_flywheel.scheduler.jobs import (
     collect_daily_papers,
+    load_preprint_targets,
     load_rss_sources,
     main,
+    poll_due_sources,
     schedule_flywheel,
+    stream_daily_papers,
 )
 
 
@@ -101,6 +108,50 @@ sources: {}
         assert sources == []
 
 
+class TestLoadPreprintTargets:
+    """预印本目标加载测试"""
+
+    def test_load_preprint_targets(self, tmp_path):
+        """测试从 api 类型的源加载 (服务器, 分类) 目标"""
+        # Arrange
+        config_file = tmp_path / "sources.yaml"
+        config_file.write_text(
+            """
+sources:
+  biorxiv_api:
+    type: api
+    params:
+      category: evolutionary_biology
+  medrxiv_genetics:
+    type: api
+    server: medrxiv
+    params:
+      category: genetic_and_genomic_medicine
+  disabled:
+    type: api
+    params:
+      category: ecology
+    enabled: false
+  unknown_server:
+    type: api
+    server: arxiv
+  journal:
+    type: rss
+    url: https://example.com/feed.rss
+""",
+            encoding="utf-8",
+        )
+
+        # Act
+        targets = load_preprint_targets(str(config_file))
+
+        # Assert
+        assert [target.label for target in targets] == [
+            "biorxiv:evolutionary_biology",
+            "medrxiv:genetic_and_genomic_medicine",
+        ]
+
+
 class TestCollectDailyPapers:
     """每日采集任务测试"""
 
@@ -109,9 +160,21 @@ class TestCollectDailyPapers:
         # Arrange
         mock_sources = [{"name": "Test Source", "url": "https://example.com/feed.rss"}]
 
-        def mock_collect_all(start_date, end_date, rss_sources, category):
+        def mock_collect_all(
+            start_date,
+            end_date,
+            rss_sources,
+            category,
+            key_index=None,
+            include_biorxiv=True,
+            preprint_targets=None,
+            report=None,
+        ):
             return [{"title": "Test Paper", "doi": "10.1234/test.001"}]
 
+        monkeypatch.setattr("evo_flywheel.scheduler.jobs._load_source_state", lambda s: None)
+        monkeypatch.setattr("evo_flywheel.scheduler.jobs._save_source_state", lambda s: None)
+        monkeypatch.setattr("evo_flywheel.scheduler.jobs._save_papers_to_db", lambda p: len(p))
         monkeypatch.setattr(
             "evo_flywheel.scheduler.jobs.collect_from_all_sources", mock_collect_all
         )
@@ -130,7 +193,16 @@ class TestCollectDailyPapers:
 
         call_args = {"captured": None}
 
-        def mock_collect_all(start_date, end_date, rss_sources, category):
+        def mock_collect_all(
+            start_date,
+            end_date,
+            rss_sources,
+            category,
+            key_index=None,
+            include_biorxiv=True,
+            preprint_targets=None,
+            report=None,
+        ):
             call_args["captured"] = (start_date, end_date)
             return []
 
@@ -152,7 +224,16 @@ class TestCollectDailyPapers:
 
         call_args = {"captured": None}
 
-        def mock_collect_all(start_date, end_date, rss_sources, category):
+        def mock_collect_all(
+            start_date,
+            end_date,
+            rss_sources,
+            category,
+            key_index=None,
+            include_biorxiv=True,
+            preprint_targets=None,
+            report=None,
+        ):
             call_args["captured"] = (start_date, end_date)
             return []
 
@@ -171,6 +252,350 @@ class TestCollectDailyPapers:
         assert start == start_date
         assert end == end_date
 
+    def test_collect_daily_papers_starts_from_high_water_mark(self, monkeypatch):
+        """测试有高水位时从高水位减去回看时长开始采集"""
+        # Arrange
+        call_args = {"captured": None}
+
+        def mock_load_state(sources):
+            for source in sources:
+                if source["name"] == "bioRxiv":
+                    source["high_water_mark"] = datetime(2024, 12, 20)
+
+        def mock_collect_all(
+            start_date,
+            end_date,
+            rss_sources,
+            category,
+            key_index=None,
+            include_biorxiv=True,
+            preprint_targets=None,
+            report=None,
+        ):
+            call_args["captured"] = start_date
+            return []
+
+        monkeypatch.setattr("evo_flywheel.scheduler.jobs._load_source_state", mock_load_state)
+        monkeypatch.setattr("evo_flywheel.scheduler.jobs._save_source_state", lambda s: None)
+        monkeypatch.setattr(
+            "evo_flywheel.scheduler.jobs.collect_from_all_sources", mock_collect_all
+        )
+
+        # Act
+        collect_daily_papers([], end_date=datetime(2024, 12, 31))
+
+        # Assert
+        overlap = get_settings().collection_overlap_hours
+        assert call_args["captured"] == datetime(2024, 12, 20) - timedelta(hours=overlap)
+
+    def test_collect_daily_papers_advances_biorxiv_high_water_mark(self, monkeypatch):
+        """测试采集后用 bioRxiv 论文日期推进高水位"""
+        # Arrange
+        saved = {}
+
+        def mock_collect_all(
+            start_date,
+            end_date,
+            rss_sources,
+            category,
+            key_index=None,
+            include_biorxiv=True,
+            preprint_targets=None,
+            report=None,
+        ):
+            return [
+                {"title": "A", "source": "bioRxiv", "publication_date": "2024-12-28"},
+                {"title": "B", "source": "bioRxiv", "publication_date": "2024-12-30"},
+                {"title": "C", "source": "Nature", "publication_date": "2025-01-05"},
+            ]
+
+        def mock_save_state(sources):
+            saved.update({s["name"]: s.get("high_water_mark") for s in sources})
+
+        monkeypatch.setattr("evo_flywheel.scheduler.jobs._load_source_state", lambda s: None)
+        monkeypatch.setattr("evo_flywheel.scheduler.jobs._save_source_state", mock_save_state)
+        monkeypatch.setattr("evo_flywheel.scheduler.jobs._save_papers_to_db", lambda p: len(p))
+        monkeypatch.setattr(
+            "evo_flywheel.scheduler.jobs.collect_from_all_sources", mock_collect_all
+        )
+
+        # Act
+        collect_daily_papers([])
+
+        # Assert
+        assert saved["bioRxiv"] == datetime(2024, 12, 30, tzinfo=UTC)
+
+    def test_collect_daily_papers_keeps_state_when_save_fails(self, monkeypatch):
+        """测试论文写库失败时不写回源状态（高水位、校验器不推进）"""
+        # Arrange
+        saved_state = []
+
+        def mock_collect_all(
+            start_date,
+            end_date,
+            rss_sources,
+            category,
+            key_index=None,
+            include_biorxiv=True,
+            preprint_targets=None,
+            report=None,
+        ):
+            return [{"title": "A", "source": "bioRxiv", "publication_date": "2024-12-28"}]
+
+        def failing_save(papers):
+            raise RuntimeError("database is locked")
+
+        monkeypatch.setattr("evo_flywheel.scheduler.jobs._load_source_state", lambda s: None)
+        monkeypatch.setattr("evo_flywheel.scheduler.jobs._save_source_state", saved_state.append)
+        monkeypatch.setattr("evo_flywheel.scheduler.jobs._save_papers_to_db", failing_save)
+        monkeypatch.setattr(
+            "evo_flywheel.scheduler.jobs.collect_from_all_sources", mock_collect_all
+        )
+
+        # Act
+        result = collect_daily_papers([])
+
+        # Assert
+        assert result == []
+        assert saved_state == []
+
+
+class TestStreamDailyPapers:
+    """流式采集测试"""
+
+    @staticmethod
+    def _run(monkeypatch, save, errors=None):
+        """用两批 bioRxiv 论文运行流式采集，返回写回的源状态"""
+        saved_state = {}
+
+        def mock_stream(start_date, end_date, writer, **kwargs):
+            stats = PipelineStats(errors=dict(errors or {}))
+            for date in ("2024-12-30", "2024-12-28"):
+                try:
+                    stats.saved += writer(
+                        [{"title": date, "source": "bioRxiv", "publication_date": date}]
+                    )
+                except Exception as e:
+                    stats.errors["writer"] = str(e)
+            return stats
+
+        def mock_save_state(sources):
+            saved_state.update({s["name"]: s.get("high_water_mark") for s in sources})
+
+        monkeypatch.setattr(get_settings(), "polling_enabled", False)
+        monkeypatch.setattr("evo_flywheel.scheduler.jobs._load_source_state", lambda s: None)
+        monkeypatch.setattr("evo_flywheel.scheduler.jobs._save_source_state", mock_save_state)
+        monkeypatch.setattr("evo_flywheel.scheduler.jobs._save_papers_to_db", save)
+        monkeypatch.setattr("evo_flywheel.collectors.pipeline.stream_from_all_sources", mock_stream)
+
+        stream_daily_papers([])
+        return saved_state
+
+    def test_saves_state_after_all_batches_written(self, monkeypatch):
+        """测试全部批次入库后推进高水位并写回状态"""
+        saved_state = self._run(monkeypatch, lambda papers: len(papers))
+
+        assert saved_state["bioRxiv"] == datetime(2024, 12, 30, tzinfo=UTC)
+
+    def test_keeps_state_when_a_batch_fails(self, monkeypatch):
+        """测试某批写库失败时（即使更新的批次已入库）不写回源状态"""
+
+        def save(papers):
+            if papers[0]["publication_date"] == "2024-12-28":
+                raise RuntimeError("database is locked")
+            return len(papers)
+
+        assert self._run(monkeypatch, save) == {}
+
+    def test_preprint_failure_still_saves_rss_state(self, monkeypatch):
+        """测试只有预印本生产者失败时照常写回 RSS 源状态，bioRxiv 高水位不变"""
+        # Arrange
+        saved_state = {}
+        hwm = datetime(2024, 12, 1, tzinfo=UTC)
+
+        def mock_load_state(sources):
+            sources[0]["high_water_mark"] = hwm
+
+        def mock_stream(start_date, end_date, writer, rss_sources, **kwargs):
+            # RSS 源抓取成功并更新了校验器；bioRxiv 的一页入库后另一页失败
+            rss_sources[0].update(etag='"v2"', consecutive_failures=0)
+            stats = PipelineStats(errors={"bioRxiv": "RuntimeError: page 2 failed"})
+            stats.saved += writer(
+                [
+                    {"title": "R", "source": "Nature"},
+                    {"title": "B", "source": "bioRxiv", "publication_date": "2024-12-30"},
+                ]
+            )
+            return stats
+
+        def mock_save_state(sources):
+            saved_state.update({s["name"]: dict(s) for s in sources})
+
+        monkeypatch.setattr(get_settings(), "polling_enabled", False)
+        monkeypatch.setattr("evo_flywheel.scheduler.jobs._load_source_state", mock_load_state)
+        monkeypatch.setattr("evo_flywheel.scheduler.jobs._save_source_state", mock_save_state)
+        monkeypatch.setattr("evo_flywheel.scheduler.jobs._save_papers_to_db", lambda p: len(p))
+        monkeypatch.setattr("evo_flywheel.collectors.pipeline.stream_from_all_sources", mock_stream)
+
+        # Act
+        stream_daily_papers([{"name": "Nature", "url": "https://example.com/nature.rss"}])
+
+        # Assert
+        assert saved_state["Nature"]["etag"] == '"v2"'
+        assert saved_state["Nature"]["consecutive_failures"] == 0
+        assert saved_state["bioRxiv"]["high_water_mark"] == hwm
+        assert "last_fetch" not in saved_state["bioRxiv"]
+
+
+class TestAdaptivePolling:
+    """采集任务的自适应轮询测试"""
+
+    def test_skips_sources_not_due(self, monkeypatch):
+        """测试未到期的源不被采集，到期的源采集后安排下次轮询"""
+        # Arrange
+        now = datetime.now(UTC)
+        captured = {}
+        saved = {}
+
+        def mock_load_state(sources):
+            for source in sources:
+                if source["name"] in ("Quiet", "bioRxiv"):
+                    source["next_poll_at"] = now + timedelta(hours=12)
+
+        def mock_collect_all(
+            start_date,
+            end_date,
+            rss_sources,
+            category,
+            key_index=None,
+            include_biorxiv=True,
+            preprint_targets=None,
+            report=None,
+        ):
+            captured["rss"] = [s["name"] for s in rss_sources]
+            captured["biorxiv"] = include_biorxiv
+            for source in rss_sources:
+                source["last_fetch"] = datetime.now(UTC)
+            return [{"title": "Busy Paper", "source": "Busy"}]
+
+        def mock_save_state(sources):
+            saved.update({s["name"]: s for s in sources})
+
+        monkeypatch.setattr("evo_flywheel.scheduler.jobs._load_source_state", mock_load_state)
+        monkeypatch.setattr("evo_flywheel.scheduler.jobs._save_source_state", mock_save_state)
+        monkeypatch.setattr("evo_flywheel.scheduler.jobs._save_papers_to_db", lambda p: len(p))
+        monkeypatch.setattr(
+            "evo_flywheel.scheduler.jobs.collect_from_all_sources", mock_collect_all
+        )
+        sources = [
+            {"name": "Busy", "url": "https://example.com/busy.rss"},
+            {"name": "Quiet", "url": "https://example.com/quiet.rss"},
+        ]
+
+        # Act
+        collect_daily_papers(sources)
+
+        # Assert
+        assert captured == {"rss": ["Busy"], "biorxiv": False}
+        assert list(saved) == ["Busy"]
+        assert saved["Busy"]["new_items"] == 1
+        assert saved["Busy"]["next_poll_at"] > now
+
+    def test_failed_preprint_collection_keeps_last_fetch(self, monkeypatch):
+        """测试预印本采集失败时不更新 bioRxiv 的 last_fetch（按失败退避）"""
+        # Arrange
+        saved = {}
+        last_fetch = datetime.now(UTC) - timedelta(days=1)
+
+        def mock_load_state(sources):
+            for source in sources:
+                source["last_fetch"] = last_fetch
+
+        def mock_collect_all(
+            start_date,
+            end_date,
+            rss_sources,
+            category,
+            key_index=None,
+            include_biorxiv=True,
+            preprint_targets=None,
+            report=None,
+        ):
+            report.sources.append(SourceReport("bioRxiv", error="HTTP 503"))
+            return []
+
+        def mock_save_state(sources):
+            saved.update({s["name"]: s for s in sources})
+
+        monkeypatch.setattr(get_settings(), "polling_enabled", True)
+        monkeypatch.setattr("evo_flywheel.scheduler.jobs._load_source_state", mock_load_state)
+        monkeypatch.setattr("evo_flywheel.scheduler.jobs._save_source_state", mock_save_state)
+        monkeypatch.setattr("evo_flywheel.scheduler.jobs._record_collection_log", lambda r, n: None)
+        monkeypatch.setattr(
+            "evo_flywheel.scheduler.jobs.collect_from_all_sources", mock_collect_all
+        )
+
+        # Act
+        collect_daily_papers([])
+
+        # Assert
+        assert saved["bioRxiv"]["last_fetch"] == last_fetch
+
+
+class TestCollectionLogRecording:
+    """采集报告写入 CollectionLog 测试"""
+
+    def test_collect_daily_papers_records_report(self, monkeypatch):
+        """测试每次采集按报告写入状态、源列表和错误"""
+        # Arrange
+        logged = {}
+
+        def mock_collect_all(
+            start_date,
+            end_date,
+            rss_sources,
+            category,
+            key_index=None,
+            include_biorxiv=True,
+            preprint_targets=None,
+            report=None,
+        ):
+            report.sources += [
+                SourceReport("bioRxiv", error="Global deadline of 180.0s exceeded"),
+                SourceReport("Nature", papers=1, seconds=0.2),
+            ]
+            report.total_papers = 1
+            return [{"title": "A", "source": "Nature"}]
+
+        @contextlib.contextmanager
+        def mock_session():
+            yield None
+
+        monkeypatch.setattr(get_settings(), "polling_enabled", False)
+        monkeypatch.setattr("evo_flywheel.scheduler.jobs._load_source_state", lambda s: None)
+        monkeypatch.setattr("evo_flywheel.scheduler.jobs._save_source_state", lambda s: None)
+        monkeypatch.setattr("evo_flywheel.scheduler.jobs._save_papers_to_db", lambda p: len(p))
+        monkeypatch.setattr("evo_flywheel.scheduler.jobs.get_db_session", mock_session)
+        monkeypatch.setattr(
+            "evo_flywheel.db.crud.create_collection_log",
+            lambda session, **kwargs: logged.update(kwargs),
+        )
+        monkeypatch.setattr(
+            "evo_flywheel.scheduler.jobs.collect_from_all_sources", mock_collect_all
+        )
+
+        # Act
+        collect_daily_papers([])
+
+        # Assert
+        assert logged == {
+            "status": "partial",
+            "total_papers": 1,
+            "new_papers": 1,
+            "sources": "bioRxiv,Nature",
+            "error_message": "bioRxiv: Global deadline of 180.0s exceeded",
+        }
+
 
 class TestScheduleFlywheel:
     """调度器配置测试"""
@@ -189,7 +614,7 @@ class TestScheduleFlywheel:
 
         # Assert
         mock_scheduler_cls.assert_called_once()
-        mock_scheduler.add_job.assert_called_once()
+        assert _job_kwargs(mock_scheduler, "flywheel")["hours"] == 4
         assert scheduler == mock_scheduler
 
     def test_schedule_flywheel_with_custom_interval(self, monkeypatch):
@@ -205,12 +630,56 @@ class TestScheduleFlywheel:
         schedule_flywheel(interval_hours=2)
 
         # Assert
-        mock_scheduler.add_job.assert_called_once()
-        # 检查 add_job 被调用时的参数
-        call_kwargs = mock_scheduler.add_job.call_args.kwargs
+        # 检查飞轮任务被添加时的参数
+        call_kwargs = _job_kwargs(mock_scheduler, "flywheel")
         assert call_kwargs.get("trigger") == "interval"
         assert call_kwargs.get("hours") == 2
 
+    def test_schedule_flywheel_adds_source_polling_job(self, monkeypatch):
+        """测试启用自适应轮询时添加源轮询任务"""
+        # Arrange
+        mock_scheduler = mock.Mock()
+        monkeypatch.setattr(
+            "evo_flywheel.scheduler.jobs.BackgroundScheduler", lambda: mock_scheduler
+        )
+
+        # Act
+        schedule_flywheel()
+
+        # Assert
+        call_kwargs = _job_kwargs(mock_scheduler, "source_polling")
+        assert call_kwargs["trigger"] == "interval"
+        assert call_kwargs["minutes"] == get_settings().polling_tick_minutes
+        for job_id in ("flywheel", "source_polling"):
+            assert _job_kwargs(mock_scheduler, job_id)["max_instances"] == 1
+            assert _job_kwargs(mock_scheduler, job_id)["coalesce"] is True
+
+    def test_poll_due_sources_skips_while_polling(self, monkeypatch):
+        """测试已有轮询在进行时（如飞轮与源轮询任务重叠），本次轮询跳过"""
+        # Arrange
+        calls = []
+        monkeypatch.setattr(get_settings(), "collection_streaming", False)
+        monkeypatch.setattr(
+            "evo_flywheel.scheduler.jobs.collect_daily_papers", lambda: calls.append(1) or []
+        )
+
+        # Act
+        with jobs._polling_lock:
+            skipped = poll_due_sources()
+        poll_due_sources()
+
+        # Assert
+        assert skipped == 0
+        assert calls == [1]
+
+
+def _job_kwargs(scheduler, job_id):
+    """返回添加指定任务时的关键字参数"""
+    for call in scheduler.add_job.call_args_list:
+        if call.kwargs.get("id") == job_id:
+            return call.kwargs
+    raise AssertionError(f"job {job_id} was not added")
+
 
 class TestMain:
     """命令行入口测试"""
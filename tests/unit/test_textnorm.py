@@ -0,0 +1,98 @@
+"""文本规范化单元测试"""
+
+from pathlib import Path
+
+import feedparser
+import pytest
+from bs4 import BeautifulSoup
+
+from evo_flywheel.collectors.textnorm import extract_doi, html_to_text, normalize_title
+
+FEED_FIXTURES = sorted((Path(__file__).parent.parent / "fixtures" / "feeds").iterdir())
+
+
+def _bs4_text(text):
+    return BeautifulSoup(text, "html.parser").get_text(separator=" ", strip=True)
+
+
+class TestNormalizeTitle:
+    """标题规范化测试"""
+
+    def test_ascii_fast_path(self):
+        """测试纯 ASCII 标题转小写并压缩空白"""
+        assert normalize_title("  Evolution\tof   Gene\nRegulation ") == (
+            "evolution of gene regulation"
+        )
+
+    def test_removes_diacritics(self):
+        """测试移除变音符号"""
+        assert normalize_title("Café Müller's Évolution") == "cafe muller's evolution"
+
+    def test_replaces_unicode_fractions(self):
+        """测试替换 Unicode 分数字符（在 NFKD 分解之前）"""
+        assert normalize_title("½ Sibs and ¾ Majority") == "1/2 sibs and 3/4 majority"
+
+    def test_unicode_whitespace(self):
+        """测试压缩 Unicode 空白字符"""
+        assert normalize_title("Ñandú  Evolution") == "nandu evolution"
+
+    def test_results_are_cached(self):
+        """测试重复标题命中缓存"""
+        normalize_title.cache_clear()
+
+        normalize_title("Repeated Title")
+        normalize_title("Repeated Title")
+
+        assert normalize_title.cache_info().hits == 1
+
+
+class TestExtractDoi:
+    """DOI 提取测试"""
+
+    def test_plain_doi(self):
+        """测试提取文本中的 DOI 并去掉末尾标点"""
+        assert extract_doi("See 10.1101/2024.12.28.123456.") == "10.1101/2024.12.28.123456"
+
+    def test_prefixed_doi(self):
+        """测试 doi: 前缀和 doi.org 链接"""
+        assert extract_doi("DOI:10.1038/s41586-024-00001;") == "10.1038/s41586-024-00001"
+        assert extract_doi("https://doi.org/10.1371/journal.pbio.3000001") == (
+            "10.1371/journal.pbio.3000001"
+        )
+
+    def test_no_doi(self):
+        """测试没有 DOI 时返回 None"""
+        assert extract_doi("No identifier here") is None
+        assert extract_doi(None) is None
+        assert extract_doi("") is None
+
+
+class TestHtmlToText:
+    """HTML 转纯文本测试"""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "<p>This is <strong>important</strong> research.</p>",
+            "<p>one<br>two</p>\n\n<p> </p>three",
+            "<p>a<!-- comment -->b</p>",
+            "<script>var x = 1;</script><style>p {}</style>visible",
+            "a &amp; b &lt;c&gt; &nbsp;&#8212; d",
+            "<![CDATA[cdata]]>after",
+            "a < b and c > d",
+            "<b>unclosed</b> <i>tail",
+            "  plain text  ",
+        ],
+    )
+    def test_matches_beautifulsoup(self, text):
+        """测试与 BeautifulSoup.get_text(separator=" ", strip=True) 结果一致"""
+        assert html_to_text(text) == _bs4_text(text)
+
+    @pytest.mark.parametrize("path", FEED_FIXTURES, ids=lambda p: p.name)
+    def test_matches_beautifulsoup_on_feed_fixtures(self, path):
+        """测试在出版商 feed 样本的全部摘要上与 BeautifulSoup 一致"""
+        feed = feedparser.parse(path.read_bytes())
+        summaries = [e.get("summary") or e.get("description") or "" for e in feed.entries]
+
+        assert summaries
+        assert [html_to_text(s) for s in summaries] == [_bs4_text(s) for s in summaries]